@@ -0,0 +1,87 @@
+"""
+Dependency injection benchmark.
+
+Sends requests to handlers whose dependencies form a graph of growing depth, a chain
+of dependencies each requiring the previous one, and of growing width, independent
+dependencies all required by the handler.
+
+    $ python benchmarks/dependencies.py
+    $ python benchmarks/dependencies.py --depths 1 10 --widths 1 10 --json
+"""
+
+from typing import Any, Callable
+
+import anyio
+from harness import create_parser, measure, report, request
+
+from ravyn import Gateway, Inject, Ravyn, get
+from ravyn.routing.router import HTTPHandler
+
+
+def make_root() -> Callable[[], int]:
+    # An injector is declared under a single key, each dependency has its own callable.
+    def root() -> int:
+        return 0
+
+    return root
+
+
+def make_link(previous: str) -> Callable[..., int]:
+    # The dependencies are resolved by the name of their parameters.
+    namespace: dict[str, Any] = {}
+    exec(f"def link({previous}: int) -> int:\n    return {previous} + 1", namespace)
+    return namespace["link"]
+
+
+def build_chain(depth: int) -> HTTPHandler:
+    dependencies = {"dependency_0": Inject(make_root())}
+    for level in range(1, depth):
+        dependencies[f"dependency_{level}"] = Inject(make_link(f"dependency_{level - 1}"))
+
+    # The handler requires the last dependency of the chain.
+    namespace: dict[str, Any] = {}
+    exec(
+        f"async def handler(dependency_{depth - 1}: int) -> int:\n"
+        f"    return dependency_{depth - 1}",
+        namespace,
+    )
+    return get("/", dependencies=dependencies)(namespace["handler"])
+
+
+def build_fan(width: int) -> HTTPHandler:
+    dependencies = {f"dependency_{index}": Inject(make_root()) for index in range(width)}
+    parameters = ", ".join(f"dependency_{index}: int" for index in range(width))
+    namespace: dict[str, Any] = {}
+    exec(f"async def handler({parameters}) -> int:\n    return {width}", namespace)
+    return get("/", dependencies=dependencies)(namespace["handler"])
+
+
+async def run(shape: str, size: int, number: int) -> dict[str, Any]:
+    handler = build_chain(size) if shape == "depth" else build_fan(size)
+    app = Ravyn(routes=[Gateway(handler=handler)])
+
+    status, body = await request(app)
+    assert status == 200, body
+    assert int(body) == (size - 1 if shape == "depth" else size)
+
+    return {
+        "benchmark": "dependencies",
+        "shape": shape,
+        "size": size,
+        "request_us": await measure(lambda: request(app), number),
+    }
+
+
+def main() -> None:
+    parser = create_parser(__doc__, number=1000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 10, 25])
+    parser.add_argument("--widths", type=int, nargs="+", default=[1, 5, 10, 25])
+    args = parser.parse_args()
+
+    for shape, sizes in (("depth", args.depths), ("width", args.widths)):
+        for size in sizes:
+            report(anyio.run(run, shape, size, args.number), args.json)
+
+
+if __name__ == "__main__":
+    main()
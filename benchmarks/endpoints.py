@@ -0,0 +1,195 @@
+"""
+Request handling benchmark.
+
+Sends requests through a Ravyn application, end to end: a minimal GET, the extraction
+of path, query and header parameters, Pydantic and msgspec request bodies, large JSON
+responses of dicts, Pydantic models and msgspec structs, and the error paths.
+
+    $ python benchmarks/endpoints.py
+    $ python benchmarks/endpoints.py --items 10 1000 --json
+"""
+
+import json
+from typing import Any
+
+import anyio
+from harness import create_parser, measure, report, request
+from pydantic import BaseModel
+
+from ravyn import Gateway, Header, Ravyn, get, post
+from ravyn.core.datastructures.msgspec import Struct
+from ravyn.exceptions import NotFound
+
+
+class ItemModel(BaseModel):
+    name: str
+    price: float
+    tags: list[str]
+
+
+class OrderModel(BaseModel):
+    id: int
+    customer: str
+    items: list[ItemModel]
+
+
+class ItemStruct(Struct):
+    name: str
+    price: float
+    tags: list[str]
+
+
+class OrderStruct(Struct):
+    id: int
+    customer: str
+    items: list[ItemStruct]
+
+
+def build_items(total: int) -> list[dict[str, Any]]:
+    return [
+        {"name": f"item-{index}", "price": index * 1.5, "tags": ["a", "b"]}
+        for index in range(total)
+    ]
+
+
+def build_app(total: int) -> Ravyn:
+    items = build_items(total)
+    models = [ItemModel(**item) for item in items]
+    structs = [ItemStruct(**item) for item in items]
+
+    @get("/")
+    async def hello() -> str:
+        return "Hello, world!"
+
+    @get("/users/{user_id:int}/items/{item_id}")
+    async def extraction(
+        user_id: int,
+        item_id: str,
+        q: str,
+        limit: int = 10,
+        token: str = Header(value="X-Token"),
+    ) -> dict[str, Any]:
+        return {"user_id": user_id, "item_id": item_id, "q": q, "limit": limit}
+
+    @post("/pydantic")
+    async def pydantic_body(data: OrderModel) -> int:
+        return len(data.items)
+
+    @post("/msgspec")
+    async def msgspec_body(data: OrderStruct) -> int:
+        return len(data.items)
+
+    @get("/json/dicts")
+    async def json_dicts() -> list[dict[str, Any]]:
+        return items
+
+    @get("/json/pydantic")
+    async def json_pydantic() -> list[ItemModel]:
+        return models
+
+    @get("/json/msgspec")
+    async def json_msgspec() -> list[ItemStruct]:
+        return structs
+
+    @get("/error")
+    async def error() -> None:
+        raise NotFound()
+
+    return Ravyn(
+        routes=[
+            Gateway(handler=handler)
+            for handler in (
+                hello,
+                extraction,
+                pydantic_body,
+                msgspec_body,
+                json_dicts,
+                json_pydantic,
+                json_msgspec,
+                error,
+            )
+        ]
+    )
+
+
+def build_cases(total: int) -> dict[str, tuple[dict[str, Any], int]]:
+    """
+    The requests per case, with the expected status.
+    """
+    body = json.dumps({"id": 1, "customer": "ravyn", "items": build_items(total)}).encode()
+    json_headers = [("content-type", "application/json")]
+    return {
+        "hello": ({"path": "/"}, 200),
+        "extraction": (
+            {
+                "path": "/users/1/items/abc",
+                "query_string": "q=search&limit=5",
+                "headers": [("X-Token", "secret")],
+            },
+            200,
+        ),
+        "pydantic_body": (
+            {"method": "POST", "path": "/pydantic", "headers": json_headers, "body": body},
+            201,
+        ),
+        "msgspec_body": (
+            {"method": "POST", "path": "/msgspec", "headers": json_headers, "body": body},
+            201,
+        ),
+        "json_dicts": ({"path": "/json/dicts"}, 200),
+        "json_pydantic": ({"path": "/json/pydantic"}, 200),
+        "json_msgspec": ({"path": "/json/msgspec"}, 200),
+        "not_found": ({"path": "/missing"}, 404),
+        "http_exception": ({"path": "/error"}, 404),
+        "validation_error": (
+            {
+                "path": "/users/1/items/abc",
+                "query_string": "q=search&limit=abc",
+                "headers": [("X-Token", "secret")],
+            },
+            400,
+        ),
+    }
+
+
+def is_sized(case: str) -> bool:
+    return case.endswith("_body") or case.startswith("json_")
+
+
+async def run(total: int, number: int, sized_only: bool = False) -> list[dict[str, Any]]:
+    app = build_app(total)
+    results = []
+    for case, (kwargs, expected) in build_cases(total).items():
+        if sized_only and not is_sized(case):
+            continue
+
+        status, body = await request(app, **kwargs)
+        assert status == expected, (case, status, body)
+
+        async def call(kwargs: dict[str, Any] = kwargs) -> None:
+            await request(app, **kwargs)
+
+        results.append(
+            {
+                "benchmark": "endpoints",
+                "case": case,
+                "items": total if is_sized(case) else 0,
+                "request_us": await measure(call, number),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = create_parser(__doc__, number=1000)
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 1000])
+    args = parser.parse_args()
+
+    for position, total in enumerate(args.items):
+        # The cases without items are measured with the first size only.
+        for result in anyio.run(run, total, args.number, position > 0):
+            report(result, args.json)
+
+
+if __name__ == "__main__":
+    main()
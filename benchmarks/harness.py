@@ -0,0 +1,142 @@
+"""
+Shared helpers of the benchmarks.
+
+The applications are driven directly through their ASGI interface, without a server
+or a network, and each call is timed with `perf_counter`: the best of `repeat` runs
+of `number` calls, per call.
+"""
+
+import argparse
+import json
+from collections.abc import Awaitable, Sequence
+from time import perf_counter
+from typing import Any, Callable
+
+from lilya.types import ASGIApp, Message
+
+Headers = Sequence[tuple[str, str]]
+
+
+def encode_headers(headers: Headers) -> list[tuple[bytes, bytes]]:
+    return [(b"host", b"testserver")] + [
+        (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+    ]
+
+
+def http_scope(
+    method: str = "GET", path: str = "/", query_string: str = "", headers: Headers = ()
+) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": query_string.encode("latin-1"),
+        "headers": encode_headers(headers),
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+
+
+def websocket_scope(path: str = "/", headers: Headers = ()) -> dict[str, Any]:
+    return {
+        "type": "websocket",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "scheme": "ws",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": encode_headers(headers),
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+        "subprotocols": [],
+    }
+
+
+async def request(
+    app: ASGIApp,
+    method: str = "GET",
+    path: str = "/",
+    query_string: str = "",
+    headers: Headers = (),
+    body: bytes = b"",
+) -> tuple[int, bytes]:
+    """
+    Sends a request to the application and returns the status and the body of the
+    response.
+    """
+    scope = http_scope(method, path, query_string, headers)
+    if body:
+        scope["headers"].append((b"content-length", str(len(body)).encode("latin-1")))
+    received = False
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]], number: int, repeat: int = 5, warmup: int = 10
+) -> float:
+    """
+    Returns the best time per call, in microseconds, of `repeat` runs of `number` calls.
+    """
+    for _ in range(warmup):
+        await call()
+
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        for _ in range(number):
+            await call()
+        timings.append(perf_counter() - started)
+    return min(timings) / number * 1e6
+
+
+def create_parser(description: str, number: int) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=description, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=number, help="Calls per run.")
+    parser.add_argument("--json", action="store_true", help="One JSON object per line.")
+    return parser
+
+
+def report(result: dict[str, Any], as_json: bool) -> None:
+    """
+    Prints a result, one JSON object per line with `as_json`. The floats are the
+    measures, the other values describe the case.
+    """
+    if as_json:
+        print(json.dumps(result))
+        return
+    case = "  ".join(
+        f"{key} {value}"
+        for key, value in result.items()
+        if key != "benchmark" and not isinstance(value, float)
+    )
+    measures = "  ".join(
+        f"{key} {value:.2f}" for key, value in result.items() if isinstance(value, float)
+    )
+    print(f"{result['benchmark']:<16} {case:<32} {measures}")
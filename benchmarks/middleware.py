@@ -0,0 +1,90 @@
+"""
+Middleware chain benchmark.
+
+Sends a "hello world" request through a Ravyn application with the default
+middleware stack and reports the time per request and the overhead of the chain.
+
+    $ python benchmarks/middleware.py
+    $ python benchmarks/middleware.py --iterations 20000 --json
+"""
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+import anyio
+
+from ravyn import Gateway, Ravyn, get
+from ravyn.utils.middleware import measure_middleware_overhead
+
+
+@get("/")
+async def hello() -> str:
+    return "Hello, world!"
+
+
+async def receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Any) -> None: ...
+
+
+def build_scope() -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+
+
+async def run(iterations: int) -> dict[str, Any]:
+    app = Ravyn(routes=[Gateway(handler=hello)])
+
+    for _ in range(100):
+        await app(build_scope(), receive, send)
+
+    started = perf_counter()
+    for _ in range(iterations):
+        await app(build_scope(), receive, send)
+    elapsed = perf_counter() - started
+
+    report = await measure_middleware_overhead(app, iterations=iterations)
+    return {
+        "benchmark": "middleware",
+        "iterations": iterations,
+        "request_us": elapsed / iterations * 1e6,
+        "middleware_overhead_us": report["overhead_us"],
+        "layers": report["layers"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+    args = parser.parse_args()
+
+    result = anyio.run(run, args.iterations)
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(
+            f"hello world  {result['request_us']:.2f}us/request  "
+            f"middleware {result['middleware_overhead_us']:.2f}us  "
+            f"layers: {' > '.join(result['layers'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
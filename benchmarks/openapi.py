@@ -0,0 +1,95 @@
+"""
+OpenAPI schema generation benchmark.
+
+Measures the generation of the schema of an application while the number of routes
+and the nesting depth of the includes grow: the first generation, a generation with
+nothing changed and a generation after adding a single route.
+
+    $ python benchmarks/openapi.py
+    $ python benchmarks/openapi.py --routes 50 200 --depths 1 5 --json
+"""
+
+import argparse
+import json
+import time
+import timeit
+from typing import Any
+
+from pydantic import BaseModel
+
+from ravyn import Gateway, Include, Ravyn, get, post
+from ravyn.openapi.openapi import _schema_caches
+
+
+def build_routes(total: int, depth: int) -> list[Any]:
+    routes: list[Any] = []
+    for index in range(total):
+        model = type(f"Item{index}", (BaseModel,), {"__annotations__": {"name": str}})
+
+        @post()
+        async def create(data: model) -> None: ...  # type: ignore[valid-type]
+
+        @get()
+        async def read(item_id: int, limit: int = 10) -> None: ...
+
+        routes.append(Gateway(f"/items-{index}", handler=create, name=f"create-{index}"))
+        routes.append(Gateway(f"/items-{index}/{{item_id}}", handler=read, name=f"read-{index}"))
+
+    for level in range(depth):
+        routes = [Include(f"/level-{level}", routes=routes)]
+    return routes
+
+
+def run(total: int, depth: int, number: int) -> dict[str, Any]:
+    app = Ravyn(routes=build_routes(total, depth), enable_openapi=True)
+    config = app.openapi_config
+
+    def cold() -> None:
+        _schema_caches.pop(app, None)
+        config.openapi(app)
+
+    cold_time = min(timeit.repeat(cold, number=number, repeat=3)) / number
+    warm_time = min(timeit.repeat(lambda: config.openapi(app), number=number, repeat=3)) / number
+
+    @get()
+    async def added() -> None: ...
+
+    app.add_route("/added", handler=added)
+    started_at = time.perf_counter()
+    schema = config.openapi(app)
+    added_time = time.perf_counter() - started_at
+    assert "/added" in schema["paths"]
+
+    return {
+        "benchmark": "openapi",
+        "routes": total * 2,
+        "depth": depth,
+        "cold_ms": cold_time * 1e3,
+        "cached_ms": warm_time * 1e3,
+        "added_route_ms": added_time * 1e3,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--routes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="One JSON object per line.")
+    args = parser.parse_args()
+
+    for total in args.routes:
+        for depth in args.depths:
+            result = run(total, depth, args.number)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print(
+                    f"{result['routes']:>6} routes  depth {result['depth']:>3}  "
+                    f"cold {result['cold_ms']:>9.2f}ms  cached {result['cached_ms']:>8.2f}ms  "
+                    f"added route {result['added_route_ms']:>8.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
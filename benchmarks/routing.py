@@ -0,0 +1,142 @@
+"""
+Route matching benchmark.
+
+Compares the linear scan of the routes with the compiled route matcher while the
+number of routes grows, matching the last declared route. The requests to the last
+route of applications of 1000 and 5000 routes, and to a route nested in a growing
+number of includes, are then sent end to end, with the default, compiled and flattened
+routing.
+
+    $ python benchmarks/routing.py
+    $ python benchmarks/routing.py --routes 100 500 1500 --json
+    $ python benchmarks/routing.py --app-routes 1000 --depths 1 10 --json
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+import anyio
+from harness import measure, report, request
+from lilya.enums import Match
+
+from ravyn import Gateway, Include, Ravyn, get
+from ravyn.routing.matcher import RouteMatcher
+
+MODES = {
+    "default": {},
+    "compiled": {"compiled_routing": True},
+    "flattened": {"flattened_routing": True},
+}
+
+
+def build_routes(total: int) -> list[Gateway]:
+    routes = []
+    for index in range(total):
+
+        @get()
+        async def handler() -> None: ...
+
+        if index % 2:
+            path = f"/resource-{index}/{{item_id:int}}"
+        else:
+            path = f"/resource-{index}/items"
+        routes.append(Gateway(path=path, handler=handler, name=f"route-{index}"))
+    return routes
+
+
+def linear_match(routes: list[Any], scope: dict) -> Any:
+    for route in routes:
+        match, _ = route.search(scope)
+        if match != Match.NONE:
+            return route
+    return None
+
+
+def compiled_match(matcher: RouteMatcher, scope: dict) -> Any:
+    return linear_match(matcher.get_candidates(scope["path"]), scope)
+
+
+def run(total: int, number: int) -> dict[str, Any]:
+    routes = build_routes(total)
+    matcher = RouteMatcher(routes)
+    scope = {"type": "http", "method": "GET", "path": last_path(total), "root_path": ""}
+
+    assert linear_match(routes, scope) is compiled_match(matcher, scope) is routes[-1]
+
+    linear = min(timeit.repeat(lambda: linear_match(routes, scope), number=number, repeat=5))
+    compiled = min(timeit.repeat(lambda: compiled_match(matcher, scope), number=number, repeat=5))
+    return {
+        "benchmark": "routing",
+        "routes": total,
+        "linear_us": linear / number * 1e6,
+        "compiled_us": compiled / number * 1e6,
+        "speedup": linear / compiled,
+    }
+
+
+def last_path(total: int) -> str:
+    last = total - 1
+    return f"/resource-{last}/10" if last % 2 else f"/resource-{last}/items"
+
+
+async def run_app(total: int, mode: str, number: int) -> dict[str, Any]:
+    app = Ravyn(routes=build_routes(total), **MODES[mode])
+    path = last_path(total)
+    status, _ = await request(app, path=path)
+    assert status == 200
+
+    return {
+        "benchmark": "routing_app",
+        "routes": total,
+        "mode": mode,
+        "request_us": await measure(lambda: request(app, path=path), number),
+    }
+
+
+async def run_nesting(depth: int, mode: str, number: int) -> dict[str, Any]:
+    routes: list[Any] = build_routes(10)
+    for level in range(depth):
+        routes = [Include(f"/level-{level}", routes=routes)]
+    app = Ravyn(routes=routes, **MODES[mode])
+    path = "".join(f"/level-{level}" for level in reversed(range(depth))) + last_path(10)
+    status, _ = await request(app, path=path)
+    assert status == 200
+
+    return {
+        "benchmark": "include_nesting",
+        "depth": depth,
+        "mode": mode,
+        "request_us": await measure(lambda: request(app, path=path), number),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--routes", type=int, nargs="+", default=[10, 100, 500, 1500])
+    parser.add_argument("--app-routes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="One JSON object per line.")
+    args = parser.parse_args()
+
+    for total in args.routes:
+        result = run(total, args.number)
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"{result['routes']:>6} routes  linear {result['linear_us']:>9.2f}us  "
+                f"compiled {result['compiled_us']:>7.2f}us  x{result['speedup']:.1f}"
+            )
+
+    for mode in MODES:
+        for total in args.app_routes:
+            report(anyio.run(run_app, total, mode, args.number), args.json)
+        for depth in args.depths:
+            report(anyio.run(run_nesting, depth, mode, args.number), args.json)
+
+
+if __name__ == "__main__":
+    main()
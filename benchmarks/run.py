@@ -0,0 +1,149 @@
+"""
+Runs the benchmarks and saves their results, to compare the runs.
+
+Each benchmark runs in its own interpreter, with `--json`, and its results are saved
+in a single JSON document with the Python, platform and Ravyn versions and the git
+commit of the run. With `--compare`, the results are compared with a previous run:
+the measures of the same cases are matched and the regressions above `--threshold`
+are reported, with a non-zero exit status.
+
+    $ python benchmarks/run.py --output baseline.json
+    $ python benchmarks/run.py --output current.json --compare baseline.json
+    $ python benchmarks/run.py --quick --only routing endpoints
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+DIRECTORY = Path(__file__).parent
+
+# The arguments of each benchmark with `--quick`, a short run checking that they work.
+BENCHMARKS: dict[str, list[str]] = {
+    "routing": ["--routes", "10", "100", "--app-routes", "100", "--depths", "1", "3"],
+    "middleware": ["--iterations", "200"],
+    "endpoints": ["--items", "10", "100"],
+    "dependencies": ["--depths", "1", "5", "--widths", "1", "5"],
+    "websocket_echo": ["--messages", "1", "10"],
+    "openapi": ["--routes", "10", "--depths", "1", "3", "--number", "1"],
+    "startup": ["--routes", "10", "100", "--number", "1"],
+}
+QUICK_NUMBER = ["--number", "20"]
+
+
+def run_benchmark(name: str, quick: bool) -> list[dict[str, Any]]:
+    command = [sys.executable, str(DIRECTORY / f"{name}.py"), "--json"]
+    if quick:
+        arguments = BENCHMARKS[name]
+        command.extend(arguments)
+        if "--number" not in arguments and name != "middleware":
+            command.extend(QUICK_NUMBER)
+
+    output = subprocess.run(command, check=True, capture_output=True, text=True, cwd=DIRECTORY)
+    return [json.loads(line) for line in output.stdout.splitlines() if line.startswith("{")]
+
+
+def get_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=DIRECTORY
+        )
+    except OSError:
+        return None
+    return output.stdout.strip() or None
+
+
+def get_metadata(quick: bool) -> dict[str, Any]:
+    import ravyn
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "ravyn": ravyn.__version__,
+        "commit": get_commit(),
+        "quick": quick,
+    }
+
+
+def get_key(result: dict[str, Any]) -> str:
+    """
+    The case of a result: its values other than the measures, which are the floats.
+    """
+    return json.dumps(
+        {key: value for key, value in result.items() if not isinstance(value, float)},
+        sort_keys=True,
+    )
+
+
+def compare(
+    baseline: list[dict[str, Any]], results: list[dict[str, Any]], threshold: float
+) -> int:
+    """
+    Prints the ratio of each measure to the baseline and returns the number of
+    regressions, the measures slower than the baseline by more than `threshold`.
+
+    The measures are times, except the speedups, where higher is better.
+    """
+    previous = {get_key(result): result for result in baseline}
+    regressions = 0
+    for result in results:
+        matched = previous.get(get_key(result))
+        if matched is None:
+            continue
+        for key, value in result.items():
+            if not isinstance(value, float) or not matched.get(key):
+                continue
+            ratio = value / matched[key]
+            slower = ratio < 1 / (1 + threshold) if key == "speedup" else ratio > 1 + threshold
+            regressions += slower
+            case = ", ".join(
+                f"{name}={case}"
+                for name, case in result.items()
+                if name != "benchmark" and not isinstance(case, (float, list))
+            )
+            print(
+                f"{'REGRESSION' if slower else 'ok':<10} {result['benchmark']} [{case}] "
+                f"{key} {matched[key]:.2f} -> {value:.2f} (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--quick", action="store_true", help="Short runs, as a smoke test.")
+    parser.add_argument("--output", type=Path, help="The JSON file of the results.")
+    parser.add_argument("--compare", type=Path, help="The JSON file of a previous run.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Default: 10%%.")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.only:
+        print(f"Running {name}...", file=sys.stderr)
+        results.extend(run_benchmark(name, args.quick))
+
+    document = {"metadata": get_metadata(args.quick), "results": results}
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2))
+    else:
+        print(json.dumps(document, indent=2))
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"{regressions} regression(s) above {args.threshold:.0%}.", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
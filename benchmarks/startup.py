@@ -0,0 +1,99 @@
+"""
+Cold start benchmark.
+
+Measures the import of Ravyn in a new interpreter and, while the number of routes
+grows, the declaration of the routes, the creation of the application, its lifespan
+startup and its first request.
+
+    $ python benchmarks/startup.py
+    $ python benchmarks/startup.py --routes 10 1000 5000 --json
+"""
+
+import subprocess
+import sys
+from time import perf_counter
+from typing import Any
+
+import anyio
+from harness import create_parser, report, request
+from lilya.types import Message
+from routing import build_routes, last_path
+
+from ravyn import Ravyn
+
+
+def run_import(repeat: int) -> dict[str, Any]:
+    def spawn(code: str) -> float:
+        started = perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        return perf_counter() - started
+
+    interpreter = min(spawn("pass") for _ in range(repeat))
+    imported = min(spawn("import ravyn; ravyn.Ravyn") for _ in range(repeat))
+    return {
+        "benchmark": "startup_import",
+        "import_ms": (imported - interpreter) * 1e3,
+    }
+
+
+async def cold_start(total: int) -> dict[str, float]:
+    started_up = anyio.Event()
+    shutdown = anyio.Event()
+    messages = [{"type": "lifespan.startup"}]
+
+    async def receive() -> Message:
+        if messages:
+            return messages.pop()
+        await shutdown.wait()
+        return {"type": "lifespan.shutdown"}
+
+    async def send(message: Message) -> None:
+        assert message["type"].endswith(".complete"), message
+        if message["type"] == "lifespan.startup.complete":
+            started_up.set()
+
+    started = perf_counter()
+    routes = build_routes(total)
+    declared = perf_counter()
+    app = Ravyn(routes=routes)
+    created = perf_counter()
+
+    async with anyio.create_task_group() as group:
+        group.start_soon(app, {"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+        await started_up.wait()
+        ready = perf_counter()
+        status, _ = await request(app, path=last_path(total))
+        responded = perf_counter()
+        shutdown.set()
+    assert status == 200
+
+    return {
+        "routes_ms": (declared - started) * 1e3,
+        "app_ms": (created - declared) * 1e3,
+        "lifespan_ms": (ready - created) * 1e3,
+        "first_request_ms": (responded - ready) * 1e3,
+    }
+
+
+def run(total: int, repeat: int) -> dict[str, Any]:
+    runs = [anyio.run(cold_start, total) for _ in range(repeat)]
+    return {
+        "benchmark": "startup",
+        "routes": total,
+        **{key: min(timings[key] for timings in runs) for key in runs[0]},
+    }
+
+
+def main() -> None:
+    parser = create_parser(__doc__, number=3)
+    parser.add_argument("--routes", type=int, nargs="+", default=[10, 1000, 5000])
+    args = parser.parse_args()
+
+    # For the cold starts, `--number` is the number of runs, the best one is kept.
+    report(run_import(args.number), args.json)
+    for total in args.routes:
+        report(run(total, args.number), args.json)
+
+
+if __name__ == "__main__":
+    main()
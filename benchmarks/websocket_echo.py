@@ -0,0 +1,72 @@
+"""
+WebSocket echo benchmark.
+
+Opens connections to an echo handler and sends a number of text messages on each one:
+the time per connection, handshake and close included, and per message.
+
+    $ python benchmarks/websocket_echo.py
+    $ python benchmarks/websocket_echo.py --messages 1 100 --json
+"""
+
+from typing import Any
+
+import anyio
+from harness import create_parser, measure, report, websocket_scope
+from lilya.types import ASGIApp, Message
+
+from ravyn import Ravyn, WebSocket, WebSocketGateway, websocket
+
+
+@websocket("/echo")
+async def echo(socket: WebSocket) -> None:
+    await socket.accept()
+    async for text in socket.iter_text():
+        await socket.send_text(text)
+
+
+async def session(app: ASGIApp, messages: int) -> int:
+    """
+    Connects, sends the messages, disconnects and returns the number of echoes.
+    """
+    incoming: list[Message] = [{"type": "websocket.connect"}]
+    incoming.extend({"type": "websocket.receive", "text": "ravyn"} for _ in range(messages))
+    incoming.append({"type": "websocket.disconnect", "code": 1000})
+    incoming.reverse()
+    echoes = 0
+
+    async def receive() -> Message:
+        return incoming.pop()
+
+    async def send(message: Message) -> None:
+        nonlocal echoes
+        if message["type"] == "websocket.send":
+            echoes += 1
+
+    await app(websocket_scope("/echo"), receive, send)
+    return echoes
+
+
+async def run(messages: int, number: int) -> dict[str, Any]:
+    app = Ravyn(routes=[WebSocketGateway(handler=echo)])
+    assert await session(app, messages) == messages
+
+    connection = await measure(lambda: session(app, messages), number)
+    return {
+        "benchmark": "websocket",
+        "messages": messages,
+        "connection_us": connection,
+        "message_us": connection / max(messages, 1),
+    }
+
+
+def main() -> None:
+    parser = create_parser(__doc__, number=500)
+    parser.add_argument("--messages", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    for messages in args.messages:
+        report(anyio.run(run, messages, args.number), args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+from ravyn import Ravyn
+from ravyn.core.config import CompressionConfig
+
+compression_config = CompressionConfig(
+    encodings=["br", "gzip"],
+    minimum_size=1024,
+    cache_size=256,
+)
+
+app = Ravyn(compression_config=compression_config)
@@ -0,0 +1,11 @@
+from ravyn import RavynSettings
+from ravyn.core.config import CompressionConfig
+
+
+class CustomSettings(RavynSettings):
+    @property
+    def compression_config(self) -> CompressionConfig:
+        return CompressionConfig(
+            encodings=["zstd", "br", "gzip"],
+            max_decompressed_size=1024 * 1024,
+        )
@@ -0,0 +1,13 @@
+from ravyn import Gateway, Include, Ravyn, get
+from ravyn.core.config import MetricsConfig
+
+
+@get("/items/{item_id:int}")
+async def read_item(item_id: int) -> dict[str, int]:
+    return {"item_id": item_id}
+
+
+app = Ravyn(
+    routes=[Include("/api", routes=[Gateway(handler=read_item)])],
+    metrics_config=MetricsConfig(path="/metrics"),
+)
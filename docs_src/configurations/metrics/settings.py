@@ -0,0 +1,8 @@
+from ravyn import RavynSettings
+from ravyn.core.config import MetricsConfig
+
+
+class CustomSettings(RavynSettings):
+    @property
+    def metrics_config(self) -> MetricsConfig:
+        return MetricsConfig(path="/internal/metrics", buckets=(0.01, 0.1, 1.0))
@@ -0,0 +1,14 @@
+from ravyn import Gateway, Include, Ravyn, get
+from ravyn.core.config import ProfilingConfig
+
+
+@get("/items/{item_id:int}")
+async def read_item(item_id: int) -> dict[str, int]:
+    return {"item_id": item_id}
+
+
+app = Ravyn(
+    routes=[Include("/api", routes=[Gateway(handler=read_item)])],
+    debug=True,
+    profiling_config=ProfilingConfig(threshold_ms=200, buffer_size=50),
+)
@@ -0,0 +1,8 @@
+from ravyn import RavynSettings
+from ravyn.core.config import ProfilingConfig
+
+
+class CustomSettings(RavynSettings):
+    @property
+    def profiling_config(self) -> ProfilingConfig:
+        return ProfilingConfig(threshold_ms=500, stack_sampling=True)
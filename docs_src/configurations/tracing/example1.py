@@ -0,0 +1,21 @@
+from ravyn import Gateway, Inject, Injects, Ravyn, get
+from ravyn.core.config import TracingConfig
+from ravyn.core.tracing import InMemorySpanExporter, get_tracer
+
+
+def get_repository() -> dict[int, str]:
+    return {1: "book"}
+
+
+@get("/items/{item_id:int}", dependencies={"repository": Inject(get_repository)})
+async def read_item(item_id: int, repository: dict[int, str] = Injects()) -> dict[str, str]:
+    with get_tracer().start_as_current_span("lookup", {"item.id": item_id}):
+        return {"item": repository[item_id]}
+
+
+exporter = InMemorySpanExporter()
+
+app = Ravyn(
+    routes=[Gateway(handler=read_item)],
+    tracing_config=TracingConfig(exporter=exporter),
+)
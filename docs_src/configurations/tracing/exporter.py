@@ -0,0 +1,13 @@
+import json
+import logging
+from collections.abc import Sequence
+
+from ravyn.core.tracing import Span, SpanExporter
+
+logger = logging.getLogger("traces")
+
+
+class LoggingSpanExporter(SpanExporter):
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            logger.info(json.dumps(span.as_dict()))
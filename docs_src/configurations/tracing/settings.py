@@ -0,0 +1,9 @@
+from ravyn import RavynSettings
+from ravyn.core.config import TracingConfig
+from ravyn.core.tracing import InMemorySpanExporter
+
+
+class CustomSettings(RavynSettings):
+    @property
+    def tracing_config(self) -> TracingConfig:
+        return TracingConfig(exporter=InMemorySpanExporter(), service_name="catalog")
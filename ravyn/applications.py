@@ -1,5 +1,5 @@
 import warnings
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from contextlib import asynccontextmanager
 from datetime import timezone as dtimezone
 from inspect import isclass
@@ -27,17 +27,26 @@ from ravyn.conf import (
 )
 from ravyn.conf.global_settings import RavynSettings
 from ravyn.contrib.schedulers.base import SchedulerConfig
+from ravyn.core.background import BackgroundExecutor
 from ravyn.core.config import (
+    BackgroundTaskConfig,
+    CompressionConfig,
     CORSConfig,
     CSRFConfig,
     LoggingConfig,
+    MetricsConfig,
     OpenAPIConfig,
+    ProfilingConfig,
     SessionConfig,
     StaticFilesConfig,
+    TracingConfig,
 )
 from ravyn.core.datastructures import State
 from ravyn.core.interceptors.types import Interceptor
+from ravyn.core.metrics import RavynMetrics
+from ravyn.core.profiling import Profiler
 from ravyn.core.protocols.template import TemplateEngineProtocol
+from ravyn.core.tracing import NO_OP_TRACER, Tracer
 from ravyn.encoders import (
     Encoder,
     MsgSpecEncoder,
@@ -51,12 +60,16 @@ from ravyn.exception_handlers import (
 )
 from ravyn.exceptions import ImproperlyConfigured, ValidationErrorException
 from ravyn.middleware.asyncexitstack import AsyncExitStackMiddleware
+from ravyn.middleware.compression import CompressionMiddleware
 from ravyn.middleware.cors import CORSMiddleware
 from ravyn.middleware.csrf import CSRFMiddleware
 from ravyn.middleware.exceptions import (
     ExceptionMiddleware,
     RavynAPIException,
 )
+from ravyn.middleware.metrics import MetricsMiddleware
+from ravyn.middleware.profiling import ProfilingMiddleware
+from ravyn.middleware.tracing import TracingMiddleware
 from ravyn.middleware.trustedhost import TrustedHostMiddleware
 from ravyn.openapi.schemas.v3_1_0 import Contact, License, SecurityScheme
 from ravyn.openapi.schemas.v3_1_0.open_api import OpenAPI
@@ -144,6 +157,8 @@ class Application(BaseLilya):
         "permissions",
         "extensions",
         "redirect_slashes",
+        "compiled_routing",
+        "flattened_routing",
         "response_class",
         "response_cookies",
         "response_headers",
@@ -165,6 +180,15 @@ class Application(BaseLilya):
         "before_request",
         "after_request",
         "logging_config",
+        "background_config",
+        "background_executor",
+        "compression_config",
+        "metrics_config",
+        "metrics",
+        "profiling_config",
+        "profiler",
+        "tracing_config",
+        "tracer",
     )
     settings_module: Optional[RavynSettings]
 
@@ -957,6 +981,114 @@ class Application(BaseLilya):
                 """
             ),
         ] = None,
+        background_config: Annotated[
+            Optional["BackgroundTaskConfig"],
+            Doc(
+                """
+                An instance of `BackgroundTaskConfig`.
+
+                When declared, the background tasks of the responses are handed over to
+                an application level executor with a bounded pool of workers, a bounded
+                queue, optional spill to SQLite and per task timeouts, started and drained
+                by the application lifespan.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+                from ravyn.core.config import BackgroundTaskConfig
+
+                app = Ravyn(background_config=BackgroundTaskConfig(workers=4, timeout=30))
+                ```
+                """
+            ),
+        ] = None,
+        compression_config: Annotated[
+            Optional["CompressionConfig"],
+            Doc(
+                """
+                An instance of `CompressionConfig`.
+
+                When declared, the responses are compressed with the `zstd`, `br` or `gzip`
+                encoding negotiated from the `Accept-Encoding` of the request and the
+                compressed request bodies are decompressed.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+                from ravyn.core.config import CompressionConfig
+
+                app = Ravyn(compression_config=CompressionConfig(minimum_size=1024))
+                ```
+                """
+            ),
+        ] = None,
+        metrics_config: Annotated[
+            Optional["MetricsConfig"],
+            Doc(
+                """
+                An instance of `MetricsConfig`.
+
+                When declared, the requests are measured per route template, with the
+                duration of each of their phases, and the metrics are served in the
+                Prometheus text format. Nothing is measured without it.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+                from ravyn.core.config import MetricsConfig
+
+                app = Ravyn(metrics_config=MetricsConfig(path="/metrics"))
+                ```
+                """
+            ),
+        ] = None,
+        profiling_config: Annotated[
+            Optional["ProfilingConfig"],
+            Doc(
+                """
+                An instance of `ProfilingConfig`.
+
+                When declared, each request is timed phase by phase and the requests
+                slower than the threshold are kept, with their timing tree, in a ring
+                buffer served on a debug only endpoint. Nothing is measured without it.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+                from ravyn.core.config import ProfilingConfig
+
+                app = Ravyn(debug=True, profiling_config=ProfilingConfig(threshold_ms=200))
+                ```
+                """
+            ),
+        ] = None,
+        tracing_config: Annotated[
+            Optional["TracingConfig"],
+            Doc(
+                """
+                An instance of `TracingConfig`.
+
+                When declared with an exporter or a tracer, each request is traced with a
+                span per interceptor, permission, dependency, validation, handler,
+                serialization and background task. The tracer is the `NoOpTracer` without
+                it and nothing is traced.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+                from ravyn.core.config import TracingConfig
+                from ravyn.core.tracing import InMemorySpanExporter
+
+                app = Ravyn(tracing_config=TracingConfig(exporter=InMemorySpanExporter()))
+                ```
+                """
+            ),
+        ] = None,
         timezone: Annotated[
             Optional[Union[dtimezone, str]],
             Doc(
@@ -1450,6 +1582,54 @@ class Application(BaseLilya):
                 """
             ),
         ] = None,
+        compiled_routing: Annotated[
+            Optional[bool],
+            Doc(
+                """
+                Boolean flag enabling the compiled route matcher for the application
+                router and the routers of its `Include`.
+
+                The fully static paths are resolved with a dictionary lookup and the
+                others walk a radix tree of static segments and typed parameters,
+                instead of testing every route in order. The precedence of the routes
+                is the same.
+
+                **Example**
+
+                ```python
+                from ravyn import Ravyn
+
+                app = Ravyn(routes=[...], compiled_routing=True)
+                ```
+                """
+            ),
+        ] = None,
+        flattened_routing: Annotated[
+            Optional[bool],
+            Doc(
+                """
+                Boolean flag compiling, once, the routes of the nested `Include` into a
+                single table of the application router. Implies `compiled_routing`.
+
+                A request no longer goes through the router of every `Include` level.
+                The middleware, permissions, interceptors, exception handlers and request
+                hooks of the `Include` are applied to each of their routes, and the
+                `Include` mounting an application are kept as a level. `path_for` and
+                `url_for` keep working the same.
+
+                **Example**
+
+                ```python
+                from ravyn import Include, Ravyn
+
+                app = Ravyn(
+                    routes=[Include("/api", routes=[Include("/v1", routes=[...])])],
+                    flattened_routing=True,
+                )
+                ```
+                """
+            ),
+        ] = None,
         extensions: Annotated[
             Optional[dict[str, Union[Extension, Pluggable, type[Extension], str]]],
             Doc(
@@ -1617,6 +1797,30 @@ class Application(BaseLilya):
         self.scheduler_config: "SchedulerConfig" = self.load_settings_value(
             "scheduler_config", scheduler_config
         )
+        self.background_config: Optional[BackgroundTaskConfig] = self.load_settings_value(
+            "background_config", background_config
+        )
+        self.compression_config: Optional[CompressionConfig] = self.load_settings_value(
+            "compression_config", compression_config
+        )
+        self.metrics_config: Optional[MetricsConfig] = self.load_settings_value(
+            "metrics_config", metrics_config
+        )
+        self.metrics: Optional[RavynMetrics] = (
+            RavynMetrics(self.metrics_config) if self.metrics_config else None
+        )
+        self.profiling_config: Optional[ProfilingConfig] = self.load_settings_value(
+            "profiling_config", profiling_config
+        )
+        self.profiler: Optional[Profiler] = (
+            Profiler(self.profiling_config) if self.profiling_config else None
+        )
+        self.tracing_config: Optional[TracingConfig] = self.load_settings_value(
+            "tracing_config", tracing_config
+        )
+        self.tracer: Tracer = (
+            self.tracing_config.get_tracer() if self.tracing_config else NO_OP_TRACER
+        )
         self.timezone = self.load_settings_value("timezone", timezone)
         self.root_path = self.load_settings_value("root_path", root_path)
         self._middleware = self.load_settings_value("middleware", middleware) or []
@@ -1636,6 +1840,12 @@ class Application(BaseLilya):
         self.redirect_slashes = self.load_settings_value(
             "redirect_slashes", redirect_slashes, is_boolean=True
         )
+        self.compiled_routing = self.load_settings_value(
+            "compiled_routing", compiled_routing, is_boolean=True
+        )
+        self.flattened_routing = self.load_settings_value(
+            "flattened_routing", flattened_routing, is_boolean=True
+        )
 
         # OpenAPI Related
         self.root_path_in_servers = self.load_settings_value(
@@ -1680,6 +1890,13 @@ class Application(BaseLilya):
         if self.enable_scheduler:
             self.activate_scheduler()
 
+        if self.tracer.enabled:
+            self.activate_tracing()
+
+        self.background_executor: Optional[BackgroundExecutor] = None
+        if self.background_config is not None:
+            self.activate_background_executor()
+
         # Handle permissions
         self.__base_permissions__ = permissions or []
         self.__lilya_permissions__ = [
@@ -1716,6 +1933,8 @@ class Application(BaseLilya):
             before_request=self.before_request_callbacks,
             after_request=self.after_request_callbacks,
         )
+        if self.compiled_routing or self.flattened_routing:
+            self.router.enable_route_matcher(flatten=self.flattened_routing)
         self.get_default_exception_handlers()
         if self.register_as_global_instance:
             monkay.set_instance(self)
@@ -1846,29 +2065,60 @@ class Application(BaseLilya):
                 "It cannot start the scheduler if there is no scheduler_config declared."
             )
 
+        self.add_lifespan_hooks(self.scheduler_config.start, self.scheduler_config.shutdown)
+
+    def activate_tracing(self) -> None:
+        """
+        Traces the runs of the scheduler tasks with the tracer of the `tracing_config`,
+        when the scheduler executor supports it.
+        """
+        executor = getattr(self.scheduler_config, "executor", None)
+        if executor is not None and hasattr(executor, "tracer"):
+            executor.tracer = self.tracer
+            add_executor = getattr(self.scheduler_config, "add_executor", None)
+            if add_executor is not None:
+                add_executor()
+
+    def activate_background_executor(self) -> None:
+        """
+        Creates the background executor from the `background_config` and makes sure
+        it is started and drained with the application.
+        """
+        self.background_executor = BackgroundExecutor(self.background_config)
+        self.add_lifespan_hooks(self.background_executor.start, self.background_executor.shutdown)
+
+    def add_lifespan_hooks(
+        self,
+        start: Callable[[], Awaitable[Any]],
+        shutdown: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Runs the `start` and `shutdown` with the application, wrapping the `lifespan`
+        when declared or adding them to the `on_startup` and `on_shutdown` otherwise.
+        """
         if self.lifespan is not None:
             original_lifespan = self.lifespan
 
             @asynccontextmanager
             async def wrapped_lifespan(app: Ravyn) -> Any:
-                # Wraps the original lifespan to include the scheduler start and shutdown.
-                await self.scheduler_config.start()
+                # Wraps the original lifespan to include the start and shutdown.
+                await start()
                 async with original_lifespan(app):
                     yield
-                await self.scheduler_config.shutdown()
+                await shutdown()
 
             self.lifespan = wrapped_lifespan
 
         else:
             if self.on_startup is not None:
-                self.on_startup.append(self.scheduler_config.start)
+                self.on_startup.append(start)
             else:
-                self.on_startup = [self.scheduler_config.start]
+                self.on_startup = [start]
 
             if self.on_shutdown is not None:
-                self.on_shutdown.append(self.scheduler_config.shutdown)
+                self.on_shutdown.append(shutdown)
             else:
-                self.on_shutdown = [self.scheduler_config.shutdown]
+                self.on_shutdown = [shutdown]
 
     def get_settings_value(
         self,
@@ -1969,6 +2219,7 @@ class Application(BaseLilya):
             template_config.directory,
             env=template_config.env,
             **template_config.env_options,
+            **template_config.get_cache_options(),
         )
         return engine
 
@@ -2377,6 +2628,7 @@ class Application(BaseLilya):
         ```
         """
         self.router.routes.append(include)
+        self.router.invalidate_route_matcher()
 
         for route in include.routes:
             self.router.create_signature_models(route)
@@ -2446,6 +2698,7 @@ class Application(BaseLilya):
                 after_request=after_request,
             )
         )
+        self.router.invalidate_route_matcher()
         self.activate_openapi()
 
     def add_router(
@@ -2530,6 +2783,7 @@ class Application(BaseLilya):
                 )
             )
 
+        self.router.invalidate_route_matcher()
         self.activate_openapi()
 
     def get_default_exception_handlers(self) -> None:
@@ -2594,12 +2848,29 @@ class Application(BaseLilya):
 
         It evaluates the middleware passed into the routes from bottom up
         """
-        user_middleware = []
+        user_middleware: list[DefineMiddleware] = []
 
+        if self.profiler is not None:
+            user_middleware.append(DefineMiddleware(ProfilingMiddleware, profiler=self.profiler))
+        if self.tracer.enabled:
+            user_middleware.append(
+                DefineMiddleware(
+                    TracingMiddleware,
+                    tracer=self.tracer,
+                    propagate=self.tracing_config.propagate,
+                    trace_background=self.tracing_config.trace_background,
+                )
+            )
+        if self.metrics is not None:
+            user_middleware.append(DefineMiddleware(MetricsMiddleware, metrics=self.metrics))
         if self.allowed_hosts:
             user_middleware.append(
                 DefineMiddleware(TrustedHostMiddleware, allowed_hosts=self.allowed_hosts)
             )
+        if self.compression_config:
+            user_middleware.append(
+                DefineMiddleware(CompressionMiddleware, config=self.compression_config)
+            )
         if self.cors_config:
             user_middleware.append(
                 DefineMiddleware(CORSMiddleware, **self.cors_config.model_dump())
@@ -2621,10 +2892,10 @@ class Application(BaseLilya):
             if isinstance(middleware, DefineMiddleware):
                 user_middleware.append(middleware)
             else:
-                user_middleware.append(DefineMiddleware(middleware))  # type: ignore
+                user_middleware.append(DefineMiddleware(middleware))
         return user_middleware
 
-    def build_middleware_stack(self) -> "ASGIApp":
+    def build_middleware_stack(self, app: Optional["ASGIApp"] = None) -> "ASGIApp":
         """
         Ravyn uses the [ravyn.core.protocols.MiddlewareProtocol] (interfaces) and therefore we
         wrap the DefineMiddleware in a slighly different manner.
@@ -2637,6 +2908,9 @@ class Application(BaseLilya):
 
         For APIViews, since it's a "wrapper", the handler will update the current list to contain
         both.
+
+        Without user middleware, nothing runs between the `RavynAPIException` and the
+        `ExceptionMiddleware`, so both are merged into a single exception layer.
         """
         debug = self.debug
         error_handler = None
@@ -2651,31 +2925,50 @@ class Application(BaseLilya):
         for route in self.routes or []:
             exception_handlers.update(self.build_routes_exception_handlers(route))
 
-        middleware = (
-            [
-                DefineMiddleware(
-                    RavynAPIException,
-                    exception_handlers=exception_handlers,
-                    error_handler=error_handler,
-                    debug=debug,
-                ),
-            ]
-            + self.user_middleware
-            + [
+        app = app or self.router
+        async_exit_stack = DefineMiddleware(
+            AsyncExitStackMiddleware,
+            config=self.async_exit_config,
+            debug=debug,
+        )
+
+        if not self.user_middleware:
+            fallback = RavynAPIException(
+                app=app,
+                exception_handlers=exception_handlers,
+                error_handler=error_handler,
+                debug=debug,
+            )
+            middleware = [
                 DefineMiddleware(
                     ExceptionMiddleware,
                     handlers=exception_handlers,
                     debug=debug,
+                    fallback=fallback.handle_exception,
                 ),
-                DefineMiddleware(
-                    AsyncExitStackMiddleware,
-                    config=self.async_exit_config,
-                    debug=debug,
-                ),
+                async_exit_stack,
             ]
-        )
+        else:
+            middleware = (
+                [
+                    DefineMiddleware(
+                        RavynAPIException,
+                        exception_handlers=exception_handlers,
+                        error_handler=error_handler,
+                        debug=debug,
+                    ),
+                ]
+                + self.user_middleware
+                + [
+                    DefineMiddleware(
+                        ExceptionMiddleware,
+                        handlers=exception_handlers,
+                        debug=debug,
+                    ),
+                    async_exit_stack,
+                ]
+            )
 
-        app: "ASGIApp" = self.router
         for cls, args, kwargs in reversed(middleware):
             app = cls(app=app, *args, **kwargs)  # noqa
         return app
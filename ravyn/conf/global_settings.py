@@ -10,12 +10,17 @@ from ravyn import __version__  # noqa
 from ravyn.conf.enums import EnvironmentType
 from ravyn.core.caches.memory import InMemoryCache
 from ravyn.core.config import (
+    BackgroundTaskConfig,
+    CompressionConfig,
     CORSConfig,
     CSRFConfig,
     LoggingConfig,
+    MetricsConfig,
     OpenAPIConfig,
+    ProfilingConfig,
     SessionConfig,
     StaticFilesConfig,
+    TracingConfig,
 )
 from ravyn.core.config.asyncexit import AsyncExitConfig
 from ravyn.core.datastructures import Secret
@@ -466,6 +471,28 @@ class RavynSettings(CacheBackendSettings):
             """
         ),
     ] = True
+    compiled_routing: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag enabling the compiled route matcher. The static paths are
+            resolved with a dictionary lookup and the others with a radix tree instead
+            of testing every route in order. Useful for applications with large route
+            tables.
+            """
+        ),
+    ] = False
+    flattened_routing: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag compiling the routes of the nested `Include` into a single
+            table of the application router, implying `compiled_routing`. The
+            middleware, permissions and interceptors of the `Include` are applied to
+            each of their routes.
+            """
+        ),
+    ] = False
     x_frame_options: Annotated[
         Union[str, None],
         Doc(
@@ -1221,6 +1248,146 @@ class RavynSettings(CacheBackendSettings):
         """
         return None
 
+    @property
+    def background_config(self) -> Optional[BackgroundTaskConfig]:
+        """
+        An instance of `BackgroundTaskConfig`.
+
+        When declared, the background tasks of the responses are handed over to an
+        application level executor with a bounded pool of workers and a bounded queue
+        instead of running inline at the end of the request.
+
+        Default:
+            None
+
+        **Example**
+
+        ```python
+        from ravyn import RavynSettings
+        from ravyn.core.config import BackgroundTaskConfig
+
+
+        class AppSettings(RavynSettings):
+
+            @property
+            def background_config(self) -> BackgroundTaskConfig:
+                return BackgroundTaskConfig(workers=4, timeout=30)
+        ```
+        """
+        return None
+
+    @property
+    def compression_config(self) -> Optional[CompressionConfig]:
+        """
+        An instance of `CompressionConfig`.
+
+        When declared, the responses are compressed with the `zstd`, `br` or `gzip`
+        encoding negotiated from the `Accept-Encoding` of the request and the compressed
+        request bodies are decompressed.
+
+        Default:
+            None
+
+        **Example**
+
+        ```python
+        from ravyn import RavynSettings
+        from ravyn.core.config import CompressionConfig
+
+
+        class AppSettings(RavynSettings):
+
+            @property
+            def compression_config(self) -> CompressionConfig:
+                return CompressionConfig(encodings=["br", "gzip"], minimum_size=1024)
+        ```
+        """
+        return None
+
+    @property
+    def metrics_config(self) -> Optional[MetricsConfig]:
+        """
+        An instance of `MetricsConfig`.
+
+        When declared, the requests are measured per route template, with the duration of
+        each of their phases, and the metrics are served in the Prometheus text format.
+
+        Default:
+            None
+
+        **Example**
+
+        ```python
+        from ravyn import RavynSettings
+        from ravyn.core.config import MetricsConfig
+
+
+        class AppSettings(RavynSettings):
+
+            @property
+            def metrics_config(self) -> MetricsConfig:
+                return MetricsConfig(path="/metrics")
+        ```
+        """
+        return None
+
+    @property
+    def profiling_config(self) -> Optional[ProfilingConfig]:
+        """
+        An instance of `ProfilingConfig`.
+
+        When declared, each request is timed phase by phase and the requests slower than
+        the threshold are kept, with their timing tree, in a ring buffer served on a debug
+        only endpoint.
+
+        Default:
+            None
+
+        **Example**
+
+        ```python
+        from ravyn import RavynSettings
+        from ravyn.core.config import ProfilingConfig
+
+
+        class AppSettings(RavynSettings):
+
+            @property
+            def profiling_config(self) -> ProfilingConfig:
+                return ProfilingConfig(threshold_ms=200)
+        ```
+        """
+        return None
+
+    @property
+    def tracing_config(self) -> Optional[TracingConfig]:
+        """
+        An instance of `TracingConfig`.
+
+        When declared with an exporter or a tracer, each request is traced with a span per
+        interceptor, permission, dependency, validation, handler, serialization and
+        background task.
+
+        Default:
+            None
+
+        **Example**
+
+        ```python
+        from ravyn import RavynSettings
+        from ravyn.core.config import TracingConfig
+        from ravyn.core.tracing import InMemorySpanExporter
+
+
+        class AppSettings(RavynSettings):
+
+            @property
+            def tracing_config(self) -> TracingConfig:
+                return TracingConfig(exporter=InMemorySpanExporter())
+        ```
+        """
+        return None
+
     @property
     def interceptors(self) -> list[Interceptor]:
         """
@@ -1,4 +1,4 @@
-from typing import TypeVar
+from typing import Any, Optional, TypeVar
 
 from jwt.exceptions import PyJWTError
 from lilya._internal._connection import Connection
@@ -7,6 +7,7 @@ from lilya.types import ASGIApp
 from ravyn.core.config.jwt import JWTConfig
 from ravyn.exceptions import AuthenticationError, NotAuthorized
 from ravyn.middleware.authentication import AuthResult, BaseAuthMiddleware
+from ravyn.security.jwt.cache import TokenCache
 from ravyn.security.jwt.token import Token
 
 T = TypeVar("T")
@@ -22,6 +23,7 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         app: ASGIApp,
         config: "JWTConfig",
         user_model: T,
+        token_cache: Optional[TokenCache] = None,
     ):
         super().__init__(app)
         """
@@ -57,6 +59,7 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         self.app = app
         self.config = config
         self.user_model = user_model
+        self.token_cache = token_cache
 
     async def authenticate(self, request: Connection) -> AuthResult:
         """
@@ -76,6 +79,19 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         if token_type not in self.config.auth_header_types:
             raise NotAuthorized(detail=f"'{token_type}' is not an authorized header.")
 
+        if self.token_cache is not None:
+            cached = await self.token_cache.get(auth_token)
+            if cached is not None:
+                if cached.revoked:
+                    raise AuthenticationError("Token has been revoked.")
+                if cached.user is not None:
+                    return AuthResult(user=cached.user)
+
+                # Verified by another process, only the user is missing.
+                user = await self.get_user(cached.sub)
+                await self.token_cache.set(auth_token, cached.sub, cached.exp, user)
+                return AuthResult(user=user)
+
         try:
             token = Token.decode(
                 token=auth_token,
@@ -85,7 +101,16 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         except PyJWTError as e:
             raise AuthenticationError(str(e)) from e
 
-        user = await self.retrieve_user(token.sub)
+        user = await self.get_user(token.sub)
+        if self.token_cache is not None:
+            await self.token_cache.set(auth_token, token.sub, token.exp.timestamp(), user)
+        return AuthResult(user=user)
+
+    async def get_user(self, token_sub: Optional[str]) -> Any:
+        """
+        Retrieves the user of the token subject, raising if not found.
+        """
+        user = await self.retrieve_user(token_sub)
         if not user:
             raise AuthenticationError("User not found.")
-        return AuthResult(user=user)
+        return user
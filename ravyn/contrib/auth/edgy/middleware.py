@@ -1,4 +1,4 @@
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from edgy import ObjectNotFound
 from lilya.types import ASGIApp
@@ -6,6 +6,7 @@ from lilya.types import ASGIApp
 from ravyn.contrib.auth.common.middleware import CommonJWTAuthMiddleware
 from ravyn.core.config.jwt import JWTConfig
 from ravyn.exceptions import AuthenticationError, NotAuthorized
+from ravyn.security.jwt.cache import TokenCache
 
 T = TypeVar("T")
 
@@ -20,8 +21,9 @@ class JWTAuthMiddleware(CommonJWTAuthMiddleware):
         app: "ASGIApp",
         config: "JWTConfig",
         user_model: T,
+        token_cache: Optional[TokenCache] = None,
     ):
-        super().__init__(app, config, user_model)
+        super().__init__(app, config, user_model, token_cache)
         """
         The user is simply the class type to be queried from the Saffier ORM.
 
@@ -1,4 +1,4 @@
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 import bson
 from lilya.types import ASGIApp
@@ -7,6 +7,7 @@ from mongoz import DocumentNotFound
 from ravyn.contrib.auth.common.middleware import CommonJWTAuthMiddleware
 from ravyn.core.config.jwt import JWTConfig
 from ravyn.exceptions import AuthenticationError, NotAuthorized
+from ravyn.security.jwt.cache import TokenCache
 
 T = TypeVar("T")
 
@@ -23,8 +24,9 @@ class JWTAuthMiddleware(CommonJWTAuthMiddleware):
         app: "ASGIApp",
         config: "JWTConfig",
         user_model: T,
+        token_cache: Optional[TokenCache] = None,
     ):
-        super().__init__(app, config, user_model)
+        super().__init__(app, config, user_model, token_cache)
         """
         The user is simply the class type to be queried from the Saffier ORM.
 
@@ -1,5 +1,4 @@
-from __future__ import annotations
-
+from collections.abc import AsyncIterator
 from typing import Any
 
 try:
@@ -9,20 +8,28 @@ except ImportError:
         "You must have the official `grpcio-tools` installed to use this module."
     ) from None
 
-from google.protobuf.json_format import MessageToDict
+import anyio
+import orjson
+from google.protobuf.json_format import MessageToDict, ParseDict, ParseError
 from grpc import aio
 from lilya._internal._path import clean_path
+from lilya.responses import Response as LilyaResponse
 
 from ravyn import HTTPException, Request, route
+from ravyn.core.background import CleanupTask
 from ravyn.exceptions import ImproperlyMiddlewareConfigured
-from ravyn.injector import Inject
-from ravyn.params import Injects
-from ravyn.responses import JSONResponse
-from ravyn.utils.helpers import make_callable
+from ravyn.responses import JSONResponse, Response, StreamingResponse
+from ravyn.utils.enums import MediaType
 
 # Allowed HTTP methods for endpoints.
 HTTP_ALLOWED_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE"]
 
+# HTTP methods without a request body, not allowed for client streaming methods.
+BODY_LESS_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
 
 class HTTPContext:
     """
@@ -30,9 +37,21 @@ class HTTPContext:
     It implements only the methods required to satisfy the service signature.
     """
 
+    __slots__ = ("_code", "_details", "_cancelled")
+
     def __init__(self) -> None:
         self._code = grpc.StatusCode.OK
         self._details = ""
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def cancelled(self) -> bool:
+        """
+        Whether the HTTP client disconnected before the end of a streamed response.
+        """
+        return self._cancelled
 
     def set_code(self, code: grpc.StatusCode) -> None:
         self._code = code
@@ -49,6 +68,77 @@ class HTTPContext:
         return self._details
 
 
+class MethodRecorder:
+    """
+    Stands in for a `grpc.aio.Server` to collect the method handlers a service
+    registers, giving the request type and the kind of each method.
+    """
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, grpc.RpcMethodHandler] = {}
+
+    def add_registered_method_handlers(
+        self, service_name: str, method_handlers: dict[str, grpc.RpcMethodHandler]
+    ) -> None:
+        self.handlers.update(method_handlers)
+
+    def add_generic_rpc_handlers(self, generic_handlers: Any) -> None:
+        for generic_handler in generic_handlers:
+            # Keyed by the fully qualified "/package.Service/Method" name.
+            method_handlers = getattr(generic_handler, "_method_handlers", None) or {}
+            for qualified_name, method_handler in method_handlers.items():
+                self.handlers.setdefault(qualified_name.rsplit("/", 1)[-1], method_handler)
+
+
+def get_request_type(method_handler: grpc.RpcMethodHandler | None) -> Any:
+    """
+    Returns the protobuf message class of the requests of a method, from its
+    `request_deserializer` (`Message.FromString`), if any.
+    """
+    if method_handler is None:
+        return None
+    return getattr(method_handler.request_deserializer, "__self__", None)
+
+
+def parse_request(body: bytes, request_type: Any) -> Any:
+    """
+    Parses a JSON body straight into the protobuf request message.
+    """
+    message = request_type()
+    if body:
+        ParseDict(orjson.loads(body), message, ignore_unknown_fields=True)
+    return message
+
+
+def message_to_json(message: Any) -> bytes:
+    """
+    Serializes a protobuf message, or a dict, to JSON bytes.
+    """
+    if hasattr(message, "SerializeToString"):
+        return orjson.dumps(MessageToDict(message, preserving_proto_field_name=True))
+    return orjson.dumps(message)
+
+
+async def iterate_requests(
+    messages: AsyncIterator[dict[str, Any]], request_type: Any
+) -> AsyncIterator[Any]:
+    """
+    Parses the elements of a streamed JSON array body into the protobuf request
+    messages, one at a time while the body is received.
+    """
+    async for data in messages:
+        if request_type is None:
+            yield data
+            continue
+
+        message = request_type()
+        try:
+            ParseDict(data, message, ignore_unknown_fields=True)
+        except ParseError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        yield message
+
+
 class GrpcGateway:
     """
     GrpcGateway bridges gRPC services (using grpcio) and HTTP endpoints in an Ravyn app.
@@ -100,6 +190,8 @@ class GrpcGateway:
         )
 
         # Register each service with the grpc.aio server.
+        self.instances: dict[type, Any] = {}
+        self.method_handlers: dict[type, dict[str, grpc.RpcMethodHandler]] = {}
         for service in services:
             instance = service()
             # We expect each service type to have a callable '__add_to_server__'
@@ -111,6 +203,11 @@ class GrpcGateway:
                 )
             add_fn(instance, self.grpc_server)
 
+            recorder = MethodRecorder()
+            add_fn(instance, recorder)
+            self.instances[service] = instance
+            self.method_handlers[service] = recorder.handlers
+
         if expose_http:
             self._register_http_endpoints()
 
@@ -161,7 +258,8 @@ class GrpcGateway:
         This method assumes that each service has callable methods that should be exposed as HTTP routes.
         """
         for service in self.services:
-            service_instance = service()
+            service_instance = self.instances[service]
+            method_handlers = self.method_handlers[service]
 
             for method_name in dir(service_instance):
                 if method_name.startswith("_"):
@@ -177,74 +275,198 @@ class GrpcGateway:
                     if name.startswith("_"):
                         name = name[1:]
 
-                    # Define a dependency for the service instance
-                    def service_dependency() -> Any:
-                        return service_instance  # noqa
-
-                    callable_fn = make_callable(method_name)
-
-                    @route(
+                    method_handler = method_handlers.get(method_name)
+                    http_methods = self.http_methods
+                    if method_handler is not None and method_handler.request_streaming:
+                        # The messages of client streaming methods are sent in the body.
+                        http_methods = [
+                            http_method
+                            for http_method in http_methods
+                            if http_method not in BODY_LESS_METHODS
+                        ]
+
+                    http_wrapper = self._create_http_handler(method, method_handler)
+                    http_wrapper = route(
                         path=route_path,
                         tags=["gRPC"],
-                        methods=self.http_methods,
+                        methods=http_methods,
                         name=name,
-                        dependencies={
-                            "service": Inject(service_dependency),
-                            "service_method": Inject(callable_fn),
-                        },
-                    )
-                    async def http_wrapper(
-                        request: Request,
-                        service: Any = Injects(),
-                        service_method: Any = Injects(),
-                    ) -> Any:
-                        """
-                        HTTP handler that wraps the gRPC method. It receives HTTP requests, converts them into
-                        data that can be processed by the gRPC method, and returns the result as an HTTP response.
-
-                        Args:
-                            request (Request): The HTTP request object containing input data.
-                            service (Any): The gRPC service instance injected from dependencies.
-                            service_method (Any): The gRPC method to be invoked, injected from dependencies.
-
-                        Returns:
-                            JSONResponse: The response that will be sent back to the client, wrapped as a JSON response.
-
-                        Raises:
-                            HTTPException: If an error occurs while invoking the gRPC method, this exception is raised
-                            with the appropriate HTTP status code and error message.
-                        """
-                        method = getattr(service, service_method)
-
-                        try:
-                            data = await request.json()  # Expecting a dict.
-                            http_context = HTTPContext()  # Create a dummy context.
-                            response = await method(
-                                data, http_context
-                            )  # Call the gRPC method with (data, context).
-                            # If response is a protobuf message, convert it to dict.
-                            if http_context.code != grpc.StatusCode.OK:
-                                raise HTTPException(
-                                    status_code=self.__grpc_to_http_status(http_context.code),
-                                    detail=http_context.details,
-                                )
-
-                            if hasattr(response, "SerializeToString"):
-                                response = MessageToDict(
-                                    response, preserving_proto_field_name=True
-                                )
-                            return JSONResponse(response)
-                        except grpc.aio.AioRpcError as e:
-                            raise HTTPException(
-                                status_code=self.__grpc_to_http_status(e.code()),
-                                detail=e.details(),
-                            ) from e
+                    )(http_wrapper)
 
                     # Yield the HTTP method, route, and handler for use by the framework
                     http_name = f"http_handler_{service_instance.__class__.__name__.lower()}_{method.__name__.lower()}"
                     http_wrapper.fn.__name__ = http_name
                     yield http_wrapper
 
+    def _create_http_handler(
+        self, method: Any, method_handler: grpc.RpcMethodHandler | None
+    ) -> Any:
+        """
+        Creates the HTTP handler calling the gRPC method, bound once at registration.
+
+        When the request type of the method is known, the JSON body is parsed straight
+        into the protobuf message and the protobuf response is serialized straight to
+        JSON bytes. Otherwise, the method receives the body as a dict.
+
+        Client streaming methods receive the elements of a JSON array body while it is
+        received, except bidirectional streaming methods which buffer it first, and server streaming methods are streamed as newline delimited JSON
+        or, when accepted by the client, as Server-Sent Events.
+        """
+        request_type = get_request_type(method_handler)
+        response_streaming = bool(method_handler and method_handler.response_streaming)
+
+        async def call_method(request: Request, data: Any) -> LilyaResponse:
+            try:
+                http_context = HTTPContext()  # Create a dummy context.
+                if response_streaming:
+                    return await self._stream_response(request, method, data, http_context)
+
+                response = await method(data, http_context)
+                self._raise_for_status(http_context)
+
+                if hasattr(response, "SerializeToString"):
+                    return Response(message_to_json(response), media_type=MediaType.JSON)
+                return JSONResponse(response)
+            except grpc.aio.AioRpcError as e:
+                raise HTTPException(
+                    status_code=self.__grpc_to_http_status(e.code()),
+                    detail=e.details(),
+                ) from e
+
+        if method_handler is not None and method_handler.request_streaming:
+
+            async def stream_wrapper(
+                request: Request, data: AsyncIterator[dict[str, Any]]
+            ) -> LilyaResponse:
+                """
+                HTTP handler of a client streaming gRPC method, receiving the messages
+                from the elements of a JSON array body.
+
+                For a bidirectional streaming method, the whole body is received and
+                kept in memory before the method is called.
+                """
+                messages = iterate_requests(data, request_type)
+                if response_streaming:
+                    # The request body cannot be received once the response is
+                    # streamed, the client disconnection is watched instead.
+                    messages = self._iterate_list([message async for message in messages])
+                return await call_method(request, messages)
+
+            return stream_wrapper
+
+        async def http_wrapper(request: Request) -> LilyaResponse:
+            """
+            HTTP handler that wraps the gRPC method. It receives HTTP requests, converts them into
+            data that can be processed by the gRPC method, and returns the result as an HTTP response.
+
+            Args:
+                request (Request): The HTTP request object containing input data.
+
+            Returns:
+                Response: The response that will be sent back to the client, as JSON.
+
+            Raises:
+                HTTPException: If an error occurs while invoking the gRPC method, this exception is raised
+                with the appropriate HTTP status code and error message.
+            """
+            if request_type is not None:
+                try:
+                    data = parse_request(await request.body(), request_type)
+                except Exception as e:  # noqa
+                    raise HTTPException(status_code=400, detail=str(e)) from e
+            else:
+                data = await request.json()  # Expecting a dict.
+            return await call_method(request, data)
+
+        return http_wrapper
+
+    def _raise_for_status(self, http_context: HTTPContext) -> None:
+        if http_context.code != grpc.StatusCode.OK:
+            raise HTTPException(
+                status_code=self.__grpc_to_http_status(http_context.code),
+                detail=http_context.details,
+            )
+
+    async def _stream_response(
+        self, request: Request, method: Any, data: Any, http_context: HTTPContext
+    ) -> StreamingResponse:
+        """
+        Streams the messages of a server streaming method.
+
+        The first message is awaited before the response starts, an error raised or
+        set in the context until then is an HTTP error. A later error is sent as the
+        last item of the stream. The messages are only requested from the method as
+        fast as the client receives them and the method is closed when the client
+        disconnects.
+        """
+        iterator = aiter(method(data, http_context))
+        try:
+            first = await anext(iterator)
+        except StopAsyncIteration:
+            first = None
+        self._raise_for_status(http_context)
+
+        is_sse = SSE_MEDIA_TYPE in request.headers.get("accept", "")
+
+        def encode(item: Any, event: str | None = None) -> bytes:
+            payload = message_to_json(item)
+            if not is_sse:
+                return payload + b"\n"
+            if event is not None:
+                return b"event: " + event.encode() + b"\ndata: " + payload + b"\n\n"
+            return b"data: " + payload + b"\n\n"
+
+        def encode_error(code: grpc.StatusCode, details: str | None) -> bytes:
+            error = {
+                "code": code.name,
+                "status_code": self.__grpc_to_http_status(code),
+                "detail": details or "",
+            }
+            return encode({"error": error}, event="error")
+
+        finished = False
+
+        async def close_iterator() -> None:
+            with anyio.CancelScope(shield=True):
+                aclose = getattr(iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal finished
+            try:
+                if first is not None:
+                    yield encode(first)
+                    async for item in iterator:
+                        yield encode(item)
+                if http_context.code != grpc.StatusCode.OK:
+                    yield encode_error(http_context.code, http_context.details)
+            except grpc.aio.AioRpcError as e:
+                yield encode_error(e.code(), e.details())
+            finally:
+                finished = True
+                await close_iterator()
+
+        stream = body()
+
+        async def close() -> None:
+            # The stream is left unfinished when the client disconnects.
+            if not finished:
+                http_context.cancel()
+                await stream.aclose()
+                await close_iterator()
+
+        return StreamingResponse(
+            stream,
+            media_type=SSE_MEDIA_TYPE if is_sse else NDJSON_MEDIA_TYPE,
+            background=CleanupTask(close),
+        )
+
+    @staticmethod
+    async def _iterate_list(messages: list[Any]) -> AsyncIterator[Any]:
+        for message in messages:
+            yield message
+
     def __grpc_to_http_status(self, grpc_status: grpc.StatusCode) -> int:
         """
         Converts gRPC status codes to HTTP status codes.
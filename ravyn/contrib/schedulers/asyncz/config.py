@@ -8,6 +8,8 @@ from asyncz.typing import Undefined, undefined
 from monkay import load
 
 from ravyn.conf import settings
+from ravyn.contrib.schedulers.asyncz.executor import RavynExecutor
+from ravyn.contrib.schedulers.asyncz.locks import LeaderElection, SchedulerLock
 from ravyn.contrib.schedulers.base import SchedulerConfig
 from ravyn.exceptions import ImproperlyConfigured
 
@@ -26,6 +28,9 @@ class AsynczConfig(SchedulerConfig):
         tasks: Union[dict[str, str]] = None,
         timezone: Union[dtimezone, str, None] = None,
         configurations: Union[dict[str, dict[str, str]], None] = None,
+        lock: Union[SchedulerLock, None] = None,
+        lock_key: str = "ravyn:scheduler",
+        lock_ttl: float = 30.0,
         **kwargs: dict[str, Any],
     ):
         """
@@ -36,6 +41,10 @@ class AsynczConfig(SchedulerConfig):
             tasks: A dictionary of tasks to be registered in the scheduler.
             timezone: The timezone to be used by the scheduler.
             configurations: Extra configurations to be passed to the scheduler.
+            lock: The lock shared by the processes running the scheduler. Only the process
+                holding it, the leader, runs the tasks.
+            lock_key: The key of the lock.
+            lock_ttl: The seconds the lock is held without being refreshed by the leader.
             **kwargs: Additional keyword arguments.
         """
         super().__init__(**kwargs)
@@ -44,6 +53,8 @@ class AsynczConfig(SchedulerConfig):
         self.timezone = timezone
         self.configurations = configurations
         self.options = kwargs
+        self.leader = LeaderElection(lock, lock_key, lock_ttl) if lock is not None else None
+        self.executor = RavynExecutor(leader=self.leader)
 
         for task, module in self.tasks.items():
             if not isinstance(task, str) or not isinstance(module, str):
@@ -56,9 +67,49 @@ class AsynczConfig(SchedulerConfig):
             configurations=self.configurations,
             **self.options,
         )
+        self.add_executor()
 
         self.register_tasks(tasks=self.tasks)
 
+    def add_executor(self) -> None:
+        """
+        Adds the `RavynExecutor` as the default executor of an `AsyncIOScheduler`,
+        unless another default executor is configured.
+
+        The executor measures the runs of the tasks, runs them only on the leader with a
+        lock and traces them when the application has a `tracing_config`.
+
+        Raises:
+            ImproperlyConfigured: If a lock is declared and the executor cannot be added.
+        """
+        executors = getattr(self.handler, "executors", None)
+        if executors is not None and executors.get("default") is self.executor:
+            return
+        if (
+            isinstance(self.handler, AsyncIOScheduler)
+            and executors is not None
+            and "default" not in executors
+        ):
+            self.handler.add_executor(self.executor, "default")
+        elif self.leader is not None:
+            raise ImproperlyConfigured(
+                "The scheduler lock requires an AsyncIOScheduler without a default executor."
+            )
+
+    @property
+    def is_leader(self) -> bool:
+        """
+        Whether this process runs the tasks, always the case without a lock.
+        """
+        return self.leader is None or self.leader.is_leader
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        The metrics of the runs of each task, by task id, measured by this process.
+        Empty when another default executor is configured.
+        """
+        return {"is_leader": self.is_leader, "tasks": self.executor.get_metrics()}
+
     def register_tasks(self, tasks: dict[str, str]) -> None:
         """
         Registers the tasks in the Scheduler.
@@ -115,6 +166,8 @@ class AsynczConfig(SchedulerConfig):
         Args:
             **kwargs: Additional keyword arguments.
         """
+        if self.leader is not None:
+            await self.leader.start()
         self.handler.start(**kwargs)
 
     async def shutdown(self, **kwargs: Any) -> None:
@@ -125,6 +178,8 @@ class AsynczConfig(SchedulerConfig):
             **kwargs: Additional keyword arguments.
         """
         self.handler.shutdown(**kwargs)
+        if self.leader is not None:
+            await self.leader.stop()
 
 
 class Task:
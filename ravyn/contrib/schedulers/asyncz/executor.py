@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import inspect
+import time
+from contextvars import copy_context
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from asyncz.events.constants import TASK_ERROR, TASK_EXECUTED, TASK_MISSED
+from asyncz.exceptions import MaximumInstancesError
+from asyncz.executors.asyncio import AsyncIOExecutor
+from asyncz.executors.base import run_coroutine_task, run_task
+
+from ravyn.core.tracing import NO_OP_TRACER, Tracer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from asyncz.tasks.types import TaskType
+
+    from ravyn.contrib.schedulers.asyncz.locks import LeaderElection
+
+
+class TaskMetrics:
+    """
+    Counters of the runs of a scheduled task.
+    """
+
+    __slots__ = (
+        "runs",
+        "errors",
+        "missed",
+        "skipped",
+        "overlaps",
+        "measured",
+        "duration",
+        "max_duration",
+        "last_duration",
+        "lateness",
+        "max_lateness",
+    )
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.errors = 0
+        self.missed = 0
+        self.skipped = 0
+        self.overlaps = 0
+        self.measured = 0
+        self.duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = 0.0
+        self.lateness = 0.0
+        self.max_lateness = 0.0
+
+    def record(self, duration: float, lateness: float) -> None:
+        self.measured += 1
+        self.duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+    def as_dict(self) -> dict[str, Any]:
+        measured = self.measured
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "missed": self.missed,
+            "skipped": self.skipped,
+            "overlaps": self.overlaps,
+            "average_duration": self.duration / measured if measured else 0.0,
+            "max_duration": self.max_duration,
+            "last_duration": self.last_duration,
+            "average_lateness": self.lateness / measured if measured else 0.0,
+            "max_lateness": self.max_lateness,
+        }
+
+
+class RavynExecutor(AsyncIOExecutor):
+    """
+    Default executor of the `AsynczConfig`, running the tasks in the event loop
+    like the `AsyncIOExecutor` and measuring every run.
+
+    With a `LeaderElection`, the runs are skipped in every process but the leader,
+    running each task once across the processes and nodes sharing the lock.
+
+    The lateness of a run is the delay between its scheduled time and its start and
+    an overlap is a run due while a previous run of the task has not finished, run
+    or not depending on the `max_instances` of the task.
+
+    Each run is traced in a span of the `tracer`, given by the application with a
+    `tracing_config`, the span is current in the task, synchronous or not.
+    """
+
+    def __init__(self, leader: LeaderElection | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.leader = leader
+        self.metrics: dict[str, TaskMetrics] = {}
+        self.tracer: Tracer = NO_OP_TRACER
+
+    def get_task_metrics(self, task_id: str) -> TaskMetrics:
+        try:
+            return self.metrics[task_id]
+        except KeyError:
+            metrics = self.metrics[task_id] = TaskMetrics()
+            return metrics
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        return {task_id: metrics.as_dict() for task_id, metrics in self.metrics.items()}
+
+    def send_task(self, task: TaskType, run_times: list[datetime]) -> None:
+        if self.instances.get(task.id):
+            self.get_task_metrics(task.id).overlaps += 1
+        try:
+            super().send_task(task, run_times)
+        except MaximumInstancesError:
+            self.get_task_metrics(task.id).skipped += len(run_times)
+            raise
+
+    def do_send_task(self, task: TaskType, run_times: list[datetime]) -> None:
+        task_id = task.id
+        assert task_id is not None, "Cannot send decorator type task"
+
+        def callback(fn: Any) -> None:
+            self.pending_futures.discard(fn)
+            try:
+                events = fn.result()
+            except BaseException:
+                self.run_task_error(task_id)
+            else:
+                self.run_task_success(task_id, events)
+
+        fn = self.event_loop.create_task(self.run(task, run_times))
+        fn.add_done_callback(callback)
+        self.pending_futures.add(fn)
+
+    async def run(self, task: TaskType, run_times: list[datetime]) -> list[Any]:
+        metrics = self.get_task_metrics(task.id)
+        if self.leader is not None and not self.leader.is_leader:
+            metrics.skipped += len(run_times)
+            return []
+
+        lateness = max((datetime.now(timezone.utc) - run_times[0]).total_seconds(), 0.0)
+        started_at = time.perf_counter()
+        store_alias = task.store_alias
+        with self.tracer.start_as_current_span(
+            f"scheduler {task.name or task.id}", {"ravyn.task.id": task.id}
+        ) as span:
+            if inspect.iscoroutinefunction(task.fn):
+                events = await run_coroutine_task(task, store_alias, run_times, self.logger)
+            else:
+                # The context, and the current span, are not copied by `run_in_executor`.
+                events = await self.event_loop.run_in_executor(
+                    None,
+                    copy_context().run,
+                    run_task,
+                    task,
+                    store_alias,
+                    run_times,
+                    self.logger,
+                )
+            if any(event.code == TASK_ERROR for event in events):
+                span.set_status("error")
+        duration = time.perf_counter() - started_at
+
+        missed = sum(event.code == TASK_MISSED for event in events)
+        metrics.missed += missed
+        metrics.runs += sum(event.code == TASK_EXECUTED for event in events)
+        metrics.errors += sum(event.code == TASK_ERROR for event in events)
+        if len(events) > missed:
+            metrics.record(duration, lateness)
+        return events
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+from urllib.parse import quote
+from uuid import uuid4
+
+import anyio
+from anyio.abc import TaskGroup
+from asyncz.file_locking import LOCK_EX, lock, unlock
+
+from ravyn.logging import logger
+
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import WatchError
+except ImportError:
+    redis = None
+
+    class WatchError(Exception):  # type: ignore[no-redef]
+        """
+        Never raised, redis is not installed.
+        """
+
+
+class SchedulerLock(ABC):
+    """
+    A lease shared by the schedulers of every process, held by a single owner at a
+    time until it expires or is released.
+
+    The owner is identified by a token, only the owner refreshes or releases the lease.
+    """
+
+    async def connect(self) -> None:  # noqa: B027
+        """
+        Opens the resources of the lock, when the scheduler starts.
+        """
+
+    async def disconnect(self) -> None:  # noqa: B027
+        """
+        Closes the resources of the lock, when the scheduler shuts down.
+        """
+
+    @abstractmethod
+    async def acquire(self, key: str, token: str, ttl: float) -> bool:
+        """
+        Takes the lease for `ttl` seconds when it is free, expired or already owned
+        by the token. Returns whether the token owns the lease.
+        """
+        raise NotImplementedError("All scheduler locks must implement acquire() method.")
+
+    @abstractmethod
+    async def refresh(self, key: str, token: str, ttl: float) -> bool:
+        """
+        Extends the lease for `ttl` seconds when owned by the token.
+        """
+        raise NotImplementedError("All scheduler locks must implement refresh() method.")
+
+    @abstractmethod
+    async def release(self, key: str, token: str) -> None:
+        """
+        Frees the lease when owned by the token.
+        """
+        raise NotImplementedError("All scheduler locks must implement release() method.")
+
+
+class FileSchedulerLock(SchedulerLock):
+    """
+    Lease stored in a file, shared by the processes of a single host.
+
+    Each read and update of the lease happens under an exclusive lock of the file.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "ravyn-scheduler")
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{quote(key, safe='')}.lock")
+
+    async def connect(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def acquire(self, key: str, token: str, ttl: float) -> bool:
+        return await anyio.to_thread.run_sync(self.update, key, token, ttl, True)
+
+    async def refresh(self, key: str, token: str, ttl: float) -> bool:
+        return await anyio.to_thread.run_sync(self.update, key, token, ttl, False)
+
+    async def release(self, key: str, token: str) -> None:
+        await anyio.to_thread.run_sync(self.update, key, token, None, False)
+
+    def update(self, key: str, token: str, ttl: float | None, acquire: bool) -> bool:
+        """
+        Writes the lease of the token, for `ttl` seconds, or clears it when `ttl` is `None`.
+        """
+        with open(self.get_path(key), "a+") as file:
+            lock(file, LOCK_EX)
+            try:
+                file.seek(0)
+                owner, _, expires_at = file.read().partition(" ")
+                now = time.time()
+                is_owner = owner == token
+                is_free = not owner or float(expires_at or 0) <= now
+
+                if not is_owner and not (acquire and is_free):
+                    return False
+
+                file.seek(0)
+                file.truncate()
+                if ttl is not None:
+                    file.write(f"{token} {now + ttl}")
+                file.flush()
+                return True
+            finally:
+                unlock(file)
+
+
+class RedisSchedulerLock(SchedulerLock):
+    """
+    Lease stored in Redis, shared by the processes of every node.
+
+    Attributes:
+        redis_url (str): The Redis connection URL.
+        client (redis.Redis | None): The Redis client, created on connect when not given.
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost", client: Any = None) -> None:
+        """
+        Initializes the Redis scheduler lock.
+
+        Args:
+            redis_url (str): The Redis connection URL.
+            client (redis.Redis | None): An existing client, for instance a `fakeredis` one.
+
+        Raises:
+            ImportError: If the `redis` package is not installed and no client is given.
+        """
+        if redis is None and client is None:
+            raise ImportError("You must install 'redis' to use this scheduler lock.")
+        self.redis_url = redis_url
+        self.client = client
+        self._owns_client = client is None
+
+    async def connect(self) -> None:
+        if self.client is None:
+            self.client = redis.Redis.from_url(self.redis_url)
+
+    async def disconnect(self) -> None:
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def acquire(self, key: str, token: str, ttl: float) -> bool:
+        if await self.client.set(key, token, nx=True, px=int(ttl * 1000)):
+            return True
+        return await self.refresh(key, token, ttl)
+
+    async def refresh(self, key: str, token: str, ttl: float) -> bool:
+        return await self.update(key, token, ttl)
+
+    async def release(self, key: str, token: str) -> None:
+        await self.update(key, token, None)
+
+    async def update(self, key: str, token: str, ttl: float | None) -> bool:
+        """
+        Extends, or deletes when `ttl` is `None`, the lease of the token in a transaction
+        watching the key.
+        """
+        async with self.client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.get(key) not in (token, token.encode()):
+                    await pipe.unwatch()
+                    return False
+
+                pipe.multi()
+                if ttl is None:
+                    pipe.delete(key)
+                else:
+                    pipe.pexpire(key, int(ttl * 1000))
+                await pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+
+class LeaderElection:
+    """
+    Elects the process running the scheduled tasks among the processes sharing
+    the `SchedulerLock`.
+
+    The leader refreshes its lease every third of the `ttl`. When the leader stops
+    or dies, another process takes over once the lease is released or expired.
+    """
+
+    def __init__(self, lock: SchedulerLock, key: str = "ravyn:scheduler", ttl: float = 30.0):
+        self.lock = lock
+        self.key = key
+        self.ttl = ttl
+        self.token = uuid4().hex
+        self._expires_at = 0.0
+        self._task_group: TaskGroup | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    async def elect(self) -> bool:
+        """
+        Acquires or refreshes the lease, returning whether the process is the leader.
+        """
+        started_at = time.monotonic()
+        try:
+            if self.is_leader:
+                elected = await self.lock.refresh(self.key, self.token, self.ttl)
+            else:
+                elected = await self.lock.acquire(self.key, self.token, self.ttl)
+        except Exception as e:  # noqa
+            logger.warning(f"Scheduler lock {self.key!r} unavailable: {e!r}")
+            elected = False
+
+        self._expires_at = started_at + self.ttl if elected else 0.0
+        return elected
+
+    async def start(self) -> None:
+        if self._task_group is not None:
+            return
+
+        await self.lock.connect()
+        await self.elect()
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self.run)
+
+    async def run(self) -> None:
+        while True:
+            await anyio.sleep(self.ttl / 3)
+            await self.elect()
+
+    async def stop(self) -> None:
+        if self._task_group is None:
+            return
+
+        self._task_group.cancel_scope.cancel()
+        await self._task_group.__aexit__(None, None, None)
+        self._task_group = None
+
+        if self.is_leader:
+            self._expires_at = 0.0
+            await self.lock.release(self.key, self.token)
+        await self.lock.disconnect()
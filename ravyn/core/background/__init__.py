@@ -0,0 +1,4 @@
+from .executor import BackgroundExecutor, BackgroundMetrics, CleanupTask, DeferredTask
+from .spill import SQLiteSpill
+
+__all__ = ["BackgroundExecutor", "BackgroundMetrics", "CleanupTask", "DeferredTask", "SQLiteSpill"]
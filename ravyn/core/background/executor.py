@@ -0,0 +1,305 @@
+import time
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from lilya.background import Task
+
+from ravyn.core.background.spill import SQLiteSpill, dump_task, load_task
+from ravyn.core.tracing.background import TracedTask
+from ravyn.logging import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.core.config.background import BackgroundTaskConfig
+
+
+class BackgroundMetrics:
+    """
+    Counters of the background executor.
+    """
+
+    __slots__ = (
+        "submitted",
+        "completed",
+        "failed",
+        "timed_out",
+        "spilled",
+        "wait_time",
+        "max_wait_time",
+        "run_time",
+        "max_run_time",
+    )
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.spilled = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.run_time = 0.0
+        self.max_run_time = 0.0
+
+    def record(self, wait_time: float, run_time: float) -> None:
+        self.wait_time += wait_time
+        self.run_time += run_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.max_run_time = max(self.max_run_time, run_time)
+
+    def as_dict(self) -> dict[str, Any]:
+        processed = self.completed + self.failed + self.timed_out
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "spilled": self.spilled,
+            "average_wait_time": self.wait_time / processed if processed else 0.0,
+            "max_wait_time": self.max_wait_time,
+            "average_run_time": self.run_time / processed if processed else 0.0,
+            "max_run_time": self.max_run_time,
+        }
+
+
+class CleanupTask(Task):
+    """
+    A task releasing the resources of a response, such as an open stream, once it
+    is sent. It always runs at the end of the request and is never handed over to
+    the executor.
+    """
+
+
+class DeferredTask:
+    """
+    Replaces the background of a response, handing the original task over to the
+    executor instead of running it at the end of the request.
+    """
+
+    __slots__ = ("executor", "task")
+
+    def __init__(self, executor: "BackgroundExecutor", task: Task) -> None:
+        self.executor = executor
+        self.task = task
+
+    async def __call__(self) -> None:
+        await self.executor.submit(self.task)
+
+
+class BackgroundExecutor:
+    """
+    Application level executor of the background tasks.
+
+    A bounded pool of workers consumes a bounded queue. When the queue is full, the
+    tasks are spilled to SQLite, when a `spill_path` is declared, or the caller waits
+    for room in the queue, applying backpressure to the requests scheduling them.
+
+    The executor is started and drained by the application lifespan. While it is not
+    running, the tasks are executed inline, exactly like without the executor.
+    """
+
+    def __init__(self, config: "BackgroundTaskConfig") -> None:
+        self.config = config
+        self.metrics = BackgroundMetrics()
+        self.spill: Optional[SQLiteSpill] = (
+            SQLiteSpill(config.spill_path) if config.spill_path else None
+        )
+        self._send_stream: Optional[MemoryObjectSendStream[tuple[Task, float]]] = None
+        self._task_group: Optional[TaskGroup] = None
+        self._spilled = 0
+        self._active = 0
+        self._workers = 0
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        """
+        The number of tasks waiting in memory.
+        """
+        if self._send_stream is None:
+            return 0
+        return self._send_stream.statistics().current_buffer_used
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of tasks waiting, in memory and spilled.
+        """
+        return self.queued + self._spilled
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        The metrics of the executor, including the current queue depth.
+        """
+        return {
+            **self.metrics.as_dict(),
+            "queue_depth": self.queue_depth,
+            "spilled_depth": self._spilled,
+            "active": self._active,
+            "workers": self.config.workers,
+        }
+
+    def defer(self, task: Task) -> Union[Task, DeferredTask]:
+        """
+        Hands the task over to the executor, except the cleanup tasks.
+        """
+        inner = task.task if isinstance(task, TracedTask) else task
+        if isinstance(inner, CleanupTask):
+            return task
+        return DeferredTask(self, task)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+
+        if self.spill is not None:
+            await anyio.to_thread.run_sync(self.spill.open)
+            self._spilled = len(self.spill)
+
+        send_stream, receive_stream = anyio.create_memory_object_stream[tuple[Task, float]](
+            max_buffer_size=self.config.max_queue_size
+        )
+        self._send_stream = send_stream
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+
+        self._running = True
+        # Counted up front, the workers only start at the next checkpoint.
+        self._workers = self.config.workers
+        for _ in range(self.config.workers):
+            self._task_group.start_soon(self._work, receive_stream.clone())
+        receive_stream.close()
+
+    async def submit(self, task: Task) -> None:
+        """
+        Queues the task. Executes it inline when the executor is not running.
+        """
+        if not self._running or self._send_stream is None:
+            await task()
+            return
+
+        if not self._workers:
+            # Nothing consumes the queue anymore, waiting for room would never end.
+            logger.error("No background worker is running, the task is executed inline.")
+            await task()
+            return
+
+        self.metrics.submitted += 1
+        item = (task, time.monotonic())
+        if self.queued < self.config.max_queue_size:
+            self._send_stream.send_nowait(item)
+            return
+
+        if self.spill is not None:
+            payload = dump_task(task)
+            if payload is not None:
+                await anyio.to_thread.run_sync(self.spill.push, payload)
+                self._spilled += 1
+                self.metrics.spilled += 1
+                return
+
+        await self._send_stream.send(item)
+
+    async def shutdown(self) -> None:
+        """
+        Stops accepting tasks and waits, up to the `drain_timeout`, for the queued ones.
+
+        The spilled tasks not yet picked by a worker stay stored for the next start.
+        """
+        if not self._running or self._send_stream is None or self._task_group is None:
+            return
+
+        self._running = False
+        with anyio.move_on_after(self.config.drain_timeout):
+            while self._workers and (self.queued or self._active):
+                await anyio.sleep(0.01)
+
+        pending = self.queued
+        if pending:
+            logger.warning(f"Background executor stopped with {pending} task(s) not executed.")
+
+        self._send_stream.close()
+        self._task_group.cancel_scope.cancel()
+        await self._task_group.__aexit__(None, None, None)
+        self._send_stream = None
+        self._task_group = None
+
+        if self.spill is not None:
+            await anyio.to_thread.run_sync(self.spill.close)
+
+    async def _take_spilled(self) -> Optional[tuple[Task, float]]:
+        """
+        Removes the oldest spilled task.
+        """
+        if self.spill is None:
+            return None
+
+        stored = await anyio.to_thread.run_sync(self.spill.pop)
+        if stored is None:
+            self._spilled = 0
+            return None
+
+        self._spilled -= 1
+        payload, created_at = stored
+        try:
+            task = load_task(payload)
+        except Exception as e:  # noqa
+            self.metrics.failed += 1
+            logger.error(f"Unable to load a spilled background task: {e!r}")
+            return None
+        return task, time.monotonic() - max(time.time() - created_at, 0.0)
+
+    async def _work(self, receive_stream: MemoryObjectReceiveStream[tuple[Task, float]]) -> None:
+        try:
+            async with receive_stream:
+                while True:
+                    # The spilled tasks are only picked once the in-memory queue is empty.
+                    if self._spilled and self._running and not self.queued:
+                        await self._run_spilled()
+                        continue
+
+                    try:
+                        task, enqueued_at = await receive_stream.receive()
+                    except anyio.EndOfStream:
+                        return
+                    await self._run(task, enqueued_at)
+        finally:
+            self._workers -= 1
+
+    async def _run_spilled(self) -> None:
+        try:
+            spilled = await self._take_spilled()
+        except Exception as e:  # noqa
+            # The stored tasks are kept for the next start, the workers go back to
+            # the in-memory queue.
+            self._spilled = 0
+            logger.error(f"Unable to read the spilled background tasks: {e!r}")
+            return
+        if spilled is not None:
+            await self._run(*spilled)
+
+    async def _run(self, task: Task, enqueued_at: float) -> None:
+        started_at = time.monotonic()
+        self._active += 1
+        try:
+            if self.config.timeout is None:
+                await task()
+            else:
+                with anyio.fail_after(self.config.timeout):
+                    await task()
+        except TimeoutError:
+            self.metrics.timed_out += 1
+            logger.error(f"Background task {task!r} timed out after {self.config.timeout}s.")
+        except Exception as e:  # noqa
+            self.metrics.failed += 1
+            logger.error(f"Background task {task!r} failed: {e!r}")
+        else:
+            self.metrics.completed += 1
+        finally:
+            self._active -= 1
+            self.metrics.record(started_at - enqueued_at, time.monotonic() - started_at)
@@ -0,0 +1,141 @@
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from lilya.background import Task, Tasks
+from lilya.concurrency import AsyncCallable
+
+from ravyn.core.tracing.background import TracedTask
+from ravyn.utils.module_loading import import_string
+
+
+def get_import_path(func: Any) -> Optional[str]:
+    """
+    Returns the import path of a module level function, or `None` if the
+    function cannot be imported back (lambdas, closures, methods...).
+    """
+    if isinstance(func, AsyncCallable):
+        func = func._callable
+
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if not module or not qualname or "." in qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def serialize_task(task: Task) -> Any:
+    """
+    Transforms a task into a structure of import paths and arguments.
+
+    Raises:
+        ValueError: If the task cannot be serialized.
+    """
+    if isinstance(task, TracedTask):
+        # A spilled task runs outside of the trace of its request.
+        task = task.task
+    if isinstance(task, Tasks):
+        return ("tasks", task.as_group, [serialize_task(child) for child in task.tasks])
+
+    path = get_import_path(task.func)
+    if path is None:
+        raise ValueError(f"{task.func!r} is not a module level function.")
+    return ("task", path, task.args, task.kwargs)
+
+
+def deserialize_task(value: Any) -> Task:
+    """
+    Builds back the task from the structure created by `serialize_task`.
+    """
+    from ravyn.background import BackgroundTask, BackgroundTasks
+
+    if value[0] == "tasks":
+        _, as_group, children = value
+        return BackgroundTasks(
+            tasks=[deserialize_task(child) for child in children], as_group=as_group
+        )
+
+    _, path, args, kwargs = value
+    return BackgroundTask(import_string(path), *args, **kwargs)
+
+
+def dump_task(task: Task) -> Optional[bytes]:
+    """
+    Pickles the task, returning `None` when it cannot be stored.
+    """
+    try:
+        return pickle.dumps(serialize_task(task))
+    except (ValueError, pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def load_task(payload: bytes) -> Task:
+    return deserialize_task(pickle.loads(payload))  # noqa: S301
+
+
+class SQLiteSpill:
+    """
+    Durable overflow of the background queue in a local SQLite file.
+
+    The tasks are stored in the order they arrived and read back, oldest first,
+    as soon as there is room in the in-memory queue.
+    """
+
+    __slots__ = ("path", "_connection", "_lock")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                return
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS background_tasks ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "payload BLOB NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def push(self, payload: bytes, created_at: Optional[float] = None) -> None:
+        with self._lock:
+            assert self._connection is not None, "The spill must be opened first."
+            self._connection.execute(
+                "INSERT INTO background_tasks (payload, created_at) VALUES (?, ?)",
+                (payload, created_at if created_at is not None else time.time()),
+            )
+
+    def pop(self) -> Optional[tuple[bytes, float]]:
+        """
+        Removes and returns the oldest stored task, if any.
+        """
+        with self._lock:
+            assert self._connection is not None, "The spill must be opened first."
+            row = self._connection.execute(
+                "SELECT id, payload, created_at FROM background_tasks ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("DELETE FROM background_tasks WHERE id = ?", (row[0],))
+            return row[1], row[2]
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._connection is None:
+                return 0
+            return int(
+                self._connection.execute("SELECT COUNT(*) FROM background_tasks").fetchone()[0]
+            )
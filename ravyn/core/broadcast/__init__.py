@@ -0,0 +1,5 @@
+from .broadcast import Broadcast, BroadcastMetrics
+from .memory import MemoryBroadcastBackend
+from .redis import RedisBroadcastBackend
+
+__all__ = ["Broadcast", "BroadcastMetrics", "MemoryBroadcastBackend", "RedisBroadcastBackend"]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from lilya.enums import Event
+from lilya.serializers import serializer
+from lilya.types import Message
+from lilya.websockets import WebSocket, WebSocketState
+
+from ravyn.core.broadcast.memory import MemoryBroadcastBackend
+from ravyn.core.protocols.broadcast import BroadcastBackend
+from ravyn.logging import logger
+
+TEXT_FRAME = b"t"
+BYTES_FRAME = b"b"
+
+
+def encode_message(message: Any) -> bytes:
+    """
+    Encodes a message, once, into the payload carried by the backend.
+
+    Strings are sent as text frames, bytes as binary frames and anything else
+    is serialized to JSON and sent as a text frame.
+    """
+    if isinstance(message, bytes):
+        return BYTES_FRAME + message
+    text: str = (
+        message
+        if isinstance(message, str)
+        else serializer.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    )
+    return TEXT_FRAME + text.encode("utf-8")
+
+
+def decode_message(payload: bytes) -> Message:
+    """
+    Decodes a payload carried by the backend into the ASGI message sent to every client.
+    """
+    if payload[:1] == BYTES_FRAME:
+        return {"type": Event.WEBSOCKET_SEND, "bytes": payload[1:]}
+    return {"type": Event.WEBSOCKET_SEND, "text": payload[1:].decode("utf-8")}
+
+
+class BroadcastMetrics:
+    """
+    Counters of a broadcast hub.
+    """
+
+    __slots__ = ("published", "received", "delivered", "timed_out", "overflowed", "failed")
+
+    def __init__(self) -> None:
+        self.published = 0
+        self.received = 0
+        self.delivered = 0
+        self.timed_out = 0
+        self.overflowed = 0
+        self.failed = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "published": self.published,
+            "received": self.received,
+            "delivered": self.delivered,
+            "timed_out": self.timed_out,
+            "overflowed": self.overflowed,
+            "failed": self.failed,
+        }
+
+
+class Broadcast:
+    """
+    Publish/subscribe hub fanning out messages to the subscribed websockets.
+
+    A message is encoded once when published and the same ASGI message is queued
+    for every websocket subscribed to the channel in this process. Each websocket
+    has its own writer, so a slow client never delays the others. The `backend`
+    carries the messages between the processes, in-memory by default.
+
+    A client not receiving a message within the `send_timeout`, failing to, or
+    letting more than `max_queued` messages wait, is unsubscribed from all the
+    channels.
+
+    When reading from the backend fails, the error is logged and the hub listens
+    again after `retry_delay` seconds.
+
+    The hub is connected and disconnected by the application lifespan.
+
+    ```python
+    broadcast = Broadcast()
+
+    app = Ravyn(
+        routes=[...],
+        on_startup=[broadcast.connect],
+        on_shutdown=[broadcast.disconnect],
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BroadcastBackend] = None,
+        send_timeout: float = 5.0,
+        max_queued: int = 100,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.backend = backend or MemoryBroadcastBackend()
+        self.send_timeout = send_timeout
+        self.max_queued = max_queued
+        self.retry_delay = retry_delay
+        self.metrics = BroadcastMetrics()
+        self._subscribers: dict[str, set[WebSocket]] = {}
+        self._queues: dict[WebSocket, MemoryObjectSendStream[Message]] = {}
+        self._task_group: Optional[TaskGroup] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._task_group is not None
+
+    def get_subscribers(self, channel: str) -> set[WebSocket]:
+        """
+        The websockets of this process subscribed to the channel.
+        """
+        return self._subscribers.get(channel, set())
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            **self.metrics.as_dict(),
+            "channels": len(self._subscribers),
+            "subscribers": sum(len(sockets) for sockets in self._subscribers.values()),
+        }
+
+    async def connect(self) -> None:
+        if self._task_group is not None:
+            return
+        await self.backend.connect()
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self.listen)
+
+    async def disconnect(self) -> None:
+        if self._task_group is None:
+            return
+        task_group, self._task_group = self._task_group, None
+        task_group.cancel_scope.cancel()
+        await task_group.__aexit__(None, None, None)
+        await self.backend.disconnect()
+        self._subscribers.clear()
+        self._queues.clear()
+
+    async def __aenter__(self) -> Broadcast:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.disconnect()
+
+    async def subscribe(self, websocket: WebSocket, *channels: str) -> None:
+        """
+        Subscribes the websocket to the channels, once the broadcast is connected.
+        """
+        if self._task_group is None:
+            raise RuntimeError("The broadcast is not connected.")
+
+        for channel in channels:
+            sockets = self._subscribers.get(channel)
+            if sockets is None:
+                sockets = self._subscribers[channel] = set()
+                await self.backend.subscribe(channel)
+            sockets.add(websocket)
+
+    async def unsubscribe(self, websocket: WebSocket, *channels: str) -> None:
+        """
+        Unsubscribes the websocket from the channels, from all of them when none is given.
+        """
+        for channel in channels or list(self._subscribers):
+            sockets = self._subscribers.get(channel)
+            if sockets is None:
+                continue
+            sockets.discard(websocket)
+            if not sockets:
+                del self._subscribers[channel]
+                if self._task_group is not None:
+                    await self.backend.unsubscribe(channel)
+
+        if not any(websocket in sockets for sockets in self._subscribers.values()):
+            queue = self._queues.pop(websocket, None)
+            if queue is not None:
+                queue.close()
+
+    @asynccontextmanager
+    async def subscription(self, websocket: WebSocket, *channels: str) -> AsyncIterator[None]:
+        """
+        Subscribes the websocket to the channels for the duration of the block.
+        """
+        await self.subscribe(websocket, *channels)
+        try:
+            yield
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.unsubscribe(websocket, *channels)
+
+    async def publish(self, channel: str, message: Any) -> None:
+        """
+        Publishes a message, a string, bytes or any JSON serializable object, to the channel.
+        """
+        self.metrics.published += 1
+        await self.backend.publish(channel, encode_message(message))
+
+    async def listen(self) -> None:
+        while True:
+            try:
+                while True:
+                    channel, payload = await self.backend.next_published()
+                    self.metrics.received += 1
+                    await self.fan_out(channel, decode_message(payload))
+            except Exception as e:  # noqa
+                logger.error(
+                    f"Broadcast listening failed, listening again in {self.retry_delay}s: {e!r}"
+                )
+                await anyio.sleep(self.retry_delay)
+
+    async def fan_out(self, channel: str, message: Message) -> None:
+        """
+        Queues the message for every websocket of the channel, without waiting for them.
+        """
+        dropped: list[WebSocket] = []
+        for websocket in self.get_subscribers(channel):
+            if websocket.application_state != WebSocketState.CONNECTED:
+                continue
+            try:
+                self.get_queue(websocket).send_nowait(message)
+            except anyio.WouldBlock:
+                self.metrics.overflowed += 1
+                dropped.append(websocket)
+
+        for websocket in dropped:
+            await self.unsubscribe(websocket)
+
+    def get_queue(self, websocket: WebSocket) -> MemoryObjectSendStream[Message]:
+        """
+        The queue of the websocket, its writer is started with the queue.
+        """
+        queue = self._queues.get(websocket)
+        if queue is None:
+            assert self._task_group is not None, "The broadcast is not connected."
+            queue, receive_stream = anyio.create_memory_object_stream[Message](
+                max_buffer_size=self.max_queued
+            )
+            self._queues[websocket] = queue
+            self._task_group.start_soon(self.write, websocket, receive_stream)
+        return queue
+
+    async def write(
+        self, websocket: WebSocket, receive_stream: MemoryObjectReceiveStream[Message]
+    ) -> None:
+        async with receive_stream:
+            async for message in receive_stream:
+                try:
+                    with anyio.fail_after(self.send_timeout):
+                        await websocket.send(message)
+                except TimeoutError:
+                    self.metrics.timed_out += 1
+                except Exception as e:  # noqa
+                    logger.debug(f"Broadcast to a websocket failed: {e!r}")
+                    self.metrics.failed += 1
+                else:
+                    self.metrics.delivered += 1
+                    continue
+
+                await self.unsubscribe(websocket)
+                return
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import math
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from ravyn.core.protocols.broadcast import BroadcastBackend
+
+
+class MemoryBroadcastBackend(BroadcastBackend):
+    """In-process broadcast backend.
+
+    The messages are only delivered to the subscribers of the same process,
+    which makes it suitable for a single node or for testing.
+    """
+
+    def __init__(self) -> None:
+        self._channels: set[str] = set()
+        self._send_stream: MemoryObjectSendStream[tuple[str, bytes]] | None = None
+        self._receive_stream: MemoryObjectReceiveStream[tuple[str, bytes]] | None = None
+
+    async def connect(self) -> None:
+        self._send_stream, self._receive_stream = anyio.create_memory_object_stream[
+            tuple[str, bytes]
+        ](max_buffer_size=math.inf)
+
+    async def disconnect(self) -> None:
+        if self._send_stream is not None:
+            self._send_stream.close()
+        if self._receive_stream is not None:
+            self._receive_stream.close()
+        self._send_stream = self._receive_stream = None
+        self._channels.clear()
+
+    async def subscribe(self, channel: str) -> None:
+        self._channels.add(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._channels.discard(channel)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        if self._send_stream is not None and channel in self._channels:
+            self._send_stream.send_nowait((channel, message))
+
+    async def next_published(self) -> tuple[str, bytes]:
+        assert self._receive_stream is not None, "The backend is not connected."
+        return await self._receive_stream.receive()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any
+
+import anyio
+
+from ravyn.core.protocols.broadcast import BroadcastBackend
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+
+class RedisBroadcastBackend(BroadcastBackend):
+    """Redis pub/sub broadcast backend.
+
+    Every node subscribes to the channels of its own connections, the messages
+    published by any node are delivered to all of them.
+
+    Attributes:
+        redis_url (str): The Redis connection URL.
+        client (redis.Redis | None): The Redis client, created on connect when not given.
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost", client: Any = None) -> None:
+        """Initializes the Redis broadcast backend.
+
+        Args:
+            redis_url (str): The Redis connection URL.
+            client (redis.Redis | None): An existing client, for instance a `fakeredis` one.
+
+        Raises:
+            ImportError: If the `redis` package is not installed and no client is given.
+        """
+        if redis is None and client is None:
+            raise ImportError("You must install 'redis' to use this broadcast backend.")
+        self.redis_url = redis_url
+        self.client = client
+        self._owns_client = client is None
+        self._pubsub: Any = None
+        self._channels: set[str] = set()
+        self._subscribed: anyio.Event | None = None
+
+    async def connect(self) -> None:
+        if self.client is None:
+            self.client = redis.Redis.from_url(self.redis_url, decode_responses=False)
+        self._pubsub = self.client.pubsub()
+
+    async def disconnect(self) -> None:
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._channels.clear()
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def subscribe(self, channel: str) -> None:
+        await self._pubsub.subscribe(channel)
+        self._channels.add(channel)
+        if self._subscribed is not None:
+            self._subscribed.set()
+
+    async def unsubscribe(self, channel: str) -> None:
+        await self._pubsub.unsubscribe(channel)
+        self._channels.discard(channel)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        await self.client.publish(channel, message)
+
+    async def next_published(self) -> tuple[str, bytes]:
+        while True:
+            # Reading from a pub/sub without any subscription raises.
+            if not self._channels:
+                self._subscribed = anyio.Event()
+                await self._subscribed.wait()
+                continue
+
+            message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is not None and message["type"] == "message":
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                return channel, message["data"]
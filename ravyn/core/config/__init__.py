@@ -1,17 +1,27 @@
 from .asyncexit import AsyncExitConfig
+from .background import BackgroundTaskConfig
+from .compression import CompressionConfig
 from .cors import CORSConfig
 from .csrf import CSRFConfig
 from .logging import LoggingConfig
+from .metrics import MetricsConfig
 from .openapi import OpenAPIConfig
+from .profiling import ProfilingConfig
 from .session import SessionConfig
 from .static_files import StaticFilesConfig
+from .tracing import TracingConfig
 
 __all__ = [
     "AsyncExitConfig",
+    "BackgroundTaskConfig",
+    "CompressionConfig",
     "CORSConfig",
     "CSRFConfig",
+    "MetricsConfig",
     "OpenAPIConfig",
+    "ProfilingConfig",
     "SessionConfig",
     "StaticFilesConfig",
+    "TracingConfig",
     "LoggingConfig",
 ]
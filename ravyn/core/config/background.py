@@ -0,0 +1,82 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated, Doc
+
+
+class BackgroundTaskConfig(BaseModel):
+    """
+    An instance of `BackgroundTaskConfig`.
+
+    When declared, the background tasks of the responses are no longer executed inline,
+    at the end of the request, but handed over to an application level executor with a bounded
+    pool of workers and a bounded queue.
+
+    The handlers keep using the same `BackgroundTask` and `BackgroundTasks` objects.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.core.config import BackgroundTaskConfig
+
+    background_config = BackgroundTaskConfig(
+        workers=4,
+        max_queue_size=500,
+        timeout=30,
+        spill_path="background.sqlite3",
+    )
+
+    app = Ravyn(background_config=background_config)
+    ```
+    """
+
+    workers: Annotated[
+        int,
+        Field(gt=0),
+        Doc(
+            """
+            The number of workers consuming the queue, which is the maximum
+            number of background tasks running concurrently.
+            """
+        ),
+    ] = 10
+    max_queue_size: Annotated[
+        int,
+        Field(gt=0),
+        Doc(
+            """
+            The maximum number of tasks waiting in memory.
+
+            When the queue is full, the task is spilled to the `spill_path`, if declared,
+            or the request waits until there is room in the queue (backpressure).
+            """
+        ),
+    ] = 1000
+    timeout: Annotated[
+        Optional[float],
+        Doc(
+            """
+            The maximum time, in seconds, a task can run before being cancelled.
+            """
+        ),
+    ] = None
+    spill_path: Annotated[
+        Optional[str],
+        Doc(
+            """
+            The path of the SQLite file where the tasks are stored when the queue is full.
+
+            Only tasks of module level functions with picklable arguments can be spilled.
+            The tasks still stored when the application stops are resumed on the next start.
+            """
+        ),
+    ] = None
+    drain_timeout: Annotated[
+        float,
+        Doc(
+            """
+            The maximum time, in seconds, the shutdown waits for the queued tasks to finish.
+            """
+        ),
+    ] = 30.0
@@ -0,0 +1,142 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated, Doc, Literal
+
+Encoding = Literal["zstd", "br", "gzip"]
+
+
+class CompressionConfig(BaseModel):
+    """
+    An instance of `CompressionConfig`.
+
+    When declared, the responses are compressed with the best encoding accepted by the
+    `Accept-Encoding` of the client, among `zstd`, `br` and `gzip`, and the request bodies
+    sent with a `Content-Encoding` are decompressed before reaching the handlers.
+
+    `br` requires `brotli` and `zstd` requires `zstandard`.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.core.config import CompressionConfig
+
+    compression_config = CompressionConfig(encodings=["br", "gzip"], minimum_size=1024)
+
+    app = Ravyn(compression_config=compression_config)
+    ```
+    """
+
+    encodings: Annotated[
+        Optional[list[Encoding]],
+        Doc(
+            """
+            The encodings of the responses, in order of preference when the client accepts
+            several with the same quality.
+
+            By default, `zstd` and `br` are used when their libraries are installed and
+            `gzip` is always used.
+            """
+        ),
+    ] = None
+    minimum_size: Annotated[
+        int,
+        Field(ge=0),
+        Doc(
+            """
+            The minimum size, in bytes, of a response body to be compressed.
+            """
+        ),
+    ] = 500
+    gzip_level: Annotated[
+        int,
+        Field(ge=0, le=9),
+        Doc(
+            """
+            The `gzip` compression level.
+            """
+        ),
+    ] = 6
+    brotli_quality: Annotated[
+        int,
+        Field(ge=0, le=11),
+        Doc(
+            """
+            The `br` compression quality.
+            """
+        ),
+    ] = 4
+    zstd_level: Annotated[
+        int,
+        Field(ge=1, le=22),
+        Doc(
+            """
+            The `zstd` compression level.
+            """
+        ),
+    ] = 3
+    excluded_media_types: Annotated[
+        list[str],
+        Doc(
+            """
+            The media types, or prefixes of media types, of the responses never compressed,
+            usually because they are already compressed.
+            """
+        ),
+    ] = [
+        "image/png",
+        "image/jpeg",
+        "image/gif",
+        "image/webp",
+        "image/avif",
+        "video/",
+        "audio/",
+        "font/woff",
+        "application/zip",
+        "application/gzip",
+        "application/zstd",
+        "application/x-brotli",
+        "text/event-stream",
+    ]
+    cache_size: Annotated[
+        int,
+        Field(ge=0),
+        Doc(
+            """
+            The number of compressed bodies kept in memory, keyed by the hash of the body
+            and the encoding.
+
+            Identical responses, for example the ones served from a cache or the OpenAPI
+            schema, are then compressed once. Only the bodies sent in a single message are
+            cached. `0` disables the cache.
+            """
+        ),
+    ] = 128
+    cache_max_body_size: Annotated[
+        int,
+        Field(ge=0),
+        Doc(
+            """
+            The maximum size, in bytes, of a response body kept in the cache.
+            """
+        ),
+    ] = 1024 * 1024
+    decompress_requests: Annotated[
+        bool,
+        Doc(
+            """
+            Decompress the request bodies sent with a `Content-Encoding` among the
+            supported encodings. The other encodings are refused with a `415`.
+            """
+        ),
+    ] = True
+    max_decompressed_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, of a decompressed request body, refused with a
+            `413` when exceeded.
+            """
+        ),
+    ] = 10 * 1024 * 1024
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated, Doc
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsConfig(BaseModel):
+    """
+    An instance of `MetricsConfig`.
+
+    When declared, the requests are measured per route template, in the Prometheus text
+    format, with the duration of each phase of the request: dispatch, parameters,
+    dependencies, validation, handler, serialization and send.
+
+    Nothing is measured, and nothing is added to the request path, when the application
+    has no `metrics_config`.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.core.config import MetricsConfig
+
+    app = Ravyn(metrics_config=MetricsConfig(path="/metrics"))
+    ```
+    """
+
+    path: Annotated[
+        Optional[str],
+        Doc(
+            """
+            The path of the endpoint exposing the metrics in the Prometheus text format.
+            `None` disables the endpoint, the metrics are then read with
+            `app.metrics.render()`.
+            """
+        ),
+    ] = "/metrics"
+    namespace: Annotated[
+        str,
+        Doc(
+            """
+            The prefix of the name of the metrics.
+            """
+        ),
+    ] = "ravyn"
+    buckets: Annotated[
+        tuple[float, ...],
+        Field(min_length=1),
+        Doc(
+            """
+            The upper bounds, in seconds, of the buckets of the duration histograms.
+            """
+        ),
+    ] = DEFAULT_BUCKETS
+    phases: Annotated[
+        bool,
+        Doc(
+            """
+            Measures the phases of the requests on top of their total duration.
+            """
+        ),
+    ] = True
@@ -0,0 +1,86 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated, Doc
+
+
+class ProfilingConfig(BaseModel):
+    """
+    An instance of `ProfilingConfig`.
+
+    When declared, each request is timed phase by phase (dispatch, interceptors,
+    permissions, parameters, dependencies, validation, handler, serialization and send)
+    and the requests slower than the `threshold_ms` are kept, with their timing tree, in a
+    ring buffer of the last `buffer_size` slow requests.
+
+    The slow requests are served, as JSON, on the `path` when the application runs in
+    `debug` and read with `app.profiler.records`. Nothing is measured, and nothing is
+    added to the request path, when the application has no `profiling_config`.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.core.config import ProfilingConfig
+
+    app = Ravyn(debug=True, profiling_config=ProfilingConfig(threshold_ms=200))
+    ```
+    """
+
+    threshold_ms: Annotated[
+        float,
+        Field(ge=0),
+        Doc(
+            """
+            The duration, in milliseconds, from which a request is kept in the ring
+            buffer. `0` keeps every request.
+            """
+        ),
+    ] = 100.0
+    buffer_size: Annotated[
+        int,
+        Field(ge=1),
+        Doc(
+            """
+            The number of slow requests kept, the oldest are dropped first.
+            """
+        ),
+    ] = 100
+    path: Annotated[
+        Optional[str],
+        Doc(
+            """
+            The path of the endpoint listing the slow requests, `<path>/<id>` returns the
+            timing tree of one of them. The endpoint is only served when the application
+            runs in `debug`, `None` disables it.
+            """
+        ),
+    ] = "/_profiling"
+    stack_sampling: Annotated[
+        bool,
+        Doc(
+            """
+            Samples the stack of the thread handling each request, every
+            `sampling_interval`, and keeps the most frequent stacks of the slow requests.
+            The stacks are only sampled while a single request is being handled.
+            """
+        ),
+    ] = False
+    sampling_interval: Annotated[
+        float,
+        Field(gt=0),
+        Doc(
+            """
+            The interval, in seconds, between two samples of the stacks.
+            """
+        ),
+    ] = 0.001
+    max_stacks: Annotated[
+        int,
+        Field(ge=1),
+        Doc(
+            """
+            The number of the most frequent stacks kept per slow request.
+            """
+        ),
+    ] = 20
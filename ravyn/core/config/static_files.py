@@ -2,11 +2,12 @@ from pathlib import Path
 from typing import Any, Optional, Tuple, Union
 
 from lilya._internal._path import clean_path
-from lilya.staticfiles import StaticFiles
 from lilya.types import ASGIApp
 from pydantic import BaseModel, DirectoryPath, constr, field_validator
 from typing_extensions import Annotated, Doc
 
+from ravyn.staticfiles import StaticFiles
+
 DirectoryType = Union[DirectoryPath, str, Path, Any]
 
 
@@ -101,6 +102,49 @@ class StaticFilesConfig(BaseModel):
             """
         ),
     ] = False
+    precompressed: Annotated[
+        bool,
+        Doc(
+            """
+            Serves the `.br` or `.gz` sibling of a file, when it exists and the client
+            accepts the encoding in its `Accept-Encoding` header.
+
+            The siblings are built ahead of time with `ravyn precompress <directory>`.
+            """
+        ),
+    ] = False
+    cache_size: Annotated[
+        int,
+        Doc(
+            """
+            The number of files kept in an in-memory LRU cache, `0` disables the cache.
+
+            A cached file is served without opening it, with its headers and ETag
+            computed once, and is only checked with a `stat` to detect a change.
+            """
+        ),
+    ] = 0
+    cache_max_file_size: Annotated[
+        int,
+        Doc(
+            """
+            The size, in bytes, of the largest file kept in the in-memory cache.
+            """
+        ),
+    ] = 64 * 1024
+    immutable: Annotated[
+        Union[bool, str],
+        Doc(
+            """
+            Sends `Cache-Control: public, max-age=31536000, immutable` for the files with
+            a content hash in their name.
+
+            When `True`, a hash is at least 8 hexadecimal characters between a `.` or a `-`
+            and the extension, for example `app.3f2a1b9c.js`. A string is used as the regular
+            expression matched against the filename instead.
+            """
+        ),
+    ] = False
 
     @field_validator("path")
     def validate_path(cls, value: str) -> str:
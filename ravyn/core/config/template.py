@@ -1,8 +1,10 @@
+from pathlib import Path
 from typing import Any, Type, Union
 
 from pydantic import BaseModel, ConfigDict, DirectoryPath
 from typing_extensions import Annotated, Doc
 
+from ravyn.core.protocols.cache import CacheBackend
 from ravyn.core.protocols.template import TemplateEngineProtocol
 from ravyn.template.jinja import JinjaTemplateEngine
 
@@ -73,3 +75,64 @@ class TemplateConfig(BaseModel):
             """
         ),
     ] = {}
+    bytecode_cache: Annotated[
+        Union[str, Path, Any, None],
+        Doc(
+            """
+            A directory where the compiled templates are stored and shared by all the
+            workers, or any `jinja2.BytecodeCache` instance.
+
+            The first worker using a template compiles it from its source and the others
+            load the compiled template, starting warm.
+
+            This is currently only used for the `jinja2` template engine and nothing else.
+
+            **Example**
+
+            ```python
+            TemplateConfig(directory="templates", bytecode_cache="/var/cache/ravyn/templates")
+            ```
+            """
+        ),
+    ] = None
+    fragment_cache: Annotated[
+        Union[CacheBackend, bool],
+        Doc(
+            """
+            Enables the `{% cache key, ttl %}...{% endcache %}` tag, rendering the enclosed
+            fragment once per `ttl` seconds and storing it in the given `CacheBackend`,
+            or in the `cache_backend` of the settings when `True`.
+
+            The hits and misses are returned by `app.template_engine.get_metrics()`.
+
+            This is currently only used for the `jinja2` template engine and nothing else.
+
+            **Example**
+
+            ```jinja
+            {% cache "navigation", 300 %}
+                {% for item in menu() %}<a href="{{ item.url }}">{{ item.title }}</a>{% endfor %}
+            {% endcache %}
+            ```
+            """
+        ),
+    ] = False
+
+    def get_cache_options(self) -> dict[str, Any]:
+        """
+        The caching options of the template engine, only the ones enabled.
+
+        Only the `JinjaTemplateEngine` supports them, none are given to other engines.
+        """
+        options: dict[str, Any] = {}
+        if not issubclass(self.engine, JinjaTemplateEngine):
+            return options
+        if self.bytecode_cache is not None:
+            options["bytecode_cache"] = self.bytecode_cache
+        if self.fragment_cache is True:
+            from ravyn.conf import settings
+
+            options["fragment_cache"] = settings.cache_backend
+        elif self.fragment_cache:
+            options["fragment_cache"] = self.fragment_cache
+        return options
@@ -0,0 +1,83 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import Annotated, Doc
+
+from ravyn.core.tracing import NO_OP_TRACER, SpanExporter, Tracer
+
+
+class TracingConfig(BaseModel):
+    """
+    An instance of `TracingConfig`.
+
+    When declared with an `exporter` or a `tracer`, each request is traced in a span with
+    a child span per interceptor, permission, dependency provider, `Requires`, validation,
+    handler and serialization, and per background task of the response. The scheduler
+    tasks of the `AsynczConfig` are traced on each run.
+
+    Without them, the tracer is the `NoOpTracer`, nothing is traced and nothing is added
+    to the request path.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.core.config import TracingConfig
+    from ravyn.core.tracing import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+
+    app = Ravyn(tracing_config=TracingConfig(exporter=exporter))
+    ```
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    exporter: Annotated[
+        Optional[SpanExporter],
+        Doc(
+            """
+            The `SpanExporter` receiving the ended spans, with the `Tracer` of Ravyn.
+            """
+        ),
+    ] = None
+    tracer: Annotated[
+        Optional[Tracer],
+        Doc(
+            """
+            A custom `Tracer`, taking precedence over the `exporter`. An adapter to the
+            OpenTelemetry SDK, for instance.
+            """
+        ),
+    ] = None
+    service_name: Annotated[
+        str,
+        Doc(
+            """
+            The name of the service, given to the `Tracer` created with the `exporter`.
+            """
+        ),
+    ] = "ravyn"
+    propagate: Annotated[
+        bool,
+        Doc(
+            """
+            Continues the trace of the W3C `traceparent` header of the incoming requests.
+            """
+        ),
+    ] = True
+    trace_background: Annotated[
+        bool,
+        Doc(
+            """
+            Traces the background tasks of the responses, as children of the request.
+            """
+        ),
+    ] = True
+
+    def get_tracer(self) -> Tracer:
+        if self.tracer is not None:
+            return self.tracer
+        if self.exporter is not None:
+            return Tracer(self.exporter, self.service_name)
+        return NO_OP_TRACER
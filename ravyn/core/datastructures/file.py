@@ -1,11 +1,13 @@
 import os
-from typing import TYPE_CHECKING, Any, Optional, Type, Union, cast
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
 
-from lilya.responses import FileResponse  # noqa
-from pydantic import FilePath, model_validator  # noqa
+from pydantic import model_validator  # noqa
 from typing_extensions import Annotated, Doc
 
 from ravyn.core.datastructures.base import ResponseContainer
+from ravyn.responses.file import FileResponse
 from ravyn.utils.enums import MediaType
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -14,10 +16,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class File(ResponseContainer[FileResponse]):
     path: Annotated[
-        FilePath,
+        Path,
         Doc(
             """
             The path to the file to download.
+
+            The file is stated once, when the `File` is created, and its
+            `stat_result` is reused by the response for the `Content-Length`,
+            `ETag` and `Last-Modified` headers.
             """
         ),
     ]
@@ -40,8 +46,19 @@ class File(ResponseContainer[FileResponse]):
 
     @model_validator(mode="before")
     def validate_fields(cls, values: dict[str, Any]) -> Any:
-        stat_result = values.get("stat_result")
-        values["stat_result"] = stat_result or os.stat(cast("str", values.get("path")))
+        if not isinstance(values, dict) or values.get("stat_result") is not None:
+            return values
+
+        path = values.get("path")
+        if path is None:
+            return values
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            raise ValueError(f"Path '{path}' does not point to a file.") from None
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise ValueError(f"Path '{path}' does not point to a file.")
+        values["stat_result"] = stat_result
         return values
 
     def to_response(
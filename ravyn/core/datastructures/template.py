@@ -70,6 +70,40 @@ class Template(ResponseContainer[TemplateResponse]):
             """
         ),
     ] = None
+    stream: Annotated[
+        bool,
+        Doc(
+            """
+            Renders the template while the response is sent, in chunks, instead of
+            rendering the whole page before sending it.
+
+            The first bytes of a large page are sent early and the page is never
+            held in memory as a whole. The response has no `content-length`.
+
+            **Example**
+
+            ```python
+            from ravyn import Template, get
+
+
+            @get(path="/report")
+            def report() -> Template:
+                return Template(name="report.html", context={"rows": rows}, stream=True)
+            ```
+            """
+        ),
+    ] = False
+    render_in_threadpool: Annotated[
+        bool,
+        Doc(
+            """
+            Renders a synchronous template in a thread, without blocking the event loop.
+
+            When streaming, each chunk is rendered in a thread. It has no effect with an
+            asynchronous template engine (`enable_async=True`).
+            """
+        ),
+    ] = False
 
     def to_response(
         self,
@@ -91,6 +125,8 @@ class Template(ResponseContainer[TemplateResponse]):
             "status_code": status_code,
             "template_engine": app.template_engine,
             "media_type": media_type,
+            "stream": self.stream,
+            "render_in_threadpool": self.render_in_threadpool,
         }
         try:
             return TemplateResponse(template_name=self.name, **data)
@@ -17,6 +17,8 @@ from ravyn.core.directives.operations.createproject import (
 )
 from ravyn.core.directives.operations.list import directives as directives  # noqa
 from ravyn.core.directives.operations.mail import mail as mail  # noqa
+from ravyn.core.directives.operations.precompress import precompress as precompress  # noqa
+from ravyn.core.directives.operations.profile import profile as profile  # noqa
 from ravyn.core.directives.operations.run import run as run  # noqa
 from ravyn.core.directives.operations.runserver import runserver as runserver  # noqa
 from ravyn.core.directives.operations.shell import shell as shell  # noqa
@@ -77,6 +79,8 @@ ravyn_cli.add_command(create_project)
 ravyn_cli.add_command(create_app)
 ravyn_cli.add_command(create_deployment)
 ravyn_cli.add_command(shell)
+ravyn_cli.add_command(precompress)
+ravyn_cli.add_command(profile)
 ravyn_cli.add_app("mail", mail)
 
 # Load custom directives if any
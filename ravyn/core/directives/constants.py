@@ -2,7 +2,13 @@ RAVYN_DISCOVER_APP = "RAVYN_DEFAULT_APP"
 DEFAULT_TEMPLATE_NAME = "default"
 APP_PARAMETER = "--app"
 HELP_PARAMETER = "--help"
-EXCLUDED_DIRECTIVES = ["createproject", "createapp", "createdeployment", "mail"]
+EXCLUDED_DIRECTIVES = [
+    "createproject",
+    "createapp",
+    "createdeployment",
+    "mail",
+    "precompress",
+]
 IGNORE_DIRECTIVES = ["directives"]
 DISCOVERY_FILES = ["application.py", "app.py", "main.py", "asgi.py"]
 DISCOVERY_FUNCTIONS = ["get_application", "get_app"]
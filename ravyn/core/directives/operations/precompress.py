@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import Annotated
+
+from sayer import Argument, Option, command, error, success
+
+from ravyn.staticfiles import precompress_directory
+
+
+@command(name="precompress")
+def precompress(
+    directory: Annotated[str, Argument(help="The directory of the static files.")],
+    min_size: Annotated[
+        int,
+        Option(1024, help="The size in bytes of the smallest file compressed.", show_default=True),
+    ],
+    brotli: Annotated[
+        bool,
+        Option(True, "--brotli/--no-brotli", help="Writes the .br files.", show_default=True),
+    ],
+    gzip: Annotated[
+        bool,
+        Option(True, "--gzip/--no-gzip", help="Writes the .gz files.", show_default=True),
+    ],
+) -> None:
+    """
+    Compresses the static files of a directory ahead of time.
+
+    Writes the `.br` and `.gz` siblings of the compressible files (html, css, js, json,
+    svg...), served by the `StaticFilesConfig` with `precompressed=True` to the clients
+    accepting the encoding. A sibling is only written again when its file changed.
+
+    How to run: `ravyn precompress <DIRECTORY>`
+
+    Example: `ravyn precompress static/`
+    """
+    if not os.path.isdir(directory):
+        error(f"The directory {directory} does not exist.")
+        sys.exit(1)
+
+    encodings = [encoding for encoding, enabled in (("br", brotli), ("gzip", gzip)) if enabled]
+    try:
+        written = precompress_directory(directory, encodings=encodings, min_size=min_size)
+    except ImportError as e:
+        error(str(e))
+        sys.exit(1)
+    success(f"{len(written)} precompressed files written in {directory}.")
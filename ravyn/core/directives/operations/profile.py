@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import Annotated, Any
+
+from rich.tree import Tree
+from sayer import Argument, Option, command, echo, error
+
+from ravyn.core.directives.constants import RAVYN_DISCOVER_APP
+from ravyn.core.directives.env import DirectiveEnv
+from ravyn.core.profiling import ProfileRecord, replay
+from ravyn.core.terminal import OutputColour
+
+
+def add_span(tree: Tree, span: dict[str, Any]) -> None:
+    for child in span["children"]:
+        branch = tree.add(
+            f"[{OutputColour.CYAN}]{child['name']}[/] {child['duration_ms']:.3f} ms "
+            f"[{OutputColour.BRIGHT_BLACK}](+{child['start_ms']:.3f} ms)[/]"
+        )
+        add_span(branch, child)
+
+
+def get_profile_tree(record: ProfileRecord) -> Tree:
+    """The timing tree of a profiled request."""
+    tree = Tree(
+        f"[bold]{record.method} {record.path}[/] [{OutputColour.GREEN}]{record.status}[/] "
+        f"{record.route} {record.duration_ms:.3f} ms"
+    )
+    if record.tree is not None:
+        add_span(tree, record.tree)
+    if record.stacks:
+        stacks = tree.add(f"[{OutputColour.YELLOW}]stacks[/]")
+        for stack in record.stacks:
+            branch = stacks.add(f"{stack['samples']} samples")
+            for frame in stack["stack"][-5:]:
+                branch.add(f"[{OutputColour.BRIGHT_BLACK}]{frame}[/]")
+    return tree
+
+
+@command(name="profile")
+def profile(
+    env: DirectiveEnv,
+    method: Annotated[str, Argument(help="The HTTP method of the request.")],
+    path: Annotated[str, Argument(help="The path of the request, with its query string.")],
+    header: Annotated[
+        list[str],
+        Option(
+            help="A header of the request, as 'name: value'. Can be used multiple times.",
+            required=False,
+            multiple=True,
+        ),
+    ],
+    data: Annotated[str | None, Option(help="The body of the request.", required=False)] = None,
+    repeat: Annotated[
+        int, Option(1, "-n", help="The number of times the request is sent.", show_default=True)
+    ] = 1,
+    stacks: Annotated[
+        bool,
+        Option(False, "--stacks", help="Samples the stacks of the request.", show_default=True),
+    ] = False,
+) -> None:
+    """
+    Replays a request against the application and prints the timing tree of its phases.
+
+    The request is sent in process, without a server, with the profiling enabled whatever
+    the `profiling_config` of the application.
+
+    How to run: `ravyn profile <METHOD> <PATH>`
+
+    Example: `ravyn profile GET /api/items/1 -n 10`
+    """
+    if os.getenv(RAVYN_DISCOVER_APP) is None and getattr(env, "app", None) is None:
+        error(
+            "You cannot specify a custom directive without specifying the --app or setting "
+            "RAVYN_DEFAULT_APP environment variable."
+        )
+        sys.exit(1)
+    if getattr(env, "ravyn_app", None) is None:
+        error("Not an ravyn app.")
+        sys.exit(1)
+
+    headers: dict[str, str] = {}
+    for value in header or []:
+        name, separator, content = value.partition(":")
+        if not separator:
+            error(f"Invalid header '{value}', expected 'name: value'.")
+            sys.exit(1)
+        headers[name.strip()] = content.strip()
+
+    records = replay(
+        env.ravyn_app,
+        method,
+        path,
+        headers=headers,
+        content=data,
+        repeat=max(repeat, 1),
+        stack_sampling=stacks,
+    )
+    for record in records:
+        echo(get_profile_tree(record))
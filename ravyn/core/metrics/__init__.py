@@ -0,0 +1,13 @@
+from .instrumentation import RavynMetrics, RequestTimer, current_request, record_cache
+from .registry import Counter, Gauge, Histogram, MetricsRegistry
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "RavynMetrics",
+    "RequestTimer",
+    "current_request",
+    "record_cache",
+]
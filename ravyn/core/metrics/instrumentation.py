@@ -0,0 +1,449 @@
+import time
+from collections import Counter as StackCounter
+from collections.abc import Awaitable, Iterable, Iterator, Sequence
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Optional
+from weakref import WeakKeyDictionary
+
+import anyio.to_thread
+from lilya.types import Message, Scope, Send
+
+from ravyn.core.metrics.registry import Counter, Gauge, Histogram, LabelValues, MetricsRegistry
+from ravyn.core.tracing import TracedTask, Tracer, current_span
+from ravyn.core.tracing.tracer import Attributes, get_name
+from ravyn.exceptions import NotAuthorized, PermissionDenied
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.applications import Ravyn
+    from ravyn.core.config.metrics import MetricsConfig
+    from ravyn.core.transformers.utils import Dependency
+    from ravyn.routing.router import HTTPHandler
+
+PHASES = (
+    "dispatch",
+    "interceptors",
+    "permissions",
+    "params",
+    "dependencies",
+    "validation",
+    "handler",
+    "serialization",
+    "send",
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE"})
+
+# The span of the untraced requests.
+NO_SPAN: ContextManager[Any] = nullcontext()
+
+
+class Span:
+    """
+    A timed phase of a request, in nanoseconds, with the phases measured inside it.
+    """
+
+    __slots__ = ("name", "start", "end", "children")
+
+    def __init__(self, name: str, start: int, end: int = 0) -> None:
+        self.name = name
+        self.start = start
+        self.end = end
+        self.children: list[Span] = []
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    def as_dict(self, origin: Optional[int] = None) -> dict[str, Any]:
+        origin = self.start if origin is None else origin
+        return {
+            "name": self.name,
+            "start_ms": (self.start - origin) / 1_000_000,
+            "duration_ms": self.duration / 1_000_000,
+            "children": [child.as_dict(origin) for child in self.children],
+        }
+
+
+class RequestTimer:
+    """
+    The route template and the duration, in nanoseconds, of each phase of a request.
+
+    With `tree`, the phases are also kept as a tree of `Span`, rooted at the request.
+    With a `tracer`, each phase is also traced in a span of the tracer. The phases are
+    measured by the handlers, through the timer of the `current_request`, the `app` is the
+    application whose routes give the templates.
+    """
+
+    __slots__ = (
+        "metrics",
+        "app",
+        "start",
+        "route",
+        "status",
+        "denied",
+        "phases",
+        "current",
+        "root",
+        "stack",
+        "stacks",
+        "tracer",
+        "trace_background",
+    )
+
+    def __init__(
+        self, metrics: Optional["RavynMetrics"] = None, tree: bool = False, app: Any = None
+    ) -> None:
+        self.metrics = metrics
+        self.app = app
+        self.start = time.perf_counter_ns()
+        self.route: Optional[str] = None
+        self.status = 500
+        self.denied = False
+        self.phases: dict[str, int] = {}
+        self.current: Optional[str] = None
+        self.root: Optional[Span] = Span("request", self.start) if tree else None
+        self.stack: list[Span] = [self.root] if self.root is not None else []
+        self.stacks: Optional[StackCounter[tuple[str, ...]]] = None
+        self.tracer: Optional[Tracer] = None
+        self.trace_background = False
+
+    @property
+    def duration(self) -> int:
+        return time.perf_counter_ns() - self.start
+
+    def add(self, phase: str, duration: int, start: Optional[int] = None) -> None:
+        self.phases[phase] = self.phases.get(phase, 0) + duration
+        if self.stack and start is not None:
+            self.stack[-1].children.append(Span(phase, start, start + duration))
+
+    async def measure(
+        self,
+        phase: str,
+        call: Callable[[], Awaitable[Any]],
+        exclusive: bool = False,
+        name: Optional[str] = None,
+        attributes: Optional[Attributes] = None,
+    ) -> Any:
+        """
+        Awaits the call, adding its duration to the phase unless it runs inside another
+        measured phase.
+
+        An `exclusive` phase contains other phases, only the time spent outside of them is
+        added to it. With a tracer, the call is traced in a span named `name`, the phase by
+        default.
+        """
+        if self.tracer is not None:
+            with self.tracer.start_as_current_span(name or phase, attributes):
+                return await self.measure_phase(phase, call, exclusive)
+        return await self.measure_phase(phase, call, exclusive)
+
+    async def measure_phase(
+        self, phase: str, call: Callable[[], Awaitable[Any]], exclusive: bool
+    ) -> Any:
+        span = None
+        if self.stack:
+            span = Span(phase, time.perf_counter_ns())
+            self.stack[-1].children.append(span)
+            self.stack.append(span)
+
+        outer = exclusive or self.current is None
+        if outer and not exclusive:
+            self.current = phase
+        measured = sum(self.phases.values()) if exclusive else 0
+        start = time.perf_counter_ns()
+        try:
+            return await call()
+        finally:
+            end = time.perf_counter_ns()
+            if exclusive:
+                self.add(phase, end - start - (sum(self.phases.values()) - measured))
+            elif outer:
+                self.add(phase, end - start)
+                self.current = None
+            if span is not None:
+                span.end = end
+                self.stack.pop()
+
+    def enter_handler(self, handler: "HTTPHandler", scope: Scope) -> None:
+        """
+        Records the route template of the handler and ends the `dispatch` phase, from the
+        start of the request, through the middleware and the routing, to the handler.
+        """
+        app = self.app if self.app is not None else scope.get("app")
+        if hasattr(app, "router"):
+            instrument_routes(app)
+            if handler.instrumented_route is None:
+                # Added to an include since the routes were walked.
+                instrument_routes(app, force=True)
+        if handler.instrumented_route is None:
+            handler.instrumented_route = handler.path_format
+        self.route = handler.instrumented_route
+        self.add("dispatch", time.perf_counter_ns() - self.start, self.start)
+
+    async def measure_permissions(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await self.measure("permissions", call)
+        except (PermissionDenied, NotAuthorized):
+            self.denied = True
+            raise
+
+    async def measure_dependency(
+        self, dependency: "Dependency", call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.tracer is None:
+            return await self.measure_phase("dependencies", call, False)
+        provider = getattr(dependency.inject, "dependency", dependency.inject)
+        return await self.measure(
+            "dependencies",
+            call,
+            name=f"dependency {dependency.key}",
+            attributes={
+                "ravyn.dependency": dependency.key,
+                "ravyn.dependency.provider": get_name(provider),
+            },
+        )
+
+    def trace_response(self, response: Any) -> None:
+        """
+        Traces the background tasks of the response in the span of the handler.
+        """
+        parent = current_span.get()
+        if (
+            self.trace_background
+            and self.tracer is not None
+            and parent is not None
+            and getattr(response, "background", None) is not None
+        ):
+            response.background = TracedTask(response.background, self.tracer, parent)
+
+    def finish(self) -> int:
+        """
+        Ends the request, returning its duration.
+        """
+        end = time.perf_counter_ns()
+        if self.root is not None:
+            self.root.end = end
+        return end - self.start
+
+    def wrap_send(self, send: Send) -> Send:
+        """
+        Records the status of the response and measures the `send` phase, from the start of
+        the response to its last body message.
+        """
+        send_start = 0
+
+        async def send_measured(message: Message) -> None:
+            nonlocal send_start
+            if message["type"] == "http.response.start":
+                self.status = message["status"]
+                send_start = time.perf_counter_ns()
+                await send(message)
+                return
+            await send(message)
+            if not message.get("more_body", False) and send_start:
+                self.add("send", time.perf_counter_ns() - send_start, send_start)
+
+        return send_measured
+
+
+current_request: ContextVar[Optional[RequestTimer]] = ContextVar(
+    "ravyn_request_timer", default=None
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Counts a hit or a miss of the cache in the metrics of the current request, when the
+    application has a `metrics_config`.
+    """
+    timer = current_request.get()
+    if timer is not None and timer.metrics is not None:
+        timer.metrics.cache_requests.inc(cache, "hit" if hit else "miss")
+
+
+def get_threadpool_statistics() -> Iterable[tuple[LabelValues, float]]:
+    try:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        statistics = limiter.statistics()
+    except Exception:  # noqa
+        # Only available from an event loop.
+        return ()
+    return (
+        (("busy",), statistics.borrowed_tokens),
+        (("waiting",), statistics.tasks_waiting),
+        (("limit",), limiter.total_tokens),
+    )
+
+
+# The number of routes of each application when its routes were last walked.
+walked_routes: "WeakKeyDictionary[Any, int]" = WeakKeyDictionary()
+
+
+def join_paths(prefix: str, path: str) -> str:
+    return "/" + "/".join(part for part in f"{prefix}/{path}".split("/") if part)
+
+
+def walk_routes(routes: Sequence[Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """
+    Yields the route template and the app of the HTTP handlers and of the static files
+    mounted in the routes, the includes are walked recursively.
+    """
+    from ravyn.routing.gateways import Gateway
+    from ravyn.routing.router import HTTPHandler, Include
+    from ravyn.staticfiles import StaticFiles
+
+    for route in routes:
+        if isinstance(route, Include):
+            path = join_paths(prefix, route.path)
+            if isinstance(route.app, StaticFiles):
+                yield path, route.app
+                continue
+            yield from walk_routes(getattr(route, "routes", None) or (), path)
+        elif isinstance(route, Gateway) and isinstance(route.handler, HTTPHandler):
+            yield join_paths(prefix, route.path_format), route.handler
+
+
+def instrument_routes(app: Any, force: bool = False) -> None:
+    """
+    Records the route template of each HTTP handler of the application, the includes are
+    walked recursively. The routes are only walked again when routes are added to the
+    application, or with `force`.
+    """
+    from ravyn.routing.router import HTTPHandler
+
+    routes = app.router.routes
+    if not force and walked_routes.get(app) == len(routes):
+        return
+    walked_routes[app] = len(routes)
+    for route, handler in walk_routes(routes):
+        if isinstance(handler, HTTPHandler):
+            handler.instrumented_route = route
+
+
+def trace_interceptor(timer: Optional[RequestTimer], interceptor: Any) -> ContextManager[Any]:
+    if timer is None or timer.tracer is None:
+        return NO_SPAN
+    name = get_name(interceptor)
+    return timer.tracer.start_as_current_span(f"interceptor {name}", {"ravyn.interceptor": name})
+
+
+def trace_permission(timer: Optional[RequestTimer], permission: Any) -> ContextManager[Any]:
+    if timer is None or timer.tracer is None:
+        return NO_SPAN
+    name = get_name(permission)
+    return timer.tracer.start_as_current_span(f"permission {name}", {"ravyn.permission": name})
+
+
+def trace_requires(timer: Optional[RequestTimer], kwargs: dict[str, Any]) -> ContextManager[Any]:
+    from ravyn.params import Requires
+
+    if timer is None or timer.tracer is None:
+        return NO_SPAN
+    names = [name for name, value in kwargs.items() if isinstance(value, Requires)]
+    return timer.tracer.start_as_current_span("requires", {"ravyn.requires": names})
+
+
+class RavynMetrics:
+    """
+    The metrics of an application with a `metrics_config`.
+
+    The phases are only measured by the handlers of the requests timed by a middleware,
+    the applications without `metrics_config` measure nothing.
+    """
+
+    def __init__(self, config: "MetricsConfig") -> None:
+        self.config = config
+        self.registry = MetricsRegistry()
+        namespace = config.namespace
+        self.request_duration = self.registry.register(
+            Histogram(
+                f"{namespace}_request_duration_seconds",
+                "Duration of the requests per route template.",
+                ("method", "route", "status"),
+                config.buckets,
+            )
+        )
+        self.phase_duration = self.registry.register(
+            Histogram(
+                f"{namespace}_request_phase_duration_seconds",
+                "Duration of each phase of the requests per route template.",
+                ("route", "phase"),
+                config.buckets,
+            )
+        )
+        self.requests_in_progress = self.registry.register(
+            Gauge(f"{namespace}_requests_in_progress", "Requests being handled.")
+        )
+        self.permission_denials = self.registry.register(
+            Counter(
+                f"{namespace}_permission_denials",
+                "Requests refused by the permissions per route template.",
+                ("route",),
+            )
+        )
+        self.cache_requests = self.registry.register(
+            Counter(
+                f"{namespace}_cache_requests",
+                "Hits and misses of the caches.",
+                ("cache", "result"),
+            )
+        )
+        self.threadpool = self.registry.register(
+            Gauge(
+                f"{namespace}_threadpool_threads",
+                "Threads of the default thread limiter, busy, waiting for a thread and limit.",
+                ("state",),
+                callback=get_threadpool_statistics,
+            )
+        )
+        self.cache_collectors: list[tuple[str, Callable[[], dict[str, Any]]]] = []
+        self.collected_routes = -1
+        self.in_progress = 0
+
+    def render(self) -> str:
+        for name, collector in self.cache_collectors:
+            for cache, values in collector().items():
+                if not isinstance(values, dict) or "hits" not in values:
+                    continue
+                label = f"{name}.{cache}" if cache != "cache" else name
+                self.cache_requests.values[(label, "hit")] = values.get("hits", 0)
+                self.cache_requests.values[(label, "miss")] = values.get("misses", 0)
+        self.requests_in_progress.set(self.in_progress)
+        return self.registry.render()
+
+    def observe(self, timer: RequestTimer, method: str) -> None:
+        route = timer.route or UNMATCHED_ROUTE
+        if method not in HTTP_METHODS:
+            method = "OTHER"
+        self.request_duration.observe(timer.duration / 1e9, method, route, str(timer.status))
+        if timer.denied:
+            self.permission_denials.inc(route)
+        if timer.route is not None and self.config.phases:
+            for phase, duration in timer.phases.items():
+                self.phase_duration.observe(duration / 1e9, route, phase)
+
+    def collect_caches(self, app: "Ravyn") -> None:
+        """
+        Collects the caches of the templates and of the static files of the application,
+        once, and again when routes are added.
+        """
+        from ravyn.staticfiles import StaticFiles
+
+        routes = app.router.routes
+        if self.collected_routes == len(routes):
+            return
+        self.collected_routes = len(routes)
+
+        template_engine = getattr(app, "template_engine", None)
+        if hasattr(template_engine, "get_metrics") and not any(
+            name == "templates" for name, _ in self.cache_collectors
+        ):
+            self.cache_collectors.append(("templates", template_engine.get_metrics))
+        for _, handler in walk_routes(routes):
+            if isinstance(handler, StaticFiles):
+                collector = ("static_files", handler.get_metrics)
+                if collector not in self.cache_collectors:
+                    self.cache_collectors.append(collector)
@@ -0,0 +1,156 @@
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import Callable, Union
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: Union[int, float]) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return repr(value)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+class Metric:
+    """
+    A metric with its samples per label values.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:  # pragma: no cover
+        raise NotImplementedError()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self.values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}_total{format_labels(self.labels, values)} {format_value(value)}"
+            for values, value in self.values.items()
+        ]
+
+
+class Gauge(Metric):
+    """
+    A gauge, set directly or read from a callback when the metrics are rendered.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        callback: Union[Callable[[], Iterable[tuple[LabelValues, float]]], None] = None,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.values: dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def set(self, value: float, *label_values: str) -> None:
+        self.values[label_values] = value
+
+    def render(self) -> list[str]:
+        if self.callback is not None:
+            self.values.update(self.callback())
+        return [
+            f"{self.name}{format_labels(self.labels, values)} {format_value(value)}"
+            for values, value in self.values.items()
+        ]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = (),
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: the count of each bucket (not cumulative), the sum and the count.
+        self.values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        sample = self.values.get(label_values)
+        if sample is None:
+            sample = self.values[label_values] = [0.0] * (len(self.buckets) + 3)
+        sample[bisect_left(self.buckets, value)] += 1
+        sample[-2] += value
+        sample[-1] += 1
+
+    def render(self) -> list[str]:
+        lines: list[str] = []
+        names = (*self.labels, "le")
+        for values, sample in self.values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), sample[:-2], strict=True):
+                cumulative += int(count)
+                labels = format_labels(names, (*values, format_value(float(bound))))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.labels, values)
+            lines.append(f"{self.name}_sum{labels} {format_value(float(sample[-2]))}")
+            lines.append(f"{self.name}_count{labels} {int(sample[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    The metrics of an application, rendered in the Prometheus text format.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"A metric named '{metric.name}' is already registered.")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics.values():
+            samples = metric.render()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,4 @@
+from .profiler import Profiler, ProfileRecord, replay
+from .sampler import StackSampler
+
+__all__ = ["ProfileRecord", "Profiler", "StackSampler", "replay"]
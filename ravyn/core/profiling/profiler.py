@@ -0,0 +1,157 @@
+import itertools
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ravyn.core.metrics.instrumentation import UNMATCHED_ROUTE, RequestTimer
+from ravyn.core.profiling.sampler import StackSampler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.applications import Ravyn
+    from ravyn.core.config.profiling import ProfilingConfig
+
+
+class ProfileRecord:
+    """
+    A slow request, with its timing tree and, with the `stack_sampling`, its most frequent
+    stacks.
+    """
+
+    __slots__ = (
+        "id",
+        "method",
+        "path",
+        "route",
+        "status",
+        "duration_ms",
+        "timestamp",
+        "phases",
+        "tree",
+        "stacks",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        method: str,
+        path: str,
+        timer: RequestTimer,
+        duration: int,
+        max_stacks: int,
+    ) -> None:
+        self.id = id
+        self.method = method
+        self.path = path
+        self.route = timer.route or UNMATCHED_ROUTE
+        self.status = timer.status
+        self.duration_ms = duration / 1_000_000
+        self.timestamp = time.time()
+        self.phases = {phase: value / 1_000_000 for phase, value in timer.phases.items()}
+        self.tree = timer.root.as_dict() if timer.root is not None else None
+        self.stacks: list[dict[str, Any]] = (
+            [
+                {"samples": samples, "stack": list(stack)}
+                for stack, samples in timer.stacks.most_common(max_stacks)
+            ]
+            if timer.stacks
+            else []
+        )
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "timestamp": self.timestamp,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **self.summary(),
+            "phases": self.phases,
+            "tree": self.tree,
+            "stacks": self.stacks,
+        }
+
+
+class Profiler:
+    """
+    The profiler of an application with a `profiling_config`.
+
+    Keeps the last `buffer_size` requests slower than the `threshold_ms`. The phases are
+    only measured by the handlers of the requests it times, the applications without
+    `profiling_config` measure nothing.
+    """
+
+    def __init__(self, config: "ProfilingConfig") -> None:
+        self.config = config
+        self.records: deque[ProfileRecord] = deque(maxlen=config.buffer_size)
+        self.sampler = StackSampler(config.sampling_interval) if config.stack_sampling else None
+        self.threshold = int(config.threshold_ms * 1_000_000)
+        self.ids = itertools.count(1)
+
+    def start(self, app: Any = None) -> RequestTimer:
+        timer = RequestTimer(tree=True, app=app)
+        if self.sampler is not None:
+            self.sampler.start(timer)
+        return timer
+
+    def finish(self, timer: RequestTimer, method: str, path: str) -> Optional[ProfileRecord]:
+        """
+        Stops the timer of the request and keeps it when slower than the threshold.
+        """
+        duration = timer.finish()
+        if self.sampler is not None:
+            self.sampler.stop(timer)
+        if duration < self.threshold:
+            return None
+        record = ProfileRecord(
+            next(self.ids), method, path, timer, duration, self.config.max_stacks
+        )
+        self.records.append(record)
+        return record
+
+    def get(self, id: int) -> Optional[ProfileRecord]:
+        for record in self.records:
+            if record.id == id:
+                return record
+        return None
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+def replay(
+    app: "Ravyn",
+    method: str,
+    path: str,
+    headers: Optional[dict[str, str]] = None,
+    content: Union[str, bytes, None] = None,
+    repeat: int = 1,
+    stack_sampling: bool = False,
+) -> Sequence[ProfileRecord]:
+    """
+    Sends the request `repeat` times to the application, in process, and returns the
+    profile of each of them, whatever their duration.
+
+    Used by the `ravyn profile` directive.
+    """
+    from lilya.testclient import TestClient
+
+    from ravyn.core.config.profiling import ProfilingConfig
+    from ravyn.middleware.profiling import ProfilingMiddleware
+
+    profiler = Profiler(
+        ProfilingConfig(
+            threshold_ms=0, buffer_size=repeat, path=None, stack_sampling=stack_sampling
+        )
+    )
+    client = TestClient(ProfilingMiddleware(app, profiler), raise_server_exceptions=False)
+    with client:
+        for _ in range(repeat):
+            client.request(method.upper(), path, headers=headers, content=content)
+    return list(profiler.records)
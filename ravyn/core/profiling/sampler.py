@@ -0,0 +1,75 @@
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+from ravyn.core.metrics.instrumentation import RequestTimer
+
+MAX_STACK_DEPTH = 64
+
+
+def format_stack(frame: Optional[FrameType]) -> tuple[str, ...]:
+    """
+    The stack of the frame, from the outermost call to the innermost.
+    """
+    stack: list[str] = []
+    while frame is not None and len(stack) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+class StackSampler:
+    """
+    Samples, every `interval`, the stack of the thread handling the request being
+    profiled and counts the stacks seen in the `RequestTimer` of the request.
+
+    A statistical, wall clock, sampler in the style of pyinstrument, without the
+    dependency. The concurrent requests run in the same thread, the event loop, and their
+    stacks cannot be told apart: the stacks are only sampled while exactly one request is
+    profiled, the others are sampled on their own. The sampling thread is only started
+    with the first sampled request and sleeps while no request is sampled.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.active: dict[RequestTimer, int] = {}
+        self.wakeup = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self, timer: RequestTimer) -> None:
+        timer.stacks = Counter()
+        with self.lock:
+            self.active[timer] = threading.get_ident()
+            self.wakeup.set()
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="ravyn-stack-sampler", daemon=True
+                )
+                self.thread.start()
+
+    def stop(self, timer: RequestTimer) -> None:
+        with self.lock:
+            self.active.pop(timer, None)
+            if not self.active:
+                self.wakeup.clear()
+
+    def sample(self) -> None:
+        with self.lock:
+            if len(self.active) != 1:
+                return
+            ((timer, thread_id),) = self.active.items()
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None and timer.stacks is not None:
+                timer.stacks[format_stack(frame)] += 1
+
+    def run(self) -> None:
+        while True:
+            self.wakeup.wait()
+            time.sleep(self.interval)
+            self.sample()
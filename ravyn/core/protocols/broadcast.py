@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class BroadcastBackend(ABC):
+    """Protocol for broadcast backends, carrying the published messages between the nodes."""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open the connection to the backend."""
+        raise NotImplementedError("Broadcast backend must implement connect method.")
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Close the connection to the backend."""
+        raise NotImplementedError("Broadcast backend must implement disconnect method.")
+
+    @abstractmethod
+    async def subscribe(self, channel: str) -> None:
+        """Start receiving the messages published to the channel."""
+        raise NotImplementedError("Broadcast backend must implement subscribe method.")
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str) -> None:
+        """Stop receiving the messages published to the channel."""
+        raise NotImplementedError("Broadcast backend must implement unsubscribe method.")
+
+    @abstractmethod
+    async def publish(self, channel: str, message: bytes) -> None:
+        """Publish an encoded message to the channel."""
+        raise NotImplementedError("Broadcast backend must implement publish method.")
+
+    @abstractmethod
+    async def next_published(self) -> tuple[str, bytes]:
+        """Wait for the next message published to a subscribed channel."""
+        raise NotImplementedError("Broadcast backend must implement next_published method.")
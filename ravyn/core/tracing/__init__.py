@@ -0,0 +1,28 @@
+from .background import TracedTask
+from .exporters import InMemorySpanExporter, SpanExporter
+from .tracer import (
+    NO_OP_TRACER,
+    NonRecordingSpan,
+    NoOpTracer,
+    Span,
+    Tracer,
+    current_span,
+    extract_traceparent,
+    get_current_span,
+    get_tracer,
+)
+
+__all__ = [
+    "InMemorySpanExporter",
+    "NO_OP_TRACER",
+    "NoOpTracer",
+    "NonRecordingSpan",
+    "Span",
+    "SpanExporter",
+    "TracedTask",
+    "Tracer",
+    "current_span",
+    "extract_traceparent",
+    "get_current_span",
+    "get_tracer",
+]
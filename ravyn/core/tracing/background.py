@@ -0,0 +1,30 @@
+from typing import Any
+
+from lilya.background import Task, Tasks
+
+from ravyn.core.tracing.tracer import Span, Tracer, get_name
+
+
+class TracedTask(Task):
+    """
+    Runs the background task of a response in a span, the child of the request span,
+    wherever the task is executed.
+    """
+
+    __slots__ = ("task", "tracer", "parent")
+
+    def __init__(self, task: Task, tracer: Tracer, parent: Span) -> None:
+        self.task = task
+        self.tracer = tracer
+        self.parent = parent
+
+    async def __call__(self) -> None:
+        attributes: dict[str, Any]
+        if isinstance(self.task, Tasks):
+            name = "background tasks"
+            attributes = {"ravyn.background.tasks": [get_name(t.func) for t in self.task.tasks]}
+        else:
+            name = f"background {get_name(getattr(self.task, 'func', self.task))}"
+            attributes = {}
+        with self.tracer.start_as_current_span(name, attributes, self.parent):
+            await self.task()
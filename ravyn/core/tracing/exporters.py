@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+from threading import Lock
+
+from ravyn.core.tracing.tracer import Span
+
+
+class SpanExporter:
+    """
+    Receives the spans once ended.
+
+    `export` is called when each span ends, in the request, the exporters sending the
+    spans over the network should buffer them and send them in the background.
+    """
+
+    def export(self, spans: Sequence[Span]) -> None:  # pragma: no cover
+        raise NotImplementedError()
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Keeps the ended spans in memory, for the tests and the local debugging.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.lock = Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self.lock:
+            self.spans.extend(spans)
+
+    def get_finished_spans(self) -> list[Span]:
+        with self.lock:
+            return list(self.spans)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.spans.clear()
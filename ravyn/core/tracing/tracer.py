@@ -0,0 +1,296 @@
+import random
+import re
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.core.tracing.exporters import SpanExporter
+
+Attributes = dict[str, Any]
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+INVALID_TRACE_ID = "0" * 32
+INVALID_SPAN_ID = "0" * 16
+
+
+def get_name(obj: Any) -> str:
+    """
+    The qualified name of a callable, a class or an instance, unwrapping the partials
+    and the `AsyncCallable` of the permissions and of the background tasks.
+    """
+    while True:
+        if isinstance(obj, partial):
+            # The synchronous callables are wrapped in a partial of `run_sync`.
+            obj = obj.args[0] if obj.args else obj.func
+        elif hasattr(obj, "__qualname__"):
+            break
+        elif hasattr(obj, "fn"):
+            obj = obj.fn
+        elif hasattr(obj, "_callable"):
+            obj = obj._callable
+        else:
+            break
+    name = getattr(obj, "__qualname__", None) or type(obj).__qualname__
+    return str(name)
+
+
+class Span:
+    """
+    An operation of a trace, with its timing in nanoseconds since the epoch, its
+    attributes, events and status, in the OpenTelemetry model.
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "end_time",
+        "attributes",
+        "events",
+        "status",
+        "status_description",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Attributes] = None,
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes: Attributes = dict(attributes) if attributes else {}
+        self.events: list[tuple[str, int, Attributes]] = []
+        self.status = "unset"
+        self.status_description: Optional[str] = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    @property
+    def duration(self) -> int:
+        return (self.end_time or time.time_ns()) - self.start_time
+
+    @property
+    def traceparent(self) -> str:
+        """
+        The W3C `traceparent` header propagating the span to another service.
+        """
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Attributes] = None) -> None:
+        self.events.append((name, time.time_ns(), dict(attributes) if attributes else {}))
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        self.status = status
+        self.status_description = description
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.add_event(
+            "exception",
+            {"exception.type": type(exc).__qualname__, "exception.message": str(exc)},
+        )
+        self.set_status("error", str(exc) or type(exc).__qualname__)
+
+    def end(self) -> None:
+        if self.end_time is not None:
+            return
+        self.end_time = time.time_ns()
+        self.tracer.on_end(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "attributes": self.attributes,
+            "events": [
+                {"name": name, "timestamp": timestamp, "attributes": attributes}
+                for name, timestamp, attributes in self.events
+            ],
+            "status": self.status,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, span_id={self.span_id!r})"
+
+
+class NonRecordingSpan(Span):
+    """
+    The span of the `NoOpTracer`, or a remote parent read from a `traceparent` header,
+    recording nothing.
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None: ...
+
+    def add_event(self, name: str, attributes: Optional[Attributes] = None) -> None: ...
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None: ...
+
+    def record_exception(self, exc: BaseException) -> None: ...
+
+    def end(self) -> None: ...
+
+
+current_span: ContextVar[Optional[Span]] = ContextVar("ravyn_current_span", default=None)
+
+
+class Tracer:
+    """
+    Creates the spans and hands them over to the exporter when they end.
+
+    The current span is kept in a context variable, the spans started inside it are its
+    children, in the same task, in the tasks it creates and in the background tasks of
+    the response.
+    """
+
+    enabled = True
+
+    def __init__(self, exporter: "SpanExporter", service_name: str = "ravyn") -> None:
+        self.exporter = exporter
+        self.service_name = service_name
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        parent: Optional[Span] = None,
+    ) -> Span:
+        """
+        Starts a span, the child of the `parent` or of the current span.
+        """
+        if parent is None:
+            parent = current_span.get()
+        if parent is None:
+            trace_id = f"{random.getrandbits(128):032x}"
+            return Span(self, name, trace_id, new_span_id(), None, attributes)
+        return Span(self, name, parent.trace_id, new_span_id(), parent.span_id, attributes)
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        parent: Optional[Span] = None,
+    ) -> Iterator[Span]:
+        """
+        Starts a span, current until the end of the block, recording the exception
+        raised inside.
+        """
+        span = self.start_span(name, attributes, parent)
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            current_span.reset(token)
+            span.end()
+
+    def on_end(self, span: Span) -> None:
+        self.exporter.export((span,))
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+class NoOpTracer(Tracer):
+    """
+    The default tracer, creating spans recording nothing.
+    """
+
+    enabled = False
+
+    def __init__(self) -> None:
+        self.exporter = None
+        self.service_name = ""
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        parent: Optional[Span] = None,
+    ) -> Span:
+        return NonRecordingSpan(self, name, INVALID_TRACE_ID, INVALID_SPAN_ID)
+
+    def on_end(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+NO_OP_TRACER = NoOpTracer()
+
+
+def new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+def get_current_span() -> Optional[Span]:
+    return current_span.get()
+
+
+def get_tracer() -> Tracer:
+    """
+    The tracer of the current span, the tracer of the application inside its requests,
+    or the `NoOpTracer`.
+
+    **Example**
+
+    ```python
+    from ravyn.core.tracing import get_tracer
+
+
+    async def charge(order_id: int) -> None:
+        with get_tracer().start_as_current_span("charge", {"order.id": order_id}):
+            ...
+    ```
+    """
+    span = current_span.get()
+    return span.tracer if span is not None else NO_OP_TRACER
+
+
+def extract_traceparent(tracer: Tracer, value: Optional[str]) -> Optional[Span]:
+    """
+    The remote parent of a W3C `traceparent` header, `None` when missing or invalid.
+    """
+    if not value:
+        return None
+    match = TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or match.group(1) == INVALID_TRACE_ID or match.group(2) == INVALID_SPAN_ID:
+        return None
+    return NonRecordingSpan(tracer, "remote", match.group(1), match.group(2))
@@ -0,0 +1,131 @@
+from typing import Any, Optional, Union, get_args
+
+import msgspec
+from pydantic.errors import PydanticSchemaGenerationError
+
+from ravyn.encoders import MsgSpecEncoder, PydanticEncoder
+from ravyn.utils.helpers import is_class_and_subclass, is_optional_union, is_union
+from ravyn.utils.schema import get_type_adapter
+
+MESSAGE_PACK_MEDIA_TYPES = frozenset({"application/x-msgpack", "application/msgpack"})
+
+# Bodies treated as "no value" for an optional `data` or `payload`.
+EMPTY_BODIES = frozenset({b"", b"null", b"{}", b"[]"})
+
+
+def get_body_type(annotation: Any) -> Any:
+    """
+    Returns the type of the body without the optional `None`, if any.
+    """
+    if is_optional_union(annotation):
+        arguments = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return arguments[0] if len(arguments) == 1 else Union[tuple(arguments)]
+    return annotation
+
+
+def is_encoder(encoder: Any, encoder_type: type) -> bool:
+    return isinstance(encoder, encoder_type) or is_class_and_subclass(encoder, encoder_type)
+
+
+class BodyDecoder:
+    """
+    Base of the decoders building the `data` or `payload` straight from the raw
+    request bytes, parsing and validating the body in a single pass.
+
+    A decoder is created once per handler, when the signature is built.
+    """
+
+    __slots__ = ("annotation", "is_optional")
+
+    def __init__(self, annotation: Any) -> None:
+        self.annotation = annotation
+        self.is_optional = is_optional_union(annotation)
+
+    @classmethod
+    def accepts(cls, encoder: Any, annotation: Any) -> bool:
+        """
+        Checks if the decoder can build the annotation handled by the given encoder.
+        """
+        raise NotImplementedError("All body decoders must implement accepts() method.")
+
+    def decode(self, body: bytes, content_type: str) -> Any:
+        """
+        Decodes and validates the raw body. An optional body without
+        any value is `None`.
+        """
+        if self.is_optional and body.strip() in EMPTY_BODIES:
+            return None
+        return self.decode_body(body, content_type)
+
+    def decode_body(self, body: bytes, content_type: str) -> Any:
+        """
+        Decodes and validates the raw body. An empty body is treated as `null`,
+        exactly like a JSON body would be.
+        """
+        raise NotImplementedError("All body decoders must implement decode_body() method.")
+
+
+class MsgSpecBodyDecoder(BodyDecoder):
+    """
+    Decodes the body into a `msgspec.Struct`, supporting both JSON and
+    MessagePack bodies.
+    """
+
+    __slots__ = ("json_decoder", "msgpack_decoder")
+
+    def __init__(self, annotation: Any) -> None:
+        super().__init__(annotation)
+        self.json_decoder = msgspec.json.Decoder(annotation)
+        self.msgpack_decoder = msgspec.msgpack.Decoder(annotation)
+
+    @classmethod
+    def accepts(cls, encoder: Any, annotation: Any) -> bool:
+        # Structs and unions of structs, tagged ones for the decoders to accept them.
+        body_type = get_body_type(annotation)
+        members = get_args(body_type) if is_union(body_type) else (body_type,)
+        return is_encoder(encoder, MsgSpecEncoder) and all(
+            is_class_and_subclass(member, msgspec.Struct) for member in members
+        )
+
+    def decode_body(self, body: bytes, content_type: str) -> Any:
+        if content_type.split(";", 1)[0].strip() in MESSAGE_PACK_MEDIA_TYPES:
+            return self.msgpack_decoder.decode(body)
+        return self.json_decoder.decode(body or b"null")
+
+
+class PydanticBodyDecoder(BodyDecoder):
+    """
+    Validates the JSON body with the `TypeAdapter` of the annotation, which
+    covers models, `RootModel` and collections such as `list[Model]`.
+    """
+
+    __slots__ = ("adapter",)
+
+    def __init__(self, annotation: Any) -> None:
+        super().__init__(annotation)
+        self.adapter = get_type_adapter(annotation)
+
+    @classmethod
+    def accepts(cls, encoder: Any, annotation: Any) -> bool:
+        return is_encoder(encoder, PydanticEncoder)
+
+    def decode_body(self, body: bytes, content_type: str) -> Any:
+        return self.adapter.validate_json(body or b"null")
+
+
+BODY_DECODERS: tuple[type[BodyDecoder], ...] = (MsgSpecBodyDecoder, PydanticBodyDecoder)
+
+
+def get_body_decoder(encoder: Any, annotation: Any) -> Optional[BodyDecoder]:
+    """
+    Returns the decoder able to build the body directly from the raw bytes,
+    or `None` when the body follows the regular JSON parsing.
+    """
+    for decoder in BODY_DECODERS:
+        if decoder.accepts(encoder, annotation):
+            try:
+                return decoder(annotation)
+            except (PydanticSchemaGenerationError, TypeError):
+                # Types unknown to the decoder keep the regular parsing.
+                return None
+    return None
@@ -0,0 +1,136 @@
+from types import UnionType
+from typing import Any, Callable, Literal, Optional, Union, get_args, get_origin
+
+import msgspec
+from orjson import loads
+from pydantic import BaseModel, Field, ValidationError
+from typing_extensions import Annotated
+
+from ravyn.utils.helpers import is_class_and_subclass
+from ravyn.utils.schema import get_type_adapter
+
+MessageDecoder = Callable[[Union[str, bytes]], Any]
+
+# The field identifying the type of a message in a discriminated union.
+DISCRIMINATOR = "type"
+
+_MESSAGE_DECODERS: dict[Any, "WebSocketMessageDecoder"] = {}
+
+
+def get_literal_tags(model: Any, field: str = DISCRIMINATOR) -> Optional[tuple[Any, ...]]:
+    """
+    Returns the values of the `Literal` declared by the model for the field, if any.
+    """
+    annotation: Any = None
+    if is_class_and_subclass(model, BaseModel):
+        model_field = model.model_fields.get(field)
+        annotation = model_field.annotation if model_field is not None else None
+    elif is_class_and_subclass(model, msgspec.Struct):
+        for struct_field in msgspec.structs.fields(model):
+            if struct_field.name == field:
+                annotation = struct_field.type
+    if get_origin(annotation) is Literal:
+        return get_args(annotation)
+    return None
+
+
+def get_dispatch_table(annotation: Any) -> Optional[dict[Any, Any]]:
+    """
+    Maps the `type` of each model of a union to the model, when all the models of
+    the union declare a distinct `Literal` type.
+    """
+    if get_origin(annotation) not in (Union, UnionType):
+        return None
+
+    table: dict[Any, Any] = {}
+    for model in get_args(annotation):
+        tags = get_literal_tags(model)
+        if not tags:
+            return None
+        for tag in tags:
+            if tag in table:
+                return None
+            table[tag] = model
+    return table
+
+
+class WebSocketMessageDecoder:
+    """
+    Decodes and validates the incoming websocket frames straight from their raw
+    text or bytes into the `message` declared by a websocket handler.
+
+    A union of models declaring a distinct `Literal` `type` is dispatched on the
+    `type` of the message: pydantic validates it as a discriminated union, tagged
+    `msgspec.Struct` are decoded by msgspec and any other union goes through a
+    dispatch table of the models.
+
+    The decoders are built once per annotation, see `get_message_decoder`.
+    """
+
+    __slots__ = ("annotation", "table", "decode")
+
+    def __init__(self, annotation: Any) -> None:
+        self.annotation = annotation
+        self.table = get_dispatch_table(annotation)
+        self.decode: MessageDecoder = self.build_decoder()
+
+    def build_decoder(self) -> MessageDecoder:
+        is_union = get_origin(self.annotation) in (Union, UnionType)
+        models = get_args(self.annotation) if is_union else (self.annotation,)
+
+        if all(is_class_and_subclass(model, msgspec.Struct) for model in models):
+            try:
+                return msgspec.json.Decoder(self.annotation).decode
+            except TypeError:
+                # msgspec only decodes the unions of tagged structs.
+                pass
+
+        if self.table is None:
+            return get_type_adapter(self.annotation).validate_json
+
+        if all(is_class_and_subclass(model, BaseModel) for model in models):
+            return get_type_adapter(
+                Annotated[self.annotation, Field(discriminator=DISCRIMINATOR)]
+            ).validate_json
+        return self.dispatch
+
+    def dispatch(self, raw: Union[str, bytes]) -> Any:
+        data = msgspec.json.decode(raw)
+        if not isinstance(data, dict):
+            raise ValueError("The message must be a JSON object.")
+
+        tag = data.get(DISCRIMINATOR)
+        try:
+            model = self.table[tag]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown message {DISCRIMINATOR}: {tag!r}.") from None
+
+        if is_class_and_subclass(model, BaseModel):
+            return model.model_validate(data)
+        return msgspec.convert(data, model)
+
+    def __call__(self, raw: Union[str, bytes]) -> Any:
+        return self.decode(raw)
+
+
+def get_message_decoder(annotation: Any) -> WebSocketMessageDecoder:
+    """
+    Returns the decoder of the annotation, built once and reused afterwards.
+    """
+    try:
+        return _MESSAGE_DECODERS[annotation]
+    except KeyError:
+        decoder = _MESSAGE_DECODERS[annotation] = WebSocketMessageDecoder(annotation)
+        return decoder
+    except TypeError:
+        # Unhashable annotations cannot be cached.
+        return WebSocketMessageDecoder(annotation)
+
+
+def get_message_errors(exc: Exception) -> list[Any]:
+    """
+    The errors of a message failing to decode or validate.
+    """
+    if isinstance(exc, ValidationError):
+        return loads(exc.json())  # type: ignore[no-any-return]
+    return [str(exc)]
@@ -11,10 +11,15 @@ from typing import (
     cast,
 )
 
+import msgspec
+from pydantic import ValidationError
 from pydantic.fields import FieldInfo
 
 from ravyn.context import Context
+from ravyn.core.metrics.instrumentation import RequestTimer, current_request, trace_requires
+from ravyn.core.transformers.decoders import BodyDecoder, get_body_decoder
 from ravyn.core.transformers.signature import SignatureModel
+from ravyn.core.transformers.stream import ItemDecoder, JSONArrayStream, build_item_decoder
 from ravyn.core.transformers.utils import (
     Dependency,
     ParamSetting,
@@ -63,6 +68,8 @@ class TransformerModel(ArbitraryExtraBaseModel):
         query_params: Set[ParamSetting],
         reserved_kwargs: Set[str],
         is_optional: bool,
+        body_stream: Optional[ItemDecoder] = None,
+        body_decoder: Optional[BodyDecoder] = None,
         **kwargs: Any,
     ):
         """
@@ -77,6 +84,10 @@ class TransformerModel(ArbitraryExtraBaseModel):
             query_params (Set[ParamSetting]): Set of query parameters.
             reserved_kwargs (Set[str]): Set of reserved keyword arguments.
             is_optional (bool): Flag indicating if the model is optional.
+            body_stream (Optional[ItemDecoder]): Decoder of each item when the body is
+                streamed as an `AsyncIterator[Item]`.
+            body_decoder (Optional[BodyDecoder]): Decoder building the body directly
+                from the raw request bytes.
             **kwargs (Any): Additional keyword arguments.
         """
         super().__init__(**kwargs)
@@ -97,6 +108,16 @@ class TransformerModel(ArbitraryExtraBaseModel):
             or reserved_kwargs
         )
         self.is_optional = is_optional
+        self.body_stream = body_stream
+        self.body_decoder = body_decoder
+
+    @property
+    def decodes_body(self) -> bool:
+        """
+        Whether the request data is already decoded into its final type
+        by the transformer and must be passed as is.
+        """
+        return self.body_stream is not None or self.body_decoder is not None
 
     def get_cookie_params(self) -> Set[ParamSetting]:
         """
@@ -228,16 +249,36 @@ class TransformerModel(ArbitraryExtraBaseModel):
             handler=handler,
         )
 
-    async def get_request_data(self, request: Request) -> Any:
+    async def get_request_data(
+        self,
+        request: Request,
+        handler: Union["HTTPHandler", "WebSocketHandler", None] = None,
+    ) -> Any:
         """
         Get request data asynchronously.
 
         Args:
             request (Request): HTTP Request object.
+            handler (Union[HTTPHandler, WebSocketHandler, None]): The handler of the
+                request, its signature model builds the validation errors of the body.
 
         Returns:
             Any: Parsed form data or JSON payload.
         """
+        if self.body_stream is not None:
+            return JSONArrayStream(request, self.body_stream)
+
+        if self.body_decoder is not None:
+            body = await request.body()
+            try:
+                return self.body_decoder.decode(body, request.headers.get("content-type", ""))
+            except ValidationError as e:
+                # The same errors as a body validated by the signature model.
+                signature_model = get_signature(handler) if handler is not None else SignatureModel
+                raise signature_model.build_base_system_exception(request, e) from e
+            except msgspec.DecodeError as e:
+                raise SignatureModel.build_encoder_exception(request, e) from e
+
         if not self.form_data:
             return await request.json()
 
@@ -309,6 +350,23 @@ class TransformerModel(ArbitraryExtraBaseModel):
         Returns:
             Any: Dependencies resolved from the connection and dependencies.
         """
+        timer = current_request.get()
+        if timer is None:
+            return await self.resolve_dependency(dependency, connection, kwargs, None)
+        return await timer.measure_dependency(
+            dependency, lambda: self.resolve_dependency(dependency, connection, kwargs, timer)
+        )
+
+    async def resolve_dependency(
+        self,
+        dependency: Dependency,
+        connection: Union["WebSocket", "Request"],
+        kwargs: dict[str, Any],
+        timer: Optional[RequestTimer],
+    ) -> Any:
+        """
+        Resolves the dependency, measured in the phases of the `timer` when set.
+        """
         signature_model = get_signature(dependency.inject)
 
         for _dependency in dependency.dependencies:
@@ -322,11 +380,20 @@ class TransformerModel(ArbitraryExtraBaseModel):
 
         # Handles with everything that is related with a Requires
         if kwargs and self.get_requires_definition():
-            kwargs = await self.get_requires_dependencies(kwargs)
+            with trace_requires(timer, kwargs):
+                kwargs = await self.get_requires_dependencies(kwargs)
 
-        dependency_kwargs = await signature_model.parse_values_for_connection(
-            connection=connection, **kwargs
-        )
+        if timer is None:
+            dependency_kwargs = await signature_model.parse_values_for_connection(
+                connection=connection, **kwargs
+            )
+        else:
+            dependency_kwargs = await timer.measure(
+                "validation",
+                lambda: signature_model.parse_values_for_connection(
+                    connection=connection, **kwargs
+                ),
+            )
         return await dependency.inject(**dependency_kwargs)
 
     def merge_with(self, other: "TransformerModel") -> "TransformerModel":
@@ -348,6 +415,8 @@ class TransformerModel(ArbitraryExtraBaseModel):
             query_params=merge_sets(self.query_params, other.query_params),
             reserved_kwargs=self.reserved_kwargs.union(other.reserved_kwargs),
             is_optional=self.is_optional or other.is_optional,
+            body_stream=self.body_stream or other.body_stream,
+            body_decoder=self.body_decoder if self.body_decoder == other.body_decoder else None,
         )
 
     def handle_reserved_kwargs(
@@ -377,9 +446,13 @@ class TransformerModel(ArbitraryExtraBaseModel):
         """
         reserved_kwargs: Any = {}
         if DATA in self.reserved_kwargs:
-            reserved_kwargs[DATA] = self.get_request_data(request=cast("Request", connection))
+            reserved_kwargs[DATA] = self.get_request_data(
+                request=cast("Request", connection), handler=handler
+            )
         if PAYLOAD in self.reserved_kwargs:
-            reserved_kwargs[PAYLOAD] = self.get_request_data(request=cast("Request", connection))
+            reserved_kwargs[PAYLOAD] = self.get_request_data(
+                request=cast("Request", connection), handler=handler
+            )
 
         if CONTEXT in self.reserved_kwargs and handler is not None:
             reserved_kwargs[CONTEXT] = self.get_request_context(
@@ -589,6 +662,15 @@ def create_signature(
     elif PAYLOAD in reserved_kwargs:
         is_optional = is_field_optional(signature_model.model_fields[PAYLOAD])
 
+    body_stream = None
+    for name, item in signature_model.body_streams.items():
+        if name in reserved_kwargs:
+            body_stream = build_item_decoder(item)
+
+    body_decoder = None
+    if not form_data and body_stream is None:
+        body_decoder = _get_body_decoder(signature_model, dependencies, _dependencies)
+
     return TransformerModel(
         form_data=form_data,
         dependencies=_dependencies,
@@ -598,9 +680,51 @@ def create_signature(
         headers=headers,
         reserved_kwargs=reserved_kwargs,
         is_optional=is_optional,
+        body_stream=body_stream,
+        body_decoder=body_decoder,
     )
 
 
+def _uses_request_data(dependency: Dependency) -> bool:
+    """
+    Checks if a dependency, or any of its own dependencies, reads the request data.
+    """
+    model_fields = get_signature(dependency.inject).model_fields
+    if DATA in model_fields or PAYLOAD in model_fields:
+        return True
+    return any(_uses_request_data(_dependency) for _dependency in dependency.dependencies)
+
+
+def _get_body_decoder(
+    signature_model: Type["SignatureModel"],
+    dependencies: "Dependencies",
+    local_dependencies: Set[Dependency],
+) -> Optional[BodyDecoder]:
+    """
+    Get the decoder able to build the `data` or `payload` straight from the raw body.
+
+    This is only possible when the `data` or `payload` is the only body field of the
+    handler, meaning the whole body is the value, and no dependency reads it as well.
+
+    Args:
+        signature_model (Type[SignatureModel]): The signature model.
+        dependencies (Dependencies): Dependency information.
+        local_dependencies (Set[Dependency]): The dependencies of the handler.
+
+    Returns:
+        Optional[BodyDecoder]: The body decoder, if any.
+    """
+    body_fields = [name for name in signature_model.encoders if name not in dependencies]
+    if len(body_fields) != 1 or body_fields[0] not in (DATA, PAYLOAD):
+        return None
+
+    if any(_uses_request_data(dependency) for dependency in local_dependencies):
+        return None
+
+    encoder_info: dict[str, Any] = signature_model.encoders[body_fields[0]]
+    return get_body_decoder(encoder_info["encoder"], encoder_info["annotation"])
+
+
 def _update_parameters_with_dependency(
     dependency: Dependency,
     global_dependencies: "Dependencies",
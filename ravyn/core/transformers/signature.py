@@ -24,6 +24,7 @@ from ravyn.core.transformers.constants import (
     UNDEFINED,
     VALIDATION_NAMES,
 )
+from ravyn.core.transformers.stream import get_body_stream_item
 from ravyn.core.transformers.utils import (
     get_connection_info,
     get_field_definition_from_param,
@@ -38,7 +39,7 @@ from ravyn.exceptions import (
 from ravyn.parsers import ArbitraryBaseModel, ArbitraryExtraBaseModel
 from ravyn.requests import Request
 from ravyn.typing import Undefined
-from ravyn.utils.constants import IS_DEPENDENCY, SKIP_VALIDATION
+from ravyn.utils.constants import DATA, IS_DEPENDENCY, PAYLOAD, SKIP_VALIDATION
 from ravyn.utils.dependencies import async_resolve_dependencies, is_requires
 from ravyn.utils.helpers import is_lambda, is_optional_union
 from ravyn.utils.schema import extract_arguments
@@ -156,6 +157,8 @@ class SignatureModel(ArbitraryBaseModel):
         encoders (ClassVar[dict[str, "Encoder"]]): Class variable holding a dictionary of encoders.
             This attribute stores encoder instances associated with parameter names,
             allowing customized encoding and decoding of function parameters.
+        body_streams (ClassVar[dict[str, Any]]): Class variable mapping the `data` or `payload`
+            declared as `AsyncIterator[Item]` to the `Item` type of the streamed JSON array.
 
     Note:
         - `dependency_names` and `return_annotation` are intended to be set statically for the class.
@@ -165,6 +168,7 @@ class SignatureModel(ArbitraryBaseModel):
     dependency_names: ClassVar[Set[str]]
     return_annotation: ClassVar[Any]
     encoders: ClassVar[dict["Encoder", Any]]
+    body_streams: ClassVar[dict[str, Any]] = {}
 
     @classmethod
     async def parse_encoders(cls, kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -200,17 +204,15 @@ class SignatureModel(ArbitraryBaseModel):
 
         for key, value in kwargs.items():
             if key in cls.encoders:
-                encoder_info: dict[str, "Encoder"] = cls.encoders[key]  # type: ignore
+                encoder_info: dict[str, Any] = cls.encoders[key]  # type: ignore
                 encoder: "Encoder" = encoder_info["encoder"]
                 annotation = encoder_info["annotation"]
 
-                if is_optional_union(annotation) and not value:
-                    kwargs[key] = None
-                    continue
-
-                if is_optional_union(annotation) and value:
-                    decoded_list = extract_arguments(annotation)
-                    annotation = decoded_list[0]  # type: ignore
+                if encoder_info["is_optional"]:
+                    if not value:
+                        kwargs[key] = None
+                        continue
+                    annotation = encoder_info["optional_annotation"]
 
                 if is_requires(value):
                     kwargs[key] = await async_resolve_dependencies(value.dependency)
@@ -418,6 +420,7 @@ class SignatureFactory(ArbitraryExtraBaseModel):
         self.defaults: dict[str, Any] = {}
         self.dependency_names = dependency_names
         self.field_definitions: dict[Any, Any] = {}
+        self.body_streams: dict[str, Any] = {}
 
     def validate_missing_dependency(self, param: Any) -> None:
         """
@@ -529,6 +532,7 @@ class SignatureFactory(ArbitraryExtraBaseModel):
             ImproperlyConfigured: If there is an error during signature creation.
         """
         try:
+            self._handle_body_streams()
             encoders = self._handle_encoders()
             self._process_parameters()
 
@@ -540,6 +544,19 @@ class SignatureFactory(ArbitraryExtraBaseModel):
                 f"Error creating signature for '{self.fn_name}': '{e}'."
             ) from e
 
+    def _handle_body_streams(self) -> None:
+        """
+        Extracts the item type of the `data` or `payload` declared as `AsyncIterator[Item]`.
+
+        Those are not validated as a whole but item by item while the body is being read.
+        """
+        for param in self.parameters:
+            if param.name not in (DATA, PAYLOAD):
+                continue
+            item = get_body_stream_item(param.annotation)
+            if item is not None:
+                self.body_streams[param.name] = item
+
     def _handle_encoders(self) -> dict[str, Any]:
         """
         Extracts encoders for parameters based on their annotations.
@@ -549,12 +566,20 @@ class SignatureFactory(ArbitraryExtraBaseModel):
         """
         encoders: dict[str, Any] = {}
         for param in self.parameters:
+            if param.name in self.body_streams:
+                continue
             if not self._should_skip_parameter(param):
                 encoder = self._find_encoder(param.annotation)
                 if encoder:
+                    # Resolved once here instead of for every request
+                    is_optional = is_optional_union(param.annotation)
                     encoders[param.name] = {
                         "encoder": encoder,
                         "annotation": param.annotation,
+                        "is_optional": is_optional,
+                        "optional_annotation": (
+                            extract_arguments(param.annotation)[0] if is_optional else None
+                        ),
                     }
         return encoders
 
@@ -598,7 +623,9 @@ class SignatureFactory(ArbitraryExtraBaseModel):
             self.validate_missing_dependency(param)
             self.get_dependency_names(param)
             self.set_default_field(param)
-            if not self._should_skip_parameter(param):
+            if param.name in self.body_streams:
+                self.field_definitions[param.name] = (Any, ...)
+            elif not self._should_skip_parameter(param):
                 self.field_definitions[param.name] = get_field_definition_from_param(
                     self.fn, param
                 )
@@ -623,4 +650,5 @@ class SignatureFactory(ArbitraryExtraBaseModel):
         model.return_annotation = self.signature.return_annotation
         model.dependency_names = self.dependency_names
         model.encoders = encoders  # type: ignore
+        model.body_streams = self.body_streams
         return model
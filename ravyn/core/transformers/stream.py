@@ -0,0 +1,220 @@
+import re
+from collections.abc import AsyncIterable as AbcAsyncIterable, AsyncIterator as AbcAsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Optional, get_args, get_origin
+
+import msgspec
+from orjson import loads
+from pydantic import TypeAdapter, ValidationError
+
+from ravyn.exceptions import ValidationErrorException
+from ravyn.utils.helpers import is_class_and_subclass
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.requests import Request
+
+BODY_STREAM_ORIGINS = (AbcAsyncIterator, AbcAsyncIterable)
+
+# Only the characters that can change the structure of the array are relevant
+# for the parser, everything in between is copied as is.
+_STRUCTURAL_TOKENS = re.compile(rb'[\[\]{},"\\]')
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPEN_ARRAY = ord("[")
+_CLOSE_ARRAY = ord("]")
+_OPEN_OBJECT = ord("{")
+_CLOSE_OBJECT = ord("}")
+_COMMA = ord(",")
+
+ItemDecoder = Callable[[bytes], Any]
+
+
+def get_body_stream_item(annotation: Any) -> Optional[Any]:
+    """
+    Returns the item type of an `AsyncIterator[Item]` or `AsyncIterable[Item]`
+    annotation, or `None` if the annotation is not a body stream.
+    """
+    if get_origin(annotation) not in BODY_STREAM_ORIGINS:
+        return None
+    args = get_args(annotation)
+    return args[0] if args else Any
+
+
+def build_item_decoder(item: Any) -> ItemDecoder:
+    """
+    Builds, once, the callable used to decode and validate each element
+    of a streamed JSON array straight from its raw bytes.
+    """
+    if is_class_and_subclass(item, msgspec.Struct):
+        return msgspec.json.Decoder(item).decode
+    return TypeAdapter(item).validate_json
+
+
+class JSONArrayParser:
+    """
+    Incremental parser for a top level JSON array.
+
+    The parser is fed with the chunks as they arrive and returns the raw bytes of
+    every element completed so far, keeping in memory only the element being
+    currently received.
+    """
+
+    __slots__ = ("buffer", "depth", "in_string", "escape", "started", "finished", "expect_item")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.finished = False
+        self.expect_item = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Parses the given chunk and returns the elements completed by it.
+        """
+        items: list[bytes] = []
+        offset = 0
+        skip = -1
+
+        if self.escape:
+            self.escape = False
+            skip = 0
+
+        for match in _STRUCTURAL_TOKENS.finditer(chunk):
+            index = match.start()
+            if index == skip:
+                continue
+
+            token = chunk[index]
+            if self.in_string:
+                if token == _BACKSLASH:
+                    if index + 1 < len(chunk):
+                        skip = index + 1
+                    else:
+                        self.escape = True
+                elif token == _QUOTE:
+                    self.in_string = False
+                continue
+
+            if self.finished:
+                raise ValueError("Unexpected content after the end of the JSON array.")
+
+            if not self.started:
+                if token != _OPEN_ARRAY or chunk[offset:index].strip():
+                    raise ValueError("The request body must be a JSON array.")
+                self.started = True
+                offset = index + 1
+                continue
+
+            if token == _QUOTE:
+                self.in_string = True
+            elif token == _OPEN_ARRAY or token == _OPEN_OBJECT:
+                self.depth += 1
+            elif token == _CLOSE_ARRAY or token == _CLOSE_OBJECT:
+                if self.depth:
+                    self.depth -= 1
+                    continue
+                if token != _CLOSE_ARRAY:
+                    raise ValueError("Unbalanced JSON array.")
+                self.buffer += chunk[offset:index]
+                self._emit(items, allow_empty=not self.expect_item)
+                self.finished = True
+                offset = index + 1
+            elif token == _COMMA and not self.depth:
+                self.buffer += chunk[offset:index]
+                self._emit(items, allow_empty=False)
+                self.expect_item = True
+                offset = index + 1
+
+        remainder = chunk[offset:]
+        if self.started and not self.finished:
+            self.buffer += remainder
+        elif remainder.strip():
+            if self.finished:
+                raise ValueError("Unexpected content after the end of the JSON array.")
+            raise ValueError("The request body must be a JSON array.")
+        return items
+
+    def _emit(self, items: list[bytes], allow_empty: bool) -> None:
+        item = bytes(self.buffer).strip()
+        self.buffer.clear()
+        if not item:
+            if allow_empty:
+                return
+            raise ValueError("Empty element in the JSON array.")
+        self.expect_item = False
+        items.append(item)
+
+    def close(self) -> None:
+        """
+        Makes sure the whole array was received.
+        """
+        if not self.finished:
+            raise ValueError("The request body ended before the JSON array was closed.")
+
+
+class JSONArrayStream:
+    """
+    Asynchronous iterator over the elements of a JSON array sent in the request body.
+
+    Used when the `data` or `payload` of a handler is declared as `AsyncIterator[Item]`.
+    The body is only read from the client when the handler asks for the next element,
+    which means the server applies backpressure naturally and a large array is never
+    fully buffered in memory.
+
+    Each element is validated against `Item` with a decoder built once per handler.
+    """
+
+    __slots__ = ("request", "decoder", "_iterator")
+
+    def __init__(self, request: "Request", decoder: ItemDecoder) -> None:
+        self.request = request
+        self.decoder = decoder
+        self._iterator: Optional[AsyncGenerator[Any, None]] = None
+
+    def __aiter__(self) -> "JSONArrayStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._iterator is None:
+            self._iterator = self._iterate()
+        return await self._iterator.__anext__()
+
+    async def _chunks(self) -> AsyncGenerator[bytes, None]:
+        if "_body" in self.request.scope:
+            yield self.request.scope["_body"]
+            return
+        async for chunk in self.request.stream():
+            yield chunk
+
+    async def _iterate(self) -> AsyncGenerator[Any, None]:
+        parser = JSONArrayParser()
+        index = 0
+
+        try:
+            async for chunk in self._chunks():
+                for item in parser.feed(chunk):
+                    try:
+                        value = self.decoder(item)
+                    except ValidationError as e:
+                        raise ValidationErrorException(
+                            detail=self.error_message(index), extra=loads(e.json())
+                        ) from e
+                    except msgspec.DecodeError as e:
+                        raise ValidationErrorException(
+                            detail=self.error_message(index), extra=[str(e)]
+                        ) from e
+                    index += 1
+                    yield value
+            parser.close()
+        except ValidationErrorException:
+            raise
+        except ValueError as e:
+            raise ValidationErrorException(detail=str(e)) from e
+
+    def error_message(self, index: int) -> str:
+        return (
+            f"Validation failed for {self.request.url} with method {self.request.method} "
+            f"on item {index} of the request body."
+        )
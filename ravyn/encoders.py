@@ -18,6 +18,7 @@ from pydantic_core import PydanticSerializationError
 
 from ravyn.exceptions import ImproperlyConfigured
 from ravyn.utils.helpers import is_union
+from ravyn.utils.schema import get_type_adapter
 
 T = TypeVar("T")
 
@@ -144,9 +145,22 @@ class MsgSpecEncoder(Encoder):
         Returns:
             Any: The encoded value.
         """
+        # Bodies decoded straight from the raw bytes are already the final structure
+        if isinstance(value, Struct) and isinstance(value, get_struct_types(annotation)):
+            return value
         return msgspec.json.decode(msgspec.json.encode(value), type=annotation)
 
 
+def get_struct_types(annotation: Any) -> tuple[type, ...]:
+    """
+    Returns the classes of an annotation, the members of an `Optional` or a `Union`
+    included.
+    """
+    if is_union(annotation):
+        return tuple(arg for arg in get_args(annotation) if isclass(arg))
+    return (annotation,) if isclass(annotation) else ()
+
+
 class PydanticEncoder(Encoder):
     """
     Encoder for Pydantic BaseModel objects.
@@ -192,7 +206,7 @@ class PydanticEncoder(Encoder):
         """
         if isinstance(value, BaseModel) or is_class_and_subclass(value, BaseModel):
             return value
-        return annotation(**value)
+        return get_type_adapter(annotation).validate_python(value)
 
 
 def is_body_encoder(value: Any) -> bool:
@@ -105,7 +105,9 @@ class HTTPException(LilyaHTTPException, RavynAPIException):
         if not detail:
             detail = args[0] if args else HTTPStatus(status_code or self.status_code).phrase
             args = args[1:]
-        super().__init__(status_code=status_code, detail=detail, headers=headers, response=response)
+        super().__init__(
+            status_code=status_code, detail=detail, headers=headers, response=response
+        )
         self.detail = detail
         self.headers = headers
         self.args = (f"{self.status_code}: {self.detail}", *args)
@@ -127,6 +129,11 @@ class ValidationErrorException(HTTPException, ValueError):
     status_code = status.HTTP_400_BAD_REQUEST
 
 
+class PayloadTooLarge(HTTPException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    detail = "The request body exceeds the maximum size allowed."
+
+
 class InternalServerError(HTTPException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
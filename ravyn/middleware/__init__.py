@@ -1,22 +1,30 @@
 from .asyncexitstack import AsyncExitStackMiddleware
 from .authentication import BaseAuthMiddleware
 from .clickjacking import XFrameOptionsMiddleware
+from .compression import CompressionMiddleware
 from .cors import CORSMiddleware
 from .csrf import CSRFMiddleware
 from .gzip import GZipMiddleware
 from .https import HTTPSRedirectMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
 from .security import SecurityMiddleware
 from .settings_middleware import RequestSettingsMiddleware
+from .tracing import TracingMiddleware
 from .trustedhost import TrustedHostMiddleware
 
 __all__ = [
     "AsyncExitStackMiddleware",
     "BaseAuthMiddleware",
+    "CompressionMiddleware",
     "CORSMiddleware",
     "CSRFMiddleware",
     "GZipMiddleware",
     "HTTPSRedirectMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
     "RequestSettingsMiddleware",
+    "TracingMiddleware",
     "TrustedHostMiddleware",
     "XFrameOptionsMiddleware",
     "SecurityMiddleware",
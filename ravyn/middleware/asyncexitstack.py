@@ -1,6 +1,7 @@
 import traceback
 from contextlib import AsyncExitStack
-from typing import Optional
+from types import TracebackType
+from typing import Any, Optional
 
 from lilya.types import ASGIApp, Receive, Scope, Send
 
@@ -8,6 +9,46 @@ from ravyn.core.config import AsyncExitConfig
 from ravyn.core.protocols.middleware import MiddlewareProtocol
 
 
+class LazyAsyncExitStack:
+    """
+    Proxy of an `AsyncExitStack` only created when used for the first time.
+
+    Most of the requests never register a cleanup callback, those do not pay for
+    the creation and the exit of a stack.
+    """
+
+    __slots__ = ("_stack",)
+
+    def __init__(self) -> None:
+        self._stack: Optional[AsyncExitStack] = None
+
+    @property
+    def stack(self) -> AsyncExitStack:
+        if self._stack is None:
+            self._stack = AsyncExitStack()
+        return self._stack
+
+    @property
+    def is_used(self) -> bool:
+        return self._stack is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stack, name)
+
+    async def __aenter__(self) -> "LazyAsyncExitStack":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> bool:
+        if self._stack is None:
+            return False
+        return await self._stack.__aexit__(exc_type, exc_value, tb)
+
+
 class AsyncExitStackMiddleware(MiddlewareProtocol):
     def __init__(
         self,
@@ -28,11 +69,8 @@ class AsyncExitStackMiddleware(MiddlewareProtocol):
         self.debug = debug
 
     async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
-        if not AsyncExitStack:
-            await self.app(scope, receive, send)  # pragma: no cover
-
         exception: Optional[Exception] = None
-        async with AsyncExitStack() as stack:
+        async with LazyAsyncExitStack() as stack:
             scope[self.config.context_name] = stack
             try:
                 await self.app(scope, receive, send)
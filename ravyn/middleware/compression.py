@@ -0,0 +1,564 @@
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Any, Optional, Union, cast
+
+from lilya.datastructures import Header
+from lilya.types import ASGIApp, Message, Receive, Scope, Send
+
+from ravyn.core.config.compression import CompressionConfig
+from ravyn.core.protocols.middleware import MiddlewareProtocol
+from ravyn.exceptions import PayloadTooLarge, ValidationErrorException
+from ravyn.responses import PlainText
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# The output of the brotli decompressor is only bounded from brotli 1.2.0.
+BROTLI_OUTPUT_LIMIT = brotli is not None and hasattr(brotli.Decompressor, "can_accept_more_data")
+
+NOT_COMPRESSED_STATUS_CODES = frozenset({204, 206, 304})
+
+
+class GzipCodec:
+    name = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def compressor(self) -> "StreamCompressor":
+        compressobj = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return StreamCompressor(
+            lambda data: compressobj.compress(data) + compressobj.flush(zlib.Z_SYNC_FLUSH),
+            compressobj.flush,
+        )
+
+    def decompressor(self, max_size: Optional[int]) -> "StreamDecompressor":
+        return GzipDecompressor(max_size)
+
+
+class BrotliCodec:
+    name = "br"
+
+    def __init__(self, quality: int) -> None:
+        if brotli is None:
+            raise ImportError("You must install 'brotli' to compress with brotli.")
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return cast(bytes, brotli.compress(data, quality=self.quality))
+
+    def compressor(self) -> "StreamCompressor":
+        compressor = brotli.Compressor(quality=self.quality)
+        return StreamCompressor(
+            lambda data: compressor.process(data) + compressor.flush(), compressor.finish
+        )
+
+    def decompressor(self, max_size: Optional[int]) -> "StreamDecompressor":
+        return BrotliDecompressor(max_size)
+
+
+class ZstdCodec:
+    name = "zstd"
+
+    def __init__(self, level: int) -> None:
+        if zstandard is None:
+            raise ImportError("You must install 'zstandard' to compress with zstd.")
+        self.level = level
+        self.compressor_factory = zstandard.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return cast(bytes, self.compressor_factory.compress(data))
+
+    def compressor(self) -> "StreamCompressor":
+        compressobj = self.compressor_factory.compressobj()
+        return StreamCompressor(
+            lambda data: compressobj.compress(data)
+            + compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressobj.flush,
+        )
+
+    def decompressor(self, max_size: Optional[int]) -> "StreamDecompressor":
+        return ZstdDecompressor(max_size)
+
+
+class StreamCompressor:
+    """
+    Compresses a streamed body, flushing every chunk so the client receives each
+    chunk without waiting for the next ones.
+    """
+
+    __slots__ = ("compress", "finish")
+
+    def __init__(self, compress: Any, finish: Any) -> None:
+        self.compress = compress
+        self.finish = finish
+
+
+class StreamDecompressor:
+    """
+    Decompresses a streamed body, refusing it with a `PayloadTooLarge` as soon as it
+    grows past `max_size` bytes, without decompressing the rest of the data.
+    """
+
+    __slots__ = ("max_size", "received")
+
+    def __init__(self, max_size: Optional[int]) -> None:
+        self.max_size = max_size
+        self.received = 0
+
+    def get_output_limit(self) -> int:
+        """
+        The bytes the next call may produce, one past the limit to detect it is crossed.
+        """
+        return self.max_size - self.received + 1
+
+    def check(self, chunk: bytes) -> bytes:
+        self.received += len(chunk)
+        if self.max_size is not None and self.received > self.max_size:
+            raise PayloadTooLarge()
+        return chunk
+
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class GzipDecompressor(StreamDecompressor):
+    __slots__ = ("decompressobj",)
+
+    def __init__(self, max_size: Optional[int]) -> None:
+        super().__init__(max_size)
+        self.decompressobj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.max_size is None:
+            return self.decompressobj.decompress(data)
+
+        # The input left once the limit of a call is reached is in the unconsumed tail.
+        chunks = []
+        while data:
+            chunks.append(self.check(self.decompressobj.decompress(data, self.get_output_limit())))
+            data = self.decompressobj.unconsumed_tail
+        return b"".join(chunks)
+
+    def flush(self) -> bytes:
+        body = self.check(self.decompressobj.flush())
+        if not self.decompressobj.eof:
+            raise ValueError("The gzip stream is truncated.")
+        return body
+
+
+class BrotliDecompressor(StreamDecompressor):
+    __slots__ = ("decompressor",)
+
+    def __init__(self, max_size: Optional[int]) -> None:
+        super().__init__(max_size)
+        self.decompressor = brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.max_size is None or not BROTLI_OUTPUT_LIMIT:
+            return self.check(self.decompressor.process(data))
+
+        # Once the limit of a call is reached, the rest is produced from empty inputs.
+        chunks = [
+            self.check(
+                self.decompressor.process(data, output_buffer_limit=self.get_output_limit())
+            )
+        ]
+        while not self.decompressor.can_accept_more_data():
+            chunks.append(
+                self.check(
+                    self.decompressor.process(b"", output_buffer_limit=self.get_output_limit())
+                )
+            )
+        return b"".join(chunks)
+
+    def flush(self) -> bytes:
+        if not self.decompressor.is_finished():
+            raise ValueError("The brotli stream is truncated.")
+        return b""
+
+
+class ZstdFrames:
+    """
+    Follows the headers of the frames and blocks of a zstd stream, without decompressing
+    them, to tell whether the stream ends with a complete frame.
+    """
+
+    __slots__ = ("buffer", "state", "skip", "checksum", "frames")
+
+    def __init__(self) -> None:
+        self.buffer = b""
+        self.state = "magic"
+        self.skip = 0
+        self.checksum = False
+        self.frames = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.frames > 0 and self.state == "magic" and not self.buffer and not self.skip
+
+    def get_needed(self) -> int:
+        if self.state == "header" and self.buffer:
+            descriptor = self.buffer[0]
+            single_segment = descriptor & 0x20
+            return (
+                1
+                + (0 if single_segment else 1)
+                + (0, 1, 2, 4)[descriptor & 0x03]
+                + (1 if single_segment else 0, 2, 4, 8)[descriptor >> 6]
+            )
+        return {"magic": 4, "header": 1, "block": 3, "skippable": 4}[self.state]
+
+    def feed(self, data: bytes) -> None:
+        position = 0
+        while position < len(data) and self.state != "invalid":
+            if self.skip:
+                skipped = min(self.skip, len(data) - position)
+                self.skip -= skipped
+                position += skipped
+                continue
+
+            needed = self.get_needed() - len(self.buffer)
+            self.buffer += data[position : position + needed]
+            position += needed
+            if len(self.buffer) == self.get_needed():
+                header, self.buffer = self.buffer, b""
+                self.read_header(header)
+
+    def read_header(self, header: bytes) -> None:
+        if self.state == "magic":
+            if header == zstandard.MAGIC_NUMBER.to_bytes(4, "little"):
+                self.state = "header"
+            elif header[0] & 0xF0 == 0x50 and header[1:] == b"\x2a\x4d\x18":
+                self.state = "skippable"
+            else:
+                # The decompressor refuses the stream.
+                self.state = "invalid"
+        elif self.state == "header":
+            self.checksum = bool(header[0] & 0x04)
+            self.state = "block"
+        elif self.state == "block":
+            value = int.from_bytes(header, "little")
+            self.skip = 1 if (value >> 1) & 0x03 == 1 else value >> 3
+            if value & 0x01:
+                self.skip += 4 if self.checksum else 0
+                self.frames += 1
+                self.state = "magic"
+        else:
+            self.skip = int.from_bytes(header, "little")
+            self.state = "magic"
+
+
+class ZstdDecompressor(StreamDecompressor):
+    """
+    The output is written to the decompressor by chunks of `write_size` bytes while it
+    is produced, the decompression stops at the first chunk past the limit.
+    """
+
+    __slots__ = ("chunks", "writer", "frames")
+
+    write_size = 64 * 1024
+
+    def __init__(self, max_size: Optional[int]) -> None:
+        super().__init__(max_size)
+        self.chunks: list[bytes] = []
+        self.writer = zstandard.ZstdDecompressor().stream_writer(self, write_size=self.write_size)
+        self.frames = ZstdFrames()
+
+    def write(self, chunk: bytes) -> int:
+        self.chunks.append(self.check(chunk))
+        return len(chunk)
+
+    def decompress(self, data: bytes) -> bytes:
+        self.frames.feed(data)
+        self.writer.write(data)
+        body = b"".join(self.chunks)
+        self.chunks.clear()
+        return body
+
+    def flush(self) -> bytes:
+        if not self.frames.complete:
+            raise ValueError("The zstd stream is truncated.")
+        return b""
+
+
+Codec = Union[GzipCodec, BrotliCodec, ZstdCodec]
+
+
+def get_codecs(config: CompressionConfig) -> dict[str, Codec]:
+    """
+    The codecs of the configured encodings, in order of preference.
+    """
+    encodings = config.encodings
+    if encodings is None:
+        encodings = [
+            encoding
+            for encoding, module in (("zstd", zstandard), ("br", brotli), ("gzip", gzip))
+            if module is not None
+        ]
+
+    codecs: dict[str, Codec] = {}
+    for encoding in encodings:
+        if encoding == "zstd":
+            codecs[encoding] = ZstdCodec(config.zstd_level)
+        elif encoding == "br":
+            codecs[encoding] = BrotliCodec(config.brotli_quality)
+        else:
+            codecs[encoding] = GzipCodec(config.gzip_level)
+    return codecs
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> Optional[str]:
+    """
+    The encoding with the highest quality in the `Accept-Encoding` header, the order of
+    the `encodings` breaking the ties. `None` when the client accepts none of them.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    for value in accept_encoding.split(","):
+        coding, _, params = value.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    default = qualities.get("*", 0.0)
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware(MiddlewareProtocol):
+    """
+    Compresses the responses with the `gzip`, `br` or `zstd` encoding negotiated from
+    the `Accept-Encoding` of the request and decompresses the request bodies sent with
+    a `Content-Encoding`.
+
+    The bodies smaller than the `minimum_size`, already encoded or of an excluded media
+    type are sent as they are. The compressed bodies sent in a single message are kept
+    in an LRU cache keyed by the hash of the body, so identical responses are only
+    compressed once.
+    """
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig) -> None:
+        """Compression Middleware class.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            config: The CompressionConfig instance.
+        """
+        super().__init__(app)
+        self.app = app
+        self.config = config
+        self.codecs = get_codecs(config)
+        self.encodings = list(self.codecs)
+        self.excluded_media_types = tuple(config.excluded_media_types)
+        self.cache: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Header.ensure_header_instance(scope=scope)
+        if self.config.decompress_requests:
+            content_encoding = headers.get("content-encoding", "").strip().lower()
+            if content_encoding and content_encoding != "identity":
+                if content_encoding not in self.codecs:
+                    response = PlainText(
+                        f"Unsupported Content-Encoding: {content_encoding}.", status_code=415
+                    )
+                    await response(scope, receive, send)
+                    return
+                scope, receive = self.decompress_request(scope, receive, content_encoding)
+
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def decompress_request(
+        self, scope: Scope, receive: Receive, encoding: str
+    ) -> tuple[Scope, Receive]:
+        """
+        Removes the `Content-Encoding` and `Content-Length` of the request and decompresses
+        the body while it is received, refused as soon as it grows past the maximum size.
+        """
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name.lower() not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = self.codecs[encoding].decompressor(self.config.max_decompressed_size)
+
+        async def receive_decompressed() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+
+            try:
+                body = decompressor.decompress(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body += decompressor.flush()
+            except PayloadTooLarge:
+                raise
+            except Exception as exc:
+                raise ValidationErrorException(
+                    detail=f"The request body is not valid {encoding} data."
+                ) from exc
+            return {**message, "body": body}
+
+        return scope, receive_decompressed
+
+    def compress_body(self, body: bytes, encoding: str) -> bytes:
+        codec = self.codecs[encoding]
+        if not self.config.cache_size or len(body) > self.config.cache_max_body_size:
+            return codec.compress(body)
+
+        key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+        compressed = self.cache.get(key)
+        if compressed is not None:
+            self.cache.move_to_end(key)
+            return compressed
+
+        compressed = codec.compress(body)
+        self.cache[key] = compressed
+        if len(self.cache) > self.config.cache_size:
+            self.cache.popitem(last=False)
+        return compressed
+
+
+class CompressionResponder:
+    """
+    Holds the `http.response.start` until the first body message, to decide whether the
+    response is compressed.
+    """
+
+    __slots__ = ("middleware", "encoding", "downstream", "start", "compressor", "passthrough")
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    def is_compressible(self, message: Message) -> bool:
+        if message.get("status", 200) in NOT_COMPRESSED_STATUS_CODES:
+            return False
+        headers = Header.ensure_header_instance(message)
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        media_type = headers.get("content-type", "").lower()
+        return not media_type.startswith(self.middleware.excluded_media_types)
+
+    def encode_headers(self, message: Message, content_length: Optional[int]) -> Message:
+        headers = Header.ensure_header_instance(message)
+        headers["content-encoding"] = self.encoding
+        if content_length is None:
+            headers.pop("content-length", None)
+        else:
+            headers["content-length"] = str(content_length)
+        headers.add_vary_header("accept-encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded body is no longer byte for byte the one of the strong ETag.
+            headers["etag"] = f"W/{etag}"
+        return {**message, "headers": headers}
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            if self.is_compressible(message):
+                self.start = message
+                return
+            self.passthrough = True
+            await self.downstream(message)
+            return
+
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if self.compressor is not None:
+            if message_type != "http.response.body":  # pragma: no cover
+                await self.downstream(message)
+                return
+            body = self.compressor.compress(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if not more_body:
+                body += self.compressor.finish()
+            await self.downstream(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+            return
+
+        start = self.start
+        if start is None:
+            await self.downstream(message)
+            return
+        self.start = None
+
+        if message_type != "http.response.body":
+            # Sent by the server from the file (pathsend, zerocopysend), as it is.
+            self.passthrough = True
+            await self.downstream(start)
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body:
+            if len(body) < self.middleware.config.minimum_size:
+                self.passthrough = True
+                await self.downstream(start)
+                await self.downstream(message)
+                return
+            body = self.middleware.compress_body(body, self.encoding)
+            await self.downstream(self.encode_headers(start, len(body)))
+            await self.downstream({"type": "http.response.body", "body": body})
+            return
+
+        self.compressor = self.middleware.codecs[self.encoding].compressor()
+        await self.downstream(self.encode_headers(start, None))
+        await self.downstream(
+            {
+                "type": "http.response.body",
+                "body": self.compressor.compress(body),
+                "more_body": True,
+            }
+        )
@@ -1,15 +1,18 @@
-from typing import Any, Callable, Mapping, Optional, Type, Union
+import inspect
+from typing import Any, Awaitable, Callable, Mapping, Optional, Type, Union
 
 from lilya import status
+from lilya._internal._exception_handlers import _lookup_exception_handler
+from lilya.compat import is_async_callable
+from lilya.concurrency import run_in_threadpool
 from lilya.exceptions import HTTPException as LilyaException
 from lilya.middleware.exceptions import ExceptionMiddleware as LilyaExceptionMiddleware
 from lilya.responses import Response as LilyaResponse
-from lilya.types import ASGIApp, Receive, Scope, Send
+from lilya.types import ASGIApp, Message, Receive, Scope, Send
 from pydantic import BaseModel
 
 from ravyn.exception_handlers import http_exception_handler
 from ravyn.exceptions import HTTPException, WebSocketException
-from ravyn.middleware._exception_handlers import wrap_app_handling_exceptions
 from ravyn.middleware.errors import ServerErrorMiddleware
 from ravyn.requests import Request
 from ravyn.responses import Response
@@ -28,9 +31,19 @@ class ExceptionMiddleware(LilyaExceptionMiddleware):
         app: ASGIApp,
         handlers: Optional[Mapping[Any, Callable[[Request, Exception], Response]]] = None,
         debug: bool = False,
+        fallback: Optional[Callable[[Scope, Receive, Send, Exception], Awaitable[None]]] = None,
     ) -> None:
+        """
+        Args:
+            app: The 'next' ASGI app to call.
+            handlers: The exception handlers by status code or exception type.
+            debug: If the application is in debug mode.
+            fallback: Called with the exceptions without handler instead of raising them,
+                merging an outer exception layer, like the `RavynAPIException`, into this one.
+        """
         self.app = app
         self.debug = debug
+        self.fallback = fallback
         self._status_handlers: dict[int, Callable] = {}
         self._exception_handlers: dict[Type[Exception], Callable] = {
             HTTPException: http_exception_handler,
@@ -53,13 +66,53 @@ class ExceptionMiddleware(LilyaExceptionMiddleware):
             self._status_handlers,
         )
 
-        conn: Union[Request, WebSocket]
-        if scope["type"] == "http":
-            conn = Request(scope, receive, send)
-        else:
-            conn = WebSocket(scope, receive, send)
+        # Single try block, the connection is only created when an exception is handled.
+        response_started = False
+
+        async def sender(message: Message) -> None:
+            nonlocal response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, sender)
+        except Exception as exc:
+            handler = None
+
+            if isinstance(exc, LilyaException):
+                handler = self._status_handlers.get(exc.status_code)
+
+            if handler is None:
+                handler = _lookup_exception_handler(self._exception_handlers, exc)
+
+            if handler is None:
+                if self.fallback is None:
+                    raise
+                await self.fallback(scope, receive, send, exc)
+                return
 
-        await wrap_app_handling_exceptions(self.app, conn)(scope, receive, send)
+            if response_started:
+                msg = "Caught handled exception, but response already started."
+                raise RuntimeError(msg) from exc
+
+            if scope["type"] == "http":
+                request = Request(scope, receive, send)
+                if is_async_callable(handler):
+                    response = await handler(request, exc)
+                else:
+                    response = await run_in_threadpool(handler, request, exc)
+                await response(scope, receive, sender)
+            else:
+                websocket = WebSocket(scope, receive, send)
+                if is_async_callable(handler):
+                    if inspect.isfunction(handler):
+                        await self.app(scope, receive, send)
+                    else:
+                        await handler(websocket, exc)
+                else:
+                    await run_in_threadpool(handler, websocket, exc)
 
 
 class ResponseContent(BaseModel):
@@ -86,27 +139,32 @@ class RavynAPIException:  # pragma: no cover
         try:
             await self.app(scope, receive, send)
         except Exception as ex:
-            if scope["type"] == ScopeType.HTTP:
-                exception_handler = (
-                    self.get_exception_handler(self.exception_handlers, ex)
-                    or self.default_http_exception_handler
-                )
-                response = exception_handler(Request(scope, receive, send), ex)
-                await response(scope, receive, send)
-                return
+            await self.handle_exception(scope, receive, send, ex)
 
-            if isinstance(ex, WebSocketException):
-                code = ex.code
-                reason = ex.detail
-            elif isinstance(ex, LilyaException):
-                code = ex.status_code + 4000
-                reason = ex.detail
-            else:
-                code = status.HTTP_500_INTERNAL_SERVER_ERROR + 4000
-                reason = repr(ex)
+    async def handle_exception(
+        self, scope: Scope, receive: Receive, send: Send, ex: Exception
+    ) -> None:
+        if scope["type"] == ScopeType.HTTP:
+            exception_handler = (
+                self.get_exception_handler(self.exception_handlers, ex)
+                or self.default_http_exception_handler
+            )
+            response = exception_handler(Request(scope, receive, send), ex)
+            await response(scope, receive, send)
+            return
+
+        if isinstance(ex, WebSocketException):
+            code = ex.code
+            reason = ex.detail
+        elif isinstance(ex, LilyaException):
+            code = ex.status_code + 4000
+            reason = ex.detail
+        else:
+            code = status.HTTP_500_INTERNAL_SERVER_ERROR + 4000
+            reason = repr(ex)
 
-            event = {"type": "websocket.close", "code": code, "reason": reason}
-            await send(event)
+        event = {"type": "websocket.close", "code": code, "reason": reason}
+        await send(event)
 
     def default_http_exception_handler(self, request: Request, exc: Exception) -> "LilyaResponse":
         """Default handler for exceptions subclassed from HTTPException."""
@@ -0,0 +1,76 @@
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+from ravyn.core.metrics.instrumentation import RavynMetrics, RequestTimer, current_request
+from ravyn.core.protocols.middleware import MiddlewareProtocol
+
+
+class MetricsMiddleware(MiddlewareProtocol):
+    """
+    Measures the requests per route template and serves the metrics, in the Prometheus
+    text format, on the `path` of the `MetricsConfig`.
+
+    The `send` phase is the time between the start of the response and its last body
+    message, the other phases are measured by the handlers. The request
+    timer of the `ProfilingMiddleware`, when declared, is shared.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RavynMetrics) -> None:
+        """Metrics Middleware class.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            metrics: The RavynMetrics of the application.
+        """
+        super().__init__(app)
+        self.app = app
+        self.metrics = metrics
+        self.path = metrics.config.path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.path is not None and scope["path"] == self.path:
+            await self.send_metrics(send)
+            return
+
+        if "app" in scope:
+            self.metrics.collect_caches(scope["app"])
+
+        timer = current_request.get()
+        if timer is not None:
+            timer.metrics = self.metrics
+            await self.measure(timer, scope, receive, send)
+            return
+
+        timer = RequestTimer(self.metrics, app=scope.get("app"))
+        token = current_request.set(timer)
+        try:
+            await self.measure(timer, scope, receive, timer.wrap_send(send))
+        finally:
+            current_request.reset(token)
+
+    async def measure(
+        self, timer: RequestTimer, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        self.metrics.in_progress += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.metrics.in_progress -= 1
+            self.metrics.observe(timer, scope["method"])
+
+    async def send_metrics(self, send: Send) -> None:
+        body = self.metrics.render().encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", self.metrics.registry.content_type.encode("latin-1")),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
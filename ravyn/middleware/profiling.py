@@ -0,0 +1,69 @@
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+from ravyn.core.metrics.instrumentation import current_request
+from ravyn.core.profiling import Profiler
+from ravyn.core.protocols.middleware import MiddlewareProtocol
+from ravyn.responses import JSONResponse
+
+
+class ProfilingMiddleware(MiddlewareProtocol):
+    """
+    Times each request phase by phase and keeps the slow requests in the ring buffer of
+    the `Profiler`.
+
+    The slow requests are listed, when the application runs in `debug`, on the `path` of
+    the `ProfilingConfig` and `<path>/<id>` returns the timing tree of one of them.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: Profiler) -> None:
+        """Profiling Middleware class.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            profiler: The Profiler of the application.
+        """
+        super().__init__(app)
+        self.app = app
+        self.profiler = profiler
+        self.path = profiler.config.path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        app = scope.get("app")
+        if (
+            self.path is not None
+            and getattr(app, "debug", False)
+            and (scope["path"] == self.path or scope["path"].startswith(f"{self.path}/"))
+        ):
+            await self.send_records(scope, receive, send)
+            return
+
+        if current_request.get() is not None:
+            # Already timed by an outer middleware, the replays of `ravyn profile`.
+            await self.app(scope, receive, send)
+            return
+
+        timer = self.profiler.start(app)
+        token = current_request.set(timer)
+        try:
+            await self.app(scope, receive, timer.wrap_send(send))
+        finally:
+            current_request.reset(token)
+            self.profiler.finish(timer, scope["method"], scope["path"])
+
+    async def send_records(self, scope: Scope, receive: Receive, send: Send) -> None:
+        record_id = scope["path"][len(self.path or "") :].strip("/")
+        if not record_id:
+            response = JSONResponse(
+                [record.summary() for record in reversed(self.profiler.records)]
+            )
+        else:
+            record = self.profiler.get(int(record_id)) if record_id.isdigit() else None
+            if record is None:
+                response = JSONResponse({"detail": "Profile not found."}, status_code=404)
+            else:
+                response = JSONResponse(record.as_dict())
+        await response(scope, receive, send)
@@ -0,0 +1,73 @@
+from lilya.datastructures import Header
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+from ravyn.core.metrics.instrumentation import RequestTimer, current_request
+from ravyn.core.protocols.middleware import MiddlewareProtocol
+from ravyn.core.tracing import Tracer, extract_traceparent
+
+
+class TracingMiddleware(MiddlewareProtocol):
+    """
+    Traces each request in a span, the parent of the spans of its phases, measured by the
+    handlers, and of the spans of its background tasks.
+
+    The span is named after the method and the route template, the W3C `traceparent`
+    header of the request, when valid, is its remote parent. The request timer of the
+    `ProfilingMiddleware`, when declared, is shared.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        tracer: Tracer,
+        propagate: bool = True,
+        trace_background: bool = True,
+    ) -> None:
+        """Tracing Middleware class.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            tracer: The Tracer of the application.
+            propagate: Continues the trace of the `traceparent` header of the requests.
+            trace_background: Traces the background tasks of the responses.
+        """
+        super().__init__(app)
+        self.app = app
+        self.tracer = tracer
+        self.propagate = propagate
+        self.trace_background = trace_background
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        if self.propagate:
+            parent = extract_traceparent(
+                self.tracer, Header.ensure_header_instance(scope).get("traceparent")
+            )
+        method = scope["method"]
+        with self.tracer.start_as_current_span(
+            method,
+            {"http.request.method": method, "url.path": scope["path"]},
+            parent,
+        ) as span:
+            timer = current_request.get()
+            owner = timer is None
+            if timer is None:
+                timer = RequestTimer(app=scope.get("app"))
+                token = current_request.set(timer)
+            timer.tracer = self.tracer
+            timer.trace_background = self.trace_background
+            try:
+                await self.app(scope, receive, timer.wrap_send(send) if owner else send)
+            finally:
+                if owner:
+                    current_request.reset(token)
+                if timer.route is not None:
+                    span.name = f"{method} {timer.route}"
+                    span.set_attribute("http.route", timer.route)
+                span.set_attribute("http.response.status_code", timer.status)
+                if timer.status >= 500:
+                    span.set_status("error")
@@ -2,6 +2,7 @@ import http.client
 import inspect
 import json
 import warnings
+from copy import deepcopy
 from typing import (
     Any,
     Optional,
@@ -12,6 +13,7 @@ from typing import (
     _GenericAlias,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 from lilya._internal._path import clean_path
 from lilya.contrib.security.base import (
@@ -139,16 +141,19 @@ def get_openapi_security_schemes(schemes: Any) -> Tuple[dict, list]:
 def get_fields_from_routes(
     routes: Sequence[BasePath], request_fields: Optional[list[FieldInfo]] = None
 ) -> list[FieldInfo]:
-    """Extracts the fields from the given routes of Ravyn"""
+    """
+    Extracts the fields from the given routes of Ravyn.
+
+    The same field is reachable more than once, for instance from a route added to
+    several includes, and is only returned once, in the order it was first found.
+    """
     body_fields: list[FieldInfo] = []
     response_from_routes: list[FieldInfo] = []
-
-    if not request_fields:
-        request_fields = []
+    request_fields = list(request_fields or [])
 
     for route in routes:
         if getattr(route, "include_in_schema", None) and isinstance(route, router.Include):
-            request_fields.extend(get_fields_from_routes(route.routes, request_fields))
+            request_fields.extend(get_fields_from_routes(route.routes))
             continue
 
         if getattr(route, "include_in_schema", None) and isinstance(
@@ -169,11 +174,33 @@ def get_fields_from_routes(
             if params:
                 request_fields.extend(params)
 
-    return list(body_fields + response_from_routes + request_fields)
+    fields: dict[int, FieldInfo] = {}
+    for field in body_fields + response_from_routes + request_fields:
+        fields.setdefault(id(field), field)
+    return list(fields.values())
+
+
+def add_operation_id(
+    route: Union[gateways.Gateway, gateways.WebhookGateway],
+    operation_id: Optional[str],
+    operation_ids: Set[str],
+) -> None:
+    """
+    Registers the operation id of the route, warning when it is already used.
+    """
+    if operation_id in operation_ids:
+        message = (
+            f"Duplicate Operation ID {operation_id} for function " + f"{route.handler.fn.__name__}"
+        )
+        file_name = getattr(route.handler, "__globals__", {}).get("__file__")
+        if file_name:
+            message += f" at {file_name}"
+        warnings.warn(message, stacklevel=1)
+    operation_ids.add(operation_id)
 
 
 def get_openapi_operation(
-    *, route: gateways.Gateway, operation_ids: Set[str]
+    *, route: gateways.Gateway, operation_ids: list[Optional[str]]
 ) -> dict[str, Any]:  # pragma: no cover
     operation = Operation()
     operation.tags = route.handler.get_handler_tags()
@@ -193,15 +220,7 @@ def get_openapi_operation(
 
     operation_id = getattr(route, "operation_id", None) or route.handler.operation_id
 
-    if operation_id in operation_ids:
-        message = (
-            f"Duplicate Operation ID {operation_id} for function " + f"{route.handler.fn.__name__}"
-        )
-        file_name = getattr(route.handler, "__globals__", {}).get("__file__")
-        if file_name:
-            message += f" at {file_name}"
-        warnings.warn(message, stacklevel=1)
-    operation_ids.add(operation_id)
+    operation_ids.append(operation_id)
 
     operation.operationId = operation_id
     if route.deprecated:
@@ -277,7 +296,7 @@ def get_openapi_operation_request_body(
 def get_openapi_path(
     *,
     route: Union[gateways.Gateway, gateways.WebhookGateway],
-    operation_ids: Set[str],
+    operation_ids: list[Optional[str]],
     field_mapping: dict[Tuple[FieldInfo, Literal["validation", "serialization"]], JsonSchemaValue],
     is_deprecated: bool = False,
 ) -> Tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:  # pragma: no cover
@@ -484,6 +503,156 @@ def is_middleware_app(route: router.Include) -> bool:
     return bool(isinstance(route.app, (DefineMiddleware, MiddlewareProtocol)))
 
 
+class PathItem:
+    """
+    The generated path item of a route, with the operation ids it registered and
+    the schemas of the fields it was generated from.
+    """
+
+    __slots__ = ("result", "operation_ids", "schemas", "version")
+
+    def __init__(
+        self,
+        result: Tuple[dict[str, Any], dict[str, Any], dict[str, Any]],
+        operation_ids: list[Optional[str]],
+        schemas: list[Tuple[FieldInfo, JsonSchemaValue]],
+        version: int,
+    ) -> None:
+        self.result = result
+        self.operation_ids = operation_ids
+        self.schemas = schemas
+        self.version = version
+
+
+class OpenAPISchemaCache:
+    """
+    Keeps the definitions of the fields and the path item of each route of the last
+    schema generated for an application.
+
+    The definitions are only generated again when the fields of the routes change and
+    a path item only when its route is new or the schemas of its fields changed, so
+    adding a route to a large application only generates the path item of that route.
+    """
+
+    def __init__(self) -> None:
+        self.fields: Tuple[FieldInfo, ...] = ()
+        self.field_mapping: dict[
+            Tuple[FieldInfo, Literal["validation", "serialization"]], JsonSchemaValue
+        ] = {}
+        self.definitions: dict[str, dict[str, Any]] = {}
+        self.version = 0
+        self.paths: dict[Tuple[BasePath, bool], PathItem] = {}
+        self.used: set[Tuple[BasePath, bool]] = set()
+
+    def get_definitions(
+        self, fields: list[FieldInfo]
+    ) -> Tuple[
+        dict[Tuple[FieldInfo, Literal["validation", "serialization"]], JsonSchemaValue],
+        dict[str, dict[str, Any]],
+    ]:
+        """
+        Returns the field mapping and a copy of the definitions of the fields.
+        """
+        if len(fields) != len(self.fields) or any(
+            field is not cached for field, cached in zip(fields, self.fields, strict=True)
+        ):
+            self.field_mapping, self.definitions = get_definitions(
+                fields=fields,
+                schema_generator=GenerateJsonSchema(ref_template=REF_TEMPLATE),
+            )
+            self.fields = tuple(fields)
+            self.version += 1
+        self.used = set()
+        return self.field_mapping, dict(self.definitions)
+
+    def get_openapi_path(
+        self,
+        *,
+        route: Union[gateways.Gateway, gateways.WebhookGateway],
+        operation_ids: Set[str],
+        is_deprecated: bool = False,
+    ) -> Tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """
+        Returns the cached path item of the route, generating it when missing or stale.
+        """
+        key = (route, is_deprecated)
+        self.used.add(key)
+        item = self.paths.get(key)
+
+        if item is not None and self.is_fresh(item):
+            for operation_id in item.operation_ids:
+                add_operation_id(route, operation_id, operation_ids)
+            return item.result
+
+        schemas = [
+            (field, deepcopy(self.field_mapping[(field, "validation")]))
+            for field in get_route_fields(route)
+            if (field, "validation") in self.field_mapping
+        ]
+        route_operation_ids: list[Optional[str]] = []
+        result = get_openapi_path(
+            route=route,
+            operation_ids=route_operation_ids,
+            field_mapping=self.field_mapping,
+            is_deprecated=is_deprecated,
+        )
+        for operation_id in route_operation_ids:
+            add_operation_id(route, operation_id, operation_ids)
+
+        self.paths[key] = PathItem(result, route_operation_ids, schemas, self.version)
+        return result
+
+    def is_fresh(self, item: PathItem) -> bool:
+        if item.version == self.version:
+            return True
+        if any(
+            self.field_mapping.get((field, "validation")) != schema
+            for field, schema in item.schemas
+        ):
+            return False
+        item.version = self.version
+        return True
+
+    def prune(self) -> None:
+        """
+        Drops the path items of the routes not found by the last generation.
+        """
+        self.paths = {key: item for key, item in self.paths.items() if key in self.used}
+
+
+_schema_caches: "WeakKeyDictionary[Any, OpenAPISchemaCache]" = WeakKeyDictionary()
+
+
+def get_schema_cache(app: Any) -> OpenAPISchemaCache:
+    """
+    Returns the schema cache of the application, a new one when the application
+    cannot be referenced weakly.
+    """
+    try:
+        return _schema_caches[app]
+    except KeyError:
+        cache = _schema_caches[app] = OpenAPISchemaCache()
+        return cache
+    except TypeError:
+        return OpenAPISchemaCache()
+
+
+def get_route_fields(route: Union[gateways.Gateway, gateways.WebhookGateway]) -> list[FieldInfo]:
+    """
+    The fields of the handler of the route used by its path item.
+    """
+    handler = cast(router.HTTPHandler, route.handler)
+    fields: list[FieldInfo] = []
+    body_fields_names: list[str] = []
+    if handler.data_field:
+        fields.append(handler.data_field)
+        body_fields_names.append(handler.data_field.alias)
+    if handler.response_models:
+        fields.extend(handler.response_models.values())
+    fields.extend(get_flat_params(handler, body_fields_names))
+    return fields
+
+
 def get_openapi(
     *,
     app: Any,
@@ -530,11 +699,8 @@ def get_openapi(
     webhooks_paths: dict[str, dict[str, Any]] = {}
     operation_ids: Set[str] = set()
     all_fields = get_fields_from_routes(list(routes or []) + list(webhooks or []))
-    schema_generator = GenerateJsonSchema(ref_template=REF_TEMPLATE)
-    field_mapping, definitions = get_definitions(
-        fields=all_fields,
-        schema_generator=schema_generator,
-    )
+    schema_cache = get_schema_cache(app)
+    _, definitions = schema_cache.get_definitions(all_fields)
 
     # Iterate through the routes
     def iterate_routes(
@@ -583,10 +749,9 @@ def get_openapi(
                 continue
 
             if isinstance(route, (gateways.Gateway, gateways.WebhookGateway)):
-                result = get_openapi_path(
+                result = schema_cache.get_openapi_path(
                     route=route,
                     operation_ids=operation_ids,
-                    field_mapping=field_mapping,
                     is_deprecated=is_deprecated,
                 )
                 if result:
@@ -616,6 +781,7 @@ def get_openapi(
             components=components,
             is_webhook=True,
         )
+    schema_cache.prune()
 
     if definitions:
         components["schemas"] = {k: definitions[k] for k in sorted(definitions)}
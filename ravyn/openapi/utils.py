@@ -1,6 +1,5 @@
 from typing import Any, Tuple, Union
 
-from pydantic import TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from typing_extensions import Literal
@@ -9,6 +8,7 @@ from ravyn.openapi.validation import (
     validation_error_definition,
     validation_error_response_definition,
 )
+from ravyn.utils.schema import get_type_adapter
 
 VALIDATION_ERROR_DEFINITION = validation_error_definition.model_dump(exclude_none=True)
 VALIDATION_ERROR_RESPONSE_DEFINITION = validation_error_response_definition.model_dump(
@@ -43,7 +43,9 @@ def get_definitions(
     dict[Tuple[FieldInfo, Literal["validation", "serialization"]], JsonSchemaValue],
     dict[str, dict[str, Any]],
 ]:
-    inputs = [(field, "validation", TypeAdapter(field.annotation).core_schema) for field in fields]
+    inputs = [
+        (field, "validation", get_type_adapter(field.annotation).core_schema) for field in fields
+    ]
     field_mapping, definitions = schema_generator.generate_definitions(
         inputs=inputs  # type: ignore
     )
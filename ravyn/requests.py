@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, cast
 
 from lilya._internal._connection import Connection as Connection  # noqa: F401
 from lilya.datastructures import URL  # noqa
@@ -11,6 +11,7 @@ from lilya.requests import (
 from lilya.types import Receive, Scope, Send
 from orjson import loads
 
+from ravyn.exceptions import PayloadTooLarge
 from ravyn.typing import Void
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -25,9 +26,11 @@ class Request(LilyaRequest):
         scope: "Scope",
         receive: "Receive" = empty_receive,
         send: "Send" = empty_send,
+        max_body_size: Optional[int] = None,
     ):
         super().__init__(scope, receive, send)
         self._json: Any = Void
+        self.max_body_size = max_body_size
 
     @property
     def app(self) -> "Ravyn":
@@ -57,6 +60,28 @@ class Request(LilyaRequest):
         )
         return cast("RavynSettings", self.scope["app_settings"])
 
+    def stream(self) -> AsyncGenerator[bytes, None]:
+        """
+        Streams the request body, enforcing the `max_body_size` when one is set.
+
+        Without a limit, the stream is the one from Lilya, untouched.
+        """
+        if self.max_body_size is None:
+            return super().stream()
+        return self._limited_stream(self.max_body_size)
+
+    async def _limited_stream(self, max_body_size: int) -> AsyncGenerator[bytes, None]:
+        content_length = self.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > max_body_size:
+            raise PayloadTooLarge()
+
+        received = 0
+        async for chunk in super().stream():
+            received += len(chunk)
+            if received > max_body_size:
+                raise PayloadTooLarge()
+            yield chunk
+
     async def json(self) -> Any:
         if self._json is Void:
             if "_body" in self.scope:
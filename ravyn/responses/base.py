@@ -18,7 +18,6 @@ from lilya import status
 from lilya.responses import (
     RESPONSE_TRANSFORM_KWARGS,
     Error as Error,  # noqa
-    FileResponse as FileResponse,  # noqa
     HTMLResponse as HTMLResponse,  # noqa
     JSONResponse as JSONResponse,  # noqa
     Ok as Ok,  # noqa
@@ -33,6 +32,7 @@ from ravyn.encoders import Encoder
 from ravyn.exceptions import ImproperlyConfigured
 from ravyn.utils.enums import MediaType
 
+from .file import FileResponse as FileResponse  # noqa
 from .mixins import ORJSONTransformMixin
 
 PlainTextResponse = PlainText
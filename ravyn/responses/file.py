@@ -0,0 +1,201 @@
+import os
+import stat
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import anyio
+from lilya.enums import HTTPMethod
+from lilya.ranges import ContentRanges, Range
+from lilya.responses import FileResponse as LilyaFileResponse
+from lilya.types import Receive, Scope, Send
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lilya.background import Task
+    from lilya.encoders import EncoderProtocol, MoldingProtocol
+
+
+def read_chunk(fd: int, count: int, offset: int) -> bytes:
+    """
+    Reads `count` bytes at `offset` of the file descriptor, without moving its position.
+    """
+    if hasattr(os, "pread"):
+        return os.pread(fd, count, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover
+    return os.read(fd, count)  # pragma: no cover
+
+
+class FileResponse(LilyaFileResponse):
+    """
+    Sends a file, or ranges of a file, with as few copies as the ASGI server allows.
+
+    Like the Lilya response, the whole file is sent from its path with the
+    `http.response.pathsend` extension. With the `http.response.zerocopysend`
+    extension, each chunk of the file, or of the requested ranges, is sent from its
+    offset. Otherwise, each chunk is read at its offset with a single call in a thread.
+
+    A `Range` request with several ranges is answered with a `multipart/byteranges`
+    body with its exact `content-length`. The ETag and Last-Modified headers come from
+    the given `stat_result`, the file is only stated when none is given.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        status_code: int = 200,
+        headers: Optional[dict[str, Any]] = None,
+        media_type: Optional[str] = None,
+        background: Optional["Task"] = None,
+        filename: Optional[str] = None,
+        stat_result: Optional[os.stat_result] = None,
+        content_disposition_type: str = "attachment",
+        encoders: Optional[
+            Sequence[
+                Union[
+                    "EncoderProtocol",
+                    "MoldingProtocol",
+                    type["EncoderProtocol"],
+                    type["MoldingProtocol"],
+                ]
+            ]
+        ] = None,
+        allow_range_requests: bool = True,
+        range_multipart_boundary: Union[bool, str] = True,
+    ) -> None:
+        super().__init__(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+            filename=filename,
+            stat_result=stat_result,
+            content_disposition_type=content_disposition_type,
+            encoders=encoders,
+            allow_range_requests=allow_range_requests,
+            range_multipart_boundary=range_multipart_boundary,
+        )
+
+    async def stat_file(self) -> None:
+        try:
+            stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+        except FileNotFoundError:
+            raise RuntimeError(f"File at path {self.path} does not exist.") from None
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise RuntimeError(f"File at path {self.path} is not a file.") from None
+        self.stat_result = stat_result
+        self.set_stat_headers(stat_result)
+
+    def get_part_headers(self, content_ranges: ContentRanges) -> list[bytes]:
+        """
+        The headers of each part of a `multipart/byteranges` body.
+        """
+        media_type = (self.media_type or "application/octet-stream").replace("\n", "")
+        return [
+            (
+                f"\r\n--{self.range_multipart_boundary}\r\n"
+                f"content-type: {media_type}\r\n"
+                f"content-range: bytes {rangedef.start}-{rangedef.stop}/"
+                f"{content_ranges.max_value + 1}\r\n\r\n"
+            ).encode("latin-1")
+            for rangedef in content_ranges.ranges
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.stat_result is None:
+            await self.stat_file()
+
+        send_header_only = "method" in scope and scope["method"].upper() in {
+            HTTPMethod.HEAD,
+            HTTPMethod.OPTIONS,
+        }
+        prefix = "websocket." if scope["type"] == "websocket" else ""
+
+        content_ranges: Optional[ContentRanges] = None
+        if not send_header_only and self.allow_range_requests and self.check_if_range(scope):
+            content_ranges = self.set_range_headers(scope)
+
+        part_headers: list[bytes] = []
+        closing = b""
+        if content_ranges is not None and "content-range" not in self.headers:
+            part_headers = self.get_part_headers(content_ranges)
+            closing = f"\r\n--{self.range_multipart_boundary}--\r\n".encode("latin-1")
+            self.headers["content-length"] = str(
+                content_ranges.size + sum(map(len, part_headers)) + len(closing)
+            )
+
+        await send(self.message(prefix=prefix))
+        if send_header_only:
+            return
+
+        extensions = scope.get("extensions") or {}
+        if content_ranges is None and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": os.fspath(self.path)})
+        else:
+            ranges = (
+                [Range(start=0, stop=int(self.headers["content-length"]) - 1)]
+                if content_ranges is None
+                else content_ranges.ranges
+            )
+            await self.send_ranges(
+                send,
+                ranges,
+                part_headers,
+                closing,
+                zerocopy="http.response.zerocopysend" in extensions,
+            )
+
+        if self.background is not None:
+            await self.background()
+
+    async def send_ranges(
+        self,
+        send: Send,
+        ranges: list[Range],
+        part_headers: list[bytes],
+        closing: bytes,
+        zerocopy: bool = False,
+    ) -> None:
+        fd = await anyio.to_thread.run_sync(os.open, self.path, os.O_RDONLY)
+        try:
+            for index, rangedef in enumerate(ranges):
+                if part_headers:
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": part_headers[index],
+                            "more_body": True,
+                        }
+                    )
+
+                offset = rangedef.start
+                remaining = rangedef.stop - rangedef.start + 1
+                is_last = index == len(ranges) - 1 and not closing
+                while remaining > 0:
+                    count = min(self.chunk_size, remaining)
+                    more_body = remaining > count or not is_last
+                    if zerocopy:
+                        await send(
+                            {
+                                "type": "http.response.zerocopysend",
+                                "file": fd,
+                                "offset": offset,
+                                "count": count,
+                                "more_body": more_body,
+                            }
+                        )
+                    else:
+                        body = await anyio.to_thread.run_sync(read_chunk, fd, count, offset)
+                        await send(
+                            {"type": "http.response.body", "body": body, "more_body": more_body}
+                        )
+                    offset += count
+                    remaining -= count
+
+            if closing:
+                await send({"type": "http.response.body", "body": closing, "more_body": False})
+            elif not ranges or ranges[-1].stop < ranges[-1].start:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            os.close(fd)
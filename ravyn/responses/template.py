@@ -1,10 +1,15 @@
-from collections.abc import Sequence
+import inspect
+from collections.abc import AsyncIterator, Iterator, Sequence
 from mimetypes import guess_type
 from pathlib import PurePath
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+import anyio
+from lilya.concurrency import run_in_threadpool
+from lilya.enums import HTTPMethod
 from lilya.types import Receive, Scope, Send
 
+from ravyn.exceptions import ImproperlyConfigured
 from ravyn.responses.base import Response
 from ravyn.utils.enums import MediaType
 
@@ -15,7 +20,37 @@ if TYPE_CHECKING:  # pragma: no cover
     from ravyn.types import ResponseCookies
 
 
+def next_chunk(chunks: Iterator[str], chunk_size: int) -> Optional[str]:
+    """
+    Joins the next rendered pieces of a template until they reach the `chunk_size`,
+    returning `None` once the template is fully rendered.
+    """
+    buffer: list[str] = []
+    size = 0
+    for piece in chunks:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            break
+    return "".join(buffer) if buffer else None
+
+
 class TemplateResponse(Response):
+    """
+    Renders a template of the template engine.
+
+    By default the template is rendered into the body when the response is created.
+    With `stream=True`, the template is rendered while the response is sent, in chunks
+    of about `chunk_size` characters using the `generate` (or `generate_async`) of the
+    Jinja templates, sending the first bytes of a large page early without holding the
+    whole page in memory.
+
+    With `render_in_threadpool=True`, a synchronous template is rendered in a thread,
+    without blocking the event loop.
+    """
+
+    chunk_size: int = 16 * 1024
+
     def __init__(
         self,
         template_name: str,
@@ -28,6 +63,8 @@ class TemplateResponse(Response):
         media_type: Union[MediaType, str] = MediaType.JSON,
         encoders: Union[Sequence["Encoder"], None] = None,
         passthrough_body_types: Union[tuple[type, ...], None] = None,
+        stream: bool = False,
+        render_in_threadpool: bool = False,
     ):
         if media_type == MediaType.JSON:  # we assume this is the default
             suffixes = PurePath(template_name).suffixes
@@ -41,7 +78,24 @@ class TemplateResponse(Response):
 
         self.template = template_engine.get_template(template_name)
         self.context = context or {}
-        content = getattr(self.template, template_engine.get_template_render_function())(**context)
+        self.stream = stream
+        self.render_in_threadpool = render_in_threadpool
+
+        if stream:
+            stream_function = getattr(template_engine, "get_template_stream_function", None)
+            if stream_function is None:
+                raise ImproperlyConfigured(
+                    f"{type(template_engine).__name__} does not support streaming templates."
+                )
+            self.generate = getattr(self.template, stream_function())
+            content = None
+        else:
+            render = getattr(self.template, template_engine.get_template_render_function())
+            if render_in_threadpool and not inspect.iscoroutinefunction(render):
+                content = run_in_threadpool(render, **self.context)
+            else:
+                content = render(**self.context)
+
         super().__init__(
             content=content,
             status_code=status_code,
@@ -52,6 +106,9 @@ class TemplateResponse(Response):
             encoders=encoders,
             passthrough_body_types=passthrough_body_types,
         )
+        if stream:
+            # The length of a streamed template is unknown, the body is chunked.
+            self.headers.pop("content-length", None)
 
     def make_response(self, content: Any) -> bytes:
         # ensure template string is not mangled
@@ -59,6 +116,76 @@ class TemplateResponse(Response):
             content = content.encode(self.charset)
         return super().make_response(content)
 
+    async def iterate_chunks(self) -> AsyncIterator[str]:
+        """
+        Renders the template in chunks of about `chunk_size` characters.
+        """
+        chunks = self.generate(**self.context)
+
+        if isinstance(chunks, AsyncIterator):
+            buffer: list[str] = []
+            size = 0
+            try:
+                async for piece in chunks:
+                    buffer.append(piece)
+                    size += len(piece)
+                    if size >= self.chunk_size:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        size = 0
+                if buffer:
+                    yield "".join(buffer)
+            finally:
+                await chunks.aclose()
+            return
+
+        try:
+            while True:
+                if self.render_in_threadpool:
+                    chunk = await run_in_threadpool(next_chunk, chunks, self.chunk_size)
+                else:
+                    chunk = next_chunk(chunks, self.chunk_size)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            chunks.close()
+
+    async def stream_template(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(self.message(prefix=""))
+        if scope.get("method", "").upper() in {HTTPMethod.HEAD, HTTPMethod.OPTIONS}:
+            return
+
+        async def stream() -> None:
+            chunks = self.iterate_chunks()
+            try:
+                async for chunk in chunks:
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": chunk.encode(self.charset),
+                            "more_body": True,
+                        }
+                    )
+            finally:
+                await chunks.aclose()
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            task_group.cancel_scope.cancel()
+
+        async def wait_for_disconnect() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    break
+            task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(stream)
+            await wait_for_disconnect()
+
+        if self.background is not None:
+            await self.background()
+
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
     ) -> None:  # pragma: no cover
@@ -72,4 +199,7 @@ class TemplateResponse(Response):
                     "context": self.context,
                 }
             )
+        if self.stream:
+            await self.stream_template(scope, receive, send)
+            return
         await super().__call__(scope, receive, send)
@@ -217,6 +217,11 @@ def get_original_data_field(
         else:
             body = data
 
+        # A streamed body is documented as the JSON array it is read from
+        body_streams = getattr(handler.signature_model, "body_streams", {})
+        if data_or_payload in body_streams:
+            body.annotation = list[body_streams[data_or_payload]]  # type: ignore
+
         # Check the annotation type
         body.annotation = convert_annotation_to_pydantic_model(body.annotation)
 
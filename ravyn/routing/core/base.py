@@ -31,6 +31,7 @@ from typing_extensions import TypedDict
 
 from ravyn import status
 from ravyn.core.datastructures import ResponseContainer, UploadFile
+from ravyn.core.metrics.instrumentation import RequestTimer, current_request, trace_permission
 from ravyn.core.transformers.model import (
     TransformerModel,
     create_signature as transformer_create_signature,
@@ -105,6 +106,63 @@ class OpenAPIDefinitionMixin:  # pragma: no cover
         return parsed_components
 
 
+class StaticResponseHeaders:
+    """
+    Route level response headers and cookies, formatted once.
+
+    The headers are formatted when the response handler of a route is compiled and set
+    on the response object by the handler, without rebuilding the header dictionaries
+    and formatting the `Set-Cookie` values on every request. The after request hooks,
+    the interceptors and the middleware see them on the response.
+
+    Route level headers take precedence over the headers of the same name coming from
+    the response while cookies declared by the response take precedence over route
+    level cookies with the same key.
+    """
+
+    __slots__ = ("headers", "cookies")
+
+    def __init__(
+        self,
+        headers: dict[str, Any] | None = None,
+        cookies: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.headers: tuple[tuple[str, str], ...] = tuple(
+            (key, str(value)) for key, value in (headers or {}).items()
+        )
+        self.cookies: tuple[tuple[str, str], ...] = tuple(
+            (cookie["key"], self.format_cookie(cookie)) for cookie in cookies or _empty
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.headers or self.cookies)
+
+    @staticmethod
+    def format_cookie(cookie: dict[str, Any]) -> str:
+        """
+        Formats the `Set-Cookie` value of a cookie exactly like `Response.set_cookie` does.
+        """
+        carrier = LilyaResponse()
+        carrier.set_cookie(**cookie)
+        value: str = carrier.headers.get_all("set-cookie")[-1]
+        return value
+
+    def apply(self, response: LilyaResponse, headers: bool = True) -> None:
+        """
+        Sets the headers, unless `headers` is false, and the cookies on the response.
+        """
+        response_headers = response.headers
+        if headers:
+            for name, value in self.headers:
+                response_headers[name] = value
+
+        if self.cookies:
+            keys = {value.split("=", 1)[0] for value in response_headers.get_all("set-cookie")}
+            for key, value in self.cookies:
+                if key not in keys:
+                    response_headers.add("set-cookie", value)
+
+
 class BaseSignature:
     """
     In charge of handling the signartures of the handlers.
@@ -155,7 +213,10 @@ class BaseResponseHandler:
 
     @staticmethod
     async def _get_response_data(
-        route: "HTTPHandler", parameter_model: "TransformerModel", request: Request
+        route: "HTTPHandler",
+        parameter_model: "TransformerModel",
+        request: Request,
+        timer: RequestTimer | None = None,
     ) -> Any:
         """
         Determine required kwargs for the given handler, assign to the object dictionary, and get the response data.
@@ -166,6 +227,7 @@ class BaseResponseHandler:
             route (HTTPHandler): The route handler for the request.
             parameter_model (TransformerModel): The parameter model for handling request parameters.
             request (Request): The incoming request.
+            timer (RequestTimer | None): Measures the phases of the request, when set.
 
         Returns:
             Any: The response data generated by processing the request.
@@ -173,9 +235,13 @@ class BaseResponseHandler:
         signature_model = get_signature(route)
 
         if parameter_model.has_kwargs:
-            kwargs: dict[str, Any] = await parameter_model.to_kwargs(
-                connection=request, handler=route
-            )
+            kwargs: dict[str, Any]
+            if timer is None:
+                kwargs = await parameter_model.to_kwargs(connection=request, handler=route)
+            else:
+                kwargs = await timer.measure(
+                    "params", lambda: parameter_model.to_kwargs(connection=request, handler=route)
+                )
 
             is_data_or_payload = (
                 DATA if DATA in kwargs else (PAYLOAD if PAYLOAD in kwargs else None)
@@ -188,8 +254,11 @@ class BaseResponseHandler:
                 # Get the request data
                 data = await request_data
 
-                # Check if the data is an UploadFile or DataUpload and matches the expected parameter type
-                if isinstance(data, (UploadFile, DataUpload)) and is_data_or_payload is not None:
+                # Check if the data is an UploadFile, DataUpload or already decoded by the
+                # transformer (streamed or raw bodies) and matches the expected parameter type
+                if (
+                    parameter_model.decodes_body or isinstance(data, (UploadFile, DataUpload))
+                ) and is_data_or_payload is not None:
                     kwargs[is_data_or_payload] = data
                 # Check if the data is None and matches the expected parameter type
                 elif is_data_or_payload is not None and data is None:
@@ -208,7 +277,9 @@ class BaseResponseHandler:
 
             else:
                 # Get the request data
-                request_data = await parameter_model.get_request_data(request=request)
+                request_data = await parameter_model.get_request_data(
+                    request=request, handler=route
+                )
 
                 # Check if there is request data
                 if request_data is not None:
@@ -230,9 +301,17 @@ class BaseResponseHandler:
                     dependency=dependency, connection=request, **kwargs
                 )
 
-            parsed_kwargs = await signature_model.parse_values_for_connection(
-                connection=request, **kwargs
-            )
+            if timer is None:
+                parsed_kwargs = await signature_model.parse_values_for_connection(
+                    connection=request, **kwargs
+                )
+            else:
+                parsed_kwargs = await timer.measure(
+                    "validation",
+                    lambda: signature_model.parse_values_for_connection(
+                        connection=request, **kwargs
+                    ),
+                )
         else:
             parsed_kwargs = {}
 
@@ -281,13 +360,14 @@ class BaseResponseHandler:
             Callable[[ResponseContainer, Type["Ravyn"], dict[str, Any]], LilyaResponse]: The response container handler function.
 
         """
+        route_headers = self.get_headers(headers)
 
         async def response_content(
             data: Union[ResponseContainer, LilyaResponse],
             app: Type["Ravyn"],
             **kwargs: dict[str, Any],
         ) -> LilyaResponse:
-            _headers = {**self.get_headers(headers), **data.headers}
+            _headers = {**route_headers, **data.headers}
             _cookies = self.get_cookies(data.cookies, cookies)
             if isinstance(data, LilyaResponse):
                 response: LilyaResponse = data
@@ -311,31 +391,20 @@ class BaseResponseHandler:
         )
 
     def _get_json_response_handler(
-        self, cookies: ResponseCookies, headers: dict[str, Any]
+        self, static_headers: StaticResponseHeaders
     ) -> Callable[[Response, dict[str, Any]], LilyaResponse]:
         """
         Creates a handler function for JSON responses.
 
         Args:
-            cookies (ResponseCookies): The response cookies.
-            headers (dict[str, Any]): The response headers.
+            static_headers (StaticResponseHeaders): The route level headers and cookies.
 
         Returns:
             Callable[[Response, dict[str, Any]], LilyaResponse]: The JSON response handler function.
         """
 
         async def response_content(data: Response, **kwargs: dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
-
+            static_headers.apply(data)
             status_code = self._get_default_status_code(data)
             if status_code:
                 data.status_code = status_code
@@ -344,14 +413,16 @@ class BaseResponseHandler:
         return cast(Callable[[Response, dict[str, Any]], LilyaResponse], response_content)
 
     def _get_response_handler(
-        self, cookies: ResponseCookies, headers: dict[str, Any], media_type: str
+        self, static_headers: StaticResponseHeaders, media_type: str
     ) -> Callable[[Response, dict[str, Any]], LilyaResponse]:
         """
         Creates a handler function for Response types.
 
+        Only the cookies declared by the response itself are formatted per request,
+        the route level headers and cookies are formatted once.
+
         Args:
-            cookies (ResponseCookies): The response cookies.
-            headers (dict[str, Any]): The response headers.
+            static_headers (StaticResponseHeaders): The route level headers and cookies.
             media_type (str): The media type.
 
         Returns:
@@ -359,13 +430,10 @@ class BaseResponseHandler:
         """
 
         async def response_content(data: Response, **kwargs: dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(data.cookies, cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)
+            if data.cookies:
+                for cookie in self.get_cookies(data.cookies):
+                    data.set_cookie(**cookie)
+            static_headers.apply(data)
 
             status_code = self._get_default_status_code(data)
             if status_code:
@@ -373,56 +441,43 @@ class BaseResponseHandler:
 
             if media_type:
                 data.media_type = media_type
-
-            for header, value in _headers.items():
-                data.headers[header] = value
             return data
 
         return cast(Callable[[Response, dict[str, Any]], LilyaResponse], response_content)
 
     def _get_lilya_response_handler(
-        self, cookies: ResponseCookies, headers: dict[str, Any]
+        self, static_headers: StaticResponseHeaders
     ) -> Callable[[LilyaResponse, dict[str, Any]], LilyaResponse]:
         """
         Creates a handler function for Lilya Responses.
 
         Args:
-            cookies (ResponseCookies): The response cookies.
-            headers (dict[str, Any]): The response headers.
+            static_headers (StaticResponseHeaders): The route level headers and cookies.
 
         Returns:
             Callable[[LilyaResponse, dict[str, Any]], LilyaResponse]: The Lilya response handler function.
         """
 
         async def response_content(data: LilyaResponse, **kwargs: dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
-
+            static_headers.apply(data)
             return data
 
         return cast(Callable[[LilyaResponse, dict[str, Any]], LilyaResponse], response_content)
 
     def _get_default_handler(
         self,
-        cookies: ResponseCookies,
-        headers: dict[str, Any],
+        static_headers: StaticResponseHeaders,
         media_type: str,
         response_class: Any,
     ) -> Callable[[Any, dict[str, Any]], LilyaResponse]:
         """
         Creates a default handler function.
 
+        A Lilya response returned by the handler only gets the route level cookies, the
+        route level headers are set on the responses built from the returned data.
+
         Args:
-            cookies (ResponseCookies): The response cookies.
-            headers (dict[str, Any]): The response headers.
+            static_headers (StaticResponseHeaders): The route level headers and cookies.
             media_type (str): The media type.
             response_class (Any): The response class.
 
@@ -432,22 +487,19 @@ class BaseResponseHandler:
 
         async def response_content(data: Any, **kwargs: dict[str, Any]) -> LilyaResponse:
             data = await self.get_response_data(data=data)
-            _cookies = self.get_cookies(cookies)
             if isinstance(data, LilyaResponse):
                 response = data
                 response.status_code = self.status_code
                 response.background = self.background
+                static_headers.apply(response, headers=False)
             else:
                 response = response_class(
                     background=self.background,
                     content=data,
-                    headers=headers,
                     media_type=media_type,
                     status_code=self.status_code,
                 )
-
-            for cookie in _cookies:
-                response.set_cookie(**cookie)  # pragma: no cover
+                static_headers.apply(response)
             return response
 
         return cast(Callable[[Response, dict[str, Any]], LilyaResponse], response_content)
@@ -478,17 +530,27 @@ class BaseDispatcher(BaseResponseHandler):
         response_class = self.get_response_class()
         headers = self.get_response_headers()
         cookies = self.get_response_cookies()
+        return_annotation = self.handler_signature.return_annotation
 
-        if is_class_and_subclass(self.handler_signature.return_annotation, ResponseContainer):
+        # The ResponseContainer merges the route headers and cookies with its own when
+        # building the response, every other handler sets them formatted once.
+        if is_class_and_subclass(return_annotation, ResponseContainer):
             handler = self._get_response_container_handler(cookies, headers, media_type)
-        elif is_class_and_subclass(self.handler_signature.return_annotation, JSONResponse):
-            handler = self._get_json_response_handler(cookies, headers)  # type: ignore[assignment]
-        elif is_class_and_subclass(self.handler_signature.return_annotation, Response):
-            handler = self._get_response_handler(cookies, headers, media_type)  # type: ignore[assignment]
-        elif is_class_and_subclass(self.handler_signature.return_annotation, LilyaResponse):
-            handler = self._get_lilya_response_handler(cookies, headers)  # type: ignore[assignment]
+        elif is_class_and_subclass(return_annotation, LilyaResponse):
+            static_headers = StaticResponseHeaders(
+                {**self.get_headers(headers), **self.allow_header}, self.get_cookies(cookies)
+            )
+            if is_class_and_subclass(return_annotation, JSONResponse):
+                handler = self._get_json_response_handler(static_headers)  # type: ignore[assignment]
+            elif is_class_and_subclass(return_annotation, Response):
+                handler = self._get_response_handler(static_headers, media_type)  # type: ignore[assignment]
+            else:
+                handler = self._get_lilya_response_handler(static_headers)  # type: ignore[assignment]
         else:
-            handler = self._get_default_handler(cookies, headers, media_type, response_class)  # type: ignore[assignment]
+            static_headers = StaticResponseHeaders(
+                self.get_headers(headers), self.get_cookies(cookies)
+            )
+            handler = self._get_default_handler(static_headers, media_type, response_class)  # type: ignore[assignment]
 
         self._response_handler = handler
 
@@ -503,6 +565,7 @@ class BaseDispatcher(BaseResponseHandler):
         request: Request,
         route: "HTTPHandler",
         parameter_model: "TransformerModel",
+        timer: RequestTimer | None = None,
     ) -> "LilyaResponse":
         """
         Get response for the given request using the specified route and parameter model.
@@ -512,20 +575,37 @@ class BaseDispatcher(BaseResponseHandler):
             request (Request): The incoming request.
             route (HTTPHandler): The route handler for the request.
             parameter_model (TransformerModel): The parameter model for handling request parameters.
+            timer (RequestTimer | None): Measures the phases of the request, when set.
 
         Returns:
             LilyaResponse: The response generated for the request.
         """
-        response_data = await self._get_response_data(
-            route=route,
-            parameter_model=parameter_model,
-            request=request,
-        )
+        if timer is None:
+            response_data = await self._get_response_data(
+                route=route,
+                parameter_model=parameter_model,
+                request=request,
+            )
 
-        response = await self.to_response(
-            app=scope["app"],
-            data=response_data,
+            response = await self.to_response(
+                app=scope["app"],
+                data=response_data,
+            )
+            return cast("LilyaResponse", response)
+
+        # The handler is what remains once the parameters, dependencies and validation
+        # measured inside are removed.
+        response_data = await timer.measure(
+            "handler",
+            lambda: self._get_response_data(
+                route=route, parameter_model=parameter_model, request=request, timer=timer
+            ),
+            exclusive=True,
+        )
+        response = await timer.measure(
+            "serialization", lambda: self.to_response(app=scope["app"], data=response_data)
         )
+        timer.trace_response(response)
         return cast("LilyaResponse", response)
 
 
@@ -926,9 +1006,11 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         Returns:
             None
         """
+        timer = current_request.get()
         for _, permission in permissions.items():
             if isinstance(permission, AsyncCallable):
-                await self.allow_connection(connection, permission)
+                with trace_permission(timer, permission):
+                    await self.allow_connection(connection, permission)
             else:
                 # Dispatches to lilya permissions
                 await dispatch_call(scope, receive, send)
@@ -20,6 +20,7 @@ from ravyn.utils.constants import AVAILABLE_METHODS
 from ravyn.utils.enums import HttpMethod, MediaType
 
 if TYPE_CHECKING:  # pragma: no cover
+    from ravyn.core.broadcast import Broadcast
     from ravyn.openapi.schemas.v3_1_0 import SecurityScheme
     from ravyn.types import (
         BackgroundTaskType,
@@ -1151,6 +1152,29 @@ def post(
             """
         ),
     ] = None,
+    max_body_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, allowed for the request body of this handler.
+
+            When the `Content-Length` header or the bytes received while reading
+            the body exceed this value, a `413 Payload Too Large` is raised before the
+            body is fully buffered.
+
+            **Example**
+
+            ```python
+            from ravyn import post
+
+
+            @post(max_body_size=1024 * 1024)
+            async def upload(data: dict) -> None:
+                ...
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], HTTPHandler]:
     """
     Handler responsible for the HTTP method `post` and
@@ -1200,6 +1224,7 @@ def post(
             responses=responses,
             before_request=before_request,
             after_request=after_request,
+            max_body_size=max_body_size,
         )
         handler.fn = func
         handler.handler = wrapped
@@ -1585,6 +1610,29 @@ def put(
             """
         ),
     ] = None,
+    max_body_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, allowed for the request body of this handler.
+
+            When the `Content-Length` header or the bytes received while reading
+            the body exceed this value, a `413 Payload Too Large` is raised before the
+            body is fully buffered.
+
+            **Example**
+
+            ```python
+            from ravyn import put
+
+
+            @put(max_body_size=1024 * 1024)
+            async def upload(data: dict) -> None:
+                ...
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], HTTPHandler]:
     """
     Handler responsible for the HTTP method `put` and
@@ -1634,6 +1682,7 @@ def put(
             responses=responses,
             before_request=before_request,
             after_request=after_request,
+            max_body_size=max_body_size,
         )
         handler.fn = func
         handler.handler = wrapped
@@ -2019,6 +2068,29 @@ def patch(
             """
         ),
     ] = None,
+    max_body_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, allowed for the request body of this handler.
+
+            When the `Content-Length` header or the bytes received while reading
+            the body exceed this value, a `413 Payload Too Large` is raised before the
+            body is fully buffered.
+
+            **Example**
+
+            ```python
+            from ravyn import patch
+
+
+            @patch(max_body_size=1024 * 1024)
+            async def upload(data: dict) -> None:
+                ...
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], HTTPHandler]:
     """
     Handler responsible for the HTTP method `path` and
@@ -2068,6 +2140,7 @@ def patch(
             responses=responses,
             before_request=before_request,
             after_request=after_request,
+            max_body_size=max_body_size,
         )
         handler.fn = func
         handler.handler = wrapped
@@ -2453,6 +2526,29 @@ def delete(
             """
         ),
     ] = None,
+    max_body_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, allowed for the request body of this handler.
+
+            When the `Content-Length` header or the bytes received while reading
+            the body exceed this value, a `413 Payload Too Large` is raised before the
+            body is fully buffered.
+
+            **Example**
+
+            ```python
+            from ravyn import delete
+
+
+            @delete(max_body_size=1024 * 1024)
+            async def upload(data: dict) -> None:
+                ...
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], HTTPHandler]:
     """
     Handler responsible for the HTTP method `delete` and
@@ -2502,6 +2598,7 @@ def delete(
             responses=responses,
             before_request=before_request,
             after_request=after_request,
+            max_body_size=max_body_size,
         )
         handler.fn = func
         handler.handler = wrapped
@@ -3506,6 +3603,29 @@ def route(
             """
         ),
     ] = None,
+    max_body_size: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The maximum size, in bytes, allowed for the request body of this handler.
+
+            When the `Content-Length` header or the bytes received while reading
+            the body exceed this value, a `413 Payload Too Large` is raised before the
+            body is fully buffered.
+
+            **Example**
+
+            ```python
+            from ravyn import route
+
+
+            @route(methods=["POST", "PUT"], max_body_size=1024 * 1024)
+            async def upload(data: dict) -> None:
+                ...
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], HTTPHandler]:
     """
     Handler responsible for allowing multiple HTTP verbs in one go
@@ -3569,6 +3689,7 @@ def route(
             responses=responses,
             before_request=before_request,
             after_request=after_request,
+            max_body_size=max_body_size,
         )
 
         handler.fn = func
@@ -3660,6 +3781,30 @@ def websocket(
             """
         ),
     ] = None,
+    broadcast: Annotated[
+        Optional["Broadcast"],
+        Doc(
+            """
+            The [Broadcast](https://ravyn.dev/routing/routes/#broadcast) hub the connections
+            are subscribed to the `channels` of.
+            """
+        ),
+    ] = None,
+    channels: Annotated[
+        Optional[Sequence[str]],
+        Doc(
+            """
+            The channels of the `broadcast` the connections are subscribed to while the
+            handler runs. The channels can use the path parameters.
+
+            **Example**
+
+            ```python
+            @websocket(path="/rooms/{room_id}", broadcast=broadcast, channels=["room:{room_id}"])
+            ```
+            """
+        ),
+    ] = None,
 ) -> Callable[[F], WebSocketHandler]:
     def wrapper(func: Any) -> WebSocketHandler:
         handler = WebSocketHandler(
@@ -3671,6 +3816,8 @@ def websocket(
             name=name,
             before_request=before_request,
             after_request=after_request,
+            broadcast=broadcast,
+            channels=channels,
         )
         handler.fn = func
         handler.handler = func
@@ -0,0 +1,473 @@
+from __future__ import annotations
+
+import copy
+import re
+from collections.abc import Sequence
+from typing import Any, Optional, cast
+
+from lilya._internal._path import clean_path, compile_path, get_route_path
+from lilya._internal._path_transformers import (
+    FloatTransformer,
+    IntegerTransformer,
+    StringTransformer,
+    Transformer,
+    UUIDTransformer,
+)
+from lilya.enums import Match, ScopeType
+from lilya.routing import BasePath, Include as LilyaInclude, Router as LilyaRouter
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+PARAM_REGEX = re.compile(r"\{([a-zA-Z_]\w*)\}")
+
+# Transformers whose regex never matches a `/` and therefore a single segment.
+SEGMENT_TRANSFORMERS = (StringTransformer, IntegerTransformer, FloatTransformer, UUIDTransformer)
+
+
+class RouteNode:
+    """
+    A node of the radix tree, one per path segment.
+    """
+
+    __slots__ = ("static", "params", "routes", "catch_all")
+
+    def __init__(self) -> None:
+        self.static: dict[str, RouteNode] = {}
+        self.params: list[tuple[re.Pattern[str], RouteNode]] = []
+        self.routes: list[int] = []
+        self.catch_all: list[int] = []
+
+    def get_param_child(self, regex: str) -> RouteNode:
+        for pattern, node in self.params:
+            if pattern.pattern == regex:
+                return node
+        node = RouteNode()
+        self.params.append((re.compile(regex), node))
+        return node
+
+
+class RouteMatcher:
+    """
+    Compiled lookup of the routes that can match a path.
+
+    The fully static paths are resolved with a single dictionary lookup and the others
+    walk a radix tree of static segments and typed parameter nodes. The matcher only
+    narrows the routes down to the candidates, in declaration order, and the router
+    still runs the `search` of each one of them, so the precedence rules and the
+    path parameters are exactly the same as the linear scan.
+    """
+
+    __slots__ = ("routes", "root", "static", "always")
+
+    def __init__(self, routes: Sequence[Any]) -> None:
+        self.routes = routes
+        self.root = RouteNode()
+        self.static: dict[str, list[int]] = {}
+        self.always: list[int] = []
+
+        static_routes: dict[str, list[int]] = {}
+        for index, route in enumerate(routes):
+            path_format: Optional[str] = getattr(route, "path_format", None)
+            convertors: Optional[dict[str, Transformer]] = getattr(route, "param_convertors", None)
+
+            if not isinstance(route, BasePath) or path_format is None or convertors is None:
+                self.always.append(index)
+            elif not path_format.startswith("/"):
+                self.always.append(index)
+            elif not convertors:
+                static_routes.setdefault(path_format, []).append(index)
+            else:
+                self.add(index, path_format, convertors)
+
+        # The candidates of a static path never change, they are computed once.
+        for path, indexes in static_routes.items():
+            self.static[path] = self.merge(indexes, self.search_tree(path))
+
+    def add(self, index: int, path_format: str, convertors: dict[str, Transformer]) -> None:
+        node = self.root
+        for segment in path_format.split("/")[1:]:
+            params = PARAM_REGEX.findall(segment)
+            if not params:
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+
+            if not all(isinstance(convertors.get(name), SEGMENT_TRANSFORMERS) for name in params):
+                node.catch_all.append(index)
+                return
+
+            regex = "".join(
+                f"(?:{convertors[part].regex})" if position % 2 else re.escape(part)
+                for position, part in enumerate(PARAM_REGEX.split(segment))
+            )
+            node = node.get_param_child(regex)
+        node.routes.append(index)
+
+    def search_tree(self, path: str) -> list[int]:
+        segments = path.split("/")[1:]
+        found: list[int] = []
+        stack: list[tuple[RouteNode, int]] = [(self.root, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            found.extend(node.catch_all)
+            if depth == len(segments):
+                found.extend(node.routes)
+                continue
+
+            segment = segments[depth]
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+            for pattern, param_node in node.params:
+                if pattern.fullmatch(segment):
+                    stack.append((param_node, depth + 1))
+        return found
+
+    def merge(self, *groups: list[int]) -> list[int]:
+        return sorted({index for group in (*groups, self.always) for index in group})
+
+    def get_indexes(self, path: str) -> list[int]:
+        indexes = self.static.get(path)
+        if indexes is None:
+            indexes = self.merge(self.search_tree(path))
+        return indexes
+
+    def get_candidates(self, path: str, redirect_slashes: bool = False) -> list[Any]:
+        """
+        The routes that can match the path, in declaration order.
+
+        With `redirect_slashes`, the routes matching the path with or without its
+        trailing slash are included, for the redirect of the router.
+        """
+        indexes = self.get_indexes(path)
+        if redirect_slashes and path != "/":
+            redirect_path = path.rstrip("/") if path.endswith("/") else f"{path}/"
+            indexes = sorted({*indexes, *self.get_indexes(redirect_path)})
+        return [self.routes[index] for index in indexes]
+
+
+class FlatRoute(BasePath):
+    """
+    A route of a nested `Include`, hoisted to the router of the application.
+
+    The combined path of the includes and the route is compiled once and used to
+    find the route without dispatching through every router in between. The prefix
+    of the includes is matched with a single regex and the scope (`root_path`,
+    `path_params`, `dependencies`...) is built as the includes would have.
+
+    Only the full matches are dispatched directly. A method not allowed, a slash
+    redirect or a path not found go through the `Include` declared after the
+    flattened routes, exactly as without flattening.
+
+    The includes declaring middleware, permissions, interceptors, exception handlers
+    or request hooks are applied around the route, with their own copy of the
+    middleware stack, in the same order as the nested dispatch. Their middleware see
+    the scope of the route.
+    """
+
+    __slots__ = (
+        "includes",
+        "route",
+        "path",
+        "path_regex",
+        "path_format",
+        "param_convertors",
+        "prefix_regex",
+        "prefix_convertors",
+        "dependencies",
+        "app",
+    )
+
+    def __init__(self, includes: Sequence[Any], route: Any, path: str, prefix: str) -> None:
+        self.includes = tuple(includes)
+        self.route = route
+        self.path = path
+        self.path_regex, self.path_format, self.param_convertors, _ = compile_path(path)
+        self.prefix_regex, _, self.prefix_convertors, _ = compile_path(
+            clean_path(f"{prefix}/{{path:path}}")
+        )
+        self.dependencies = [include.dependencies for include in self.includes]
+        self.app = self.build_app()
+
+    @property
+    def name(self) -> Optional[str]:
+        name: Optional[str] = getattr(self.route, "name", None)
+        return name
+
+    def build_app(self) -> ASGIApp:
+        """
+        The route wrapped in the includes carrying a behaviour, innermost first. Each
+        one is a copy of the include dispatching to the next level instead of its
+        router.
+        """
+        app: ASGIApp = self.route.handle_dispatch
+        for include in reversed(self.includes):
+            if is_transparent(include):
+                continue
+            level = copy.copy(include)
+            level.app = app
+            level._apply_permissions(level.wrapped_permissions)
+            level._apply_middleware(level.middleware)
+            app = level.handle_dispatch
+        return app
+
+    def search(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] not in (ScopeType.HTTP, ScopeType.WEBSOCKET):
+            return Match.NONE, {}
+
+        root_path = scope.get("root_path", "")
+        route_path = get_route_path(scope)
+        match = self.prefix_regex.match(route_path)
+        if match is None:
+            return Match.NONE, {}
+
+        params = {
+            key: self.prefix_convertors[key].transform(value)
+            for key, value in match.groupdict().items()
+        }
+        remaining_path = f"/{params.pop('path', '')}"
+        child_scope: dict[str, Any] = {
+            "path_params": {**scope.get("path_params", {}), **params},
+            "app_root_path": scope.get("app_root_path", root_path),
+            "root_path": root_path + route_path[: -len(remaining_path)],
+            "handler": self.includes[-1].app,
+            "dependencies": [*scope.get("dependencies", []), *self.dependencies],
+        }
+
+        route_match, route_scope = self.route.search({**scope, **child_scope})
+        if route_match != Match.FULL:
+            return Match.NONE, {}
+        child_scope.update(route_scope)
+        return Match.FULL, child_scope
+
+    async def handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope["route"] = self.route
+        scope["route_path_template"] = getattr(self.route, "path", None)
+        await self.app(scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, route={self.route!r})"
+
+
+def is_transparent(include: Any) -> bool:
+    """
+    Whether the include only prefixes its routes, without any behaviour of its own.
+    """
+    return not any(
+        (
+            include.middleware,
+            include.wrapped_permissions,
+            include.permissions,
+            getattr(include, "interceptors", None),
+            include.exception_handlers,
+            include.before_request,
+            include.after_request,
+        )
+    )
+
+
+def get_include_router(include: Any) -> Optional[CompiledRouter]:
+    """
+    The router created by an `Include` declared with routes, when it can be flattened.
+
+    An include mounting an application (like a `ChildRavyn`) or whose router has
+    middleware, permissions or request hooks of its own stays a regular route.
+    """
+    if not isinstance(include, LilyaInclude):
+        return None
+
+    router = getattr(include, "__base_app__", None)
+    if not isinstance(router, CompiledRouter):
+        return None
+
+    for value in (
+        router.middleware,
+        router.permissions,
+        router.before_request,
+        router.after_request,
+    ):
+        if value:
+            return None
+
+    for route in router.routes:
+        path = getattr(route, "path", None)
+        if not isinstance(route, BasePath) or not isinstance(path, str):
+            return None
+        if not path.startswith("/"):
+            return None
+    return router
+
+
+def flatten_routes(
+    routes: Sequence[Any], redirect_slashes: bool
+) -> tuple[list[Any], list[CompiledRouter]]:
+    """
+    Replaces the `Include` by their routes, recursively, keeping the order. Each
+    flattened `Include` is kept after its routes, for the requests not fully matching
+    any of them.
+
+    Returns the routes and the routers of the flattened includes.
+    """
+    flattened: list[Any] = []
+    routers: list[CompiledRouter] = []
+    for route in routes:
+        router = get_include_router(route)
+        if router is None or router.redirect_slashes != redirect_slashes:
+            flattened.append(route)
+            continue
+
+        include_routers: list[CompiledRouter] = []
+        try:
+            entries = _flatten_include(route, (), "", redirect_slashes, include_routers)
+        except ValueError:
+            # Duplicated path parameters between the levels, kept nested.
+            flattened.append(route)
+            continue
+
+        flattened.extend(entries)
+        flattened.append(route)
+        routers.extend(include_routers)
+    return flattened, routers
+
+
+def _flatten_include(
+    include: Any,
+    includes: tuple[Any, ...],
+    prefix: str,
+    redirect_slashes: bool,
+    routers: list[CompiledRouter],
+) -> list[FlatRoute]:
+    includes = (*includes, include)
+    if include.path != "/":
+        prefix += include.path
+    routers.append(include.__base_app__)
+
+    entries: list[FlatRoute] = []
+    for route in include.__base_app__.routes:
+        router = get_include_router(route)
+        if router is not None and router.redirect_slashes == redirect_slashes:
+            entries.extend(_flatten_include(route, includes, prefix, redirect_slashes, routers))
+        elif isinstance(route, LilyaInclude):
+            path = route.path if route.path != "/" else ""
+            entries.append(FlatRoute(includes, route, f"{prefix}{path}/{{path:path}}", prefix))
+        else:
+            entries.append(FlatRoute(includes, route, f"{prefix}{route.path}", prefix))
+    return entries
+
+
+class MatchedRouter:
+    """
+    A router as seen by the Lilya dispatch loop of one request, with only the
+    candidate routes of its path.
+    """
+
+    __slots__ = ("router", "routes")
+
+    def __init__(self, router: Any, routes: list[Any]) -> None:
+        self.router = router
+        self.routes = routes
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.router, name)
+
+
+class CompiledRoutingMixin:
+    """
+    Dispatches the requests of a router through a `RouteMatcher` once enabled with
+    `enable_route_matcher`, instead of testing every route in order.
+
+    The matcher is invalidated when routes are added and enables itself in the
+    routers of the nested `Include`. When flattened, the routes of the nested
+    `Include` are compiled into the table of this router, turning the dispatch
+    through every level into a single lookup, and a change in any of them
+    invalidates this table as well. The routes of the router are left untouched,
+    so `path_for`, `url_for` and the OpenAPI keep working the same.
+    """
+
+    routes: list[Any]
+    redirect_slashes: bool
+    route_matcher_enabled: bool = False
+    route_matcher_flattened: bool = False
+    _route_matcher: Optional[RouteMatcher] = None
+    _route_matcher_parents: tuple[CompiledRoutingMixin, ...] = ()
+
+    def enable_route_matcher(self, flatten: bool = False) -> None:
+        """
+        Enables the compiled matcher. With `flatten`, the routes of the nested
+        `Include` are hoisted into this router as well.
+        """
+        self.route_matcher_enabled = True
+        self.route_matcher_flattened = flatten
+        self.invalidate_route_matcher()
+
+    def invalidate_route_matcher(self) -> None:
+        """
+        Drops the compiled table, rebuilt at the next request, along with the tables
+        of the routers flattening this one.
+        """
+        self._route_matcher = None
+        for parent in self._route_matcher_parents:
+            parent.invalidate_route_matcher()
+
+    def get_route_matcher(self) -> RouteMatcher:
+        if self._route_matcher is not None:
+            return self._route_matcher
+
+        routes = self.routes
+        if self.route_matcher_flattened:
+            routes, routers = flatten_routes(routes, self.redirect_slashes)
+            for router in routers:
+                if self not in router._route_matcher_parents:
+                    router._route_matcher_parents = (*router._route_matcher_parents, self)
+                # Their own table serves the requests falling back to the includes.
+                if not router.route_matcher_enabled:
+                    router.enable_route_matcher()
+        matcher = RouteMatcher(routes)
+
+        for route in routes:
+            if isinstance(route, FlatRoute):
+                route = route.route
+            nested = getattr(route, "__base_app__", None)
+            if isinstance(nested, CompiledRoutingMixin) and not nested.route_matcher_enabled:
+                nested.enable_route_matcher(flatten=self.route_matcher_flattened)
+
+        self._route_matcher = matcher
+        return matcher
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.route_matcher_enabled or scope["type"] not in (
+            ScopeType.HTTP,
+            ScopeType.WEBSOCKET,
+        ):
+            await super().app(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        candidates = self.get_route_matcher().get_candidates(
+            get_route_path(scope),
+            redirect_slashes=self.redirect_slashes and scope["type"] == ScopeType.HTTP,
+        )
+        await LilyaRouter.app(cast(Any, MatchedRouter(self, candidates)), scope, receive, send)
+
+
+class CompiledRouter(CompiledRoutingMixin, LilyaRouter):
+    """
+    The router created by an `Include` declared with `routes`.
+    """
+
+    def add_route(self, *args: Any, **kwargs: Any) -> None:
+        super().add_route(*args, **kwargs)
+        self.invalidate_route_matcher()
+
+    def add_websocket_route(self, *args: Any, **kwargs: Any) -> None:
+        super().add_websocket_route(*args, **kwargs)
+        self.invalidate_route_matcher()
+
+    def include(self, *args: Any, **kwargs: Any) -> None:
+        super().include(*args, **kwargs)
+        self.invalidate_route_matcher()
+
+    def host(self, *args: Any, **kwargs: Any) -> None:
+        super().host(*args, **kwargs)
+        self.invalidate_route_matcher()
@@ -19,8 +19,10 @@ from typing import (
     Type,
     Union,
     cast,
+    get_type_hints,
 )
 
+import msgspec
 from lilya import status
 from lilya._internal._connection import Connection
 from lilya._internal._path import clean_path
@@ -46,8 +48,14 @@ from typing_extensions import Annotated, Doc
 from ravyn.conf import settings
 from ravyn.core.datastructures import File, Redirect
 from ravyn.core.interceptors.types import Interceptor
+from ravyn.core.metrics.instrumentation import current_request, trace_interceptor
+from ravyn.core.transformers.messages import (
+    WebSocketMessageDecoder,
+    get_message_decoder,
+    get_message_errors,
+)
 from ravyn.core.transformers.model import TransformerModel, get_signature
-from ravyn.core.transformers.signature import SignatureModel
+from ravyn.core.transformers.signature import SignatureFactory, SignatureModel
 from ravyn.core.urls import include
 from ravyn.exceptions import (
     ImproperlyConfigured,
@@ -66,9 +74,11 @@ from ravyn.routing.controllers.base import BaseController
 from ravyn.routing.core._internal import OpenAPIFieldInfoMixin
 from ravyn.routing.core.base import Dispatcher
 from ravyn.routing.gateways import Gateway, WebhookGateway, WebSocketGateway
+from ravyn.routing.matcher import CompiledRouter, CompiledRoutingMixin
 from ravyn.typing import Void, VoidType
 from ravyn.utils.constants import (
     DATA,
+    MESSAGE,
     PAYLOAD,
     REDIRECT_STATUS_CODES,
     REQUEST,
@@ -80,10 +90,11 @@ from ravyn.utils.helpers import (
     is_class_and_subclass,
     is_optional_union,
 )
-from ravyn.websockets import WebSocket, WebSocketClose
+from ravyn.websockets import WebSocket, WebSocketClose, WebSocketState
 
 if TYPE_CHECKING:  # pragma: no cover
     from ravyn.applications import Application, Ravyn
+    from ravyn.core.broadcast import Broadcast
     from ravyn.core.interceptors.interceptor import RavynInterceptor
     from ravyn.openapi.schemas.v3_1_0.security_scheme import SecurityScheme
     from ravyn.permissions.types import Permission
@@ -103,7 +114,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ravyn.typing import AnyCallable
 
 
-class BaseRouter(Dispatcher, LilyaRouter):
+class BaseRouter(Dispatcher, CompiledRoutingMixin, LilyaRouter):
     __slots__ = (
         "redirect_slashes",
         "default",
@@ -734,6 +745,7 @@ class BaseRouter(Dispatcher, LilyaRouter):
 
     def activate(self) -> None:
         self.routes = self.reorder_routes()
+        self.invalidate_route_matcher()
 
     async def handle_interceptors(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
@@ -909,6 +921,7 @@ class BaseRouter(Dispatcher, LilyaRouter):
                 if route_handlers:
                     self.routes.extend(route_handlers)
                 self.routes.pop(self.routes.index(value))
+                self.invalidate_route_matcher()
 
 
 class RoutingMethodsMixin:
@@ -2217,6 +2230,7 @@ class Router(RoutingMethodsMixin, BaseRouter):
         self.validate_root_route_parent(gateway)
         self.create_signature_models(gateway)
         self.routes.append(gateway)
+        self.invalidate_route_matcher()
 
     def add_websocket_route(
         self,
@@ -2348,6 +2362,7 @@ class Router(RoutingMethodsMixin, BaseRouter):
         self.validate_root_route_parent(websocket_gateway)
         self.create_signature_models(websocket_gateway)
         self.routes.append(websocket_gateway)
+        self.invalidate_route_matcher()
 
     def route(
         self,
@@ -2602,8 +2617,12 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         "__type__",
         "before_request",
         "after_request",
+        "max_body_size",
     )
 
+    # The route template of the handler, recorded on its first measured request.
+    instrumented_route: Optional[str] = None
+
     def __init__(
         self,
         path: Optional[str] = None,
@@ -2634,6 +2653,7 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         responses: Optional[dict[int, OpenAPIResponse]] = None,
         security: Optional[list[SecurityScheme]] = None,
         operation_id: Optional[str] = None,
+        max_body_size: Optional[int] = None,
     ) -> None:
         """
         Handles the "handler" or "controller" of the platform. A handler can be any get, put, patch, post, delete or route.
@@ -2741,6 +2761,7 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         self.__type__: Union[str, None] = None
         self.before_request = list(before_request or [])
         self.after_request = list(after_request or [])
+        self.max_body_size = max_body_size
 
         if self.responses:
             self.validate_responses(responses=self.responses)
@@ -2754,12 +2775,14 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         if not self.interceptors:
             return
 
+        timer = current_request.get()
         for obj in self.interceptors:
             interceptor: "RavynInterceptor" = obj()
-            if is_async_callable(interceptor.intercept):
-                await interceptor.intercept(scope, receive, send)
-            else:
-                await run_in_threadpool(interceptor.intercept, scope, receive, send)  # type: ignore
+            with trace_interceptor(timer, obj):
+                if is_async_callable(interceptor.intercept):
+                    await interceptor.intercept(scope, receive, send)
+                else:
+                    await run_in_threadpool(interceptor.intercept, scope, receive, send)  # type: ignore
 
     async def handle_permissions(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -2898,6 +2921,11 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         Returns:
             None
         """
+        # Only set when the requests are measured, by the metrics, tracing or profiling.
+        timer = current_request.get()
+        if timer is not None:
+            timer.enter_handler(self, scope)
+
         for before_request in self.before_request:
             if inspect.isclass(before_request):
                 before_request = before_request()
@@ -2907,23 +2935,42 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
             else:
                 await run_in_threadpool(before_request, scope, receive, send)
 
-        await self.handle_interceptors(scope, receive, send)
+        if timer is None:
+            await self.handle_interceptors(scope, receive, send)
+        else:
+            await timer.measure(
+                "interceptors", lambda: self.handle_interceptors(scope, receive, send)
+            )
 
         methods = [scope["method"]]
         await self.allowed_methods(scope, receive, send, methods)
 
-        request = Request(scope=scope, receive=receive, send=send)
+        request = Request(
+            scope=scope, receive=receive, send=send, max_body_size=self.max_body_size
+        )
         route_handler, parameter_model = self.route_map[scope["method"]]
 
         # Check the permissions for the application if they exist.
-        await self.handle_permissions(scope, receive, send)
+        if timer is None:
+            await self.handle_permissions(scope, receive, send)
+        else:
+            await timer.measure_permissions(lambda: self.handle_permissions(scope, receive, send))
 
         response = await self.get_response_for_request(
             scope=scope,
             request=request,
             route=route_handler,
             parameter_model=parameter_model,
+            timer=timer,
         )
+
+        # Hand the background tasks over to the application executor, when enabled,
+        # instead of running them at the end of the request.
+        if getattr(response, "background", None) is not None:
+            executor = getattr(scope.get("app"), "background_executor", None)
+            if executor is not None:
+                response.background = executor.defer(response.background)
+
         await response(scope, receive, send)
 
         for after_request in self.after_request:
@@ -3083,6 +3130,9 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
         "name",
         "before_request",
         "after_request",
+        "broadcast",
+        "channels",
+        "message_decoder",
         "__type__",
     )
 
@@ -3105,6 +3155,24 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
         ] = None,
         before_request: Sequence[Callable[..., Any]] | None = None,
         after_request: Sequence[Callable[..., Any]] | None = None,
+        broadcast: Annotated[
+            Optional["Broadcast"],
+            Doc(
+                """
+                The `Broadcast` hub the connections are subscribed to the `channels` of.
+                """
+            ),
+        ] = None,
+        channels: Annotated[
+            Optional[Sequence[str]],
+            Doc(
+                """
+                The channels of the `broadcast` the connections are subscribed to while
+                the handler runs. The channels can use the path parameters, for example
+                `"room:{room_id}"`.
+                """
+            ),
+        ] = None,
     ):
         if not path:
             path = "/"
@@ -3159,6 +3227,9 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
         self.tags: Sequence[str] = []
         self.__type__: Union[str, None] = None
         self.name = name
+        self.broadcast = broadcast
+        self.channels = list(channels or [])
+        self.message_decoder: Optional[WebSocketMessageDecoder] = None
 
     async def handle_interceptors(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
@@ -3251,6 +3322,69 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
                 "Functions decorated with 'asgi, get, patch, put, post and delete' must be async functions."
             )
 
+    def create_signature_model(self, is_websocket: bool = False) -> None:
+        """
+        Creates the signature model of the handler.
+
+        A `message` declared by the handler is not part of the signature, it is
+        decoded and validated from every incoming frame by the `message_decoder`.
+        """
+        if not self.signature_model and self.fn is not None:
+            signature = Signature.from_callable(self.fn)
+            if MESSAGE in signature.parameters:
+                self.message_decoder = get_message_decoder(self.get_message_annotation())
+                factory = SignatureFactory(fn=self.fn, dependency_names=self.dependency_names)
+                factory.signature = signature.replace(
+                    parameters=[
+                        parameter
+                        for name, parameter in signature.parameters.items()
+                        if name != MESSAGE
+                    ]
+                )
+                self.signature_model = factory.create_signature()
+        super().create_signature_model(is_websocket=is_websocket)
+
+    def get_message_annotation(self) -> Any:
+        try:
+            annotation = get_type_hints(self.fn, include_extras=True).get(MESSAGE)
+        except (NameError, TypeError):
+            annotation = Signature.from_callable(self.fn).parameters[MESSAGE].annotation
+        if annotation is None or annotation is Signature.empty:
+            raise ImproperlyConfigured("The websocket 'message' must declare its type.")
+        return annotation
+
+    async def handle_messages(
+        self, websocket: WebSocket, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Accepts the connection and calls the handler with every message received,
+        decoded and validated, until the connection is closed.
+
+        A message failing the validation is answered with its errors.
+        """
+        decoder = self.message_decoder
+        if websocket.application_state == WebSocketState.CONNECTING:
+            await websocket.accept()
+
+        while websocket.application_state == WebSocketState.CONNECTED:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            raw = message.get("bytes")
+            if raw is None:
+                raw = message.get("text", "")
+
+            try:
+                value = decoder(raw)
+            except (msgspec.DecodeError, ValueError) as e:
+                await websocket.send_json(
+                    {"detail": "Invalid message.", "errors": get_message_errors(e)}
+                )
+                continue
+
+            await fn(*args, **kwargs, **{MESSAGE: value})
+
     async def handle_dispatch(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
         Handles the dispatching of a request.
@@ -3286,10 +3420,18 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
         kwargs = await self.get_kwargs(websocket=websocket)
 
         fn = self.fn
-        if isinstance(self.parent, BaseController):
-            await fn(self.parent, **kwargs)
+        args = (self.parent,) if isinstance(self.parent, BaseController) else ()
+        if self.message_decoder is not None:
+            args = (websocket, fn, *args)
+            fn = self.handle_messages
+
+        if self.broadcast is not None and self.channels:
+            path_params = scope.get("path_params", {})
+            channels = [channel.format(**path_params) for channel in self.channels]
+            async with self.broadcast.subscription(websocket, *channels):
+                await fn(*args, **kwargs)
         else:
-            await fn(**kwargs)
+            await fn(*args, **kwargs)
 
         for after_request in self.after_request:
             if inspect.isclass(after_request):
@@ -3332,6 +3474,8 @@ class Include(Dispatcher, LilyaInclude):
     `ImproperlyConfigured` is raised.
     """
 
+    router_class = CompiledRouter
+
     __slots__ = (
         "path",
         "app",
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Union
+
+import jwt
+from jwt.exceptions import PyJWTError
+
+from ravyn.core.protocols.cache import CacheBackend
+
+REVOKED = "revoked"
+
+
+class CachedToken:
+    """
+    The verified subject of a token and, when resolved in this process, its user.
+    """
+
+    __slots__ = ("sub", "exp", "user", "revoked")
+
+    def __init__(
+        self,
+        sub: Any = None,
+        exp: Optional[float] = None,
+        user: Any = None,
+        revoked: bool = False,
+    ) -> None:
+        self.sub = sub
+        self.exp = exp
+        self.user = user
+        self.revoked = revoked
+
+
+class TokenCache:
+    """
+    Cache of the verified JWT tokens and the users resolved from them.
+
+    The tokens are stored by their SHA-256 digest, never in clear. A cache hit skips
+    the signature verification and the user lookup done by the authentication
+    middlewares.
+
+    The entries live until the `exp` of the token, capped by the `ttl`. The resolved
+    users are kept in a bounded, process local, LRU of `max_size` entries, since they
+    are usually ORM objects that cannot be serialized. When a `backend` is declared,
+    the verified claims and the revocations are also stored there and shared between
+    processes. A local entry is then trusted for `local_ttl` seconds before the backend
+    is read again, the delay before a revocation done by another process is seen.
+
+    The revocations are also kept locally, until the `exp` of the token, up to
+    `max_size` of them: the expired ones and then the oldest ones are dropped first.
+
+    **Example**
+
+    ```python
+    from ravyn import Ravyn
+    from ravyn.contrib.auth.edgy.middleware import JWTAuthMiddleware
+    from ravyn.core.caches.redis import RedisCache
+    from ravyn.core.config.jwt import JWTConfig
+    from ravyn.core.middleware import DefineMiddleware
+    from ravyn.security.jwt.cache import TokenCache
+
+    token_cache = TokenCache(ttl=300, backend=RedisCache("redis://localhost:6379"))
+
+    app = Ravyn(
+        middleware=[
+            DefineMiddleware(
+                JWTAuthMiddleware,
+                config=JWTConfig(signing_key="secret"),
+                user_model=User,
+                token_cache=token_cache,
+            )
+        ]
+    )
+
+    # On logout
+    await token_cache.revoke(token)
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = 300,
+        max_size: int = 10_000,
+        backend: Optional[CacheBackend] = None,
+        prefix: str = "ravyn:jwt:",
+        local_ttl: float = 5.0,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.backend = backend
+        self.prefix = prefix
+        self.local_ttl = local_ttl
+        self.hits = 0
+        self.misses = 0
+        # The entry, its deadline and when it was last read from the backend.
+        self._entries: OrderedDict[str, tuple[CachedToken, Optional[float], float]] = OrderedDict()
+        self._revoked: OrderedDict[str, Optional[float]] = OrderedDict()
+
+    @staticmethod
+    def get_digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get_deadline(self, exp: Optional[float]) -> Optional[float]:
+        """
+        The moment the entry expires, the `exp` of the token capped by the `ttl`.
+        """
+        deadline = time.time() + self.ttl if self.ttl else None
+        if exp is None:
+            return deadline
+        return exp if deadline is None else min(exp, deadline)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "revoked": len(self._revoked),
+        }
+
+    async def get(self, token: str) -> Optional[CachedToken]:
+        """
+        Returns the cached verification of the token, a revoked entry or `None`.
+        """
+        digest = self.get_digest(token)
+        now = time.time()
+
+        if digest in self._revoked:
+            expires_at = self._revoked[digest]
+            if expires_at is None or expires_at > now:
+                return CachedToken(revoked=True)
+            del self._revoked[digest]
+
+        cached: Optional[CachedToken] = None
+        deadline: Optional[float] = None
+        checked_at = 0.0
+        entry = self._entries.get(digest)
+        if entry is not None:
+            if entry[1] is None or entry[1] > now:
+                self._entries.move_to_end(digest)
+                cached, deadline, checked_at = entry
+            else:
+                del self._entries[digest]
+
+        if self.backend is not None and not (
+            cached is not None and time.monotonic() - checked_at < self.local_ttl
+        ):
+            value = await self.backend.get(self.prefix + digest)
+            if value == REVOKED:
+                self._entries.pop(digest, None)
+                self.add_revocation(digest, self.get_revocation_deadline(token))
+                return CachedToken(revoked=True)
+            if value is None:
+                cached = None
+                self._entries.pop(digest, None)
+            elif cached is None:
+                exp = value.get("exp")
+                if exp is None or exp > now:
+                    cached = CachedToken(sub=value.get("sub"), exp=exp)
+            else:
+                self._entries[digest] = (cached, deadline, time.monotonic())
+
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    async def set(self, token: str, sub: Any, exp: Optional[float], user: Any = None) -> None:
+        """
+        Stores a token after its signature was verified, with its resolved user.
+        """
+        deadline = self.get_deadline(exp)
+        if deadline is not None and deadline <= time.time():
+            return
+
+        digest = self.get_digest(token)
+        self._entries[digest] = (
+            CachedToken(sub=sub, exp=exp, user=user),
+            deadline,
+            time.monotonic(),
+        )
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        if self.backend is not None:
+            await self.backend.set(
+                self.prefix + digest, {"sub": sub, "exp": exp}, ttl=self.get_backend_ttl(deadline)
+            )
+
+    async def evict(self, token: str) -> None:
+        """
+        Removes the token from the cache. The next request verifies it again.
+        """
+        digest = self.get_digest(token)
+        self._entries.pop(digest, None)
+        if self.backend is not None:
+            await self.backend.delete(self.prefix + digest)
+
+    async def revoke(self, token: str) -> None:
+        """
+        Rejects the token until its expiration, even if its signature is valid.
+        """
+        digest = self.get_digest(token)
+        expires_at = self.get_revocation_deadline(token)
+        self._entries.pop(digest, None)
+        self.add_revocation(digest, expires_at)
+        if self.backend is not None:
+            await self.backend.set(
+                self.prefix + digest, REVOKED, ttl=self.get_backend_ttl(expires_at)
+            )
+
+    def add_revocation(self, digest: str, expires_at: Optional[float]) -> None:
+        self._revoked[digest] = expires_at
+        self._revoked.move_to_end(digest)
+        if len(self._revoked) <= self.max_size:
+            return
+
+        now = time.time()
+        for key, deadline in list(self._revoked.items()):
+            if deadline is not None and deadline <= now:
+                del self._revoked[key]
+        while len(self._revoked) > self.max_size:
+            self._revoked.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Clears the process local entries. The revocations are kept.
+        """
+        self._entries.clear()
+
+    @staticmethod
+    def get_revocation_deadline(token: str) -> Optional[float]:
+        """
+        A revocation lasts as long as the token, read without verifying the signature.
+        """
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except PyJWTError:
+            return None
+        exp: Union[int, float, None] = claims.get("exp")
+        return float(exp) if exp is not None else None
+
+    @staticmethod
+    def get_backend_ttl(deadline: Optional[float]) -> Optional[int]:
+        if deadline is None:
+            return None
+        return max(int(deadline - time.time()), 1)
@@ -1 +1,365 @@
-from lilya.staticfiles import StaticFiles as StaticFiles  # noqa
+import gzip
+import os
+import re
+import stat
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from mimetypes import guess_type
+from typing import Any, Optional, Union
+
+import anyio
+from lilya.datastructures import Header
+from lilya.responses import Response
+from lilya.staticfiles import PathLike, StaticFiles as LilyaStaticFiles, StaticResponse
+from lilya.types import Scope
+
+from ravyn.responses.file import FileResponse
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Filenames with a content hash of at least 8 hexadecimal digits, `app.3f2a1b9c.js`
+# or `app-3f2a1b9c.js`, as generated by most bundlers.
+HASHED_FILENAME = r"[.-](?=[0-9a-f]*\d)[0-9a-f]{8,}\.[^/]+$"
+
+# The encodings of the precompressed files, in order of preference.
+PRECOMPRESSED_ENCODINGS: tuple[tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+PRECOMPRESSED_SUFFIXES = dict(PRECOMPRESSED_ENCODINGS)
+PRECOMPRESSED_CODINGS = frozenset(PRECOMPRESSED_SUFFIXES)
+
+COMPRESSIBLE_EXTENSIONS = frozenset(
+    {
+        ".css",
+        ".csv",
+        ".html",
+        ".ico",
+        ".js",
+        ".json",
+        ".map",
+        ".mjs",
+        ".svg",
+        ".txt",
+        ".wasm",
+        ".webmanifest",
+        ".xml",
+    }
+)
+
+
+def get_accepted_encodings(headers: Header) -> frozenset[str]:
+    """
+    The content codings accepted by the `Accept-Encoding` header, without the ones
+    refused with `q=0`.
+    """
+    encodings = set()
+    for value in headers.get("accept-encoding", "").split(","):
+        coding, _, params = value.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = params.strip().replace(" ", "")
+        if quality.startswith("q=") and quality[2:] in ("0", "0.", "0.0", "0.00", "0.000"):
+            continue
+        encodings.add(coding)
+    return frozenset(encodings)
+
+
+class CachedFile:
+    """
+    A small static file kept in memory with the headers of its response.
+
+    The `files` are the file served and, for a precompressed sibling, the file it was
+    built from, with their modification time and size: the cached file is stale once one
+    of them changed.
+    """
+
+    __slots__ = ("body", "headers", "files")
+
+    def __init__(
+        self,
+        body: bytes,
+        headers: dict[str, str],
+        files: Sequence[tuple[str, os.stat_result]],
+    ) -> None:
+        self.body = body
+        self.headers = headers
+        self.files = tuple(
+            (path, stat_result.st_mtime_ns, stat_result.st_size) for path, stat_result in files
+        )
+
+    def is_fresh(self) -> bool:
+        for path, st_mtime_ns, st_size in self.files:
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                return False
+            if stat_result.st_mtime_ns != st_mtime_ns or stat_result.st_size != st_size:
+                return False
+        return True
+
+
+class StaticFilesMetrics:
+    """
+    Hits and misses of the in-memory cache of the static files.
+    """
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class StaticFiles(LilyaStaticFiles):
+    """
+    Serves the static files of the directories and packages.
+
+    On top of the Lilya `StaticFiles`:
+
+    * `precompressed` serves the `.br` or `.gz` sibling of a file, built with
+        `ravyn precompress`, when the client accepts the encoding.
+    * `cache_size` keeps the most recently served files up to `cache_max_file_size`
+        bytes in memory, with their headers and ETag computed once. A cached file is
+        served without a thread and without opening it, the file is only checked with a
+        `stat` to detect a change.
+    * `immutable` marks the files with a content hash in their name as cacheable for
+        a year by the browsers and proxies.
+
+    The large files are sent by the ASGI server with the `http.response.pathsend` or
+    `http.response.zerocopysend` extensions when available.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Union[PathLike, list[PathLike], tuple[PathLike, ...], None] = None,
+        packages: Union[list[Union[str, tuple[str, str]]], None] = None,
+        html: bool = False,
+        check_dir: bool = True,
+        follow_symlink: bool = False,
+        fall_through: bool = False,
+        precompressed: bool = False,
+        cache_size: int = 0,
+        cache_max_file_size: int = 64 * 1024,
+        immutable: Union[bool, str] = False,
+    ) -> None:
+        super().__init__(
+            directory=directory,
+            packages=packages,
+            html=html,
+            check_dir=check_dir,
+            follow_symlink=follow_symlink,
+            fall_through=fall_through,
+        )
+        self.precompressed = precompressed
+        self.cache_size = cache_size
+        self.cache_max_file_size = cache_max_file_size
+        self.immutable_pattern: Optional[re.Pattern[str]] = None
+        if immutable:
+            self.immutable_pattern = re.compile(
+                HASHED_FILENAME if immutable is True else immutable
+            )
+        self.cache: OrderedDict[tuple[str, frozenset[str]], CachedFile] = OrderedDict()
+        self.metrics = StaticFilesMetrics()
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {"cache": self.metrics.as_dict(), "cached_files": len(self.cache)}
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not self.cache_size or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        request_headers = Header.ensure_header_instance(scope=scope)
+        if "range" in request_headers:
+            return await super().get_response(path, scope)
+
+        # Only the encodings of the precompressed files change the response, the others
+        # would only multiply the copies of the same file.
+        encodings = (
+            get_accepted_encodings(request_headers) & PRECOMPRESSED_CODINGS
+            if self.precompressed
+            else frozenset()
+        )
+        key = (self.get_route_path(scope), encodings)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if cached.is_fresh():
+                self.metrics.hits += 1
+                self.cache.move_to_end(key)
+                return self.cached_response(cached, request_headers)
+            del self.cache[key]
+
+        self.metrics.misses += 1
+        response = await super().get_response(path, scope)
+        if (
+            isinstance(response, FileResponse)
+            and response.status_code == 200
+            and response.stat_result is not None
+            and response.stat_result.st_size <= self.cache_max_file_size
+        ):
+            cached = await anyio.to_thread.run_sync(self.read_file, response)
+            if cached is not None:
+                self.cache[key] = cached
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+                return self.cached_response(cached, request_headers)
+        return response
+
+    def read_file(self, response: FileResponse) -> Optional[CachedFile]:
+        with open(response.path, "rb") as file:
+            body = file.read(self.cache_max_file_size + 1)
+        stat_result = response.stat_result
+        if stat_result is None or len(body) != stat_result.st_size:
+            # Changed since it was looked up.
+            return None
+        path = os.fspath(response.path)
+        files = [(path, stat_result)]
+        encoding = response.headers.get("content-encoding")
+        if encoding in PRECOMPRESSED_SUFFIXES:
+            # A precompressed sibling, built from the file it is served for.
+            source = path[: -len(PRECOMPRESSED_SUFFIXES[encoding])]
+            try:
+                source_stat = os.stat(source)
+            except OSError:
+                return None
+            if source_stat.st_mtime_ns != stat_result.st_mtime_ns:
+                return None
+            files.append((source, source_stat))
+        headers = dict(response.headers.items())
+        return CachedFile(body, headers, files)
+
+    def cached_response(self, cached: CachedFile, request_headers: Header) -> Response:
+        headers = Header(cached.headers)
+        if self.is_not_modified(headers, request_headers):
+            return StaticResponse(headers)
+        return Response(cached.body, headers=headers)
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Header.ensure_header_instance(scope=scope)
+        headers: dict[str, str] = {}
+        media_type: Optional[str] = None
+
+        if self.immutable_pattern is not None and self.immutable_pattern.search(
+            os.path.basename(full_path)
+        ):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+
+        if self.precompressed:
+            headers["vary"] = "accept-encoding"
+            accepted = get_accepted_encodings(request_headers)
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                compressed_stat = self.get_stat_result(full_path + suffix)
+                # A sibling not rebuilt since the file changed is stale.
+                if (
+                    compressed_stat is not None
+                    and stat.S_ISREG(compressed_stat.st_mode)
+                    and compressed_stat.st_mtime_ns == stat_result.st_mtime_ns
+                ):
+                    media_type = guess_type(full_path)[0] or "application/octet-stream"
+                    headers["content-encoding"] = encoding
+                    full_path, stat_result = full_path + suffix, compressed_stat
+                    break
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers=headers,
+            media_type=media_type,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return StaticResponse(response.headers)
+        return response
+
+
+def compress_file(path: str, encoding: str, min_ratio: float = 0.95) -> bool:
+    """
+    Writes the `.br` or `.gz` sibling of the file, when the compressed file is smaller
+    than `min_ratio` of the original. Returns whether the sibling was written.
+    """
+    suffix = dict(PRECOMPRESSED_ENCODINGS)[encoding]
+    with open(path, "rb") as file:
+        content = file.read()
+
+    if encoding == "br":
+        if brotli is None:
+            raise ImportError("You must install 'brotli' to precompress with brotli.")
+        compressed = brotli.compress(content, quality=11)
+    else:
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+
+    target = path + suffix
+    if len(compressed) >= len(content) * min_ratio:
+        if os.path.exists(target):
+            os.remove(target)
+        return False
+
+    temporary = f"{target}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(compressed)
+    stat_result = os.stat(path)
+    os.utime(temporary, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+    os.replace(temporary, target)
+    return True
+
+
+def precompress_directory(
+    directory: PathLike,
+    encodings: Sequence[str] = ("br", "gzip"),
+    min_size: int = 1024,
+    extensions: Iterable[str] = COMPRESSIBLE_EXTENSIONS,
+) -> list[str]:
+    """
+    Writes the `.br` and `.gz` siblings of the compressible files of the directory,
+    served by the `StaticFiles` with `precompressed=True`.
+
+    The files smaller than `min_size` bytes are skipped and a sibling is only written
+    again when the original file changed. Returns the written files.
+    """
+    if "br" in encodings and brotli is None:
+        raise ImportError("You must install 'brotli' to precompress with brotli.")
+
+    suffixes = dict(PRECOMPRESSED_ENCODINGS)
+    extensions = {extension.lower() for extension in extensions}
+    written: list[str] = []
+
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in extensions:
+                continue
+
+            path = os.path.join(root, name)
+            stat_result = os.stat(path)
+            if stat_result.st_size < min_size:
+                continue
+
+            for encoding in encodings:
+                target = path + suffixes[encoding]
+                try:
+                    if os.stat(target).st_mtime_ns == stat_result.st_mtime_ns:
+                        continue
+                except FileNotFoundError:
+                    pass
+                if compress_file(path, encoding):
+                    written.append(target)
+    return written
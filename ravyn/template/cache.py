@@ -0,0 +1,136 @@
+import os
+from typing import Any, Callable, Optional, Union, cast
+
+from ravyn.exceptions import ImproperlyConfigured, MissingDependency
+
+try:
+    from jinja2 import nodes
+    from jinja2.bccache import Bucket, FileSystemBytecodeCache
+    from jinja2.environment import Environment
+    from jinja2.ext import Extension
+    from jinja2.parser import Parser
+    from markupsafe import Markup
+except ImportError as exc:  # pragma: no cover
+    raise MissingDependency("jinja2 is not installed") from exc
+
+
+class CacheMetrics:
+    """
+    Hits and misses of a template cache.
+    """
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class BytecodeCache(FileSystemBytecodeCache):
+    """
+    Stores the compiled templates in a directory shared by the workers, so only the
+    first worker compiles a template from its source and the others start warm.
+
+    The files are written to a temporary file and renamed, never read half written.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        directory = os.fspath(directory)
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(directory)
+        self.metrics = CacheMetrics()
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.metrics.misses += 1
+        else:
+            self.metrics.hits += 1
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Adds the `{% cache key, ttl %}...{% endcache %}` tag, rendering the enclosed
+    fragment once per `ttl` seconds (for ever without `ttl`) and storing it in the
+    `CacheBackend` of the environment.
+
+    ```jinja
+    {% cache "navigation", 300 %}
+        {% for item in menu() %}<a href="{{ item.url }}">{{ item.title }}</a>{% endfor %}
+    {% endcache %}
+    ```
+
+    A synchronous environment uses the `sync_get` and `sync_set` of the backend.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        environment.extend(
+            fragment_cache=None,
+            fragment_cache_prefix="ravyn:template:fragment:",
+            fragment_cache_metrics=CacheMetrics(),
+        )
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        method = "cache_fragment_async" if self.environment.is_async else "cache_fragment"
+        return nodes.CallBlock(self.call_method(method, args), [], [], body).set_lineno(lineno)
+
+    def get_backend(self) -> Any:
+        backend = self.environment.fragment_cache
+        if backend is None:
+            raise ImproperlyConfigured("The fragment cache of the templates has no cache backend.")
+        return backend
+
+    def cache_fragment(self, key: Any, ttl: Optional[int], caller: Callable[[], str]) -> str:
+        backend = self.get_backend()
+        if not hasattr(backend, "sync_get") or not hasattr(backend, "sync_set"):
+            raise ImproperlyConfigured(
+                f"{type(backend).__name__} has no synchronous methods, "
+                "enable the async environment of the templates to cache fragments."
+            )
+
+        metrics: CacheMetrics = self.environment.fragment_cache_metrics
+        cache_key = f"{self.environment.fragment_cache_prefix}{key}"
+        value = backend.sync_get(cache_key)
+        if value is not None:
+            metrics.hits += 1
+            return Markup(value)
+
+        metrics.misses += 1
+        value = caller()
+        backend.sync_set(cache_key, str(value), ttl)
+        return value
+
+    async def cache_fragment_async(
+        self, key: Any, ttl: Optional[int], caller: Callable[[], Any]
+    ) -> str:
+        backend = self.get_backend()
+        metrics: CacheMetrics = self.environment.fragment_cache_metrics
+        cache_key = f"{self.environment.fragment_cache_prefix}{key}"
+        value = await backend.get(cache_key)
+        if value is not None:
+            metrics.hits += 1
+            return Markup(value)
+
+        metrics.misses += 1
+        value = await caller()
+        await backend.set(cache_key, str(value), ttl)
+        return cast(str, value)
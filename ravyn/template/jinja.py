@@ -1,3 +1,4 @@
+import os
 from typing import TYPE_CHECKING, Any, Union
 
 from lilya.templating.jinja import Jinja2Template
@@ -7,20 +8,52 @@ from ravyn.exceptions import MissingDependency
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic import DirectoryPath
 
+    from ravyn.core.protocols.cache import CacheBackend
+
 try:
     from jinja2 import Environment
+    from jinja2.bccache import BytecodeCache as JinjaBytecodeCache
 except ImportError as exc:  # pragma: no cover
     raise MissingDependency("jinja2 is not installed") from exc
 
+from ravyn.template.cache import BytecodeCache, FragmentCacheExtension
+
 
 class JinjaTemplateEngine(Jinja2Template):
     def __init__(
         self,
         directory: Union["DirectoryPath", list["DirectoryPath"]],
         env: Union[Environment, None] = None,
+        bytecode_cache: Union[str, "os.PathLike[str]", JinjaBytecodeCache, None] = None,
+        fragment_cache: Union["CacheBackend", None] = None,
         **env_options: Any,
     ) -> None:
         super().__init__(directory=directory, env=env, **env_options)
 
+        if bytecode_cache is not None:
+            if isinstance(bytecode_cache, (str, os.PathLike)):
+                bytecode_cache = BytecodeCache(bytecode_cache)
+            self.env.bytecode_cache = bytecode_cache
+
+        if fragment_cache is not None:
+            self.env.add_extension(FragmentCacheExtension)
+            self.env.fragment_cache = fragment_cache
+
     def get_template_render_function(self) -> str:
         return "render_async" if self.env.is_async else "render"
+
+    def get_template_stream_function(self) -> str:
+        return "generate_async" if self.env.is_async else "generate"
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        The hits and misses of the bytecode and fragment caches of the templates.
+        """
+        metrics: dict[str, Any] = {}
+        bytecode_cache = self.env.bytecode_cache
+        if isinstance(bytecode_cache, BytecodeCache):
+            metrics["bytecode_cache"] = bytecode_cache.metrics.as_dict()
+        fragment_metrics = getattr(self.env, "fragment_cache_metrics", None)
+        if fragment_metrics is not None:
+            metrics["fragment_cache"] = fragment_metrics.as_dict()
+        return metrics
@@ -26,6 +26,7 @@ REDIRECT_STATUS_CODES = {
 }
 
 SOCKET = "socket"
+MESSAGE = "message"
 DATA = "data"
 PAYLOAD = "payload"
 REQUEST = "request"
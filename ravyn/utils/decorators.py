@@ -27,6 +27,7 @@ from typing_extensions import Annotated, Doc, Unpack
 
 from ravyn import Controller
 from ravyn.conf import settings
+from ravyn.core.metrics.instrumentation import record_cache
 from ravyn.core.protocols.cache import CacheBackend
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -427,6 +428,7 @@ class cache:  # noqa
                 async with anyio.Lock():  # Ensure async thread safety
                     try:
                         cached_value = await self.backend.get(key)
+                        record_cache(func.__qualname__, cached_value is not None)
                         if cached_value is not None:
                             return cached_value
                     except Exception as e:
@@ -470,6 +472,7 @@ class cache:  # noqa
                             return await self.backend.get(key)
 
                         cached_value = anyio.run(get_cached)
+                        record_cache(func.__qualname__, cached_value is not None)
 
                         if cached_value is not None:
                             return cached_value
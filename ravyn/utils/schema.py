@@ -1,11 +1,17 @@
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Type, TypeVar, Union, _GenericAlias, cast, get_args
 
+from pydantic import TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import SkipJsonSchema
 
 T = TypeVar("T", int, float, Decimal)
 
+# The most recently used adapters are kept, the annotations of the handlers of an
+# application are far less numerous.
+TYPE_ADAPTERS_CACHE_SIZE = 1024
+
 
 def is_field_optional(field: "FieldInfo") -> bool:
     """
@@ -77,3 +83,23 @@ def extract_arguments(
             if arg not in arguments:
                 arguments.append(arg)
     return arguments
+
+
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    """
+    Returns the `TypeAdapter` of the given annotation.
+
+    Building a `TypeAdapter` means generating the whole core schema, so each
+    annotation gets one created once and reused afterwards.
+    """
+    try:
+        hash(annotation)
+    except TypeError:
+        # Unhashable annotations cannot be cached.
+        return TypeAdapter(annotation)
+    return _get_cached_type_adapter(annotation)
+
+
+@lru_cache(maxsize=TYPE_ADAPTERS_CACHE_SIZE)
+def _get_cached_type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
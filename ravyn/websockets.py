@@ -1,15 +1,321 @@
-from typing import Optional
+import time
+from collections import deque
+from types import TracebackType
+from typing import Any, Literal, Optional
 
+import anyio
+from anyio.abc import TaskGroup
+from lilya.enums import Event, MessageMode
+from lilya.exceptions import WebSocketRuntimeError
+from lilya.serializers import serializer
+from lilya.types import Message
 from lilya.websockets import (
-    WebSocket as WebSocket,  # noqa
+    WebSocket as LilyaWebSocket,
     WebSocketClose as WebSocketClose,  # noqa
     WebSocketDisconnect as LilyaWebSocketDisconnect,  # noqa
     WebSocketState as WebSocketState,  # noqa
 )
 
+SendQueuePolicy = Literal["drop_oldest", "disconnect"]
+
 
 class WebSocketDisconnect(LilyaWebSocketDisconnect):
     """Ravyn WebSocketDisconnect"""
 
     def __init__(self, code: int = 1000, reason: Optional[str] = None) -> None:
-        super().__init__(code, reason)  # pragma: no cover
+        super().__init__(code, reason)
+
+
+class SendQueueMetrics:
+    """
+    Counters of a websocket send queue.
+    """
+
+    __slots__ = ("queued", "sent", "frames", "dropped", "lag", "max_lag")
+
+    def __init__(self) -> None:
+        self.queued = 0
+        self.sent = 0
+        self.frames = 0
+        self.dropped = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    def record(self, messages: int, lag: float) -> None:
+        self.sent += messages
+        self.frames += 1
+        self.lag += lag * messages
+        self.max_lag = max(self.max_lag, lag)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "average_lag": self.lag / self.sent if self.sent else 0.0,
+            "max_lag": self.max_lag,
+        }
+
+
+class WebSocketSendQueue:
+    """
+    Outgoing queue of a websocket, sent by a background writer.
+
+    Sending to the queue never waits for the client. When a slow client lets the
+    queue reach the `high_water_mark`, the oldest messages are dropped or the
+    connection is closed, depending on the `policy`.
+
+    With a `batch_size` greater than one, the consecutive JSON messages waiting
+    in the queue are sent together, as a JSON array, in a single frame.
+
+    When the writer fails to send, the client being gone for instance, the queued
+    messages are discarded and the next `put`, or else the exit of the queue, raises a
+    `WebSocketDisconnect` chained from the error of the send.
+    """
+
+    def __init__(
+        self,
+        websocket: LilyaWebSocket,
+        high_water_mark: int = 1000,
+        policy: SendQueuePolicy = "drop_oldest",
+        batch_size: int = 1,
+        batch_interval: float = 0.0,
+        close_code: int = 1008,
+    ) -> None:
+        if high_water_mark < 1:
+            raise ValueError("The high_water_mark must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("The batch_size must be at least 1.")
+        if policy not in ("drop_oldest", "disconnect"):
+            raise ValueError('The policy should be "drop_oldest" or "disconnect".')
+
+        self.websocket = websocket
+        self.high_water_mark = high_water_mark
+        self.policy = policy
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.close_code = close_code
+        self.metrics = SendQueueMetrics()
+        self._buffer: deque[tuple[str, Any, float]] = deque()
+        self._task_group: Optional[TaskGroup] = None
+        self._wakeup = anyio.Event()
+        self._idle = anyio.Event()
+        self._idle.set()
+        self._closing = False
+        self._stopped = False
+        self._error: Optional[BaseException] = None
+        self._error_raised = False
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of messages waiting to be sent.
+        """
+        return len(self._buffer)
+
+    @property
+    def lag(self) -> float:
+        """
+        The time, in seconds, the oldest message is waiting in the queue.
+        """
+        if not self._buffer:
+            return 0.0
+        return time.monotonic() - self._buffer[0][2]
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        The metrics of the queue, including the current depth and lag.
+        """
+        return {**self.metrics.as_dict(), "pending": self.pending, "lag": self.lag}
+
+    async def send_json(self, data: Any, mode: str = "text") -> None:
+        if mode not in {MessageMode.TEXT, MessageMode.BINARY}:
+            raise WebSocketRuntimeError('The "mode" argument should be "text" or "binary".')
+        self.put(mode, data)
+
+    async def send_text(self, data: str) -> None:
+        self.put("raw", {"type": Event.WEBSOCKET_SEND, "text": data})
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.put("raw", {"type": Event.WEBSOCKET_SEND, "bytes": data})
+
+    def put(self, kind: str, payload: Any) -> None:
+        """
+        Queues a payload without waiting.
+
+        Raises `WebSocketDisconnect` when the queue is closed, including after a
+        slow client was disconnected by the `disconnect` policy or after a failed send.
+        """
+        if self._error is not None:
+            self._error_raised = True
+            raise self.disconnected() from self._error
+        if self._closing or self._stopped:
+            raise WebSocketDisconnect(self.close_code, "Send queue closed.")
+
+        if len(self._buffer) >= self.high_water_mark:
+            if self.policy == "disconnect":
+                self.metrics.dropped += len(self._buffer)
+                self._buffer.clear()
+                self._closing = True
+                self._wakeup.set()
+                raise WebSocketDisconnect(self.close_code, "Slow consumer.")
+            self._buffer.popleft()
+            self.metrics.dropped += 1
+
+        self._buffer.append((kind, payload, time.monotonic()))
+        self.metrics.queued += 1
+        if self._idle.is_set():
+            self._idle = anyio.Event()
+        self._wakeup.set()
+
+    def next_frame(self) -> tuple[Message, int, float]:
+        """
+        Pops the next frame, batching the consecutive JSON messages.
+        """
+        kind, payload, queued_at = self._buffer.popleft()
+        if kind == "raw":
+            return payload, 1, queued_at
+
+        batch = [payload]
+        if self.batch_size > 1:
+            while self._buffer and len(batch) < self.batch_size and self._buffer[0][0] == kind:
+                batch.append(self._buffer.popleft()[1])
+
+        text = serializer.dumps(
+            batch if self.batch_size > 1 else payload, separators=(",", ":"), ensure_ascii=False
+        )
+        if kind == MessageMode.TEXT:
+            return {"type": Event.WEBSOCKET_SEND, "text": text}, len(batch), queued_at
+        return (
+            {"type": Event.WEBSOCKET_SEND, "bytes": text.encode("utf-8")},
+            len(batch),
+            queued_at,
+        )
+
+    def disconnected(self) -> WebSocketDisconnect:
+        """
+        The disconnection raised to the handler after a failed send.
+        """
+        if isinstance(self._error, LilyaWebSocketDisconnect):
+            return WebSocketDisconnect(self._error.code, self._error.reason)
+        return WebSocketDisconnect(1006, "Send failed.")
+
+    async def writer(self) -> None:
+        # The errors of the writer are kept for the handler, raised in the task group they
+        # would cancel the handler and be wrapped in an exception group.
+        try:
+            await self.write()
+        except Exception as exc:  # noqa
+            self._error = exc
+            self._stopped = True
+            self.metrics.dropped += len(self._buffer)
+            self._buffer.clear()
+            self._idle.set()
+
+    async def write(self) -> None:
+        while True:
+            if self._closing:
+                self._idle.set()
+                await self.websocket.close(code=self.close_code, reason="Slow consumer.")
+                return
+
+            if not self._buffer:
+                self._idle.set()
+                if self._stopped:
+                    return
+                self._wakeup = anyio.Event()
+                await self._wakeup.wait()
+                continue
+
+            if (
+                self.batch_interval
+                and self.batch_size > 1
+                and len(self._buffer) < self.batch_size
+                and self._buffer[0][0] != "raw"
+            ):
+                await anyio.sleep(self.batch_interval)
+                if self._closing or not self._buffer:
+                    continue
+
+            message, messages, queued_at = self.next_frame()
+            await self.websocket.send(message)
+            self.metrics.record(messages, time.monotonic() - queued_at)
+
+    async def flush(self) -> None:
+        """
+        Waits until every queued message was sent.
+        """
+        await self._idle.wait()
+
+    async def start(self) -> None:
+        if self._task_group is not None:
+            return
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self.writer)
+
+    async def stop(self, exc: Optional[BaseException] = None) -> None:
+        """
+        Sends the queued messages and stops the writer.
+
+        When stopped because of an exception, the queued messages are discarded
+        unless the slow client is being disconnected.
+        """
+        if self._task_group is None:
+            return
+
+        self._stopped = True
+        if exc is not None and not self._closing:
+            self.metrics.dropped += len(self._buffer)
+            self._buffer.clear()
+            self._task_group.cancel_scope.cancel()
+        self._wakeup.set()
+
+        task_group, self._task_group = self._task_group, None
+        await task_group.__aexit__(None, None, None)
+        if exc is None and self._error is not None and not self._error_raised:
+            raise self.disconnected() from self._error
+
+    async def __aenter__(self) -> "WebSocketSendQueue":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.stop(exc_value)
+
+
+class WebSocket(LilyaWebSocket):
+    """Ravyn WebSocket"""
+
+    def send_queue(
+        self,
+        high_water_mark: int = 1000,
+        policy: SendQueuePolicy = "drop_oldest",
+        batch_size: int = 1,
+        batch_interval: float = 0.0,
+        close_code: int = 1008,
+    ) -> WebSocketSendQueue:
+        """
+        Creates a send queue for the websocket, used as an async context manager.
+
+        ```python
+        async with socket.send_queue(high_water_mark=100, batch_size=50) as queue:
+            async for tick in ticker():
+                await queue.send_json(tick)
+            print(queue.get_metrics()["max_lag"])
+        ```
+        """
+        return WebSocketSendQueue(
+            self,
+            high_water_mark=high_water_mark,
+            policy=policy,
+            batch_size=batch_size,
+            batch_interval=batch_interval,
+            close_code=close_code,
+        )
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from pydantic import BaseModel, RootModel
+
+from ravyn import Gateway, post
+from ravyn.core.transformers.decoders import PydanticBodyDecoder
+from ravyn.encoders import PydanticEncoder
+from ravyn.testclient import create_client
+from ravyn.utils.schema import get_type_adapter
+
+
+class Item(BaseModel):
+    sku: str
+    quantity: int
+
+
+class Tags(RootModel[list[str]]): ...
+
+
+@post()
+async def bulk(data: list[Item]) -> int:
+    return sum(item.quantity for item in data)
+
+
+@post()
+async def tags(data: Tags) -> list[str]:
+    return data.root
+
+
+@post()
+async def optional_item(data: Optional[Item] = None) -> Optional[str]:
+    return data.sku if data else None
+
+
+def test_list_of_models_body():
+    with create_client(routes=[Gateway(handler=bulk)]) as client:
+        assert isinstance(bulk.transformer.body_decoder, PydanticBodyDecoder)
+
+        response = client.post(
+            "/", json=[{"sku": "a", "quantity": 2}, {"sku": "b", "quantity": 3}]
+        )
+
+        assert response.status_code == 201
+        assert response.json() == 5
+
+
+def test_list_of_models_body_validation_error():
+    with create_client(routes=[Gateway(handler=bulk)]) as client:
+        response = client.post("/", json=[{"sku": "a", "quantity": 2}, {"sku": "b"}])
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["loc"] == [1, "quantity"]
+
+
+def test_root_model_body():
+    with create_client(routes=[Gateway(handler=tags)]) as client:
+        response = client.post("/", json=["a", "b"])
+
+        assert response.status_code == 201
+        assert response.json() == ["a", "b"]
+
+
+def test_optional_model_body():
+    with create_client(routes=[Gateway(handler=optional_item)]) as client:
+        response = client.post("/", json={})
+        assert response.status_code == 201
+        assert response.content == b""
+
+        response = client.post("/", json={"sku": "c", "quantity": 1})
+        assert response.json() == "c"
+
+
+def test_type_adapters_are_cached():
+    assert get_type_adapter(list[Item]) is get_type_adapter(list[Item])
+
+
+def test_pydantic_encoder_encodes_collections():
+    encoded = PydanticEncoder().encode(list[Item], [{"sku": "a", "quantity": 1}])
+
+    assert encoded == [Item(sku="a", quantity=1)]
+
+
+def test_raw_body_validation_error_matches_the_other_body_paths():
+    @post("/raw")
+    async def raw(data: Item) -> str:
+        return data.sku
+
+    @post("/parsed")
+    async def parsed(data: Item, query: str = "") -> str:
+        return data.sku
+
+    with create_client(routes=[Gateway(handler=raw), Gateway(handler=parsed)]) as client:
+        raw_response = client.post("/raw", json={"sku": 1})
+        parsed_response = client.post("/parsed", json={"sku": 1})
+
+        assert raw.transformer.body_decoder is not None
+        assert raw_response.status_code == parsed_response.status_code == 400
+        assert raw_response.json()["errors"] == parsed_response.json()["errors"]
@@ -0,0 +1,36 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: numbers.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC, 5, 29, 0, "", "numbers.proto"
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rnumbers.proto\x12\x04test\"\x1d\n\x0c\x43ountRequest\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\"\x17\n\x06Number\x12\r\n\x05value\x18\x01 \x01(\x05\"\x19\n\x08SumReply\x12\r\n\x05total\x18\x01 \x01(\x05\x32\x87\x01\n\x07Numbers\x12+\n\x05\x43ount\x12\x12.test.CountRequest\x1a\x0c.test.Number0\x01\x12%\n\x03Sum\x12\x0c.test.Number\x1a\x0e.test.SumReply(\x01\x12(\n\x06\x44ouble\x12\x0c.test.Number\x1a\x0c.test.Number(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'numbers_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_COUNTREQUEST']._serialized_start=23
+  _globals['_COUNTREQUEST']._serialized_end=52
+  _globals['_NUMBER']._serialized_start=54
+  _globals['_NUMBER']._serialized_end=77
+  _globals['_SUMREPLY']._serialized_start=79
+  _globals['_SUMREPLY']._serialized_end=104
+  _globals['_NUMBERS']._serialized_start=107
+  _globals['_NUMBERS']._serialized_end=242
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,185 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from tests.grpc.protocol import numbers_pb2 as numbers__pb2
+
+GRPC_GENERATED_VERSION = "1.71.0"
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in numbers_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class NumbersStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Count = channel.unary_stream(
+                '/test.Numbers/Count',
+                request_serializer=numbers__pb2.CountRequest.SerializeToString,
+                response_deserializer=numbers__pb2.Number.FromString,
+                _registered_method=True)
+        self.Sum = channel.stream_unary(
+                '/test.Numbers/Sum',
+                request_serializer=numbers__pb2.Number.SerializeToString,
+                response_deserializer=numbers__pb2.SumReply.FromString,
+                _registered_method=True)
+        self.Double = channel.stream_stream(
+                '/test.Numbers/Double',
+                request_serializer=numbers__pb2.Number.SerializeToString,
+                response_deserializer=numbers__pb2.Number.FromString,
+                _registered_method=True)
+
+
+class NumbersServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def Count(self, request, context):
+        """Streams the numbers from 1 to `count`.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Sum(self, request_iterator, context):
+        """Sums the streamed numbers.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Double(self, request_iterator, context):
+        """Doubles each streamed number.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_NumbersServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Count': grpc.unary_stream_rpc_method_handler(
+                    servicer.Count,
+                    request_deserializer=numbers__pb2.CountRequest.FromString,
+                    response_serializer=numbers__pb2.Number.SerializeToString,
+            ),
+            'Sum': grpc.stream_unary_rpc_method_handler(
+                    servicer.Sum,
+                    request_deserializer=numbers__pb2.Number.FromString,
+                    response_serializer=numbers__pb2.SumReply.SerializeToString,
+            ),
+            'Double': grpc.stream_stream_rpc_method_handler(
+                    servicer.Double,
+                    request_deserializer=numbers__pb2.Number.FromString,
+                    response_serializer=numbers__pb2.Number.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'test.Numbers', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('test.Numbers', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Numbers:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def Count(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/test.Numbers/Count',
+            numbers__pb2.CountRequest.SerializeToString,
+            numbers__pb2.Number.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Sum(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/test.Numbers/Sum',
+            numbers__pb2.Number.SerializeToString,
+            numbers__pb2.SumReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Double(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/test.Numbers/Double',
+            numbers__pb2.Number.SerializeToString,
+            numbers__pb2.Number.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
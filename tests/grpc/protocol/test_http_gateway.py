@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from ravyn import Ravyn
+from ravyn.contrib.grpc.gateway import GrpcGateway, MethodRecorder, get_request_type
+from ravyn.contrib.grpc.register import register_grpc_http_routes
+from ravyn.testclient import RavynTestClient
+from tests.grpc.protocol import greeter_pb2, greeter_pb2_grpc
+from tests.grpc.protocol.service import GreeterService
+
+REQUESTS: list = []
+
+
+class RecordingGreeterService(GreeterService):
+    async def SayHello(self, request, context):
+        REQUESTS.append(request)
+        return await super().SayHello(request, context)
+
+
+# The grpc.aio server of the gateway is created with the event loop of the module.
+gateway = GrpcGateway(path="/grpc", services=[RecordingGreeterService])
+app = Ravyn(routes=[])
+register_grpc_http_routes(app=app, grpc_gateways=[gateway])
+
+
+def create_client() -> RavynTestClient:
+    REQUESTS.clear()
+    return RavynTestClient(app)
+
+
+def test_method_handlers_are_recorded():
+    recorder = MethodRecorder()
+    greeter_pb2_grpc.add_GreeterServicer_to_server(GreeterService(), recorder)
+
+    assert list(recorder.handlers) == ["SayHello"]
+    assert get_request_type(recorder.handlers["SayHello"]) is greeter_pb2.HelloRequest
+
+
+def test_requests_are_parsed_into_the_protobuf_message():
+    client = create_client()
+
+    response = client.post(
+        "/grpc/recordinggreeterservice/sayhello", json={"name": "World", "unknown": 1}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"message": "Hello, World!"}
+    assert REQUESTS == [greeter_pb2.HelloRequest(name="World")]
+
+
+def test_empty_body_is_an_empty_message():
+    client = create_client()
+
+    response = client.post("/grpc/recordinggreeterservice/sayhello")
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Hello, !"}
+
+
+def test_invalid_body_is_a_bad_request():
+    client = create_client()
+
+    response = client.post(
+        "/grpc/recordinggreeterservice/sayhello", json={"name": ["not", "a", "string"]}
+    )
+
+    assert response.status_code == 400
+    assert REQUESTS == []
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import anyio
+import grpc
+import pytest
+
+from ravyn import Ravyn
+from ravyn.contrib.grpc.gateway import GrpcGateway
+from ravyn.contrib.grpc.register import register_grpc_http_routes
+from ravyn.testclient import RavynTestClient
+from tests.grpc.protocol import numbers_pb2, numbers_pb2_grpc
+
+EVENTS: list = []
+
+
+class NumbersService(numbers_pb2_grpc.NumbersServicer):
+    async def Count(self, request, context):
+        if request.count < 0:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("The count must be positive")
+            return
+
+        try:
+            for value in range(1, request.count + 1):
+                if value == 13:
+                    context.set_code(grpc.StatusCode.OUT_OF_RANGE)
+                    context.set_details("Unlucky number")
+                    return
+                yield numbers_pb2.Number(value=value)
+        finally:
+            EVENTS.append(("closed", context.cancelled()))
+
+    async def Sum(self, request_iterator, context):
+        total = 0
+        async for number in request_iterator:
+            total += number.value
+        return numbers_pb2.SumReply(total=total)
+
+    async def Double(self, request_iterator, context):
+        async for number in request_iterator:
+            yield numbers_pb2.Number(value=number.value * 2)
+
+    @classmethod
+    def __add_to_server__(cls, instance, server):
+        numbers_pb2_grpc.add_NumbersServicer_to_server(instance, server)
+
+
+# The grpc.aio server of the gateway is created with the event loop of the module.
+gateway = GrpcGateway(path="/grpc", services=[NumbersService])
+app = Ravyn(routes=[])
+register_grpc_http_routes(app=app, grpc_gateways=[gateway])
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    EVENTS.clear()
+
+
+def test_server_streaming_as_ndjson():
+    client = RavynTestClient(app)
+
+    response = client.post("/grpc/numbersservice/count", json={"count": 3})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text == '{"value":1}\n{"value":2}\n{"value":3}\n'
+    assert EVENTS == [("closed", False)]
+
+
+def test_server_streaming_as_server_sent_events():
+    client = RavynTestClient(app)
+
+    response = client.post(
+        "/grpc/numbersservice/count",
+        json={"count": 2},
+        headers={"accept": "text/event-stream"},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'data: {"value":1}\n\ndata: {"value":2}\n\n'
+
+
+def test_server_streaming_errors():
+    client = RavynTestClient(app)
+
+    response = client.post("/grpc/numbersservice/count", json={"count": -1})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "The count must be positive"
+
+    response = client.post("/grpc/numbersservice/count", json={"count": 20})
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 13
+    assert lines[-1] == (
+        '{"error":{"code":"OUT_OF_RANGE","status_code":400,"detail":"Unlucky number"}}'
+    )
+
+
+def test_client_streaming_from_a_json_array():
+    client = RavynTestClient(app)
+
+    def body():
+        yield b'[{"value": 1}, {"val'
+        yield b'ue": 2},'
+        yield b' {"value": 3}]'
+
+    response = client.post("/grpc/numbersservice/sum", content=body())
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 6}
+
+    response = client.post("/grpc/numbersservice/sum", json=[{"value": "one"}])
+
+    assert response.status_code == 400
+
+
+def test_bidirectional_streaming():
+    client = RavynTestClient(app)
+
+    response = client.post("/grpc/numbersservice/double", json=[{"value": 1}, {"value": 2}])
+
+    assert response.text == '{"value":2}\n{"value":4}\n'
+
+
+@pytest.mark.anyio
+async def test_stream_is_closed_when_the_client_disconnects():
+    sent: list = []
+    disconnected = anyio.Event()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b'{"count": 1000000}', "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message["body"]:
+            sent.append(message["body"])
+            if len(sent) == 2:
+                disconnected.set()
+            await anyio.sleep(0)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/grpc/numbersservice/count",
+        "raw_path": b"/grpc/numbersservice/count",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+
+    with anyio.fail_after(5):
+        await app(scope, receive, send)
+
+    assert 2 <= len(sent) < 100
+    assert EVENTS == [("closed", True)]
@@ -0,0 +1,114 @@
+import pytest
+from lilya.responses import PlainText
+
+from ravyn import Gateway, Include, Ravyn, Response, get
+from ravyn.core.datastructures import Cookie, ResponseHeader
+from ravyn.responses.encoders import ORJSONResponse
+from ravyn.routing.core.base import StaticResponseHeaders
+from ravyn.testclient import RavynTestClient, create_client
+
+
+@get(
+    path="/default",
+    response_headers={"x-route": ResponseHeader(value="route")},
+    response_cookies=[Cookie(key="route-cookie", value="abc")],
+)
+async def default_handler() -> dict:
+    return {"hello": "world"}
+
+
+@get(
+    path="/response",
+    response_headers={"x-route": ResponseHeader(value="route")},
+    response_cookies=[Cookie(key="route-cookie", value="abc")],
+)
+async def response_handler() -> Response:
+    return Response("ok", headers={"x-route": "response"})
+
+
+@get(
+    path="/lilya",
+    response_headers={"x-route": ResponseHeader(value="route")},
+    response_cookies=[Cookie(key="route-cookie", value="abc")],
+)
+async def lilya_handler() -> dict:
+    return PlainText("ok")
+
+
+@get(path="/json", response_headers={"x-route": ResponseHeader(value="route")})
+async def json_handler() -> ORJSONResponse:
+    return ORJSONResponse({"hello": "world"})
+
+
+def test_static_headers_and_cookies_on_default_handler(test_client_factory):
+    with create_client(routes=[Gateway(handler=default_handler)]) as client:
+        response = client.get("/default")
+
+        assert response.status_code == 200
+        assert response.json() == {"hello": "world"}
+        assert response.headers["x-route"] == "route"
+        assert response.headers["set-cookie"] == "route-cookie=abc; Path=/; SameSite=lax"
+
+
+def test_static_headers_take_precedence_over_response_headers(test_client_factory):
+    with create_client(routes=[Gateway(handler=response_handler)]) as client:
+        response = client.get("/response")
+
+        assert response.status_code == 200
+        assert response.headers["x-route"] == "route"
+        assert response.headers["allow"] == "{'GET'}"
+        assert response.headers["set-cookie"] == "route-cookie=abc; Path=/; SameSite=lax"
+
+
+def test_static_headers_from_parent_levels(test_client_factory):
+    app = Ravyn(
+        routes=[Include("/api", routes=[Gateway(handler=json_handler)])],
+        response_headers={"x-parent": ResponseHeader(value="parent")},
+    )
+
+    with RavynTestClient(app) as client:
+        response = client.get("/api/json")
+
+        assert response.status_code == 200
+        assert response.headers["x-route"] == "route"
+        assert response.headers["x-parent"] == "parent"
+
+
+def test_lilya_response_only_gets_the_route_cookies(test_client_factory):
+    with create_client(routes=[Gateway(handler=lilya_handler)]) as client:
+        response = client.get("/lilya")
+
+        assert response.status_code == 200
+        assert "x-route" not in response.headers
+        assert response.headers["set-cookie"] == "route-cookie=abc; Path=/; SameSite=lax"
+
+
+@pytest.mark.anyio
+async def test_static_headers_are_set_on_the_response_object():
+    @get(path="/seen", response_headers={"x-route": ResponseHeader(value="route")})
+    async def seen_handler() -> Response:
+        return Response("ok")
+
+    response_handler = Gateway(handler=seen_handler).handler.get_response_for_handler()
+    response = await response_handler(Response("ok"))
+
+    assert response.headers["x-route"] == "route"
+    assert response.headers["allow"] == "{'GET'}"
+
+
+def test_static_response_headers_apply():
+    static_headers = StaticResponseHeaders(
+        {"X-Route": "route"},
+        [{"key": "session", "value": "static"}, {"key": "theme", "value": "dark"}],
+    )
+    response = Response("ok", headers={"x-route": "response"})
+    response.set_cookie(key="session", value="response")
+
+    static_headers.apply(response)
+
+    assert response.headers["x-route"] == "route"
+    assert response.headers.get_all("set-cookie") == [
+        "session=response; Path=/; SameSite=lax",
+        "theme=dark; Path=/; SameSite=lax",
+    ]
+    assert not StaticResponseHeaders()
@@ -0,0 +1,213 @@
+import gzip
+import json
+import zlib
+
+import brotli
+import pytest
+
+from ravyn import Gateway, Request, get, post
+from ravyn.applications import Ravyn
+from ravyn.core.config import CompressionConfig
+from ravyn.exceptions import PayloadTooLarge
+from ravyn.middleware.compression import get_codecs, negotiate_encoding
+from ravyn.responses import PlainText, Response, StreamingResponse
+
+BODY = "ravyn " * 500
+PAYLOAD = json.dumps({"text": BODY}).encode()
+
+
+@get("/text")
+def text() -> PlainText:
+    return PlainText(BODY)
+
+
+@get("/small")
+def small() -> PlainText:
+    return PlainText("small")
+
+
+@get("/image")
+def image() -> Response:
+    return Response(BODY.encode(), media_type="image/png")
+
+
+@get("/stream")
+def stream() -> StreamingResponse:
+    def chunks():
+        for _ in range(10):
+            yield BODY.encode()
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@post("/echo")
+async def echo(request: Request) -> PlainText:
+    body = await request.body()
+    return PlainText(f"{request.headers.get('content-encoding')}:{body.decode()}")
+
+
+@post("/items")
+async def items(data: dict[str, str]) -> dict[str, str]:
+    return data
+
+
+def create_app(**kwargs):
+    return Ravyn(
+        routes=[
+            Gateway(handler=text),
+            Gateway(handler=small),
+            Gateway(handler=image),
+            Gateway(handler=stream),
+            Gateway(handler=echo),
+            Gateway(handler=items),
+        ],
+        compression_config=CompressionConfig(**kwargs),
+    )
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("identity", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ["br", "gzip"]) == expected
+
+
+def test_compress_response(test_client_factory):
+    client = test_client_factory(create_app(encodings=["br", "gzip"]))
+
+    response = client.get("/text", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "accept-encoding"
+    assert response.text == BODY
+
+    response = client.get("/text", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY
+
+    response = client.get("/text", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == BODY
+
+
+def test_skip_small_and_excluded_responses(test_client_factory):
+    client = test_client_factory(create_app())
+
+    response = client.get("/small", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "small"
+
+    response = client.get("/image", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY.encode()
+
+
+def test_compress_streaming_response(test_client_factory):
+    client = test_client_factory(create_app(encodings=["gzip"]))
+
+    response = client.get("/stream", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == BODY * 10
+
+
+def test_compressed_bodies_are_cached(test_client_factory, monkeypatch):
+    app = create_app(encodings=["gzip"], cache_size=2)
+    client = test_client_factory(app)
+    calls = []
+    original = gzip.compress
+
+    def compress(data, *args, **kwargs):
+        calls.append(len(data))
+        return original(data, *args, **kwargs)
+
+    monkeypatch.setattr(gzip, "compress", compress)
+
+    for _ in range(3):
+        response = client.get("/text", headers={"accept-encoding": "gzip"})
+        assert response.text == BODY
+
+    assert calls == [len(BODY)]
+
+
+@pytest.mark.parametrize(
+    "encoding, compress",
+    [("gzip", gzip.compress), ("br", brotli.compress), ("deflate", zlib.compress)],
+)
+def test_decompress_request(test_client_factory, encoding, compress):
+    client = test_client_factory(create_app(encodings=["br", "gzip"]))
+
+    response = client.post(
+        "/echo", content=compress(PAYLOAD), headers={"content-encoding": encoding}
+    )
+
+    if encoding == "deflate":
+        assert response.status_code == 415
+    else:
+        assert response.status_code == 200
+        assert response.text == f"None:{PAYLOAD.decode()}"
+
+
+def test_decompress_request_data(test_client_factory):
+    client = test_client_factory(create_app())
+
+    response = client.post(
+        "/items",
+        content=gzip.compress(b'{"name": "ravyn"}'),
+        headers={"content-encoding": "gzip", "content-type": "application/json"},
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {"name": "ravyn"}
+
+
+def test_decompress_request_limits(test_client_factory):
+    client = test_client_factory(create_app(max_decompressed_size=100))
+
+    response = client.post(
+        "/echo", content=gzip.compress(PAYLOAD), headers={"content-encoding": "gzip"}
+    )
+    assert response.status_code == 413
+
+    response = client.post("/echo", content=b"not gzip", headers={"content-encoding": "gzip"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_truncated_request_is_refused(test_client_factory, encoding):
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    client = test_client_factory(create_app(encodings=[encoding]))
+    codec = get_codecs(CompressionConfig(encodings=[encoding]))[encoding]
+    body = codec.compress(PAYLOAD)
+
+    response = client.post("/echo", content=body[:-8], headers={"content-encoding": encoding})
+    assert response.status_code == 400
+
+    response = client.post("/echo", content=body, headers={"content-encoding": encoding})
+    assert response.status_code == 200
+    assert response.text == f"None:{PAYLOAD.decode()}"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_decompression_bomb_is_refused_early(encoding):
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    codec = get_codecs(CompressionConfig(encodings=[encoding]))[encoding]
+    bomb = codec.compress(b"\0" * 100_000_000)
+    decompressor = codec.decompressor(1000)
+
+    with pytest.raises(PayloadTooLarge):
+        decompressor.decompress(bomb)
+    # Refused at the first chunk past the limit, the rest is not decompressed.
+    assert decompressor.received <= 1000 + 64 * 1024
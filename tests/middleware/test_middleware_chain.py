@@ -0,0 +1,109 @@
+import pytest
+from lilya.middleware import DefineMiddleware
+
+from ravyn import Gateway, Ravyn, Request, get
+from ravyn.middleware.asyncexitstack import LazyAsyncExitStack
+from ravyn.middleware.gzip import GZipMiddleware
+from ravyn.responses import JSONResponse
+from ravyn.testclient import RavynTestClient, create_client
+from ravyn.utils.middleware import get_middleware_layers, measure_middleware_overhead
+
+CLEANUPS: list[str] = []
+
+
+@pytest.fixture(autouse=True)
+def clear_cleanups():
+    CLEANUPS.clear()
+
+
+async def cleanup() -> None:
+    CLEANUPS.append("closed")
+
+
+@get("/hello")
+async def hello(request: Request) -> dict:
+    stack = request.scope["ravyn_astack"]
+    return {"lazy": isinstance(stack, LazyAsyncExitStack), "used": stack.is_used}
+
+
+@get("/cleanup")
+async def with_cleanup(request: Request) -> str:
+    request.scope["ravyn_astack"].push_async_callback(cleanup)
+    return "ok"
+
+
+@get("/fail")
+async def fail() -> None:
+    raise ValueError("Boom")
+
+
+def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
+    return JSONResponse({"detail": str(exc)}, status_code=400)
+
+
+def test_exit_stack_is_only_created_when_used():
+    with create_client(routes=[Gateway(handler=hello), Gateway(handler=with_cleanup)]) as client:
+        assert client.get("/hello").json() == {"lazy": True, "used": False}
+
+        client.get("/cleanup")
+
+    assert CLEANUPS == ["closed"]
+
+
+def test_exception_layers_are_merged_without_user_middleware():
+    app = Ravyn(routes=[Gateway(handler=hello)])
+    app.user_middleware = []
+
+    assert get_middleware_layers(app.build_middleware_stack()) == [
+        "ExceptionMiddleware",
+        "AsyncExitStackMiddleware",
+        "Router",
+    ]
+
+
+def test_exception_layers_around_user_middleware():
+    app = Ravyn(routes=[Gateway(handler=hello)])
+    app.user_middleware = [DefineMiddleware(GZipMiddleware)]
+
+    assert get_middleware_layers(app.build_middleware_stack()) == [
+        "RavynAPIException",
+        "GZipMiddleware",
+        "ExceptionMiddleware",
+        "AsyncExitStackMiddleware",
+        "Router",
+    ]
+
+
+@pytest.mark.parametrize("user_middleware", [[], [DefineMiddleware(GZipMiddleware)]])
+def test_exceptions_with_and_without_user_middleware(user_middleware):
+    app = Ravyn(routes=[Gateway(handler=fail)])
+    app.user_middleware = user_middleware
+    app.middleware_stack = app.build_middleware_stack()
+
+    response = RavynTestClient(app).get("/fail")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "ValueError('Boom')"
+
+    app = Ravyn(
+        routes=[Gateway(handler=fail)], exception_handlers={ValueError: handle_value_error}
+    )
+    app.user_middleware = user_middleware
+    app.middleware_stack = app.build_middleware_stack()
+
+    response = RavynTestClient(app).get("/fail")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Boom"}
+
+
+@pytest.mark.anyio
+async def test_measure_middleware_overhead():
+    app = Ravyn(routes=[Gateway(handler=hello)])
+    app.user_middleware = []
+
+    report = await measure_middleware_overhead(app, iterations=10)
+
+    assert report["layers"] == ["ExceptionMiddleware", "AsyncExitStackMiddleware"]
+    assert report["iterations"] == 10
+    assert report["overhead_us"] >= 0
@@ -0,0 +1,154 @@
+from typing import Optional, Union
+
+import msgspec
+from lilya import status
+
+from ravyn import Gateway, Inject, Injects, post
+from ravyn.core.transformers.decoders import MsgSpecBodyDecoder
+from ravyn.testclient import create_client
+
+
+class Reading(msgspec.Struct):
+    sensor: str
+    value: float
+
+
+class Counted(msgspec.Struct):
+    name: str
+    decoded: int = 0
+
+    def __post_init__(self) -> None:
+        self.decoded += 1
+
+
+class Cat(msgspec.Struct, tag=True):
+    name: str
+    decoded: int = 0
+
+    def __post_init__(self) -> None:
+        self.decoded += 1
+
+
+class Dog(msgspec.Struct, tag=True):
+    name: str
+
+
+class Location(msgspec.Struct):
+    lat: float
+    lng: float
+
+
+@post(status_code=status.HTTP_202_ACCEPTED)
+def ingest(data: Reading) -> Reading:
+    return data
+
+
+@post(status_code=status.HTTP_202_ACCEPTED)
+def ingest_optional(data: Optional[Reading] = None) -> Optional[Reading]:
+    return data
+
+
+@post(status_code=status.HTTP_202_ACCEPTED)
+def ingest_counted(data: Optional[Counted] = None) -> Optional[Counted]:
+    return data
+
+
+@post(status_code=status.HTTP_202_ACCEPTED)
+def ingest_pet(data: Optional[Union[Cat, Dog]] = None) -> str:
+    return f"{type(data).__name__} {data.decoded}"
+
+
+@post(status_code=status.HTTP_202_ACCEPTED)
+def ingest_with_location(data: Reading, location: Location) -> dict:
+    return {"sensor": data.sensor, "lat": location.lat}
+
+
+def get_sensor(data: dict) -> str:
+    return data["sensor"]
+
+
+@post(status_code=status.HTTP_202_ACCEPTED, dependencies={"sensor": Inject(get_sensor)})
+def ingest_with_dependency(data: Reading, sensor: str = Injects()) -> str:
+    return sensor
+
+
+def test_msgspec_body_is_decoded_from_raw_bytes():
+    with create_client(routes=[Gateway(handler=ingest)]) as client:
+        assert isinstance(ingest.transformer.body_decoder, MsgSpecBodyDecoder)
+
+        response = client.post("/", json={"sensor": "a", "value": 1.5})
+
+        assert response.status_code == 202
+        assert response.json() == {"sensor": "a", "value": 1.5}
+
+
+def test_msgspec_body_from_msgpack():
+    with create_client(routes=[Gateway(handler=ingest)]) as client:
+        response = client.post(
+            "/",
+            content=msgspec.msgpack.encode({"sensor": "b", "value": 2}),
+            headers={"content-type": "application/x-msgpack"},
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"sensor": "b", "value": 2.0}
+
+
+def test_msgspec_raw_body_validation_error():
+    with create_client(routes=[Gateway(handler=ingest)]) as client:
+        response = client.post("/", json={"sensor": 1, "value": 1.5})
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "detail": "Validation failed for http://testserver/ with method POST.",
+            "errors": [{"sensor": "Expected `str`, got `int`"}],
+        }
+
+
+def test_msgspec_raw_body_optional():
+    with create_client(routes=[Gateway(handler=ingest_optional)]) as client:
+        response = client.post("/")
+
+        assert response.status_code == 202
+        assert response.content == b""
+
+
+def test_msgspec_raw_body_optional_is_decoded_once():
+    with create_client(routes=[Gateway(handler=ingest_counted)]) as client:
+        response = client.post("/", json={"name": "a"})
+
+        assert response.status_code == 202
+        assert response.json() == {"name": "a", "decoded": 1}
+
+
+def test_msgspec_raw_body_union_of_structs():
+    with create_client(routes=[Gateway(handler=ingest_pet)]) as client:
+        assert isinstance(ingest_pet.transformer.body_decoder, MsgSpecBodyDecoder)
+
+        response = client.post("/", json={"type": "Cat", "name": "a"})
+
+        assert response.status_code == 202
+        assert response.json() == "Cat 1"
+
+
+def test_msgspec_raw_body_not_used_for_complex_bodies():
+    with create_client(routes=[Gateway(handler=ingest_with_location)]) as client:
+        assert ingest_with_location.transformer.body_decoder is None
+
+        response = client.post(
+            "/",
+            json={"data": {"sensor": "c", "value": 1}, "location": {"lat": 1.0, "lng": 2.0}},
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"sensor": "c", "lat": 1.0}
+
+
+def test_msgspec_raw_body_not_used_when_dependencies_read_the_data():
+    with create_client(routes=[Gateway(handler=ingest_with_dependency)]) as client:
+        assert ingest_with_dependency.transformer.body_decoder is None
+
+        response = client.post("/", json={"sensor": "d", "value": 1})
+
+        assert response.status_code == 202
+        assert response.json() == "d"
@@ -0,0 +1,115 @@
+import pytest
+from pydantic import BaseModel
+
+from ravyn import Gateway, Include, Ravyn, get, post, route
+from ravyn.openapi import openapi
+from ravyn.openapi.openapi import get_fields_from_routes, get_schema_cache
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Order(BaseModel):
+    quantity: int
+
+
+@post()
+async def create_item(data: Item) -> Item:
+    return data
+
+
+@get()
+async def read_item(item_id: int, limit: int = 10) -> Item: ...
+
+
+@post()
+async def create_order(data: Order) -> Order:
+    return data
+
+
+@route(methods=["GET", "POST"])
+async def read_or_create_item() -> Item: ...
+
+
+def nest(routes: list, depth: int) -> list:
+    for index in range(depth):
+        routes = [Include(f"/level-{index}", routes=routes)]
+    return routes
+
+
+def test_fields_are_collected_once():
+    gateway = Gateway("/items", handler=create_item)
+    routes = [
+        *nest([gateway, Gateway("/items/{item_id}", handler=read_item)], 6),
+        Include("/copy", routes=[gateway]),
+    ]
+
+    app = Ravyn(routes=routes)
+
+    fields = get_fields_from_routes(app.routes)
+
+    assert len(fields) == len({id(field) for field in fields}) == 3
+
+
+def test_path_items_are_reused(monkeypatch):
+    app = Ravyn(
+        routes=nest([Gateway("/items", handler=create_item)], 3),
+        enable_openapi=True,
+    )
+    generated = []
+    get_openapi_path = openapi.get_openapi_path
+
+    def record(**kwargs):
+        if kwargs["route"].include_in_schema:
+            generated.append(kwargs["route"].path)
+        return get_openapi_path(**kwargs)
+
+    monkeypatch.setattr(openapi, "get_openapi_path", record)
+
+    first = app.openapi_config.openapi(app)
+    cache = get_schema_cache(app)
+    field_mapping = cache.field_mapping
+
+    assert app.openapi_config.openapi(app) == first
+    assert cache.field_mapping is field_mapping
+    assert generated == ["/items"]
+
+    app.add_route("/orders", handler=create_order)
+    schema = app.openapi_config.openapi(app)
+
+    assert cache.field_mapping is not field_mapping
+    assert generated == ["/items", "/orders"]
+    assert "/orders" in schema["paths"]
+    assert "Order" in schema["components"]["schemas"]
+    assert (
+        schema["paths"]["/level-2/level-1/level-0/items"]
+        == first["paths"]["/level-2/level-1/level-0/items"]
+    )
+
+
+def test_removed_routes_are_pruned():
+    app = Ravyn(
+        routes=[Gateway("/items", handler=create_item), Gateway("/orders", handler=create_order)],
+        enable_openapi=True,
+    )
+    app.openapi_config.openapi(app)
+    cache = get_schema_cache(app)
+
+    # The routes of the application also contain the OpenAPI ones.
+    app.router.routes = [route for route in app.router.routes if route.path != "/orders"]
+    schema = app.openapi_config.openapi(app)
+
+    assert "/orders" not in schema["paths"]
+    assert "Order" not in schema["components"]["schemas"]
+    paths = {route.path for route, _ in cache.paths}
+    assert "/items" in paths
+    assert "/orders" not in paths
+
+
+def test_duplicate_operation_ids_warn_from_the_cache():
+    app = Ravyn(routes=[Gateway("/items", handler=read_or_create_item)], enable_openapi=True)
+
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="Duplicate Operation ID"):
+            app.openapi_config.openapi(app)
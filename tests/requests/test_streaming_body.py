@@ -0,0 +1,123 @@
+from typing import AsyncIterator
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from ravyn import Gateway, post
+from ravyn.core.transformers.stream import JSONArrayParser
+from ravyn.testclient import create_client
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Point(msgspec.Struct):
+    x: int
+    y: int
+
+
+@post("/items")
+async def create_items(data: AsyncIterator[Item]) -> dict:
+    names = [item.name async for item in data]
+    return {"total": len(names), "names": names}
+
+
+@post("/points")
+async def create_points(payload: AsyncIterator[Point]) -> int:
+    total = 0
+    async for point in payload:
+        total += point.x * point.y
+    return total
+
+
+@post("/limited", max_body_size=16)
+async def limited(data: dict) -> dict:
+    return data
+
+
+@post("/limited-stream", max_body_size=32)
+async def limited_stream(data: AsyncIterator[int]) -> int:
+    return sum([value async for value in data])
+
+
+def test_streamed_body_is_validated_item_by_item():
+    def body():
+        yield b'[{"id": 1, "name": "a, [b]"'
+        yield b'}, {"id": 2, "name": "\\"c\\\\'
+        yield b'"} ,{"id": 3, "name": "d"}]'
+
+    with create_client(routes=[Gateway(handler=create_items)]) as client:
+        response = client.post("/items", content=body())
+
+        assert response.status_code == 201
+        assert response.json() == {"total": 3, "names": ["a, [b]", '"c\\', "d"]}
+
+
+def test_streamed_body_with_msgspec_items():
+    with create_client(routes=[Gateway(handler=create_points)]) as client:
+        response = client.post("/points", json=[{"x": 1, "y": 2}, {"x": 3, "y": 4}])
+
+        assert response.status_code == 201
+        assert response.json() == 14
+
+
+def test_streamed_body_empty_array():
+    with create_client(routes=[Gateway(handler=create_items)]) as client:
+        response = client.post("/items", json=[])
+
+        assert response.json() == {"total": 0, "names": []}
+
+
+def test_streamed_body_invalid_item_reports_index():
+    with create_client(routes=[Gateway(handler=create_items)]) as client:
+        response = client.post("/items", json=[{"id": 1, "name": "a"}, {"id": "x"}])
+
+        assert response.status_code == 400
+        assert "item 1" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2", b"[1,,2]", b"[1] 2"])
+def test_streamed_body_must_be_a_json_array(body):
+    with create_client(routes=[Gateway(handler=limited_stream)]) as client:
+        response = client.post("/limited-stream", content=body)
+
+        assert response.status_code == 400
+
+
+def test_max_body_size_from_content_length():
+    with create_client(routes=[Gateway(handler=limited)]) as client:
+        response = client.post("/limited", json={"name": "x" * 32})
+        assert response.status_code == 413
+
+        response = client.post("/limited", json={"a": 1})
+        assert response.status_code == 201
+        assert response.json() == {"a": 1}
+
+
+def test_max_body_size_while_streaming():
+    def payload():
+        yield b"["
+        for _ in range(20):
+            yield b"1,"
+        yield b"1]"
+
+    with create_client(routes=[Gateway(handler=limited_stream)]) as client:
+        response = client.post("/limited-stream", content=payload())
+        assert response.status_code == 413
+
+        response = client.post("/limited-stream", content=b"[1, 2, 3]")
+        assert response.json() == 6
+
+
+def test_json_array_parser_across_chunks():
+    parser = JSONArrayParser()
+
+    items = []
+    for chunk in [b" [", b'{"a": [1, ', b'2]}, "x\\', b'"y"', b", 3 ]  "]:
+        items.extend(parser.feed(chunk))
+    parser.close()
+
+    assert items == [b'{"a": [1, 2]}', b'"x\\"y"', b"3"]
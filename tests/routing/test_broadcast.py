@@ -0,0 +1,194 @@
+import time
+
+import anyio
+import pytest
+from lilya.websockets import WebSocketState
+
+from ravyn import WebSocket, WebSocketGateway, websocket
+from ravyn.core.broadcast import Broadcast, MemoryBroadcastBackend, RedisBroadcastBackend
+from ravyn.core.broadcast.broadcast import decode_message, encode_message
+from ravyn.testclient import create_client
+
+broadcast = Broadcast()
+
+
+@websocket(path="/rooms/{room}", broadcast=broadcast, channels=["room:{room}"])
+async def room(socket: WebSocket, room: str) -> None:
+    await socket.accept()
+    while True:
+        text = await socket.receive_text()
+        if text == "leave":
+            break
+        await broadcast.publish(f"room:{room}", {"room": room, "text": text})
+    await socket.close()
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0) -> None:
+        self.application_state = WebSocketState.CONNECTED
+        self.delay = delay
+        self.messages: list = []
+
+    async def send(self, message) -> None:
+        await anyio.sleep(self.delay)
+        self.messages.append(message)
+
+
+def wait_for(condition) -> None:
+    deadline = time.monotonic() + 2
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_broadcast_to_the_websockets_of_the_channel():
+    with create_client(
+        routes=[WebSocketGateway(handler=room)],
+        on_startup=[broadcast.connect],
+        on_shutdown=[broadcast.disconnect],
+    ) as client:
+        with (
+            client.websocket_connect("/rooms/red") as first,
+            client.websocket_connect("/rooms/red") as second,
+            client.websocket_connect("/rooms/blue") as other,
+        ):
+            assert broadcast.get_metrics()["subscribers"] == 3
+
+            first.send_text("hello")
+
+            assert first.receive_json() == {"room": "red", "text": "hello"}
+            assert second.receive_json() == {"room": "red", "text": "hello"}
+
+            other.send_text("bye")
+
+            assert other.receive_json() == {"room": "blue", "text": "bye"}
+
+            for session in (first, second, other):
+                session.send_text("leave")
+
+        wait_for(lambda: broadcast.get_metrics()["subscribers"] == 0)
+        metrics = broadcast.get_metrics()
+
+    assert metrics["published"] == 2
+    assert metrics["delivered"] == 3
+    assert metrics["channels"] == 0
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("text", {"type": "websocket.send", "text": "text"}),
+        (b"bytes", {"type": "websocket.send", "bytes": b"bytes"}),
+        ({"value": 1}, {"type": "websocket.send", "text": '{"value":1}'}),
+    ],
+)
+def test_messages_are_encoded_once(message, expected):
+    assert decode_message(encode_message(message)) == expected
+
+
+async def wait_until(condition) -> None:
+    with anyio.fail_after(2):
+        while not condition():
+            await anyio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_slow_websockets_are_unsubscribed():
+    hub = Broadcast(send_timeout=0.05)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=1)
+
+    async with hub:
+        await hub.subscribe(fast, "news", "sports")
+        await hub.subscribe(slow, "news", "sports")
+
+        await hub.fan_out("news", decode_message(encode_message("hello")))
+        await wait_until(lambda: hub.get_subscribers("news") == {fast})
+
+        assert fast.messages == [{"type": "websocket.send", "text": "hello"}]
+        assert slow.messages == []
+        assert hub.get_subscribers("sports") == {fast}
+        assert hub.get_metrics()["timed_out"] == 1
+
+
+@pytest.mark.anyio
+async def test_slow_websockets_do_not_delay_the_others():
+    hub = Broadcast(max_queued=1)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=1)
+
+    async with hub:
+        await hub.subscribe(fast, "news")
+        await hub.subscribe(slow, "news")
+
+        with anyio.fail_after(0.5):
+            for text in ("first", "second", "third"):
+                await hub.fan_out("news", decode_message(encode_message(text)))
+                await wait_until(lambda: len(fast.messages) == 1)
+                fast.messages.clear()
+
+        # The slow client let its queue overflow.
+        assert hub.get_subscribers("news") == {fast}
+        assert hub.get_metrics()["overflowed"] == 1
+
+
+@pytest.mark.anyio
+async def test_listening_restarts_after_a_backend_failure():
+    class FlakyBackend(MemoryBroadcastBackend):
+        failed = False
+
+        async def next_published(self):
+            if not self.failed:
+                self.failed = True
+                raise ConnectionError("Connection lost")
+            return await super().next_published()
+
+    hub = Broadcast(FlakyBackend(), retry_delay=0.01)
+    socket = FakeWebSocket()
+
+    async with hub, hub.subscription(socket, "news"):
+        await anyio.sleep(0.05)
+        await hub.publish("news", "hello")
+        await wait_until(lambda: socket.messages)
+
+    assert socket.messages == [{"type": "websocket.send", "text": "hello"}]
+
+
+@pytest.mark.anyio
+async def test_websockets_not_accepted_are_skipped():
+    hub = Broadcast()
+    socket = FakeWebSocket()
+    socket.application_state = WebSocketState.CONNECTING
+
+    async with hub:
+        await hub.subscribe(socket, "news")
+        await hub.fan_out("news", decode_message(encode_message("hello")))
+
+    assert socket.messages == []
+
+
+@pytest.mark.anyio
+async def test_subscribing_requires_a_connected_broadcast():
+    hub = Broadcast()
+
+    with pytest.raises(RuntimeError, match="not connected"):
+        await hub.subscribe(FakeWebSocket(), "news")
+
+    assert hub.get_subscribers("news") == set()
+
+
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+@pytest.mark.anyio
+async def test_redis_backend_across_nodes(anyio_backend):
+    fakeredis = pytest.importorskip("fakeredis")
+
+    server = fakeredis.FakeServer()
+    node_a = Broadcast(RedisBroadcastBackend(client=fakeredis.FakeAsyncRedis(server=server)))
+    node_b = Broadcast(RedisBroadcastBackend(client=fakeredis.FakeAsyncRedis(server=server)))
+    socket = FakeWebSocket()
+
+    async with node_a, node_b, node_b.subscription(socket, "news"):
+        await node_a.publish("news", {"headline": "Ravyn"})
+
+        with anyio.fail_after(2):
+            while not socket.messages:
+                await anyio.sleep(0.01)
+
+    assert socket.messages == [{"type": "websocket.send", "text": '{"headline":"Ravyn"}'}]
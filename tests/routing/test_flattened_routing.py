@@ -0,0 +1,152 @@
+from lilya.middleware import DefineMiddleware
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+from ravyn import Gateway, Include, Ravyn, Request, get
+from ravyn.permissions import DenyAll
+from ravyn.routing.matcher import FlatRoute
+from ravyn.testclient import RavynTestClient
+
+
+@get("/items/{item_id:int}")
+async def item(request: Request, tenant: str, item_id: int) -> dict:
+    return {
+        "tenant": tenant,
+        "item_id": item_id,
+        "root_path": request.scope["root_path"],
+        "route": request.scope["route_path_template"],
+    }
+
+
+@get("/status")
+async def status() -> str:
+    return "ok"
+
+
+@get("/secret")
+async def secret() -> str:
+    return "secret"
+
+
+@get("/traced")
+async def traced(request: Request) -> list:
+    return request.scope["layers"]
+
+
+class LayerMiddleware:
+    def __init__(self, app: ASGIApp, name: str) -> None:
+        self.app = app
+        self.name = name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope.setdefault("layers", []).append(self.name)
+        await self.app(scope, receive, send)
+
+
+def create_app(flattened_routing: bool) -> Ravyn:
+    return Ravyn(
+        routes=[
+            Include(
+                "/api",
+                routes=[
+                    Include(
+                        "/v1",
+                        routes=[
+                            Include("/{tenant}", routes=[Gateway(handler=item)], name="tenant"),
+                            Gateway(handler=status),
+                        ],
+                        name="v1",
+                    ),
+                    Include("/admin", routes=[Gateway(handler=secret)], permissions=[DenyAll]),
+                    Include(
+                        "/traced",
+                        routes=[
+                            Include(
+                                "/inner",
+                                routes=[Gateway(handler=traced)],
+                                middleware=[DefineMiddleware(LayerMiddleware, name="inner")],
+                            )
+                        ],
+                        middleware=[DefineMiddleware(LayerMiddleware, name="outer")],
+                    ),
+                ],
+                name="api",
+            ),
+        ],
+        flattened_routing=flattened_routing,
+    )
+
+
+def test_flattened_routing_matches_the_nested_dispatch():
+    requests = [
+        ("GET", "/api/v1/acme/items/1"),
+        ("POST", "/api/v1/acme/items/1"),
+        ("GET", "/api/v1/acme/items/one"),
+        ("GET", "/api/v1/status"),
+        ("GET", "/api/v1/status/"),
+        ("GET", "/api/v1/acme/items/1/"),
+        ("GET", "/api/admin/secret"),
+        ("GET", "/api/admin/unknown"),
+        ("GET", "/api/traced/inner/traced"),
+        ("GET", "/api/traced/inner/unknown"),
+        ("GET", "/api/unknown"),
+        ("GET", "/unknown"),
+    ]
+    nested = RavynTestClient(create_app(flattened_routing=False))
+    flattened = RavynTestClient(create_app(flattened_routing=True))
+
+    for method, path in requests:
+        expected = nested.request(method, path)
+        response = flattened.request(method, path)
+
+        assert response.status_code == expected.status_code, (method, path)
+        assert response.content == expected.content, (method, path)
+
+
+def test_includes_are_flattened_before_their_fallback():
+    app = create_app(flattened_routing=True)
+
+    routes = app.router.get_route_matcher().routes
+
+    assert [route.path for route in routes] == [
+        "/api/v1/{tenant}/items/{item_id:int}",
+        "/api/v1/status",
+        "/api/admin/secret",
+        "/api/traced/inner/traced",
+        "/api",
+    ]
+    assert all(isinstance(route, FlatRoute) for route in routes[:-1])
+    # The requests not matching a route fully go through the include, as nested.
+    assert isinstance(routes[-1], Include)
+
+
+def test_include_middleware_wrap_the_flattened_route():
+    client = RavynTestClient(create_app(flattened_routing=True))
+
+    assert client.get("/api/traced/inner/traced").json() == ["outer", "inner"]
+
+
+def test_table_is_rebuilt_when_a_nested_include_changes():
+    app = create_app(flattened_routing=True)
+    client = RavynTestClient(app)
+    client.get("/api/v1/status")
+    matcher = app.router.get_route_matcher()
+
+    @get("/added")
+    async def added() -> str:
+        return "added"
+
+    gateway = Gateway(handler=added)
+    app.router.create_signature_models(gateway)
+    router = app.router.routes[0].routes[0].__base_app__
+    router.routes.append(gateway)
+    router.invalidate_route_matcher()
+
+    assert app.router.get_route_matcher() is not matcher
+    assert client.get("/api/v1/added").json() == "added"
+
+
+def test_path_for_keeps_working():
+    app = create_app(flattened_routing=True)
+    RavynTestClient(app).get("/api/v1/status")
+
+    assert app.path_for("api:v1:tenant:item", tenant="acme", item_id=1) == ("/api/v1/acme/items/1")
@@ -0,0 +1,135 @@
+from uuid import UUID
+
+from ravyn import Gateway, Include, Ravyn, get, post
+from ravyn.routing.matcher import RouteMatcher
+from ravyn.testclient import RavynTestClient
+
+
+@get("/users/me")
+async def me() -> str:
+    return "me"
+
+
+@get("/users/{user_id:int}")
+async def user(user_id: int) -> int:
+    return user_id
+
+
+@get("/users/{name}")
+async def user_by_name(name: str) -> str:
+    return name
+
+
+@post("/users/{user_id:int}")
+async def update_user(user_id: int) -> int:
+    return user_id
+
+
+@get("/items/{item_id:uuid}")
+async def item(item_id: UUID) -> str:
+    return str(item_id)
+
+
+@get("/files/{file_path:path}")
+async def files(file_path: str) -> str:
+    return file_path
+
+
+@get("/reports/{year:int}-{month:int}.csv")
+async def report(year: int, month: int) -> str:
+    return f"{year}/{month}"
+
+
+def create_app(compiled_routing: bool) -> Ravyn:
+    return Ravyn(
+        routes=[
+            Gateway(handler=me),
+            Gateway(handler=user),
+            Gateway(handler=user_by_name),
+            Gateway(handler=update_user),
+            Include(
+                "/api",
+                routes=[
+                    Gateway(handler=item),
+                    Gateway(handler=files),
+                    Include("/v1", routes=[Gateway(handler=report)]),
+                ],
+            ),
+        ],
+        compiled_routing=compiled_routing,
+    )
+
+
+def test_compiled_routing_matches_the_linear_scan():
+    requests = [
+        ("GET", "/users/me"),
+        ("GET", "/users/10"),
+        ("GET", "/users/ravyn"),
+        ("POST", "/users/10"),
+        ("PUT", "/users/10"),
+        ("GET", "/api/items/5f0b7e4c-9c2c-4b61-8b2a-8d7a2a8b6f11"),
+        ("GET", "/api/items/not-an-uuid"),
+        ("GET", "/api/files/a/b/c.txt"),
+        ("GET", "/api/v1/reports/2024-10.csv"),
+        ("GET", "/users/me/"),
+        ("GET", "/missing"),
+    ]
+    linear = RavynTestClient(create_app(compiled_routing=False))
+    compiled = RavynTestClient(create_app(compiled_routing=True))
+
+    for method, path in requests:
+        expected = linear.request(method, path)
+        response = compiled.request(method, path)
+
+        assert response.status_code == expected.status_code, (method, path)
+        assert response.content == expected.content, (method, path)
+
+
+def test_static_paths_are_resolved_with_a_lookup():
+    app = create_app(compiled_routing=True)
+    matcher = app.router.get_route_matcher()
+
+    assert "/users/me" in matcher.static
+    assert [route.handler for route in matcher.get_candidates("/users/me")] == [
+        me,
+        user_by_name,
+    ]
+
+
+def test_candidates_keep_the_declaration_order():
+    app = create_app(compiled_routing=True)
+    matcher = app.router.get_route_matcher()
+
+    candidates = matcher.get_candidates("/users/10")
+
+    assert [route.handler for route in candidates] == [user, user_by_name, update_user]
+    assert matcher.get_candidates("/api/anything")[-1].path == "/api"
+    assert len(matcher.get_candidates("/unknown")) == 0
+
+
+def test_matcher_is_rebuilt_when_routes_change():
+    app = create_app(compiled_routing=True)
+    matcher = app.router.get_route_matcher()
+
+    @get()
+    async def added() -> str:
+        return "added"
+
+    app.add_route("/added", added)
+
+    assert app.router.get_route_matcher() is not matcher
+    assert RavynTestClient(app).get("/added").json() == "added"
+
+
+def test_route_matcher_without_routes():
+    assert RouteMatcher([]).get_candidates("/") == []
+
+
+def test_candidates_include_the_slash_redirects():
+    app = create_app(compiled_routing=True)
+    matcher = app.router.get_route_matcher()
+
+    assert matcher.get_candidates("/users/me/") == []
+    assert [
+        route.handler for route in matcher.get_candidates("/users/me/", redirect_slashes=True)
+    ] == [me, user_by_name]
@@ -0,0 +1,149 @@
+from typing import Literal, Union
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from ravyn import WebSocket, WebSocketGateway, websocket
+from ravyn.core.transformers.messages import get_message_decoder
+from ravyn.testclient import create_client
+
+
+class Chat(BaseModel):
+    type: Literal["chat"]
+    text: str
+
+
+class Join(BaseModel):
+    type: Literal["join"]
+    room: str
+
+
+class Point(msgspec.Struct):
+    x: int
+    y: int
+
+
+class Move(msgspec.Struct):
+    type: Literal["move"]
+    x: int
+
+
+class Stop(msgspec.Struct):
+    type: Literal["stop"]
+
+
+class Jump(msgspec.Struct, tag_field="type", tag="jump"):
+    height: int
+
+
+class Fall(msgspec.Struct, tag_field="type", tag="fall"):
+    depth: int
+
+
+@websocket(path="/chat/{room}")
+async def chat(socket: WebSocket, room: str, message: Chat) -> None:
+    await socket.send_json({"room": room, "text": message.text})
+
+
+@websocket(path="/events")
+async def events(socket: WebSocket, message: Union[Chat, Join]) -> None:
+    await socket.send_json({"kind": type(message).__name__, **message.model_dump()})
+
+
+@websocket(path="/points")
+async def points(socket: WebSocket, message: Point) -> None:
+    if message.x < 0:
+        await socket.close()
+        return
+    await socket.send_json({"sum": message.x + message.y})
+
+
+@websocket(path="/moves")
+async def moves(socket: WebSocket, message: Union[Move, Stop]) -> None:
+    await socket.send_json({"kind": type(message).__name__})
+
+
+routes = [
+    WebSocketGateway(handler=chat),
+    WebSocketGateway(handler=events),
+    WebSocketGateway(handler=points),
+    WebSocketGateway(handler=moves),
+]
+
+
+def test_messages_are_validated_with_the_connection_parameters():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/chat/general") as session:
+            session.send_json({"type": "chat", "text": "hello"})
+            assert session.receive_json() == {"room": "general", "text": "hello"}
+
+            session.send_bytes(b'{"type": "chat", "text": "bytes"}')
+            assert session.receive_json() == {"room": "general", "text": "bytes"}
+
+
+def test_invalid_messages_are_answered_with_the_errors():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/chat/general") as session:
+            session.send_json({"type": "chat"})
+            error = session.receive_json()
+
+            assert error["detail"] == "Invalid message."
+            assert error["errors"][0]["loc"] == ["text"]
+
+            session.send_text("not json")
+            assert session.receive_json()["detail"] == "Invalid message."
+
+            session.send_json({"type": "chat", "text": "still open"})
+            assert session.receive_json() == {"room": "general", "text": "still open"}
+
+
+def test_discriminated_union_of_models():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/events") as session:
+            session.send_json({"type": "join", "room": "general"})
+            assert session.receive_json() == {"kind": "Join", "type": "join", "room": "general"}
+
+            session.send_json({"type": "chat", "text": "hi"})
+            assert session.receive_json() == {"kind": "Chat", "type": "chat", "text": "hi"}
+
+
+def test_msgspec_messages():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/points") as session:
+            session.send_json({"x": 1, "y": 2})
+            assert session.receive_json() == {"sum": 3}
+
+            session.send_json({"x": "1", "y": 2})
+            assert session.receive_json()["errors"] == ["Expected `int`, got `str` - at `$.x`"]
+
+            session.send_json({"x": -1, "y": 0})
+
+
+def test_dispatch_table_of_untagged_structs():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/moves") as session:
+            session.send_json({"type": "move", "x": 1})
+            assert session.receive_json() == {"kind": "Move"}
+
+            session.send_json({"type": "stop"})
+            assert session.receive_json() == {"kind": "Stop"}
+
+            session.send_json({"type": "fly"})
+            assert session.receive_json()["errors"] == ["Unknown message type: 'fly'."]
+
+
+@pytest.mark.parametrize(
+    "annotation,raw,expected",
+    [
+        (Union[Chat, Join], b'{"type": "join", "room": "a"}', Join(type="join", room="a")),
+        (Union[Jump, Fall], b'{"type": "fall", "depth": 2}', Fall(depth=2)),
+        (Union[Move, Stop], '{"type": "move", "x": 3}', Move(type="move", x=3)),
+        (Point, b'{"x": 1, "y": 1}', Point(x=1, y=1)),
+    ],
+)
+def test_message_decoders(annotation, raw, expected):
+    decoder = get_message_decoder(annotation)
+
+    assert decoder(raw) == expected
+    assert get_message_decoder(annotation) is decoder
@@ -0,0 +1,154 @@
+import pytest
+from lilya.websockets import WebSocketDisconnect
+
+from ravyn import WebSocket, WebSocketGateway, websocket
+from ravyn.testclient import create_client
+from ravyn.websockets import WebSocketSendQueue
+
+
+@websocket(path="/ordered")
+async def ordered(socket: WebSocket) -> None:
+    await socket.accept()
+    async with socket.send_queue() as queue:
+        await queue.send_text("first")
+        await queue.send_json({"second": True})
+        await queue.send_bytes(b"third")
+        await queue.flush()
+        metrics = queue.get_metrics()
+    await socket.send_json(metrics)
+    await socket.close()
+
+
+@websocket(path="/batched")
+async def batched(socket: WebSocket) -> None:
+    await socket.accept()
+    async with socket.send_queue(batch_size=3) as queue:
+        for value in range(5):
+            await queue.send_json({"value": value})
+        await queue.send_text("done")
+    await socket.send_json(queue.get_metrics())
+    await socket.close()
+
+
+@websocket(path="/drop-oldest")
+async def drop_oldest(socket: WebSocket) -> None:
+    await socket.accept()
+    async with socket.send_queue(high_water_mark=2) as queue:
+        for value in range(5):
+            await queue.send_json(value)
+    await socket.send_json(queue.get_metrics())
+    await socket.close()
+
+
+@websocket(path="/disconnect")
+async def disconnect(socket: WebSocket) -> None:
+    await socket.accept()
+    async with socket.send_queue(high_water_mark=2, policy="disconnect") as queue:
+        for value in range(5):
+            await queue.send_json(value)
+
+
+routes = [
+    WebSocketGateway(handler=ordered),
+    WebSocketGateway(handler=batched),
+    WebSocketGateway(handler=drop_oldest),
+    WebSocketGateway(handler=disconnect),
+]
+
+
+def test_send_queue_keeps_the_order():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/ordered") as session:
+            assert session.receive_text() == "first"
+            assert session.receive_json() == {"second": True}
+            assert session.receive_bytes() == b"third"
+
+            metrics = session.receive_json()
+
+    assert metrics["queued"] == 3
+    assert metrics["sent"] == 3
+    assert metrics["frames"] == 3
+    assert metrics["pending"] == 0
+    assert metrics["lag"] == 0
+    assert metrics["max_lag"] >= 0
+
+
+def test_send_queue_batches_json_messages():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/batched") as session:
+            assert session.receive_json() == [{"value": 0}, {"value": 1}, {"value": 2}]
+            assert session.receive_json() == [{"value": 3}, {"value": 4}]
+            assert session.receive_text() == "done"
+
+            metrics = session.receive_json()
+
+    assert metrics["sent"] == 6
+    assert metrics["frames"] == 3
+
+
+def test_send_queue_drops_the_oldest_messages():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/drop-oldest") as session:
+            assert session.receive_json() == 3
+            assert session.receive_json() == 4
+
+            metrics = session.receive_json()
+
+    assert metrics["dropped"] == 3
+    assert metrics["sent"] == 2
+
+
+def test_send_queue_disconnects_slow_consumers():
+    with create_client(routes=routes) as client:
+        with client.websocket_connect("/disconnect") as session:
+            with pytest.raises(WebSocketDisconnect) as raised:
+                session.receive_json()
+
+    assert raised.value.code == 1008
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"high_water_mark": 0}, {"batch_size": 0}, {"policy": "block"}],
+)
+def test_send_queue_validates_the_arguments(kwargs):
+    with pytest.raises(ValueError):
+        WebSocketSendQueue(None, **kwargs)
+
+
+class FailingWebSocket:
+    async def send(self, message):
+        raise OSError("Connection reset.")
+
+
+@pytest.mark.anyio
+async def test_send_queue_raises_a_disconnect_when_the_send_fails():
+    reached = []
+
+    with pytest.raises(WebSocketDisconnect) as raised:
+        async with WebSocketSendQueue(FailingWebSocket()) as queue:
+            await queue.send_text("lost")
+            await queue.flush()
+            reached.append("after the send")
+
+    # The handler is not cancelled by the writer, only told on exit.
+    assert reached == ["after the send"]
+    assert raised.value.code == 1006
+    assert isinstance(raised.value.__cause__, OSError)
+    assert queue.get_metrics()["dropped"] == 0
+
+    with pytest.raises(WebSocketDisconnect) as raised:
+        queue.put("raw", {"type": "websocket.send", "text": "again"})
+    assert isinstance(raised.value.__cause__, OSError)
+
+
+@pytest.mark.anyio
+async def test_send_queue_put_raises_a_disconnect_after_a_failed_send():
+    async with WebSocketSendQueue(FailingWebSocket()) as queue:
+        await queue.send_text("lost")
+        await queue.flush()
+
+        with pytest.raises(WebSocketDisconnect) as raised:
+            await queue.send_text("next")
+
+    assert isinstance(raised.value.__cause__, OSError)
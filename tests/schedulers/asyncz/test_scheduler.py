@@ -109,12 +109,12 @@ def test_ravyn_starts_scheduler():
 @pytest.fixture
 def scheduler_class(monkeypatch):
     scheduler_class = AsyncIOScheduler
-    scheduler_class._setup = MagicMock()
+    monkeypatch.setattr(scheduler_class, "_setup", MagicMock(), raising=False)
     # by patching out _setup task_defaults are not initialized anymore
-    scheduler_class.task_defaults = TaskDefaultStruct()
-    scheduler_class.timezone = timezone.utc
-    scheduler_class.loggers = default_loggers_class()
-    scheduler_class.logger_name = "asyncz.schedulers"
+    monkeypatch.setattr(scheduler_class, "task_defaults", TaskDefaultStruct(), raising=False)
+    monkeypatch.setattr(scheduler_class, "timezone", timezone.utc, raising=False)
+    monkeypatch.setattr(scheduler_class, "loggers", default_loggers_class(), raising=False)
+    monkeypatch.setattr(scheduler_class, "logger_name", "asyncz.schedulers", raising=False)
     return scheduler_class
 
 
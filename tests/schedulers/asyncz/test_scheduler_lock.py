@@ -0,0 +1,175 @@
+from datetime import datetime, timezone
+
+import anyio
+import pytest
+from asyncz.exceptions import MaximumInstancesError
+
+from ravyn.contrib.schedulers.asyncz.config import AsynczConfig
+from ravyn.contrib.schedulers.asyncz.locks import (
+    FileSchedulerLock,
+    LeaderElection,
+    RedisSchedulerLock,
+)
+
+pytestmark = pytest.mark.parametrize("anyio_backend", ["asyncio"])
+
+RUNS: list = []
+
+
+async def record(name: str, delay: float = 0) -> None:
+    await anyio.sleep(delay)
+    RUNS.append(name)
+
+
+def fail() -> None:
+    raise ValueError("Failed")
+
+
+async def wait_for(condition) -> None:
+    with anyio.fail_after(2):
+        while not condition():
+            await anyio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_file_lock_lease(tmp_path):
+    lock = FileSchedulerLock(str(tmp_path))
+    await lock.connect()
+
+    assert await lock.acquire("scheduler", "first", 10)
+    assert not await lock.acquire("scheduler", "second", 10)
+    assert not await lock.refresh("scheduler", "second", 10)
+    assert await lock.refresh("scheduler", "first", 10)
+
+    await lock.release("scheduler", "second")
+    assert not await lock.acquire("scheduler", "second", 10)
+
+    await lock.release("scheduler", "first")
+    assert await lock.acquire("scheduler", "second", 0)
+    # An expired lease is free.
+    assert await lock.acquire("scheduler", "first", 10)
+
+
+@pytest.mark.anyio
+async def test_redis_lock_lease():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    lock = RedisSchedulerLock(client=fakeredis.FakeAsyncRedis())
+
+    assert await lock.acquire("scheduler", "first", 10)
+    assert await lock.acquire("scheduler", "first", 10)
+    assert not await lock.acquire("scheduler", "second", 10)
+    assert not await lock.refresh("scheduler", "second", 10)
+
+    await lock.release("scheduler", "second")
+    assert not await lock.acquire("scheduler", "second", 10)
+
+    await lock.release("scheduler", "first")
+    assert await lock.acquire("scheduler", "second", 10)
+
+
+@pytest.mark.anyio
+async def test_leader_election_fails_over(tmp_path):
+    lock = FileSchedulerLock(str(tmp_path))
+    first = LeaderElection(lock, ttl=10)
+    second = LeaderElection(lock, ttl=10)
+
+    await first.start()
+
+    assert first.is_leader
+    assert not await second.elect()
+    assert not second.is_leader
+
+    await first.stop()
+
+    assert await second.elect()
+    assert second.is_leader
+
+
+@pytest.mark.anyio
+async def test_tasks_run_once_across_schedulers(tmp_path):
+    RUNS.clear()
+    lock = FileSchedulerLock(str(tmp_path))
+    leader = AsynczConfig(lock=lock)
+    follower = AsynczConfig(lock=lock)
+
+    await leader.start()
+    await follower.start()
+    try:
+        for config in (leader, follower):
+            config.handler.add_task(record, args=["task"], id="task")
+
+        await wait_for(lambda: follower.get_metrics()["tasks"].get("task", {}).get("skipped"))
+        await wait_for(lambda: RUNS)
+
+        assert leader.is_leader
+        assert not follower.is_leader
+    finally:
+        await follower.shutdown()
+        await leader.shutdown()
+
+    assert RUNS == ["task"]
+    assert leader.get_metrics()["tasks"]["task"]["runs"] == 1
+    assert follower.get_metrics()["tasks"]["task"] == {
+        "runs": 0,
+        "errors": 0,
+        "missed": 0,
+        "skipped": 1,
+        "overlaps": 0,
+        "average_duration": 0.0,
+        "max_duration": 0.0,
+        "last_duration": 0.0,
+        "average_lateness": 0.0,
+        "max_lateness": 0.0,
+    }
+
+
+@pytest.mark.anyio
+async def test_task_metrics(tmp_path):
+    RUNS.clear()
+    config = AsynczConfig(lock=FileSchedulerLock(str(tmp_path)))
+
+    await config.start()
+    try:
+        config.handler.add_task(fail, id="fail")
+        # Added paused, the runs are sent by the test.
+        task = config.handler.add_task(record, args=["slow", 0.2], id="slow", next_run_time=None)
+
+        config.executor.send_task(task, [datetime.now(timezone.utc)])
+        with pytest.raises(MaximumInstancesError):
+            config.executor.send_task(task, [datetime.now(timezone.utc)])
+
+        await wait_for(lambda: RUNS)
+        await wait_for(lambda: config.get_metrics()["tasks"].get("fail", {}).get("errors"))
+        assert config.get_metrics()["is_leader"] is True
+    finally:
+        await config.shutdown()
+
+    metrics = config.get_metrics()
+
+    assert metrics["tasks"]["fail"]["errors"] == 1
+    assert metrics["tasks"]["slow"]["runs"] == 1
+    assert metrics["tasks"]["slow"]["skipped"] == 1
+    assert metrics["tasks"]["slow"]["overlaps"] == 1
+    assert metrics["tasks"]["slow"]["max_duration"] >= 0.2
+
+
+@pytest.mark.anyio
+async def test_task_metrics_without_a_lock():
+    RUNS.clear()
+    config = AsynczConfig()
+    assert config.handler.executors["default"] is config.executor
+
+    await config.start()
+    try:
+        config.handler.add_task(record, args=["unlocked"], id="unlocked")
+        await wait_for(lambda: config.get_metrics()["tasks"].get("unlocked", {}).get("runs"))
+    finally:
+        await config.shutdown()
+
+    metrics = config.get_metrics()
+
+    assert RUNS == ["unlocked"]
+    assert metrics["is_leader"] is True
+    assert metrics["tasks"]["unlocked"]["runs"] == 1
+    assert metrics["tasks"]["unlocked"]["errors"] == 0
@@ -0,0 +1,57 @@
+import anyio
+import pytest
+
+from ravyn import Ravyn
+from ravyn.contrib.schedulers.asyncz.config import AsynczConfig
+from ravyn.core.config import TracingConfig
+from ravyn.core.tracing import NO_OP_TRACER, InMemorySpanExporter, get_tracer
+
+
+async def collect() -> None:
+    with get_tracer().start_as_current_span("collect inside"):
+        await anyio.sleep(0)
+
+
+def clean() -> None:
+    with get_tracer().start_as_current_span("clean inside"):
+        pass
+
+
+def fail() -> None:
+    raise ValueError("Failed")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_scheduler_tasks_are_traced():
+    exporter = InMemorySpanExporter()
+    config = AsynczConfig()
+    app = Ravyn(scheduler_config=config, tracing_config=TracingConfig(exporter=exporter))
+
+    assert config.executor.tracer is app.tracer
+
+    await config.start()
+    try:
+        config.handler.add_task(collect, id="collect")
+        config.handler.add_task(clean, id="clean")
+        config.handler.add_task(fail, id="fail")
+
+        with anyio.fail_after(2):
+            while len(exporter.get_finished_spans()) < 5:
+                await anyio.sleep(0.01)
+    finally:
+        await config.shutdown()
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["collect inside"].parent_id == spans["scheduler collect"].span_id
+    # The synchronous tasks run in a thread with the context of the run.
+    assert spans["clean inside"].parent_id == spans["scheduler clean"].span_id
+    assert spans["scheduler clean"].attributes == {"ravyn.task.id": "clean"}
+    assert spans["scheduler fail"].status == "error"
+
+
+def test_scheduler_without_tracing():
+    config = AsynczConfig()
+    Ravyn(scheduler_config=config)
+
+    assert config.executor.tracer is NO_OP_TRACER
@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from lilya.middleware import DefineMiddleware
+
+from ravyn import Gateway, Request, get
+from ravyn.contrib.auth.common.middleware import CommonJWTAuthMiddleware
+from ravyn.core.caches.memory import InMemoryCache
+from ravyn.core.config.jwt import JWTConfig
+from ravyn.security.jwt.cache import TokenCache
+from ravyn.security.jwt.token import Token
+from ravyn.testclient import create_client
+
+pytestmark = pytest.mark.anyio
+
+jwt_config = JWTConfig(signing_key="a-signing-key")
+LOOKUPS: list[str] = []
+
+
+class JWTAuthMiddleware(CommonJWTAuthMiddleware):
+    async def retrieve_user(self, token_sub):
+        LOOKUPS.append(token_sub)
+        return {"id": token_sub}
+
+
+@get("/me")
+async def me(request: Request) -> dict:
+    return request.user
+
+
+@pytest.fixture(autouse=True)
+def clear_lookups():
+    LOOKUPS.clear()
+
+
+def create_token(sub: str = "1", lifetime: timedelta = timedelta(minutes=5)) -> str:
+    token = Token(exp=datetime.now(timezone.utc) + lifetime, sub=sub)
+    return token.encode(key=jwt_config.signing_key, algorithm=jwt_config.algorithm)
+
+
+def create_app_client(token_cache: TokenCache):
+    return create_client(
+        routes=[Gateway(handler=me)],
+        middleware=[
+            DefineMiddleware(
+                JWTAuthMiddleware,
+                config=jwt_config,
+                user_model=None,
+                token_cache=token_cache,
+            )
+        ],
+    )
+
+
+def test_cache_hit_skips_verification_and_lookup():
+    token_cache = TokenCache()
+    headers = {"Authorization": f"Bearer {create_token()}"}
+
+    with create_app_client(token_cache) as client:
+        for _ in range(3):
+            response = client.get("/me", headers=headers)
+            assert response.json() == {"id": "1"}
+
+    assert LOOKUPS == ["1"]
+    assert token_cache.get_stats()["hits"] == 2
+    assert token_cache.get_stats()["misses"] == 1
+
+
+def test_revoked_token_is_rejected():
+    token_cache = TokenCache()
+    token = create_token()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with create_app_client(token_cache) as client:
+        assert client.get("/me", headers=headers).status_code == 200
+
+        client.portal.call(token_cache.revoke, token)
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == 401
+
+
+def test_invalid_token_is_not_cached():
+    token_cache = TokenCache()
+    headers = {"Authorization": "Bearer not-a-token"}
+
+    with create_app_client(token_cache) as client:
+        assert client.get("/me", headers=headers).status_code == 401
+
+    assert token_cache.get_stats()["size"] == 0
+
+
+async def test_entry_expires_with_the_token():
+    token_cache = TokenCache(ttl=None)
+    exp = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+    await token_cache.set("token", "1", exp.timestamp(), {"id": "1"})
+
+    assert await token_cache.get("token") is None
+
+
+async def test_ttl_caps_the_token_expiration():
+    token_cache = TokenCache(ttl=60)
+    exp = (datetime.now(timezone.utc) + timedelta(days=1)).timestamp()
+
+    assert token_cache.get_deadline(exp) < exp
+
+
+async def test_lru_is_bounded():
+    token_cache = TokenCache(max_size=2)
+
+    for name in ("a", "b", "c"):
+        await token_cache.set(name, name, None, {"id": name})
+
+    assert await token_cache.get("a") is None
+    assert (await token_cache.get("c")).user == {"id": "c"}
+
+
+async def test_backend_shares_claims_and_revocations():
+    backend = InMemoryCache()
+    first = TokenCache(backend=backend)
+    second = TokenCache(backend=backend)
+    token = create_token()
+
+    await first.set(token, "1", None, {"id": "1"})
+
+    cached = await second.get(token)
+    assert cached.sub == "1"
+    assert cached.user is None
+
+    await first.revoke(token)
+    assert (await second.get(token)).revoked
+
+
+async def test_revocations_are_bounded():
+    token_cache = TokenCache(max_size=2)
+
+    for sub in ("1", "2", "3"):
+        await token_cache.revoke(create_token(sub))
+
+    assert token_cache.get_stats()["revoked"] == 2
+
+
+async def test_local_entries_spare_the_backend_reads():
+    class CountingCache(InMemoryCache):
+        reads = 0
+
+        async def get(self, key):
+            self.reads += 1
+            return await super().get(key)
+
+    backend = CountingCache()
+    token_cache = TokenCache(backend=backend)
+    token = create_token()
+    await token_cache.set(token, "1", None, {"id": "1"})
+
+    for _ in range(3):
+        assert (await token_cache.get(token)).user == {"id": "1"}
+    assert backend.reads == 0
+
+    await TokenCache(backend=backend).revoke(token)
+    token_cache.local_ttl = 0
+    assert (await token_cache.get(token)).revoked
+    assert backend.reads == 1
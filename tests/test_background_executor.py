@@ -0,0 +1,173 @@
+import time
+
+import anyio
+import pytest
+
+from ravyn import Gateway, Ravyn, get
+from ravyn.background import BackgroundTask, BackgroundTasks
+from ravyn.core.background import BackgroundExecutor, CleanupTask, DeferredTask
+from ravyn.core.background.spill import SQLiteSpill
+from ravyn.core.config import BackgroundTaskConfig
+from ravyn.testclient import RavynTestClient
+
+pytestmark = pytest.mark.anyio
+
+CALLS: list[str] = []
+
+
+async def record(name: str) -> None:
+    CALLS.append(name)
+
+
+async def slow(delay: float) -> None:
+    await anyio.sleep(delay)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not met in time"
+        time.sleep(0.01)
+
+
+@get(
+    "/notify",
+    background=BackgroundTasks(
+        tasks=[BackgroundTask(record, "first"), BackgroundTask(record, name="second")]
+    ),
+)
+async def notify() -> str:
+    return "ok"
+
+
+def test_background_tasks_run_in_the_executor():
+    app = Ravyn(routes=[Gateway(handler=notify)], background_config=BackgroundTaskConfig())
+
+    with RavynTestClient(app) as client:
+        assert app.background_executor.is_running
+
+        response = client.get("/notify")
+        assert response.json() == "ok"
+
+        wait_for(lambda: CALLS == ["first", "second"])
+        metrics = app.background_executor.get_metrics()
+        assert metrics["submitted"] == 1
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0
+
+    assert not app.background_executor.is_running
+
+
+def test_background_tasks_run_inline_without_config():
+    app = Ravyn(routes=[Gateway(handler=notify)])
+
+    with RavynTestClient(app) as client:
+        client.get("/notify")
+
+    assert app.background_executor is None
+    assert CALLS == ["first", "second"]
+
+
+async def test_timeout_is_recorded():
+    executor = BackgroundExecutor(BackgroundTaskConfig(workers=1, timeout=0.01))
+    await executor.start()
+
+    await executor.submit(BackgroundTask(slow, 1))
+    await executor.shutdown()
+
+    assert executor.metrics.timed_out == 1
+    assert executor.metrics.completed == 0
+
+
+async def test_submit_runs_inline_when_not_started():
+    executor = BackgroundExecutor(BackgroundTaskConfig())
+
+    await executor.submit(BackgroundTask(record, "inline"))
+
+    assert CALLS == ["inline"]
+    assert executor.metrics.submitted == 0
+
+
+async def test_full_queue_spills_to_sqlite(tmp_path):
+    config = BackgroundTaskConfig(
+        workers=1, max_queue_size=1, spill_path=str(tmp_path / "spill.sqlite3")
+    )
+    executor = BackgroundExecutor(config)
+    await executor.start()
+
+    await executor.submit(BackgroundTask(slow, 0.05))
+    while not executor.get_metrics()["active"]:
+        await anyio.sleep(0.001)
+    for name in ("a", "b", "c"):
+        await executor.submit(BackgroundTask(record, name))
+
+    assert executor.metrics.spilled == 2
+    assert executor.queue_depth == 3
+
+    await executor.shutdown()
+    assert CALLS == ["a"]
+    assert executor.get_metrics()["spilled_depth"] == 2
+
+    # The spilled tasks are resumed on the next start
+    executor = BackgroundExecutor(config)
+    await executor.start()
+    await anyio.sleep(0.05)
+    await executor.shutdown()
+
+    assert CALLS == ["a", "b", "c"]
+    assert executor.queue_depth == 0
+
+
+async def test_workers_survive_spill_errors(tmp_path, monkeypatch):
+    def broken_pop(self):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(SQLiteSpill, "pop", broken_pop)
+    config = BackgroundTaskConfig(
+        workers=1, max_queue_size=1, spill_path=str(tmp_path / "spill.sqlite3")
+    )
+    executor = BackgroundExecutor(config)
+    await executor.start()
+
+    await executor.submit(BackgroundTask(slow, 0.05))
+    while not executor.get_metrics()["active"]:
+        await anyio.sleep(0.001)
+    for name in ("a", "b"):
+        await executor.submit(BackgroundTask(record, name))
+    assert executor.get_metrics()["spilled"] == 1
+
+    with anyio.fail_after(1):
+        while "a" not in CALLS or executor._spilled:
+            await anyio.sleep(0.01)
+        await executor.submit(BackgroundTask(record, "c"))
+        while "c" not in CALLS:
+            await anyio.sleep(0.01)
+
+    assert executor._workers == 1
+    await executor.shutdown()
+
+
+async def test_submit_runs_inline_without_workers():
+    executor = BackgroundExecutor(BackgroundTaskConfig(workers=1, max_queue_size=1))
+    await executor.start()
+    executor._workers = 0
+
+    with anyio.fail_after(1):
+        await executor.submit(BackgroundTask(record, "first"))
+        await executor.submit(BackgroundTask(record, "second"))
+
+    assert CALLS == ["first", "second"]
+    await executor.shutdown()
+
+
+def test_cleanup_tasks_are_not_deferred():
+    executor = BackgroundExecutor(BackgroundTaskConfig())
+    cleanup = CleanupTask(record, "cleanup")
+
+    assert executor.defer(cleanup) is cleanup
+    assert isinstance(executor.defer(BackgroundTask(record, "task")), DeferredTask)
@@ -0,0 +1,155 @@
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from ravyn import get
+from ravyn.core.datastructures import File
+from ravyn.responses import FileResponse
+from ravyn.testclient import create_client
+
+CONTENT = bytes(range(256)) * 8
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+def make_client(path):
+    @get("/file")
+    def download() -> File:
+        return File(path=path, filename="data.bin")
+
+    return create_client(routes=[download])
+
+
+def test_file_stats_once_and_reuses_stat_result(file_path):
+    file = File(path=file_path, filename="data.bin")
+
+    assert file.stat_result.st_size == len(CONTENT)
+
+    stat_result = os.stat(file_path)
+    assert File(path=file_path, filename="data.bin", stat_result=stat_result).stat_result is (
+        stat_result
+    )
+
+
+def test_file_requires_an_existing_file(tmp_path):
+    with pytest.raises(ValidationError):
+        File(path=tmp_path / "missing.bin", filename="missing.bin")
+
+    with pytest.raises(ValidationError):
+        File(path=tmp_path, filename="directory")
+
+
+def test_file_single_range(file_path):
+    with make_client(file_path) as client:
+        response = client.get("/file", headers={"range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert response.headers["content-length"] == "10"
+    assert response.content == CONTENT[10:20]
+
+
+def test_file_multiple_ranges(file_path):
+    with make_client(file_path) as client:
+        response = client.get("/file", headers={"range": "bytes=0-9, 100-149"})
+
+    assert response.status_code == 206
+    content_type, _, boundary = response.headers["content-type"].partition("; boundary=")
+    assert content_type == "multipart/byteranges"
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert response.content.endswith(f"\r\n--{boundary}--\r\n".encode())
+
+    parts = response.content.split(f"--{boundary}".encode())[1:-1]
+    assert [part.split(b"\r\n\r\n", 1)[1][:-2] for part in parts] == [
+        CONTENT[0:10],
+        CONTENT[100:150],
+    ]
+    assert f"content-range: bytes 100-149/{len(CONTENT)}".encode() in parts[1]
+
+
+def test_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    with make_client(path) as client:
+        response = client.get("/file")
+
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+async def call(response, extensions, headers=(), method="GET"):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/",
+        "headers": list(headers),
+        "extensions": extensions,
+    }
+    messages = []
+
+    async def receive():  # pragma: no cover
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            body = os.pread(message["file"], message["count"], message["offset"])
+            message = {**message, "body": body}
+        messages.append(message)
+
+    await response(scope, receive, send)
+    return messages
+
+
+@pytest.mark.anyio
+async def test_file_response_pathsend(file_path):
+    messages = await call(FileResponse(file_path), {"http.response.pathsend": {}})
+
+    assert messages[1] == {"type": "http.response.pathsend", "path": os.fspath(file_path)}
+
+
+@pytest.mark.anyio
+async def test_file_response_zerocopysend(file_path, monkeypatch):
+    monkeypatch.setattr(FileResponse, "chunk_size", 1000)
+
+    messages = await call(FileResponse(file_path), {"http.response.zerocopysend": {}})
+
+    bodies = messages[1:]
+    assert {message["type"] for message in bodies} == {"http.response.zerocopysend"}
+    assert [(message["offset"], message["count"]) for message in bodies] == [
+        (0, 1000),
+        (1000, 1000),
+        (2000, 48),
+    ]
+    assert [message["more_body"] for message in bodies] == [True, True, False]
+    assert b"".join(message["body"] for message in bodies) == CONTENT
+
+
+@pytest.mark.anyio
+async def test_file_response_zerocopysend_range(file_path):
+    messages = await call(
+        FileResponse(file_path),
+        {"http.response.pathsend": {}, "http.response.zerocopysend": {}},
+        headers=[(b"range", b"bytes=100-199")],
+    )
+
+    assert messages[0]["status"] == 206
+    assert messages[1]["type"] == "http.response.zerocopysend"
+    assert (messages[1]["offset"], messages[1]["count"]) == (100, 100)
+    assert messages[1]["body"] == CONTENT[100:200]
+
+
+@pytest.mark.anyio
+async def test_file_response_head(file_path):
+    messages = await call(
+        FileResponse(file_path), {"http.response.zerocopysend": {}}, method="HEAD"
+    )
+
+    assert len(messages) == 1
+    assert messages[0]["headers"]["content-length"] == str(len(CONTENT))
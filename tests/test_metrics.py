@@ -0,0 +1,141 @@
+from ravyn import Gateway, Include, Inject, Injects, get
+from ravyn.applications import Ravyn
+from ravyn.core.caches.memory import InMemoryCache
+from ravyn.core.config import MetricsConfig
+from ravyn.core.metrics import Counter, Histogram, MetricsRegistry
+from ravyn.permissions import DenyAll
+from ravyn.utils.decorators import cache
+
+
+def get_factor() -> int:
+    return 3
+
+
+def create_app(**kwargs):
+    @cache(ttl=10, backend=InMemoryCache())
+    async def double(value: int) -> int:
+        return value * 2
+
+    @get("/items/{item_id:int}", dependencies={"factor": Inject(get_factor)})
+    async def item(item_id: int, factor: int = Injects()) -> dict[str, int]:
+        return {"value": await double(item_id) * factor}
+
+    @get("/secret", permissions=[DenyAll])
+    async def secret() -> str:
+        return "secret"
+
+    return Ravyn(
+        routes=[Include("/api", routes=[Gateway(handler=item), Gateway(handler=secret)])],
+        metrics_config=MetricsConfig(**kwargs),
+    )
+
+
+def test_registry_render():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("events", "The events.", ("kind",)))
+    histogram = registry.register(Histogram("latency", "The latency.", buckets=(0.1, 1.0)))
+
+    counter.inc('a"b')
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP events The events.",
+        "# TYPE events counter",
+        'events_total{kind="a\\"b"} 1',
+        "# HELP latency The latency.",
+        "# TYPE latency histogram",
+        'latency_bucket{le="0.1"} 1',
+        'latency_bucket{le="1.0"} 2',
+        'latency_bucket{le="+Inf"} 3',
+        "latency_sum 5.55",
+        "latency_count 3",
+    ]
+
+
+def test_metrics_per_route_template_and_phase(test_client_factory):
+    client = test_client_factory(create_app())
+
+    assert client.get("/api/items/1").json() == {"value": 6}
+    assert client.get("/api/items/1").json() == {"value": 6}
+    assert client.get("/api/items/2").json() == {"value": 12}
+    assert client.get("/missing").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    assert (
+        'ravyn_request_duration_seconds_count{method="GET",route="/api/items/{item_id}",'
+        'status="200"} 3'
+    ) in text
+    assert (
+        'ravyn_request_duration_seconds_count{method="GET",route="unmatched",status="404"} 1'
+    ) in text
+    for phase in (
+        "dispatch",
+        "params",
+        "dependencies",
+        "validation",
+        "handler",
+        "serialization",
+        "send",
+    ):
+        assert (
+            f'ravyn_request_phase_duration_seconds_count{{route="/api/items/{{item_id}}",'
+            f'phase="{phase}"}} 3'
+        ) in text
+    assert 'ravyn_cache_requests_total{cache="create_app.<locals>.double",result="hit"} 1' in text
+    assert 'ravyn_cache_requests_total{cache="create_app.<locals>.double",result="miss"} 2' in text
+    assert 'ravyn_threadpool_threads{state="busy"}' in text
+
+
+def test_metrics_permission_denials(test_client_factory):
+    client = test_client_factory(create_app(path="/internal/metrics", phases=False))
+
+    assert client.get("/api/secret").status_code == 403
+
+    text = client.get("/internal/metrics").text
+    assert 'ravyn_permission_denials_total{route="/api/secret"} 1' in text
+    assert 'route="/api/secret",status="403"' in text
+    assert 'phase="handler"' not in text
+
+
+def test_metrics_disabled(test_client_factory):
+    @get("/")
+    async def home() -> str:
+        return "home"
+
+    app = Ravyn(routes=[Gateway(handler=home)])
+    client = test_client_factory(app)
+
+    assert client.get("/").status_code == 200
+    assert client.get("/metrics").status_code == 404
+    assert app.metrics is None
+    assert "instrumented_route" not in app.routes[0].handler.__dict__
+    assert "handle_dispatch" not in app.routes[0].handler.__dict__
+
+
+def test_metrics_nested_includes_and_added_routes(test_client_factory):
+    @get("/{item_id:int}")
+    async def first(item_id: int) -> int:
+        return item_id
+
+    @get("/{item_id:int}")
+    async def second(item_id: int) -> int:
+        return item_id
+
+    app = Ravyn(
+        routes=[Include("/a", routes=[Include("/b", routes=[Gateway("/first", handler=first)])])],
+        metrics_config=MetricsConfig(),
+    )
+    client = test_client_factory(app)
+
+    assert client.get("/a/b/first/1").status_code == 200
+    app.add_route("/second", second)
+    assert client.get("/second/2").status_code == 200
+
+    text = client.get("/metrics").text
+    assert 'route="/a/b/first/{item_id}",status="200"} 1' in text
+    assert 'route="/second/{item_id}",status="200"} 1' in text
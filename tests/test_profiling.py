@@ -0,0 +1,175 @@
+import time
+
+from ravyn import Gateway, Include, Inject, Injects, get
+from ravyn.applications import Ravyn
+from ravyn.core.config import MetricsConfig, ProfilingConfig
+from ravyn.core.metrics import RequestTimer
+from ravyn.core.profiling import StackSampler, replay
+
+
+def get_factor() -> int:
+    return 3
+
+
+@get("/items/{item_id:int}", dependencies={"factor": Inject(get_factor)})
+async def item(item_id: int, factor: int = Injects()) -> dict[str, int]:
+    return {"value": item_id * factor}
+
+
+@get("/slow")
+async def slow() -> str:
+    time.sleep(0.05)
+    return "slow"
+
+
+def create_app(debug: bool = True, **kwargs) -> Ravyn:
+    return Ravyn(
+        routes=[Include("/api", routes=[Gateway(handler=item), Gateway(handler=slow)])],
+        debug=debug,
+        profiling_config=ProfilingConfig(**kwargs),
+    )
+
+
+def test_profiling_keeps_the_timing_tree(test_client_factory):
+    app = create_app(threshold_ms=0)
+    client = test_client_factory(app)
+
+    assert client.get("/api/items/2").json() == {"value": 6}
+
+    (record,) = app.profiler.records
+    assert record.route == "/api/items/{item_id}"
+    assert record.status == 200
+    assert set(record.phases) >= {
+        "dispatch",
+        "interceptors",
+        "permissions",
+        "params",
+        "dependencies",
+        "handler",
+        "serialization",
+        "send",
+    }
+
+    children = [span["name"] for span in record.tree["children"]]
+    assert children[:4] == ["dispatch", "interceptors", "permissions", "handler"]
+    assert children[-1] == "send"
+    handler = record.tree["children"][3]
+    assert "params" in [span["name"] for span in handler["children"]]
+    assert record.tree["duration_ms"] == record.duration_ms
+
+
+def test_profiling_threshold_and_ring_buffer(test_client_factory):
+    app = create_app(threshold_ms=30, buffer_size=2)
+    client = test_client_factory(app)
+
+    client.get("/api/items/1")
+    assert len(app.profiler.records) == 0
+
+    for _ in range(3):
+        client.get("/api/slow")
+
+    assert [record.id for record in app.profiler.records] == [2, 3]
+    assert all(record.duration_ms >= 30 for record in app.profiler.records)
+
+
+def test_profiling_endpoint(test_client_factory):
+    app = create_app(threshold_ms=0)
+    client = test_client_factory(app)
+
+    client.get("/api/items/1")
+    client.get("/api/items/2")
+
+    summaries = client.get("/_profiling").json()
+    assert [summary["path"] for summary in summaries] == ["/api/items/2", "/api/items/1"]
+    assert "tree" not in summaries[0]
+
+    detail = client.get(f"/_profiling/{summaries[0]['id']}").json()
+    assert detail["route"] == "/api/items/{item_id}"
+    assert detail["tree"]["name"] == "request"
+    assert client.get("/_profiling/999").status_code == 404
+    # The endpoint requests are not profiled.
+    assert len(app.profiler.records) == 2
+
+
+def test_profiling_endpoint_is_debug_only(test_client_factory):
+    app = create_app(debug=False, threshold_ms=0)
+    client = test_client_factory(app)
+
+    client.get("/api/items/1")
+
+    assert client.get("/_profiling").status_code == 404
+    assert len(app.profiler.records) == 2
+
+
+def test_profiling_stack_sampling(test_client_factory):
+    app = create_app(threshold_ms=0, stack_sampling=True, sampling_interval=0.001)
+    client = test_client_factory(app)
+
+    client.get("/api/slow")
+
+    (record,) = app.profiler.records
+    assert record.stacks
+    assert any("slow (" in frame for stack in record.stacks for frame in stack["stack"])
+    assert app.profiler.sampler.active == {}
+
+
+def test_stack_sampling_only_samples_a_single_request():
+    sampler = StackSampler(interval=10)
+    first, second = RequestTimer(), RequestTimer()
+    sampler.start(first)
+    sampler.start(second)
+
+    # Both run in this thread, their stacks cannot be told apart.
+    sampler.sample()
+    assert not first.stacks and not second.stacks
+
+    sampler.stop(second)
+    sampler.sample()
+    assert sum(first.stacks.values()) == 1
+    assert not second.stacks
+    sampler.stop(first)
+
+
+def test_profiling_shares_the_timer_with_the_metrics(test_client_factory):
+    app = Ravyn(
+        routes=[Gateway(handler=item)],
+        profiling_config=ProfilingConfig(threshold_ms=0),
+        metrics_config=MetricsConfig(),
+    )
+    client = test_client_factory(app)
+
+    client.get("/items/1")
+
+    (record,) = app.profiler.records
+    assert record.tree["children"][-1]["name"] == "send"
+    text = app.metrics.render()
+    assert 'ravyn_request_duration_seconds_count{method="GET",route="/items/{item_id}"' in text
+    assert 'phase="permissions"} 1' in text
+
+
+def test_replay():
+    @get("/")
+    async def home() -> str:
+        return "home"
+
+    app = Ravyn(routes=[Gateway(handler=home)])
+
+    records = replay(app, "get", "/", headers={"x-test": "1"}, repeat=3)
+
+    assert [record.status for record in records] == [200, 200, 200]
+    assert all(record.tree["children"] for record in records)
+    assert app.profiler is None
+
+
+def test_profiling_disabled(test_client_factory):
+    @get("/")
+    async def home() -> str:
+        return "home"
+
+    app = Ravyn(routes=[Gateway(handler=home)])
+    client = test_client_factory(app)
+
+    assert client.get("/").status_code == 200
+    assert client.get("/_profiling").status_code == 404
+    assert app.profiler is None
+    assert "instrumented_route" not in app.routes[0].handler.__dict__
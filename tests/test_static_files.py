@@ -8,6 +8,7 @@ from pydantic import ValidationError
 from ravyn import Include, get
 from ravyn.core.config import StaticFilesConfig
 from ravyn.core.config.template import TemplateConfig
+from ravyn.staticfiles import precompress_directory
 from ravyn.testclient import create_client
 
 
@@ -187,3 +188,99 @@ def test_mixing_static_and_include_template_config(
 
         response = client.get("/include")
         assert response.status_code == 200
+
+
+def test_staticfiles_precompressed(tmpdir: Any) -> None:
+    content = "body { color: red; }\n" * 100
+    tmpdir.join("app.css").write(content)
+    assert precompress_directory(str(tmpdir), encodings=["gzip"]) == [
+        os.path.join(tmpdir, "app.css.gz")
+    ]
+    static_files_config = StaticFilesConfig(path="/static", directory=tmpdir, precompressed=True)
+
+    with create_client([], static_files_config=static_files_config) as client:
+        response = client.get("/static/app.css", headers={"accept-encoding": "br, gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        assert response.headers["vary"] == "accept-encoding"
+        assert int(response.headers["content-length"]) < len(content)
+        assert response.text == content
+
+        response = client.get("/static/app.css", headers={"accept-encoding": "gzip;q=0"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == str(len(content))
+        assert response.text == content
+
+        # The sibling is stale once the file changed.
+        tmpdir.join("app.css").write(content + "a { color: blue; }\n")
+        os.utime(tmpdir.join("app.css"), ns=(0, 1))
+        response = client.get("/static/app.css", headers={"accept-encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text.endswith("a { color: blue; }\n")
+
+
+def test_staticfiles_memory_cache(tmpdir: Any) -> None:
+    path = tmpdir.join("app.3f2a1b9c.js")
+    path.write("console.log(1);")
+    tmpdir.join("large.js").write("x" * 100)
+    static_files_config = StaticFilesConfig(
+        path="/static",
+        directory=tmpdir,
+        cache_size=1,
+        cache_max_file_size=50,
+        immutable=True,
+    )
+
+    with create_client([], static_files_config=static_files_config) as client:
+        static_files = next(route.app for route in client.app.routes if route.path == "/static")
+        first = client.get("/static/app.3f2a1b9c.js")
+        second = client.get("/static/app.3f2a1b9c.js")
+
+        assert first.text == second.text == "console.log(1);"
+        assert first.headers == second.headers
+        assert second.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert static_files.get_metrics()["cache"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+        response = client.get(
+            "/static/app.3f2a1b9c.js", headers={"if-none-match": second.headers["etag"]}
+        )
+        assert response.status_code == 304
+
+        # A changed file is read again.
+        path.write("console.log(22);")
+        os.utime(path, ns=(0, 0))
+        assert client.get("/static/app.3f2a1b9c.js").text == "console.log(22);"
+
+        response = client.get("/static/large.js")
+        assert response.text == "x" * 100
+        assert "cache-control" not in response.headers
+        assert static_files.get_metrics()["cached_files"] == 1
+
+
+def test_staticfiles_memory_cache_precompressed(tmpdir: Any) -> None:
+    content = "body { color: red; }\n" * 100
+    tmpdir.join("app.css").write(content)
+    precompress_directory(str(tmpdir), encodings=["gzip"])
+    static_files_config = StaticFilesConfig(
+        path="/static", directory=tmpdir, precompressed=True, cache_size=10
+    )
+
+    with create_client([], static_files_config=static_files_config) as client:
+        static_files = next(route.app for route in client.app.routes if route.path == "/static")
+        for coding in ("x0", "x1", "x2"):
+            response = client.get(
+                "/static/app.css", headers={"accept-encoding": f"gzip, {coding}"}
+            )
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.text == content
+
+        # The codings without a precompressed file share the same entry.
+        assert static_files.get_metrics()["cached_files"] == 1
+        assert static_files.get_metrics()["cache"]["hits"] == 2
+
+        # The cached sibling is stale once the file it was built from changed.
+        tmpdir.join("app.css").write(content + "a { color: blue; }\n")
+        response = client.get("/static/app.css", headers={"accept-encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text.endswith("a { color: blue; }\n")
@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from ravyn import Gateway, Ravyn, Template, get
+from ravyn.core.caches.memory import InMemoryCache
+from ravyn.core.config.template import TemplateConfig
+from ravyn.core.protocols.template import TemplateEngineProtocol
+from ravyn.exceptions import ImproperlyConfigured
+from ravyn.template.jinja import JinjaTemplateEngine
+from ravyn.testclient import RavynTestClient
+
+
+def write(template_dir, name: str, content: str) -> None:
+    with open(os.path.join(template_dir, name), "w") as file:
+        file.write(content)
+
+
+def test_bytecode_cache_is_shared(template_dir, tmp_path_factory):
+    write(template_dir, "index.html", "<html>Hello {{ name }}</html>")
+    directory = tmp_path_factory.mktemp("bytecode")
+
+    first = JinjaTemplateEngine(template_dir, bytecode_cache=str(directory))
+    assert first.get_template("index.html").render(name="world") == "<html>Hello world</html>"
+
+    second = JinjaTemplateEngine(template_dir, bytecode_cache=directory)
+    assert second.get_template("index.html").render(name="world") == "<html>Hello world</html>"
+
+    assert os.listdir(directory)
+    assert first.get_metrics()["bytecode_cache"] == {"hits": 0, "misses": 1, "hit_ratio": 0.0}
+    assert second.get_metrics()["bytecode_cache"] == {"hits": 1, "misses": 0, "hit_ratio": 1.0}
+
+
+def test_fragment_cache(template_dir):
+    write(
+        template_dir,
+        "index.html",
+        "{% cache 'menu', 60 %}<nav>{{ menu() }}</nav>{% endcache %}{{ name }}",
+    )
+    calls = []
+
+    def menu() -> str:
+        calls.append(1)
+        return "<b>"
+
+    engine = JinjaTemplateEngine(template_dir, fragment_cache=InMemoryCache())
+    template = engine.get_template("index.html")
+
+    assert template.render(menu=menu, name="first") == "<nav>&lt;b&gt;</nav>first"
+    assert template.render(menu=menu, name="second") == "<nav>&lt;b&gt;</nav>second"
+    assert len(calls) == 1
+    assert engine.get_metrics() == {
+        "fragment_cache": {"hits": 1, "misses": 1, "hit_ratio": 0.5},
+    }
+
+
+def test_fragment_cache_requires_a_backend(template_dir):
+    write(template_dir, "index.html", "{% cache 'menu' %}menu{% endcache %}")
+
+    engine = JinjaTemplateEngine(template_dir, fragment_cache=InMemoryCache())
+    engine.env.fragment_cache = None
+
+    with pytest.raises(ImproperlyConfigured):
+        engine.get_template("index.html").render()
+
+
+def test_fragment_cache_async(template_dir):
+    write(template_dir, "index.html", "{% cache key %}{{ menu() }}{% endcache %}")
+    calls = []
+
+    async def menu() -> str:
+        calls.append(1)
+        return "menu"
+
+    @get()
+    async def homepage() -> Template:
+        return Template(name="index.html", context={"key": "menu", "menu": menu})
+
+    app = Ravyn(
+        routes=[Gateway("/", handler=homepage)],
+        template_config=TemplateConfig(
+            directory=template_dir,
+            env_options={"enable_async": True},
+            fragment_cache=InMemoryCache(),
+        ),
+    )
+    client = RavynTestClient(app)
+
+    assert client.get("/").text == "menu"
+    assert client.get("/").text == "menu"
+    assert len(calls) == 1
+    assert app.template_engine.get_metrics()["fragment_cache"]["hits"] == 1
+
+
+def test_cache_options_are_only_given_to_jinja(template_dir):
+    class OtherEngine(TemplateEngineProtocol):
+        pass
+
+    config = TemplateConfig(
+        directory=template_dir, engine=OtherEngine, bytecode_cache=str(template_dir)
+    )
+    assert config.get_cache_options() == {}
+
+    config = TemplateConfig(directory=template_dir, bytecode_cache=str(template_dir))
+    assert config.get_cache_options() == {"bytecode_cache": str(template_dir)}
@@ -6,6 +6,7 @@ from ravyn.applications import Ravyn
 from ravyn.core.config.template import TemplateConfig
 from ravyn.core.datastructures import Template
 from ravyn.requests import Request
+from ravyn.responses import TemplateResponse
 from ravyn.routing.gateways import Gateway
 from ravyn.routing.handlers import get
 from ravyn.template.jinja import JinjaTemplateEngine
@@ -101,3 +102,72 @@ def test_alternative_template(template_dir, test_client_factory):
     client = RavynTestClient(app)
     response = client.get("/")
     assert response.text == "<html>Hello, <a href='http://testserver/'>world</a></html>"
+
+
+@pytest.mark.parametrize("env_options", [{}, {"enable_async": True}])
+@pytest.mark.parametrize("render_in_threadpool", [False, True])
+def test_templates_stream(template_dir, env_options, render_in_threadpool):
+    path = os.path.join(template_dir, "rows.html")
+    with open(path, "w") as file:
+        file.write("<ul>{% for row in rows %}<li>{{ row }}</li>{% endfor %}</ul>")
+
+    @get()
+    async def homepage() -> Template:
+        return Template(
+            name="rows.html",
+            context={"rows": range(5000)},
+            stream=True,
+            render_in_threadpool=render_in_threadpool,
+        )
+
+    app = Ravyn(
+        routes=[Gateway("/", handler=homepage)],
+        template_config=TemplateConfig(
+            directory=template_dir, engine=JinjaTemplateEngine, env_options=env_options
+        ),
+    )
+    client = RavynTestClient(app)
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert "content-length" not in response.headers
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.text == "<ul>" + "".join(f"<li>{row}</li>" for row in range(5000)) + "</ul>"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("env_options", [{}, {"enable_async": True}])
+async def test_templates_stream_chunks(template_dir, env_options):
+    path = os.path.join(template_dir, "rows.html")
+    with open(path, "w") as file:
+        file.write("{% for row in rows %}{{ row }}{% endfor %}")
+
+    engine = JinjaTemplateEngine(directory=template_dir, **env_options)
+    response = TemplateResponse(
+        "rows.html", engine, context={"rows": ["x" * 10] * 10}, stream=True
+    )
+    response.chunk_size = 25
+
+    chunks = [chunk async for chunk in response.iterate_chunks()]
+
+    assert chunks == ["x" * 30, "x" * 30, "x" * 30, "x" * 10]
+
+
+def test_templates_render_in_threadpool(template_dir):
+    path = os.path.join(template_dir, "index.html")
+    with open(path, "w") as file:
+        file.write("<html>Hello {{ name }}</html>")
+
+    @get()
+    async def homepage() -> Template:
+        return Template(name="index.html", context={"name": "world"}, render_in_threadpool=True)
+
+    app = Ravyn(
+        routes=[Gateway("/", handler=homepage)],
+        template_config=TemplateConfig(directory=template_dir, engine=JinjaTemplateEngine),
+    )
+    client = RavynTestClient(app)
+    response = client.get("/")
+
+    assert response.text == "<html>Hello world</html>"
+    assert response.headers["content-length"] == "24"
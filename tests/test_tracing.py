@@ -0,0 +1,169 @@
+import pytest
+
+from ravyn import BackgroundTask, Gateway, Inject, Injects, get
+from ravyn.applications import Ravyn
+from ravyn.core.config import BackgroundTaskConfig, TracingConfig
+from ravyn.core.interceptors.interceptor import RavynInterceptor
+from ravyn.core.tracing import NO_OP_TRACER, InMemorySpanExporter, get_tracer
+from ravyn.permissions import AllowAny, DenyAll
+
+NOTIFIED: list = []
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class LoggingInterceptor(RavynInterceptor):
+    async def intercept(self, scope, receive, send) -> None: ...
+
+
+def get_session() -> str:
+    return "session"
+
+
+def get_repository(session: str = Injects()) -> str:
+    return f"repository of {session}"
+
+
+async def notify(value: str) -> None:
+    with get_tracer().start_as_current_span("notify inside"):
+        NOTIFIED.append(value)
+
+
+def create_app(exporter, **kwargs):
+    @get(
+        "/items/{item_id:int}",
+        dependencies={
+            "repository": Inject(get_repository),
+            "session": Inject(get_session),
+        },
+        permissions=[AllowAny],
+        background=BackgroundTask(notify, "done"),
+    )
+    async def item(item_id: int, repository: str = Injects()) -> dict[str, str]:
+        with get_tracer().start_as_current_span("query"):
+            return {"repository": repository}
+
+    @get("/secret", permissions=[DenyAll])
+    async def secret() -> str:
+        return "secret"
+
+    return Ravyn(
+        routes=[
+            Gateway(handler=item, interceptors=[LoggingInterceptor]),
+            Gateway(handler=secret),
+        ],
+        tracing_config=TracingConfig(exporter=exporter),
+        **kwargs,
+    )
+
+
+def get_span(spans, name):
+    (span,) = [span for span in spans if span.name == name]
+    return span
+
+
+def test_tracing_spans(test_client_factory):
+    NOTIFIED.clear()
+    exporter = InMemorySpanExporter()
+    client = test_client_factory(create_app(exporter))
+
+    response = client.get("/items/1")
+    assert response.json() == {"repository": "repository of session"}
+    assert NOTIFIED == ["done"]
+
+    spans = exporter.get_finished_spans()
+    request = get_span(spans, "GET /items/{item_id}")
+    assert request.parent_id is None
+    assert request.attributes["http.route"] == "/items/{item_id}"
+    assert request.attributes["http.response.status_code"] == 200
+    assert {span.trace_id for span in spans} == {request.trace_id}
+
+    children = {span.name for span in spans if span.parent_id == request.span_id}
+    assert children >= {
+        "interceptors",
+        "permissions",
+        "handler",
+        "serialization",
+        "background notify",
+    }
+    interceptors = get_span(spans, "interceptors")
+    assert get_span(spans, "interceptor LoggingInterceptor").parent_id == interceptors.span_id
+    permissions = get_span(spans, "permissions")
+    assert get_span(spans, "permission AllowAny").parent_id == permissions.span_id
+
+    handler = get_span(spans, "handler")
+    repository = get_span(spans, "dependency repository")
+    assert repository.parent_id == handler.span_id
+    assert repository.attributes["ravyn.dependency.provider"] == "get_repository"
+    assert get_span(spans, "dependency session").parent_id == repository.span_id
+    assert get_span(spans, "query").parent_id == handler.span_id
+    background = get_span(spans, "background notify")
+    assert get_span(spans, "notify inside").parent_id == background.span_id
+
+
+def test_tracing_propagates_the_traceparent(test_client_factory):
+    exporter = InMemorySpanExporter()
+    client = test_client_factory(create_app(exporter))
+
+    client.get("/items/1", headers={"traceparent": TRACEPARENT})
+    client.get("/items/1", headers={"traceparent": "00-invalid"})
+
+    first, second = [span for span in exporter.get_finished_spans() if span.name.startswith("GET")]
+    assert first.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert first.parent_id == "b7ad6b7169203331"
+    assert second.trace_id != first.trace_id
+    assert second.parent_id is None
+
+
+def test_tracing_permission_denied(test_client_factory):
+    exporter = InMemorySpanExporter()
+    client = test_client_factory(create_app(exporter))
+
+    assert client.get("/secret").status_code == 403
+
+    spans = exporter.get_finished_spans()
+    denied = get_span(spans, "permission DenyAll")
+    assert denied.status == "error"
+    assert denied.events[0][0] == "exception"
+    request = get_span(spans, "GET /secret")
+    assert request.attributes["http.response.status_code"] == 403
+
+
+def test_tracing_background_executor(test_client_factory):
+    NOTIFIED.clear()
+    exporter = InMemorySpanExporter()
+    app = create_app(exporter, background_config=BackgroundTaskConfig())
+
+    with test_client_factory(app) as client:
+        client.get("/items/1")
+
+    assert NOTIFIED == ["done"]
+    spans = exporter.get_finished_spans()
+    request = get_span(spans, "GET /items/{item_id}")
+    assert get_span(spans, "background notify").parent_id == request.span_id
+
+
+def test_tracing_disabled(test_client_factory):
+    @get("/")
+    async def home() -> str:
+        return get_tracer().start_span("home").trace_id
+
+    app = Ravyn(routes=[Gateway(handler=home)], tracing_config=TracingConfig())
+    client = test_client_factory(app)
+
+    assert client.get("/").json() == "0" * 32
+    assert app.tracer is NO_OP_TRACER
+    assert "instrumented_route" not in app.routes[0].handler.__dict__
+    assert Ravyn().tracer is NO_OP_TRACER
+
+
+@pytest.mark.parametrize("custom", [True, False])
+def test_tracing_config_tracer(custom):
+    from ravyn.core.tracing import Tracer
+
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter, service_name="custom")
+    config = TracingConfig(tracer=tracer if custom else None, exporter=exporter)
+
+    assert (config.get_tracer() is tracer) is custom
+    assert config.get_tracer().exporter is exporter